@@ -0,0 +1,62 @@
+"""add trigram search indexes for products, parties and batches
+
+Revision ID: 20261019_0039
+Revises: 20260622_0038
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0039"
+down_revision: str | Sequence[str] | None = "20260622_0038"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to the search documents in app/services/search.py so the
+# planner can use these indexes for the list endpoints' LIKE filters.
+SEARCH_INDEXES = {
+    "ix_products_search_trgm": (
+        "products",
+        ("sku", "name", "display_name", "brand", "category", "rack_number"),
+    ),
+    "ix_parties_search_trgm": (
+        "parties",
+        ("name", "display_name", "contact_person", "gstin", "city"),
+    ),
+    "ix_batches_search_trgm": ("batches", ("batch_no",)),
+}
+
+
+def _search_document_sql(columns: tuple[str, ...]) -> str:
+    parts = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"lower({parts})"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    available = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first()
+    if available is None:
+        # Search still works without pg_trgm; it just falls back to sequential scans.
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+    for index_name, (table_name, columns) in SEARCH_INDEXES.items():
+        if table_name not in table_names:
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+            f"USING gin (({_search_document_sql(columns)}) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for index_name in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
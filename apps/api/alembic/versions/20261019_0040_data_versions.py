@@ -0,0 +1,40 @@
+"""add data_versions table for master list ETags
+
+Revision ID: 20261019_0040
+Revises: 20261019_0039
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0040"
+down_revision: str | Sequence[str] | None = "20261019_0039"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_versions" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("NOW()")),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_versions" not in inspector.get_table_names():
+        return
+
+    op.drop_table("data_versions")
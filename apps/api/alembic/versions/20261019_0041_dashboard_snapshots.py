@@ -0,0 +1,55 @@
+"""add dashboard_snapshots table for incremental dashboard KPIs
+
+Revision ID: 20261019_0041
+Revises: 20261019_0040
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0041"
+down_revision: str | Sequence[str] | None = "20261019_0040"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "dashboard_snapshots" not in inspector.get_table_names():
+        op.create_table(
+            "dashboard_snapshots",
+            sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+            sa.Column("as_of", sa.Date(), nullable=True),
+            sa.Column("total_products", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("total_parties", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("total_warehouses", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("stock_items_count", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column(
+                "total_stock_value",
+                sa.Numeric(24, 7),
+                nullable=False,
+                server_default=sa.text("0"),
+            ),
+            sa.Column("expiring_soon_count", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("open_purchase_orders", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("pending_dispatches", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+        )
+
+    # The row exists from the start (with as_of NULL, i.e. "rebuild on first
+    # read") so concurrent write paths always have a row to apply deltas to.
+    op.execute("INSERT INTO dashboard_snapshots (id) VALUES (1) ON CONFLICT (id) DO NOTHING")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "dashboard_snapshots" not in inspector.get_table_names():
+        return
+
+    op.drop_table("dashboard_snapshots")
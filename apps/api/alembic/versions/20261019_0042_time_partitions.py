@@ -0,0 +1,209 @@
+"""partition inventory_ledger and audit_logs by month
+
+Revision ID: 20261019_0042
+Revises: 20261019_0041
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0042"
+down_revision: str | Sequence[str] | None = "20261019_0041"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MONTHS_AHEAD = 3
+
+# table -> (partition key, outgoing foreign keys, secondary indexes)
+TABLES: dict[str, tuple[str, dict[str, str], dict[str, str]]] = {
+    "inventory_ledger": (
+        "created_at",
+        {
+            "warehouse_id": "warehouses",
+            "product_id": "products",
+            "batch_id": "batches",
+            "created_by": "users",
+        },
+        {
+            "ix_inventory_ledger_wh_prod": "(warehouse_id, product_id)",
+            "ix_inventory_ledger_wh_prod_batch_created": (
+                "(warehouse_id, product_id, batch_id, created_at)"
+            ),
+            "ix_inventory_ledger_batch_id": "(batch_id)",
+            "ix_inventory_ledger_reason": "(reason)",
+            "ix_inventory_ledger_created_at_brin": "USING brin (created_at)",
+        },
+    ),
+    "audit_logs": (
+        "timestamp",
+        {"performed_by": "users"},
+        {
+            "ix_audit_logs_entity_type": "(entity_type)",
+            "ix_audit_logs_entity_id": "(entity_id)",
+            "ix_audit_logs_module": "(module)",
+            "ix_audit_logs_action": "(action)",
+            "ix_audit_logs_performed_by": "(performed_by)",
+            "ix_audit_logs_timestamp_brin": "USING brin (timestamp)",
+        },
+    ),
+}
+
+# Foreign keys to inventory_ledger.id dropped on upgrade, restored on downgrade.
+LEDGER_REFERENCES: dict[str, tuple[str, ...]] = {
+    "stock_adjustments": ("ledger_id",),
+    "stock_corrections": ("out_ledger_id", "in_ledger_id"),
+    "stock_source_provenance": ("ledger_id",),
+}
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def _is_partitioned(bind, table_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table_name))"
+            ),
+            {"table_name": table_name},
+        ).scalar_one()
+    )
+
+
+def _drop_incoming_foreign_keys(inspector: sa.Inspector, table_name: str) -> None:
+    # A foreign key cannot reference a partitioned table unless it includes the
+    # partition key, so references to these rows become plain id columns.
+    for referencing_table in inspector.get_table_names():
+        for fk in inspector.get_foreign_keys(referencing_table):
+            if fk["referred_table"] == table_name and fk.get("name"):
+                op.drop_constraint(fk["name"], referencing_table, type_="foreignkey")
+
+
+def _partition(table_name: str) -> None:
+    key, foreign_keys, indexes = TABLES[table_name]
+    old_table = f"{table_name}_unpartitioned"
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    _drop_incoming_foreign_keys(inspector, table_name)
+    pk_name = inspector.get_pk_constraint(table_name).get("name")
+    index_names = [index["name"] for index in inspector.get_indexes(table_name)]
+
+    op.execute(f"ALTER TABLE {table_name} RENAME TO {old_table}")
+    if pk_name:
+        op.execute(f"ALTER TABLE {old_table} RENAME CONSTRAINT {pk_name} TO {old_table}_pkey")
+    for index_name in index_names:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    op.execute(f"UPDATE {old_table} SET {key} = NOW() WHERE {key} IS NULL")
+    op.execute(
+        f"CREATE TABLE {table_name} (LIKE {old_table} INCLUDING DEFAULTS) "
+        f"PARTITION BY RANGE ({key})"
+    )
+    op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {key} SET NOT NULL")
+    op.execute(
+        f"ALTER TABLE {table_name} "
+        f"ADD CONSTRAINT {table_name}_pkey PRIMARY KEY (id, {key})"
+    )
+    for column, referred_table in foreign_keys.items():
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referred_table} (id)"
+        )
+    for index_name, definition in indexes.items():
+        op.execute(f"CREATE INDEX {index_name} ON {table_name} {definition}")
+
+    oldest = bind.execute(sa.text(f"SELECT MIN({key}) FROM {old_table}")).scalar_one()
+    current = _month_start(date.today())
+    month = _month_start(min(oldest.date(), current)) if oldest is not None else current
+    last = _add_months(current, MONTHS_AHEAD)
+    op.execute(f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT")
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE {table_name}_p{month:%Y%m} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(_add_months(month, 1))})"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(f"INSERT INTO {table_name} SELECT * FROM {old_table}")
+    op.execute(f"ALTER SEQUENCE {table_name}_id_seq OWNED BY {table_name}.id")
+    op.execute(
+        f"SELECT setval('{table_name}_id_seq', "
+        f"COALESCE((SELECT MAX(id) FROM {table_name}), 0) + 1, false)"
+    )
+    op.execute(f"DROP TABLE {old_table}")
+
+
+def _unpartition(table_name: str) -> None:
+    key, foreign_keys, indexes = TABLES[table_name]
+    new_table = f"{table_name}_plain"
+
+    op.execute(f"CREATE TABLE {new_table} (LIKE {table_name} INCLUDING DEFAULTS)")
+    op.execute(f"INSERT INTO {new_table} SELECT * FROM {table_name}")
+    op.execute(f"ALTER SEQUENCE {table_name}_id_seq OWNED BY {new_table}.id")
+    op.execute(f"DROP TABLE {table_name}")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO {table_name}")
+    op.execute(f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_pkey PRIMARY KEY (id)")
+    for column, referred_table in foreign_keys.items():
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referred_table} (id)"
+        )
+    for index_name, definition in indexes.items():
+        if definition.startswith("USING brin"):
+            index_name = index_name.removesuffix("_brin")
+            definition = f"({key})"
+        op.execute(f"CREATE INDEX {index_name} ON {table_name} {definition}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    for table_name, (key, _foreign_keys, _indexes) in TABLES.items():
+        if table_name not in table_names or _is_partitioned(bind, table_name):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table_name)}
+        # Legacy audit tables (actor_user_id/created_at) keep their layout.
+        if key not in columns or (table_name == "audit_logs" and "performed_by" not in columns):
+            continue
+        _partition(table_name)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table_name in TABLES:
+        if _is_partitioned(bind, table_name):
+            _unpartition(table_name)
+
+    table_names = set(sa.inspect(bind).get_table_names())
+    for referencing_table, columns in LEDGER_REFERENCES.items():
+        if referencing_table not in table_names:
+            continue
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {referencing_table} ADD CONSTRAINT {referencing_table}_{column}_fkey "
+                f"FOREIGN KEY ({column}) REFERENCES inventory_ledger (id)"
+            )
@@ -0,0 +1,116 @@
+"""add inventory checkpoints, ledger archive and period closes
+
+Revision ID: 20261019_0043
+Revises: 20261019_0042
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0043"
+down_revision: str | Sequence[str] | None = "20261019_0042"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _is_partitioned(bind, table_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table_name))"
+            ),
+            {"table_name": table_name},
+        ).scalar_one()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    if "inventory_checkpoints" not in table_names:
+        op.create_table(
+            "inventory_checkpoints",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("warehouse_id", sa.Integer(), sa.ForeignKey("warehouses.id"), nullable=False),
+            sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+            sa.Column("batch_id", sa.Integer(), sa.ForeignKey("batches.id"), nullable=False),
+            sa.Column(
+                "is_opening", sa.Boolean(), nullable=False, server_default=sa.text("false")
+            ),
+            sa.Column("qty", sa.Numeric(18, 3), nullable=False, server_default="0"),
+            sa.Column("stock_value", sa.Numeric(24, 7), nullable=False, server_default="0"),
+            sa.Column("last_movement_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("closed_through", sa.Date(), nullable=False),
+            sa.UniqueConstraint(
+                "warehouse_id",
+                "product_id",
+                "batch_id",
+                "is_opening",
+                name="uq_inventory_checkpoints_bucket",
+            ),
+        )
+        op.create_index(
+            "ix_inventory_checkpoints_product", "inventory_checkpoints", ["product_id"]
+        )
+
+    if "inventory_period_closes" not in table_names:
+        op.create_table(
+            "inventory_period_closes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("fiscal_year_end", sa.Date(), nullable=False, unique=True),
+            sa.Column("cutoff_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("archived_rows", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("checkpoint_rows", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("closed_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("closed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if (
+        bind.dialect.name == "postgresql"
+        and "inventory_ledger_archive" not in table_names
+        and _is_partitioned(bind, "inventory_ledger")
+    ):
+        # Closed ledger partitions are re-attached here, so the archive has to
+        # match inventory_ledger column for column.
+        op.execute(
+            "CREATE TABLE inventory_ledger_archive (LIKE inventory_ledger INCLUDING CONSTRAINTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        op.execute(
+            "ALTER TABLE inventory_ledger_archive "
+            "ADD CONSTRAINT inventory_ledger_archive_pkey PRIMARY KEY (id, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX ix_inventory_ledger_archive_wh_prod "
+            "ON inventory_ledger_archive (warehouse_id, product_id)"
+        )
+        op.execute(
+            "CREATE INDEX ix_inventory_ledger_archive_created_at_brin "
+            "ON inventory_ledger_archive USING brin (created_at)"
+        )
+        op.execute(
+            "CREATE TABLE inventory_ledger_archive_default "
+            "PARTITION OF inventory_ledger_archive DEFAULT"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    table_names = set(sa.inspect(bind).get_table_names())
+
+    if "inventory_ledger_archive" in table_names:
+        # Put archived rows back so the ledger is complete again.
+        op.execute("INSERT INTO inventory_ledger SELECT * FROM inventory_ledger_archive")
+        op.execute("DROP TABLE inventory_ledger_archive")
+    if "inventory_period_closes" in table_names:
+        op.drop_table("inventory_period_closes")
+    if "inventory_checkpoints" in table_names:
+        op.drop_index("ix_inventory_checkpoints_product", table_name="inventory_checkpoints")
+        op.drop_table("inventory_checkpoints")
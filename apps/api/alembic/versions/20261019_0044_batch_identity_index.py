@@ -0,0 +1,59 @@
+"""replace the batch metadata constraint with a NULL-safe identity index
+
+Revision ID: 20261019_0044
+Revises: 20261019_0043
+Create Date: 2026-10-19 21:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0044"
+down_revision: str | Sequence[str] | None = "20261019_0043"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to BATCH_IDENTITY_COLUMNS in app/models/batch.py, which the
+# batch registry names as the ON CONFLICT target.
+IDENTITY_COLUMNS = "product_id, batch_no, expiry_date, mfg_date, mrp, reference_id"
+
+# The old constraint let batches differing only in NULLs repeat. Merging them
+# would mean moving stock, so the later copies are kept and tagged instead.
+TAG_DUPLICATES_SQL = f"""
+    UPDATE batches
+    SET reference_id = left(
+        coalesce(batches.reference_id || ' ', '')
+        || 'DUPLICATE-' || batches.id || '-OF-' || ranked.canonical_id,
+        120
+    )
+    FROM (
+        SELECT id, min(id) OVER (PARTITION BY {IDENTITY_COLUMNS}) AS canonical_id
+        FROM batches
+    ) AS ranked
+    WHERE ranked.id = batches.id
+      AND ranked.id <> ranked.canonical_id
+"""
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "batches" not in inspector.get_table_names():
+        return
+
+    op.execute(TAG_DUPLICATES_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_batches_identity "
+        f"ON batches ({IDENTITY_COLUMNS}) NULLS NOT DISTINCT"
+    )
+    op.execute("ALTER TABLE batches DROP CONSTRAINT IF EXISTS uq_batch_product_metadata")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_batches_identity")
+    op.execute(
+        "ALTER TABLE batches ADD CONSTRAINT uq_batch_product_metadata "
+        f"UNIQUE ({IDENTITY_COLUMNS})"
+    )
@@ -0,0 +1,39 @@
+"""add snapshot_seq to audit_logs for delta-encoded snapshots
+
+Revision ID: 20261019_0045
+Revises: 20261019_0044
+Create Date: 2026-10-19 22:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0045"
+down_revision: str | Sequence[str] | None = "20261019_0044"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "audit_logs" not in inspector.get_table_names():
+        return
+    columns = {column["name"] for column in inspector.get_columns("audit_logs")}
+    # Tenants still on the legacy audit layout keep writing full snapshots.
+    if "performed_by" not in columns:
+        return
+
+    # Existing rows keep NULL, which reads as a full snapshot.
+    op.execute("ALTER TABLE audit_logs ADD COLUMN IF NOT EXISTS snapshot_seq INTEGER")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_entity_history "
+        "ON audit_logs (entity_type, entity_id, timestamp, id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_entity_history")
+    op.execute("ALTER TABLE audit_logs DROP COLUMN IF EXISTS snapshot_seq")
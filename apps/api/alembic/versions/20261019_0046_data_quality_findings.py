@@ -0,0 +1,71 @@
+"""add data_quality_findings table maintained from write paths
+
+Revision ID: 20261019_0046
+Revises: 20261019_0045
+Create Date: 2026-10-19 23:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261019_0046"
+down_revision: str | Sequence[str] | None = "20261019_0045"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_quality_findings" not in inspector.get_table_names():
+        op.create_table(
+            "data_quality_findings",
+            sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+            sa.Column("report", sa.String(length=32), nullable=False),
+            sa.Column("entity_type", sa.String(length=32), nullable=False),
+            sa.Column("subject_key", sa.String(length=255), nullable=False),
+            sa.Column("entity_id", sa.Integer(), nullable=True),
+            sa.Column("entity_name", sa.String(length=255), nullable=True),
+            sa.Column("rules", postgresql.ARRAY(sa.String(length=64)), nullable=False),
+            sa.Column("details", sa.String(length=512), nullable=True),
+            sa.Column("record_count", sa.Integer(), nullable=True),
+            sa.Column(
+                "detected_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.Column(
+                "checked_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.UniqueConstraint(
+                "report", "entity_type", "subject_key", name="uq_data_quality_findings_subject"
+            ),
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_data_quality_findings_rules "
+        "ON data_quality_findings USING gin (rules)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_data_quality_findings_detected_at "
+        "ON data_quality_findings (detected_at)"
+    )
+    # The table starts empty; the runtime schema repair runs the first full
+    # scan, which the data_versions marker then records.
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_quality_findings" not in inspector.get_table_names():
+        return
+
+    op.drop_table("data_quality_findings")
+    op.execute("DELETE FROM data_versions WHERE table_name = 'data_quality_findings'")
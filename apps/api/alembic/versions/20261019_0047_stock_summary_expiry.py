@@ -0,0 +1,51 @@
+"""copy batch expiry onto stock_summary with partial covering indexes
+
+Revision ID: 20261019_0047
+Revises: 20261019_0046
+Create Date: 2026-10-20 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0047"
+down_revision: str | Sequence[str] | None = "20261019_0046"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "stock_summary" not in inspector.get_table_names():
+        return
+
+    op.execute("ALTER TABLE stock_summary ADD COLUMN IF NOT EXISTS expiry_date DATE")
+    op.execute(
+        """
+        UPDATE stock_summary AS s
+        SET expiry_date = b.expiry_date
+        FROM batches AS b
+        WHERE b.id = s.batch_id AND s.expiry_date IS NULL
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_stock_summary_in_stock_expiry "
+        "ON stock_summary (expiry_date) "
+        "INCLUDE (warehouse_id, product_id, batch_id, qty_on_hand) "
+        "WHERE qty_on_hand > 0"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_stock_summary_in_stock_wh_prod_expiry "
+        "ON stock_summary (warehouse_id, product_id, expiry_date, batch_id) "
+        "INCLUDE (qty_on_hand) "
+        "WHERE qty_on_hand > 0"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_stock_summary_in_stock_wh_prod_expiry")
+    op.execute("DROP INDEX IF EXISTS ix_stock_summary_in_stock_expiry")
+    op.execute("ALTER TABLE stock_summary DROP COLUMN IF EXISTS expiry_date")
@@ -0,0 +1,40 @@
+"""add optimistic-concurrency version columns to document headers
+
+Revision ID: 20261019_0048
+Revises: 20261019_0047
+Create Date: 2026-10-20 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0048"
+down_revision: str | Sequence[str] | None = "20261019_0047"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+VERSIONED_TABLES = (
+    "purchase_orders",
+    "grns",
+    "sales_orders",
+    "dispatch_notes",
+    "purchase_bills",
+)
+
+
+def upgrade() -> None:
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+    for table_name in VERSIONED_TABLES:
+        if table_name in existing_tables:
+            op.execute(
+                f"ALTER TABLE {table_name} "
+                "ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1"
+            )
+
+
+def downgrade() -> None:
+    for table_name in VERSIONED_TABLES:
+        op.execute(f"ALTER TABLE IF EXISTS {table_name} DROP COLUMN IF EXISTS version")
@@ -0,0 +1,49 @@
+"""add idempotency_keys table for retried posting requests
+
+Revision ID: 20261019_0049
+Revises: 20261019_0048
+Create Date: 2026-10-20 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0049"
+down_revision: str | Sequence[str] | None = "20261019_0048"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "idempotency_keys" not in inspector.get_table_names():
+        op.create_table(
+            "idempotency_keys",
+            sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+            sa.Column("subject", sa.String(length=255), nullable=False),
+            sa.Column("route", sa.String(length=255), nullable=False),
+            sa.Column("key", sa.String(length=255), nullable=False),
+            sa.Column("request_hash", sa.String(length=64), nullable=False),
+            sa.Column("status_code", sa.Integer(), nullable=False),
+            sa.Column("response_body", sa.JSON(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+            sa.UniqueConstraint(
+                "subject", "route", "key", name="uq_idempotency_keys_subject_route_key"
+            ),
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_idempotency_keys_expires_at ON idempotency_keys (expires_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS idempotency_keys")
@@ -0,0 +1,87 @@
+"""check inventory_ledger references with constraint triggers
+
+Revision ID: 20261019_0050
+Revises: 20261019_0049
+Create Date: 2026-10-20 06:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261019_0050"
+down_revision: str | Sequence[str] | None = "20261019_0049"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Columns whose foreign keys to inventory_ledger.id 20261019_0042 dropped.
+LEDGER_REFERENCES: dict[str, tuple[str, ...]] = {
+    "stock_adjustments": ("ledger_id",),
+    "stock_corrections": ("out_ledger_id", "in_ledger_id"),
+    "stock_source_provenance": ("ledger_id",),
+}
+
+CHECK_FUNCTION = """
+CREATE OR REPLACE FUNCTION check_inventory_ledger_reference()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    ref_column text;
+    ref_id bigint;
+    found_row boolean;
+BEGIN
+    FOREACH ref_column IN ARRAY TG_ARGV LOOP
+        ref_id := (to_jsonb(NEW) ->> ref_column)::bigint;
+        CONTINUE WHEN ref_id IS NULL;
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM %I.inventory_ledger WHERE id = $1)',
+            TG_TABLE_SCHEMA
+        ) INTO found_row USING ref_id;
+        IF NOT found_row
+            AND to_regclass(format('%I.inventory_ledger_archive', TG_TABLE_SCHEMA)) IS NOT NULL
+        THEN
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM %I.inventory_ledger_archive WHERE id = $1)',
+                TG_TABLE_SCHEMA
+            ) INTO found_row USING ref_id;
+        END IF;
+        IF NOT found_row THEN
+            RAISE foreign_key_violation USING MESSAGE = format(
+                'insert or update on table "%s" violates ledger reference: '
+                '%s=%s is not present in inventory_ledger',
+                TG_TABLE_NAME, ref_column, ref_id
+            );
+        END IF;
+    END LOOP;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    table_names = set(sa.inspect(bind).get_table_names())
+    op.execute(CHECK_FUNCTION)
+    for table_name, columns in LEDGER_REFERENCES.items():
+        if table_name not in table_names:
+            continue
+        arguments = ", ".join(f"'{column}'" for column in columns)
+        op.execute(f"DROP TRIGGER IF EXISTS {table_name}_ledger_reference ON {table_name}")
+        op.execute(
+            f"CREATE CONSTRAINT TRIGGER {table_name}_ledger_reference "
+            f"AFTER INSERT OR UPDATE OF {', '.join(columns)} ON {table_name} "
+            f"FOR EACH ROW EXECUTE FUNCTION check_inventory_ledger_reference({arguments})"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for table_name in LEDGER_REFERENCES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table_name}_ledger_reference ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS check_inventory_ledger_reference()")
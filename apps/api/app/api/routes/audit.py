@@ -10,11 +10,12 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.exceptions import AppException
+from app.core.partitions import as_utc
 from app.core.permissions import require_permission
 from app.models.audit import AuditLog
 from app.models.user import User
 from app.schemas.audit import AuditLogDetailResponse, AuditLogListResponse, RecordHistoryResponse
-from app.services.audit import changed_fields
+from app.services.audit import Snapshots, changed_fields, expand_snapshots, replay_snapshots
 
 router = APIRouter()
 
@@ -121,7 +122,8 @@ def _legacy_summary(metadata: dict[str, Any], action: str) -> str:
     return action.replace("_", " ").title()
 
 
-def _build_audit_row(log: AuditLog) -> AuditLogDetailResponse:
+def _build_audit_row(log: AuditLog, snapshots: Snapshots) -> AuditLogDetailResponse:
+    before_snapshot, after_snapshot = snapshots
     return AuditLogDetailResponse(
         id=str(log.id),
         timestamp=log.timestamp,
@@ -136,9 +138,9 @@ def _build_audit_row(log: AuditLog) -> AuditLogDetailResponse:
         remarks=log.remarks,
         source_screen=log.source_screen,
         source_reference=log.source_reference,
-        changed_fields=changed_fields(log.before_snapshot, log.after_snapshot),
-        before_snapshot=log.before_snapshot,
-        after_snapshot=log.after_snapshot,
+        changed_fields=changed_fields(before_snapshot, after_snapshot),
+        before_snapshot=before_snapshot,
+        after_snapshot=after_snapshot,
         metadata=log.metadata_json,
     )
 
@@ -176,6 +178,12 @@ def _build_legacy_audit_row(row: Mapping[str, Any]) -> AuditLogDetailResponse:
     )
 
 
+def _build_stored_audit_row(log: AuditLog) -> AuditLogDetailResponse:
+    # Delta rows keep exactly the changed fields, so lists that only show those
+    # need not rebuild the full snapshots.
+    return _build_audit_row(log, (log.before_snapshot, log.after_snapshot))
+
+
 def _matches_search(row: AuditLogDetailResponse, search: str | None) -> bool:
     normalized = (search or "").strip().lower()
     if not normalized:
@@ -245,9 +253,9 @@ def _apply_audit_filters(
     if entity_id:
         stmt = stmt.where(cast(AuditLog.entity_id, String) == entity_id)
     if date_from is not None:
-        stmt = stmt.where(AuditLog.timestamp >= date_from)
+        stmt = stmt.where(AuditLog.timestamp >= as_utc(date_from))
     if date_to is not None:
-        stmt = stmt.where(AuditLog.timestamp <= date_to)
+        stmt = stmt.where(AuditLog.timestamp <= as_utc(date_to))
     if search:
         normalized = search.strip().lower()
         if normalized:
@@ -410,7 +418,7 @@ def list_audit_logs(
         .offset((page - 1) * page_size)
         .limit(page_size)
     ).scalars()
-    data = [_build_audit_row(log) for log in logs]
+    data = [_build_stored_audit_row(log) for log in logs]
     return AuditLogListResponse(total=total, page=page, page_size=page_size, data=data)
 
 
@@ -454,7 +462,7 @@ def export_audit_logs(
         date_to=date_to,
         search=search,
     )
-    rows = [_build_audit_row(log) for log in db.execute(stmt.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())).scalars()]
+    rows = [_build_stored_audit_row(log) for log in db.execute(stmt.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())).scalars()]
     return _write_audit_csv(rows)
 
 
@@ -518,7 +526,7 @@ def get_audit_log_detail(
             message="Audit log not found",
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    return _build_audit_row(log)
+    return _build_audit_row(log, expand_snapshots(db, [log])[log.id])
 
 
 @router.get("/history/{entity_type}/{entity_id}", response_model=RecordHistoryResponse)
@@ -554,8 +562,14 @@ def get_record_history(
         .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
         .all()
     )
+    # The whole history is loaded, so delta rows replay without another query.
+    snapshots = replay_snapshots(reversed(logs))
     return RecordHistoryResponse(
         entity_type=entity_type.upper(),
         entity_id=entity_id,
-        entries=[_build_audit_row(log) for log in logs if _is_visible_audit_action(log.action)],
+        entries=[
+            _build_audit_row(log, snapshots[log.id])
+            for log in logs
+            if _is_visible_audit_action(log.action)
+        ],
     )
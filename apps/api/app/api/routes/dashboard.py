@@ -1,40 +1,49 @@
-from decimal import Decimal
+from datetime import date
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import tenant_session
 from app.core.permissions import require_permission
-from app.models.inventory import StockSummary
-from app.models.party import Party
-from app.models.product import Product
+from app.core.tenant import get_read_db
+from app.models.dashboard_snapshot import DASHBOARD_SNAPSHOT_ID, DashboardSnapshot
 from app.models.user import User
-from app.models.warehouse import Warehouse
 from app.schemas.dashboard import DashboardMetrics
+from app.services.dashboard import current_dashboard_snapshot
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
+def _metrics(snapshot: DashboardSnapshot) -> DashboardMetrics:
+    return DashboardMetrics(
+        total_products=snapshot.total_products,
+        total_parties=snapshot.total_parties,
+        total_warehouses=snapshot.total_warehouses,
+        stock_items_count=snapshot.stock_items_count,
+        total_stock_value=snapshot.total_stock_value,
+        expiring_soon_count=snapshot.expiring_soon_count,
+        open_purchase_orders=snapshot.open_purchase_orders,
+        pending_dispatches=snapshot.pending_dispatches,
+        as_of=snapshot.as_of,
+    )
+
+
+def _refresh_metrics(tenant_schema: str | None) -> DashboardMetrics:
+    # The day's first read rebuilds the snapshot, which only the primary can write.
+    with tenant_session(tenant_schema) as db:
+        metrics = _metrics(current_dashboard_snapshot(db))
+        db.commit()
+    return metrics
+
+
 @router.get("/metrics", response_model=DashboardMetrics)
-def get_dashboard_metrics(
-    db: Session = Depends(get_db),
+async def get_dashboard_metrics(
+    read_db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("dashboard:view")),
 ) -> DashboardMetrics:
     _ = current_user
-    total_products = db.query(func.count(Product.id)).scalar() or 0
-    total_parties = db.query(func.count(Party.id)).scalar() or 0
-    total_warehouses = db.query(func.count(Warehouse.id)).scalar() or 0
-    stock_items_count = (
-        db.query(func.count(StockSummary.id))
-        .filter(StockSummary.qty_on_hand > Decimal("0"))
-        .scalar()
-        or 0
-    )
-
-    return DashboardMetrics(
-        total_products=total_products,
-        total_parties=total_parties,
-        total_warehouses=total_warehouses,
-        stock_items_count=stock_items_count,
-    )
+    snapshot = await read_db.get(DashboardSnapshot, DASHBOARD_SNAPSHOT_ID)
+    if snapshot is None or snapshot.as_of != date.today():
+        return await run_in_threadpool(_refresh_metrics, read_db.info.get("tenant_schema"))
+    return _metrics(snapshot)
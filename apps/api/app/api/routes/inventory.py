@@ -12,10 +12,12 @@ from sqlalchemy.orm import Session
 
 from app.core.database import IS_POSTGRES, get_db, set_tenant_search_path
 from app.core.exceptions import AppException
+from app.core.idempotency import IdempotentRequest, idempotent_request
 from app.core.permissions import require_permission
 from app.models.batch import Batch
 from app.models.enums import InventoryReason, StockAdjustmentReason, StockAdjustmentType
 from app.models.inventory import StockSummary
+from app.models.period_close import InventoryPeriodClose
 from app.models.product import Product
 from app.models.stock_operations import StockAdjustment, StockCorrection
 from app.models.user import User
@@ -25,9 +27,12 @@ from app.schemas.inventory import (
     InventoryAdjustRequest,
     InventoryInRequest,
     InventoryOutRequest,
+    PeriodCloseRequest,
+    PeriodCloseResponse,
     StockAdjustmentCreateRequest,
     StockAdjustmentListResponse,
     StockAdjustmentResponse,
+    StockBalanceCheckResponse,
     StockCorrectionListResponse,
     StockCorrectionRequest,
     StockCorrectionResponse,
@@ -35,7 +40,22 @@ from app.schemas.inventory import (
 )
 from app.schemas.masters import BulkImportError, BulkImportResult
 from app.services.audit import snapshot_model, write_audit_log
-from app.services.inventory import stock_adjust, stock_in, stock_out
+from app.services.batches import BatchKey, resolve_batch, resolve_batches
+from app.services.inventory import (
+    StockMovement,
+    lock_stock,
+    stock_adjust,
+    stock_in,
+    stock_in_many,
+    stock_out,
+)
+from app.services.period_close import close_fiscal_year, stock_balance_mismatches
+from app.services.search import (
+    batch_search_document,
+    build_text_search,
+    matching_warehouse_ids,
+    product_search_document,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -298,35 +318,17 @@ def _get_or_create_corrected_batch(
         else source_batch.mfg_date
     )
     target_mrp = payload.corrected_mrp if payload.corrected_mrp is not None else source_batch.mrp
-    target_reference_id = payload.corrected_reference_id
-    target_batch = (
-        db.query(Batch)
-        .filter(Batch.product_id == payload.product_id)
-        .filter(Batch.batch_no == payload.corrected_batch_no)
-        .filter(Batch.expiry_date == payload.corrected_expiry_date)
-        .filter(Batch.mfg_date == target_mfg if target_mfg is not None else Batch.mfg_date.is_(None))
-        .filter(Batch.mrp == target_mrp if target_mrp is not None else Batch.mrp.is_(None))
-        .filter(
-            Batch.reference_id == target_reference_id
-            if target_reference_id is not None
-            else Batch.reference_id.is_(None)
-        )
-        .first()
-    )
-    if target_batch is not None:
-        return target_batch
-
-    target_batch = Batch(
-        product_id=payload.product_id,
-        batch_no=payload.corrected_batch_no,
-        expiry_date=payload.corrected_expiry_date,
-        mfg_date=target_mfg,
-        mrp=target_mrp,
-        reference_id=target_reference_id,
+    return resolve_batch(
+        db,
+        BatchKey(
+            product_id=payload.product_id,
+            batch_no=payload.corrected_batch_no,
+            expiry_date=payload.corrected_expiry_date,
+            mfg_date=target_mfg,
+            mrp=target_mrp,
+            reference_id=payload.corrected_reference_id,
+        ),
     )
-    db.add(target_batch)
-    db.flush()
-    return target_batch
 
 
 @router.post("/in", response_model=InventoryActionResponse)
@@ -334,6 +336,13 @@ def create_stock_in(
     payload: InventoryInRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("inventory:in")),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+) -> InventoryActionResponse:
+    return idempotency.run(db, lambda: _stock_in_action(db, payload, current_user))
+
+
+def _stock_in_action(
+    db: Session, payload: InventoryInRequest, current_user: User
 ) -> InventoryActionResponse:
     result = stock_in(
         db,
@@ -345,6 +354,7 @@ def create_stock_in(
         created_by=current_user.id,
         ref_type=payload.ref_type,
         ref_id=payload.ref_id,
+        commit=False,
     )
     return InventoryActionResponse(
         ledger_id=result.ledger.id,
@@ -373,7 +383,7 @@ async def bulk_upload_opening_stock(
         warehouse.code.upper(): warehouse
         for warehouse in db.query(Warehouse).filter(Warehouse.is_active.is_(True)).all()
     }
-    batch_cache: dict[tuple[int, str, date, date | None, Decimal | None, str | None], Batch] = {}
+    parsed_rows: list[tuple[int, Warehouse, BatchKey, Decimal]] = []
 
     for index, row in enumerate(rows, start=1):
         if not isinstance(row, dict):
@@ -417,58 +427,63 @@ async def bulk_upload_opening_stock(
             mfg_date = _parse_optional_date(_to_text(row.get("mfg_date")), "mfg_date", index)
             mrp = _parse_optional_decimal(_to_text(row.get("mrp")), "mrp", index)
             qty = _parse_required_decimal(qty_raw, "qty", index)
-            batch_reference_id = _to_text(row.get("ref_id")) or None
-
-            with db.begin_nested():
-                cache_key = (product.id, batch_no, expiry_date, mfg_date, mrp, batch_reference_id)
-                batch = batch_cache.get(cache_key)
-                if batch is None:
-                    batch = (
-                        db.query(Batch)
-                        .filter(Batch.product_id == product.id)
-                        .filter(Batch.batch_no == batch_no)
-                        .filter(Batch.expiry_date == expiry_date)
-                        .filter(Batch.mfg_date == mfg_date if mfg_date is not None else Batch.mfg_date.is_(None))
-                        .filter(Batch.mrp == mrp if mrp is not None else Batch.mrp.is_(None))
-                        .filter(
-                            Batch.reference_id == batch_reference_id
-                            if batch_reference_id is not None
-                            else Batch.reference_id.is_(None)
-                        )
-                        .first()
-                    )
-                    if batch is None:
-                        batch = Batch(
-                            product_id=product.id,
-                            batch_no=batch_no,
-                            expiry_date=expiry_date,
-                            mfg_date=mfg_date,
-                            mrp=mrp,
-                            reference_id=batch_reference_id,
-                        )
-                        db.add(batch)
-                        db.flush()
-                    batch_cache[cache_key] = batch
-
-                stock_in(
-                    db,
-                    warehouse_id=warehouse.id,
-                    product_id=product.id,
-                    batch_id=batch.id,
-                    qty=qty,
-                    reason=InventoryReason.OPENING_STOCK,
-                    created_by=current_user.id,
-                    ref_type="OPENING",
-                    ref_id=batch_reference_id or f"BULK-OPENING-{index}",
-                    commit=False,
-                )
-            created_count += 1
         except AppException as error:
             errors.append(
                 _bulk_error(index, error.message, (error.details or {}).get("field"))
             )
-        except Exception as error:
-            errors.append(_bulk_error(index, str(error)))
+            continue
+        batch_key = BatchKey(
+            product_id=product.id,
+            batch_no=batch_no,
+            expiry_date=expiry_date,
+            mfg_date=mfg_date,
+            mrp=mrp,
+            reference_id=_to_text(row.get("ref_id")) or None,
+        )
+        parsed_rows.append((index, warehouse, batch_key, qty))
+
+    batches = resolve_batches(db, [batch_key for _index, _warehouse, batch_key, _qty in parsed_rows])
+    movements = [
+        (
+            index,
+            StockMovement(
+                warehouse.id,
+                batch_key.product_id,
+                batches[batch_key].id,
+                qty,
+                ref_id=batch_key.reference_id or f"BULK-OPENING-{index}",
+            ),
+        )
+        for index, warehouse, batch_key, qty in parsed_rows
+    ]
+
+    def _post(batch: list[StockMovement]) -> None:
+        with db.begin_nested():
+            stock_in_many(
+                db,
+                batch,
+                reason=InventoryReason.OPENING_STOCK,
+                created_by=current_user.id,
+                ref_type="OPENING",
+            )
+
+    try:
+        # Every row in one posting; only a failure replays them one by one to
+        # find the rows at fault.
+        _post([movement for _index, movement in movements])
+        created_count = len(movements)
+    except Exception:
+        for index, movement in movements:
+            try:
+                _post([movement])
+                created_count += 1
+            except AppException as error:
+                errors.append(
+                    _bulk_error(index, error.message, (error.details or {}).get("field"))
+                )
+            except Exception as error:
+                errors.append(_bulk_error(index, str(error)))
+    errors.sort(key=lambda error: error.row)
 
     try:
         db.commit()
@@ -544,27 +559,39 @@ def list_stock_items(
         stmt = stmt.where(StockSummary.warehouse_id == warehouse_id)
     if product_id is not None:
         stmt = stmt.where(StockSummary.product_id == product_id)
-    if search:
-        normalized = search.strip().lower()
-        if normalized:
-            pattern = f"%{normalized}%"
-            stmt = stmt.where(
-                or_(
-                    func.lower(Product.sku).like(pattern),
-                    func.lower(Product.name).like(pattern),
-                    func.lower(Batch.batch_no).like(pattern),
-                    func.lower(Warehouse.name).like(pattern),
-                )
-            )
-
-    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-    total = int(db.execute(count_stmt).scalar_one())
+    order_by = [Product.name.asc(), Warehouse.name.asc(), Batch.expiry_date.asc()]
+    text_search = build_text_search(db, search)
+    if text_search is not None:
+        # Match through the indexed product and batch search documents rather than
+        # OR-ing LIKEs across the joined rows.
+        conditions = [
+            StockSummary.product_id.in_(
+                select(Product.id).where(text_search.matches(product_search_document()))
+            ),
+            StockSummary.batch_id.in_(
+                select(Batch.id).where(text_search.matches(batch_search_document()))
+            ),
+        ]
+        warehouse_ids = matching_warehouse_ids(db, text_search)
+        if warehouse_ids:
+            conditions.append(StockSummary.warehouse_id.in_(warehouse_ids))
+        stmt = stmt.where(or_(*conditions))
+        order_by.insert(0, text_search.rank(product_search_document()))
 
+    # The total rides along as a window aggregate instead of a second COUNT query.
     rows = db.execute(
-        stmt.order_by(Product.name.asc(), Warehouse.name.asc(), Batch.expiry_date.asc())
+        stmt.add_columns(func.count().over().label("total_count"))
+        .order_by(*order_by)
         .offset((page - 1) * page_size)
         .limit(page_size)
-    ).mappings()
+    ).mappings().all()
+    if rows:
+        total = int(rows[0]["total_count"])
+    elif page > 1:
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        total = int(db.execute(count_stmt).scalar_one())
+    else:
+        total = 0
 
     data = [
         {
@@ -704,6 +731,11 @@ def create_stock_correction(
         db.add(correction)
         db.flush()
 
+        # Both positions at once, so corrections between the same two batches
+        # in opposite directions queue instead of deadlocking.
+        source_key = (payload.warehouse_id, payload.product_id, payload.source_batch_id)
+        corrected_key = (payload.warehouse_id, payload.product_id, corrected_batch.id)
+        lock_stock(db, {source_key}, create={corrected_key})
         out_result = stock_out(
             db,
             warehouse_id=payload.warehouse_id,
@@ -854,6 +886,13 @@ def create_stock_out(
     payload: InventoryOutRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("inventory:out")),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+) -> InventoryActionResponse:
+    return idempotency.run(db, lambda: _stock_out_action(db, payload, current_user))
+
+
+def _stock_out_action(
+    db: Session, payload: InventoryOutRequest, current_user: User
 ) -> InventoryActionResponse:
     result = stock_out(
         db,
@@ -865,6 +904,7 @@ def create_stock_out(
         created_by=current_user.id,
         ref_type=payload.ref_type,
         ref_id=payload.ref_id,
+        commit=False,
     )
     return InventoryActionResponse(
         ledger_id=result.ledger.id,
@@ -880,6 +920,13 @@ def create_stock_adjust_legacy(
     payload: InventoryAdjustRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("inventory:adjust")),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
+) -> InventoryActionResponse:
+    return idempotency.run(db, lambda: _stock_adjust_action(db, payload, current_user))
+
+
+def _stock_adjust_action(
+    db: Session, payload: InventoryAdjustRequest, current_user: User
 ) -> InventoryActionResponse:
     result = stock_adjust(
         db,
@@ -889,6 +936,7 @@ def create_stock_adjust_legacy(
         delta_qty=payload.delta_qty,
         reason=payload.reason,
         created_by=current_user.id,
+        commit=False,
     )
     return InventoryActionResponse(
         ledger_id=result.ledger.id,
@@ -1113,3 +1161,56 @@ def create_stock_adjustment(
         after_qty=result.summary.qty_on_hand,
         created_at=adjustment.created_at,
     )
+
+
+@router.get("/stock-balance-check", response_model=StockBalanceCheckResponse)
+def check_stock_balances(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("inventory:view")),
+) -> StockBalanceCheckResponse:
+    mismatches = stock_balance_mismatches(db)
+    return StockBalanceCheckResponse(balanced=not mismatches, mismatches=mismatches)
+
+
+@router.get("/period-closes", response_model=list[PeriodCloseResponse])
+def list_period_closes(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("inventory:view")),
+) -> list[PeriodCloseResponse]:
+    closes = db.execute(
+        select(InventoryPeriodClose).order_by(InventoryPeriodClose.fiscal_year_end.desc())
+    ).scalars()
+    return [PeriodCloseResponse.model_validate(close) for close in closes]
+
+
+@router.post("/period-closes", response_model=PeriodCloseResponse)
+def create_period_close(
+    payload: PeriodCloseRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("settings:update")),
+) -> PeriodCloseResponse:
+    try:
+        period_close = close_fiscal_year(
+            db, fiscal_year_end=payload.fiscal_year_end, closed_by=current_user.id
+        )
+        write_audit_log(
+            db,
+            module="Inventory",
+            action="CLOSE",
+            entity_type="INVENTORY_PERIOD_CLOSE",
+            entity_id=period_close.id,
+            performed_by=current_user.id,
+            summary=f"Closed stock ledger through {payload.fiscal_year_end.isoformat()}",
+            source_screen="Inventory / Period Close",
+            after_snapshot={
+                "fiscal_year_end": payload.fiscal_year_end.isoformat(),
+                "archived_rows": period_close.archived_rows,
+                "checkpoint_rows": period_close.checkpoint_rows,
+            },
+        )
+        _commit_with_tenant_context(db)
+        db.refresh(period_close)
+    except AppException:
+        db.rollback()
+        raise
+    return PeriodCloseResponse.model_validate(period_close)
@@ -1,18 +1,24 @@
 import csv
 import io
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal, InvalidOperation
 from enum import Enum
+from typing import NoReturn
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
-from sqlalchemy import func, or_
+from sqlalchemy import func, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_user
+from app.core.concurrency import limit_concurrency
 from app.core.database import get_db, set_tenant_search_path
 from app.core.exceptions import AppException
 from app.core.permissions import require_permission
+from app.core.tenant import get_read_db
 from app.domain.pricing import unit_price_from_mrp
 from app.domain.quantity import quantity_precision_from_decimal_allowed
 from app.domain.tax_identity import (
@@ -59,6 +65,7 @@ from app.models.enums import (
 from app.models.gst_verification import GSTVerificationLog
 from app.models.inventory import InventoryLedger, StockSummary
 from app.models.party import Party
+from app.models.period_close import InventoryCheckpoint
 from app.models.product import Product
 from app.models.purchase import GRN, PurchaseCreditNote, PurchaseOrder, PurchaseReturn
 from app.models.purchase_bill import PurchaseBill
@@ -91,10 +98,14 @@ from app.schemas.masters import (
     GSTVerificationStartRequest,
     PartyCreate,
     PartyRead,
+    PartySummary,
+    PartySummaryPage,
     PartyUpdate,
     ProductCreate,
     ProductListResponse,
     ProductRead,
+    ProductSummary,
+    ProductSummaryPage,
     ProductUpdate,
     RackCreate,
     RackRead,
@@ -111,6 +122,21 @@ from app.schemas.masters import (
     WarehouseUpdate,
 )
 from app.services.audit import snapshot_model, write_audit_log
+from app.services.dashboard import record_dashboard_delta
+from app.services.data_quality import note_inserted_records
+from app.services.data_versions import bump_data_version, conditional_list_response
+from app.services.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    fetch_keyset_page,
+    parse_fields,
+)
+from app.services.search import (
+    build_text_search,
+    matching_warehouse_ids,
+    party_search_document,
+    product_search_document,
+)
 
 router = APIRouter()
 
@@ -146,6 +172,9 @@ DEFAULT_PARTY_CATEGORY_NAMES = [
     PartyCategory.OTHER.value,
 ]
 
+PARTY_IMPORT_CHUNK_SIZE = 1000
+PRODUCT_IMPORT_CHUNK_SIZE = 1000
+
 PARTY_WRITE_FIELDS = {
     "name",
     "display_name",
@@ -186,6 +215,13 @@ def _commit_with_tenant_context(db: Session) -> None:
         set_tenant_search_path(db, tenant_schema)
 
 
+def _rollback_with_tenant_context(db: Session) -> None:
+    db.rollback()
+    tenant_schema = db.info.get("tenant_schema")
+    if isinstance(tenant_schema, str) and tenant_schema:
+        set_tenant_search_path(db, tenant_schema)
+
+
 def _commit_or_400(db: Session, error_message: str, details: dict | None = None) -> None:
     try:
         _commit_with_tenant_context(db)
@@ -219,6 +255,8 @@ def _warehouse_has_dependencies(db: Session, warehouse_id: int) -> bool:
         db.query(PurchaseReturn.id).filter(PurchaseReturn.warehouse_id == warehouse_id),
         db.query(PurchaseCreditNote.id).filter(PurchaseCreditNote.warehouse_id == warehouse_id),
         db.query(InventoryLedger.id).filter(InventoryLedger.warehouse_id == warehouse_id),
+        # Every archived ledger row is carried by a checkpoint for its bucket.
+        db.query(InventoryCheckpoint.id).filter(InventoryCheckpoint.warehouse_id == warehouse_id),
         db.query(StockSummary.id).filter(StockSummary.warehouse_id == warehouse_id),
         db.query(StockCorrection.id).filter(StockCorrection.warehouse_id == warehouse_id),
         db.query(StockAdjustment.id).filter(StockAdjustment.warehouse_id == warehouse_id),
@@ -265,6 +303,7 @@ def _delete_or_deactivate_warehouse(
         warehouse.is_active = False
         for rack in warehouse.racks:
             rack.is_active = False
+        bump_data_version(db, "warehouses")
         _commit_or_400(db, "Failed to deactivate warehouse")
         db.refresh(warehouse)
         return WarehouseDeleteResult(
@@ -276,6 +315,8 @@ def _delete_or_deactivate_warehouse(
 
     warehouse_snapshot = WarehouseRead.model_validate(warehouse)
     db.delete(warehouse)
+    bump_data_version(db, "warehouses")
+    record_dashboard_delta(db, total_warehouses=-1)
     _commit_or_400(db, "Failed to delete warehouse")
     return WarehouseDeleteResult(
         id=warehouse_snapshot.id,
@@ -379,6 +420,11 @@ def _ensure_unique_party_identifiers(
                 details={"field": "gstin"},
             )
 
+
+def _party_code_for_id(party_id: int) -> str:
+    return f"PTY-{party_id:06d}"
+
+
 def _assign_party_code(party: Party) -> None:
     if party.id is None:
         raise AppException(
@@ -386,7 +432,7 @@ def _assign_party_code(party: Party) -> None:
             message="Party code cannot be generated before the party is created",
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-    party.party_code = f"PTY-{party.id:06d}"
+    party.party_code = _party_code_for_id(party.id)
 
 
 def _default_party_types_for_category(name: str) -> list[str]:
@@ -455,20 +501,7 @@ def _count_active_parties_for_category(db: Session, category_name: str) -> int:
     )
 
 
-def _validate_active_party_category_name(
-    db: Session, category_name: str | None, party_type: str | None = None
-) -> str | None:
-    normalized_category = _to_nullable_text(category_name)
-    if not normalized_category:
-        return None
-
-    _ensure_default_party_categories(db)
-    category_record = (
-        db.query(Category)
-        .filter(func.lower(Category.name) == normalized_category.lower())
-        .filter(Category.is_active.is_(True))
-        .first()
-    )
+def _check_party_category(category_record: Category | None, party_type: str | None) -> str:
     if category_record is None:
         raise AppException(
             error_code="VALIDATION_ERROR",
@@ -498,6 +531,44 @@ def _validate_active_party_category_name(
     return category_record.name
 
 
+def _validate_active_party_category_name(
+    db: Session, category_name: str | None, party_type: str | None = None
+) -> str | None:
+    normalized_category = _to_nullable_text(category_name)
+    if not normalized_category:
+        return None
+
+    _ensure_default_party_categories(db)
+    category_record = (
+        db.query(Category)
+        .filter(func.lower(Category.name) == normalized_category.lower())
+        .filter(Category.is_active.is_(True))
+        .first()
+    )
+    return _check_party_category(category_record, party_type)
+
+
+def _load_active_party_categories(db: Session) -> dict[str, Category]:
+    """Active party categories keyed by lower-cased name, for validating many rows
+    without a lookup per row."""
+    _ensure_default_party_categories(db)
+    categories: dict[str, Category] = {}
+    for category in db.query(Category).filter(Category.is_active.is_(True)).all():
+        categories.setdefault(category.name.strip().lower(), category)
+    return categories
+
+
+def _check_active_party_category(
+    active_categories: dict[str, Category],
+    category_name: str | None,
+    party_type: str | None = None,
+) -> str | None:
+    normalized_category = _to_nullable_text(category_name)
+    if not normalized_category:
+        return None
+    return _check_party_category(active_categories.get(normalized_category.lower()), party_type)
+
+
 def _ensure_master_brands_from_products(db: Session) -> bool:
     existing_names = {
         str(name).strip().lower()
@@ -813,7 +884,15 @@ def _ensure_unique_brand_name(
         )
 
 
-def _validate_active_brand_name(db: Session, brand_name: str | None) -> str:
+def _resolve_active_brand_name(
+    brand_name: str | None,
+    find_active: Callable[[str], str | None],
+) -> str:
+    """The active manufacturer ``brand_name`` names, as ``find_active`` looks it up.
+
+    Shared by the interactive and import paths so both reject the same input
+    the same way.
+    """
     normalized_brand = _to_text(brand_name)
     if not normalized_brand:
         raise AppException(
@@ -822,22 +901,29 @@ def _validate_active_brand_name(db: Session, brand_name: str | None) -> str:
             status_code=status.HTTP_400_BAD_REQUEST,
             details={"field": "brand"},
         )
-
-    _ensure_master_brands_from_products(db)
-    brand_record = (
-        db.query(Brand)
-        .filter(func.lower(Brand.name) == normalized_brand.lower())
-        .filter(Brand.is_active.is_(True))
-        .first()
-    )
-    if brand_record is None:
+    brand = find_active(normalized_brand)
+    if brand is None:
         raise AppException(
             error_code="VALIDATION_ERROR",
             message="Manufacturer must exist in Master Settings and be active",
             status_code=status.HTTP_400_BAD_REQUEST,
             details={"field": "brand"},
         )
-    return brand_record.name
+    return brand
+
+
+def _validate_active_brand_name(db: Session, brand_name: str | None) -> str:
+    def _find_active(normalized_brand: str) -> str | None:
+        _ensure_master_brands_from_products(db)
+        return (
+            db.query(Brand.name)
+            .filter(func.lower(Brand.name) == normalized_brand.lower())
+            .filter(Brand.is_active.is_(True))
+            .limit(1)
+            .scalar()
+        )
+
+    return _resolve_active_brand_name(brand_name, _find_active)
 
 
 def _validate_active_tax_rate(db: Session, gst_rate: Decimal | None) -> Decimal | None:
@@ -872,21 +958,25 @@ def _validate_default_warehouse_id(db: Session, warehouse_id: int | None) -> int
         .first()
     )
     if warehouse is None:
-        raise AppException(
-            error_code="VALIDATION_ERROR",
-            message="Default warehouse must exist and be active",
-            status_code=status.HTTP_400_BAD_REQUEST,
-            details={"field": "default_warehouse_id"},
-        )
+        _raise_inactive_default_warehouse()
     return warehouse.id
 
 
-def _validate_rack_number(
-    db: Session,
-    *,
+def _raise_inactive_default_warehouse() -> NoReturn:
+    raise AppException(
+        error_code="VALIDATION_ERROR",
+        message="Default warehouse must exist and be active",
+        status_code=status.HTTP_400_BAD_REQUEST,
+        details={"field": "default_warehouse_id"},
+    )
+
+
+def _resolve_active_rack_number(
     warehouse_id: int | None,
     rack_number: str | None,
+    find_active: Callable[[int, str], str | None],
 ) -> str | None:
+    """Like :func:`_resolve_active_brand_name`, for a rack in ``warehouse_id``."""
     normalized_rack_number = _to_nullable_text(rack_number)
     if normalized_rack_number is None:
         return None
@@ -898,55 +988,113 @@ def _validate_rack_number(
             status_code=status.HTTP_400_BAD_REQUEST,
             details={"field": "rack_number"},
         )
-
-    rack = (
-        db.query(Rack)
-        .filter(Rack.warehouse_id == warehouse_id)
-        .filter(func.lower(Rack.rack_number) == normalized_rack_number.lower())
-        .filter(Rack.is_active.is_(True))
-        .first()
-    )
+    rack = find_active(warehouse_id, normalized_rack_number)
     if rack is None:
         raise AppException(
             error_code="VALIDATION_ERROR",
             message="Rack number must exist in the selected warehouse and be active",
             status_code=status.HTTP_400_BAD_REQUEST,
             details={"field": "rack_number"},
-    )
-    return rack.rack_number
+        )
+    return rack
+
+
+def _validate_rack_number(
+    db: Session,
+    *,
+    warehouse_id: int | None,
+    rack_number: str | None,
+) -> str | None:
+    def _find_active(rack_warehouse_id: int, normalized_rack_number: str) -> str | None:
+        return (
+            db.query(Rack.rack_number)
+            .filter(Rack.warehouse_id == rack_warehouse_id)
+            .filter(func.lower(Rack.rack_number) == normalized_rack_number.lower())
+            .filter(Rack.is_active.is_(True))
+            .limit(1)
+            .scalar()
+        )
+
+    return _resolve_active_rack_number(warehouse_id, rack_number, _find_active)
 
 
 def _normalize_rack_number_value(rack_number: str | None) -> str | None:
     return _to_nullable_text(rack_number)
 
 
+@dataclass
+class _ProductImportLookups:
+    """Master data a product import validates against, loaded once per import."""
+
+    brands: dict[str, str]
+    warehouse_ids: set[int]
+    warehouse_ids_by_code: dict[str, int]
+    racks: dict[tuple[int, str], str]
+    tax_rates: set[Decimal]
+    skus: set[str]
+
+
+def _load_product_import_lookups(db: Session) -> _ProductImportLookups:
+    _ensure_master_brands_from_products(db)
+    brands: dict[str, str] = {}
+    for (name,) in db.query(Brand.name).filter(Brand.is_active.is_(True)).all():
+        brands.setdefault(name.lower(), name)
+
+    warehouse_ids: set[int] = set()
+    warehouse_ids_by_code: dict[str, int] = {}
+    for warehouse_id, code in (
+        db.query(Warehouse.id, Warehouse.code).filter(Warehouse.is_active.is_(True)).all()
+    ):
+        warehouse_ids.add(warehouse_id)
+        warehouse_ids_by_code.setdefault(code.lower(), warehouse_id)
+
+    racks: dict[tuple[int, str], str] = {}
+    for warehouse_id, rack_number in (
+        db.query(Rack.warehouse_id, Rack.rack_number).filter(Rack.is_active.is_(True)).all()
+    ):
+        racks.setdefault((warehouse_id, rack_number.lower()), rack_number)
+
+    return _ProductImportLookups(
+        brands=brands,
+        warehouse_ids=warehouse_ids,
+        warehouse_ids_by_code=warehouse_ids_by_code,
+        racks=racks,
+        tax_rates={
+            Decimal(str(rate_percent)).quantize(Decimal("0.01"))
+            for (rate_percent,) in db.query(TaxRate.rate_percent)
+            .filter(TaxRate.is_active.is_(True))
+            .all()
+        },
+        skus={sku for (sku,) in db.query(Product.sku).all()},
+    )
+
+
+def _validate_brand_for_import(lookups: _ProductImportLookups, brand_name: str | None) -> str:
+    return _resolve_active_brand_name(brand_name, lambda name: lookups.brands.get(name.lower()))
+
+
 def _validate_default_warehouse_for_import(
-    db: Session,
+    lookups: _ProductImportLookups,
     warehouse_id_text: str | None,
     warehouse_code_text: str | None,
 ) -> int | None:
     normalized_code = _to_text(warehouse_code_text)
     if normalized_code:
-        warehouse = (
-            db.query(Warehouse)
-            .filter(func.lower(Warehouse.code) == normalized_code.lower())
-            .filter(Warehouse.is_active.is_(True))
-            .first()
-        )
-        if warehouse is None:
+        warehouse_id = lookups.warehouse_ids_by_code.get(normalized_code.lower())
+        if warehouse_id is None:
             raise AppException(
                 error_code="VALIDATION_ERROR",
                 message="Default warehouse code must exist and be active",
                 status_code=status.HTTP_400_BAD_REQUEST,
                 details={"field": "default_warehouse_code"},
             )
-        return warehouse.id
+        return warehouse_id
 
     normalized_id = _to_text(warehouse_id_text)
     if not normalized_id:
         return None
     try:
-        return _validate_default_warehouse_id(db, int(normalized_id))
+        warehouse_id = int(normalized_id)
     except ValueError as error:
         raise AppException(
             error_code="VALIDATION_ERROR",
@@ -954,15 +1102,22 @@ def _validate_default_warehouse_for_import(
             status_code=status.HTTP_400_BAD_REQUEST,
             details={"field": "default_warehouse_id"},
         ) from error
+    if warehouse_id not in lookups.warehouse_ids:
+        _raise_inactive_default_warehouse()
+    return warehouse_id
 
 
 def _validate_rack_for_import(
-    db: Session,
+    lookups: _ProductImportLookups,
     *,
     warehouse_id: int | None,
     rack_number: str | None,
 ) -> str | None:
-    return _validate_rack_number(db, warehouse_id=warehouse_id, rack_number=rack_number)
+    return _resolve_active_rack_number(
+        warehouse_id,
+        rack_number,
+        lambda rack_warehouse_id, name: lookups.racks.get((rack_warehouse_id, name.lower())),
+    )
 
 
 def _parse_import_bool(value: object, *, default: bool = False) -> bool:
@@ -972,20 +1127,18 @@ def _parse_import_bool(value: object, *, default: bool = False) -> bool:
     return normalized in {"true", "yes", "1", "y", "active"}
 
 
-@router.get("/parties", response_model=list[PartyRead])
-def list_parties(
-    include_inactive: bool = Query(default=False),
-    party_type: PartyType | None = Query(default=None),
-    party_category: str | None = Query(default=None),
-    state: str | None = Query(default=None),
-    city: str | None = Query(default=None),
-    gstin: str | None = Query(default=None),
-    is_active: bool | None = Query(default=None),
-    search: str | None = Query(default=None),
-    db: Session = Depends(get_db),
-    current_user=Depends(require_permission("party:view")),
+def _load_parties(
+    db: Session,
+    *,
+    include_inactive: bool,
+    party_type: PartyType | None,
+    party_category: str | None,
+    state: str | None,
+    city: str | None,
+    gstin: str | None,
+    is_active: bool | None,
+    search: str | None,
 ) -> list[PartyRead]:
-    _ = current_user
     query = db.query(Party).order_by(Party.name.asc())
     if is_active is not None:
         query = query.filter(Party.is_active.is_(is_active))
@@ -1001,25 +1154,130 @@ def list_parties(
         query = query.filter(func.lower(Party.city) == city.strip().lower())
     if gstin:
         query = query.filter(func.upper(Party.gstin) == gstin.strip().upper())
-    if search:
-        like_query = f"%{search.strip()}%"
-        query = query.filter(
-            Party.name.ilike(like_query)
-            | Party.display_name.ilike(like_query)
-            | Party.contact_person.ilike(like_query)
-            | Party.gstin.ilike(like_query)
-            | Party.city.ilike(like_query)
+    text_search = build_text_search(db, search)
+    if text_search is not None:
+        document = party_search_document()
+        query = query.filter(text_search.matches(document)).order_by(None).order_by(
+            text_search.rank(document), Party.name.asc()
         )
-    return query.all()
+    return [PartyRead.model_validate(party) for party in query.all()]
+
+
+@router.get(
+    "/parties",
+    response_model=list[PartyRead],
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_parties(
+    request: Request,
+    response: Response,
+    include_inactive: bool = Query(default=False),
+    party_type: PartyType | None = Query(default=None),
+    party_category: str | None = Query(default=None),
+    state: str | None = Query(default=None),
+    city: str | None = Query(default=None),
+    gstin: str | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    search: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(require_permission("party:view")),
+) -> list[PartyRead] | Response:
+    _ = current_user
+    not_modified_response = await db.run_sync(
+        conditional_list_response, request, response, ("parties",)
+    )
+    if not_modified_response is not None:
+        return not_modified_response
+    return await db.run_sync(
+        _load_parties,
+        include_inactive=include_inactive,
+        party_type=party_type,
+        party_category=party_category,
+        state=state,
+        city=city,
+        gstin=gstin,
+        is_active=is_active,
+        search=search,
+    )
+
+
+def _load_party_summaries(
+    db: Session,
+    *,
+    include_inactive: bool,
+    party_type: PartyType | None,
+    search: str | None,
+    cursor: str | None,
+    limit: int,
+    fields: str | None,
+) -> PartySummaryPage:
+    stmt = select().select_from(Party)
+    if not include_inactive:
+        stmt = stmt.where(Party.is_active.is_(True))
+    if party_type is not None:
+        stmt = stmt.where(Party.party_type == party_type.value)
+    text_search = build_text_search(db, search)
+    if text_search is not None:
+        stmt = stmt.where(text_search.matches(party_search_document()))
+    columns = {name: getattr(Party, name) for name in PartySummary.model_fields}
+    items, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns=columns,
+        fields=parse_fields(fields, list(columns)),
+        sort_keys=[Party.name, Party.id],
+        descending=False,
+        cursor=cursor,
+        limit=limit,
+    )
+    return PartySummaryPage(
+        items=[PartySummary.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/parties/summary",
+    response_model=PartySummaryPage,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_party_summaries(
+    include_inactive: bool = Query(default=False),
+    party_type: PartyType | None = Query(default=None),
+    search: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    fields: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(require_permission("party:view")),
+) -> PartySummaryPage:
+    """Cursor-paginated party list ordered by name; pass ``next_cursor`` back as
+    ``cursor`` and ``fields`` (comma separated) for a sparse projection."""
+    _ = current_user
+    return await db.run_sync(
+        _load_party_summaries,
+        include_inactive=include_inactive,
+        party_type=party_type,
+        search=search,
+        cursor=cursor,
+        limit=limit,
+        fields=fields,
+    )
 
 
 @router.get("/brands", response_model=list[BrandRead])
 def list_brands(
+    request: Request,
+    response: Response,
     include_inactive: bool = Query(default=False),
     db: Session = Depends(get_db),
     current_user=Depends(require_permission("masters:view")),
-) -> list[BrandRead]:
+) -> list[BrandRead] | Response:
     _ = current_user
+    not_modified_response = conditional_list_response(db, request, response, ("brands", "products"))
+    if not_modified_response is not None:
+        return not_modified_response
     if _ensure_master_brands_from_products(db):
         _commit_or_400(db, "Failed to prepare existing brands")
     query = db.query(Brand).order_by(Brand.name.asc())
@@ -1037,6 +1295,7 @@ def create_brand(
     _ensure_unique_brand_name(db, name=payload.name)
     brand = Brand(**payload.model_dump())
     db.add(brand)
+    bump_data_version(db, "brands")
     _commit_or_400(db, "Failed to create brand")
     write_audit_log(
         db,
@@ -1070,6 +1329,7 @@ def update_brand(
     for field, value in updates.items():
         setattr(brand, field, value)
 
+    bump_data_version(db, "brands")
     _commit_or_400(db, "Failed to update brand")
     write_audit_log(
         db,
@@ -1098,6 +1358,7 @@ def delete_brand(
     before_snapshot = snapshot_model(brand)
     brand_snapshot = BrandRead.model_validate(brand)
     db.delete(brand)
+    bump_data_version(db, "brands")
     _commit_or_400(db, "Failed to delete brand")
     write_audit_log(
         db,
@@ -1176,11 +1437,16 @@ def _ensure_unique_uom_name(db: Session, *, name: str, exclude_uom_id: int | Non
 
 @router.get("/uoms", response_model=list[UomRead])
 def list_uoms(
+    request: Request,
+    response: Response,
     include_inactive: bool = Query(default=False),
     db: Session = Depends(get_db),
     current_user=Depends(require_permission("masters:view")),
-) -> list[UomRead]:
+) -> list[UomRead] | Response:
     _ = current_user
+    not_modified_response = conditional_list_response(db, request, response, ("uoms", "products"))
+    if not_modified_response is not None:
+        return not_modified_response
     if _ensure_master_uoms_from_products(db):
         _commit_or_400(db, "Failed to prepare units of measure")
     query = db.query(Uom).order_by(Uom.name.asc())
@@ -1198,6 +1464,7 @@ def create_uom(
     _ensure_unique_uom_name(db, name=payload.name)
     uom = Uom(**payload.model_dump())
     db.add(uom)
+    bump_data_version(db, "uoms")
     _commit_or_400(db, "Failed to create unit of measure")
     write_audit_log(
         db,
@@ -1229,6 +1496,7 @@ def update_uom(
     before_snapshot = snapshot_model(uom)
     for field, value in updates.items():
         setattr(uom, field, value)
+    bump_data_version(db, "uoms")
     _commit_or_400(db, "Failed to update unit of measure")
     write_audit_log(
         db,
@@ -1257,6 +1525,7 @@ def delete_uom(
     before_snapshot = snapshot_model(uom)
     uom_snapshot = UomRead.model_validate(uom)
     db.delete(uom)
+    bump_data_version(db, "uoms")
     _commit_or_400(db, "Failed to delete unit of measure")
     write_audit_log(
         db,
@@ -1275,11 +1544,16 @@ def delete_uom(
 
 @router.get("/categories", response_model=list[CategoryRead])
 def list_categories(
+    request: Request,
+    response: Response,
     include_inactive: bool = Query(default=False),
     db: Session = Depends(get_db),
     current_user=Depends(_require_masters_or_party_view),
-) -> list[CategoryRead]:
+) -> list[CategoryRead] | Response:
     _ = current_user
+    not_modified_response = conditional_list_response(db, request, response, ("categories",))
+    if not_modified_response is not None:
+        return not_modified_response
     if _ensure_default_party_categories(db):
         _commit_or_400(db, "Failed to prepare default party categories")
     query = db.query(Category).order_by(Category.name.asc())
@@ -1298,6 +1572,7 @@ def create_category(
     _ensure_unique_category_name(db, name=payload.name)
     category = Category(**payload.model_dump())
     db.add(category)
+    bump_data_version(db, "categories")
     _commit_or_400(db, "Failed to create category")
     write_audit_log(
         db,
@@ -1348,6 +1623,7 @@ def update_category(
             .update({"party_category": category.name}, synchronize_session=False)
         )
 
+    bump_data_version(db, "categories", "parties")
     _commit_or_400(db, "Failed to update category")
     write_audit_log(
         db,
@@ -1385,6 +1661,7 @@ def delete_category(
     before_snapshot = snapshot_model(category)
     category_snapshot = CategoryRead.model_validate(category)
     db.delete(category)
+    bump_data_version(db, "categories")
     _commit_or_400(db, "Failed to delete category")
     write_audit_log(
         db,
@@ -1476,6 +1753,8 @@ def create_party(
         slot=2,
     )
     _assign_party_code(party)
+    bump_data_version(db, "parties")
+    record_dashboard_delta(db, total_parties=1)
     _commit_or_400(db, "Failed to create party")
     write_audit_log(
         db,
@@ -1590,6 +1869,7 @@ def update_party(
     if not party.party_code:
         _assign_party_code(party)
 
+    bump_data_version(db, "parties")
     _commit_or_400(db, "Failed to update party")
     write_audit_log(
         db,
@@ -1618,6 +1898,75 @@ def replace_party(
     return update_party(party_id=party_id, payload=payload, db=db, current_user=current_user)
 
 
+def _bulk_party_row_payload(row: dict) -> dict:
+    return {
+        "party_name": _to_text(row.get("party_name") or row.get("name")),
+        "display_name": _to_text(row.get("display_name")) or None,
+        "party_type": _to_text(row.get("party_type") or row.get("type")) or "CUSTOMER",
+        "party_category": _to_text(row.get("party_category") or row.get("category")) or None,
+        "contact_person": _to_text(row.get("contact_person")) or None,
+        "designation": _to_text(row.get("designation")) or None,
+        "mobile": _to_text(row.get("mobile") or row.get("phone")) or None,
+        "whatsapp_no": _to_text(row.get("whatsapp_no")) or None,
+        "office_phone": _to_text(row.get("office_phone")) or None,
+        "email": _to_text(row.get("email")) or None,
+        "website": _to_text(row.get("website")) or None,
+        "address_line_1": _to_text(row.get("address_line_1") or row.get("address")) or None,
+        "address_line_2": _to_text(row.get("address_line_2")) or None,
+        "state": _to_text(row.get("state")) or None,
+        "city": _to_text(row.get("city")) or None,
+        "pincode": _to_text(row.get("pincode")) or None,
+        "country": _to_text(row.get("country")) or "India",
+        "gstin": _to_text(row.get("gstin")) or None,
+        "pan_number": _to_text(row.get("pan_number")) or None,
+        "registration_type": _to_text(row.get("registration_type")) or None,
+        "drug_license_number": _to_text(row.get("drug_license_number")) or None,
+        "fssai_number": _to_text(row.get("fssai_number")) or None,
+        "udyam_number": _to_text(row.get("udyam_number")) or None,
+        "credit_limit": _to_text(row.get("credit_limit")) or Decimal("0.00"),
+        "payment_terms": _to_text(row.get("payment_terms")) or None,
+        "opening_balance": _to_text(row.get("opening_balance")) or Decimal("0.00"),
+        "outstanding_tracking_mode": _to_text(row.get("outstanding_tracking_mode")) or None,
+        "is_active": True,
+    }
+
+
+def _insert_party_chunk(
+    db: Session,
+    pending: list[tuple[int, dict]],
+    errors: list[BulkImportError],
+) -> list[int]:
+    """Insert validated party rows with one multi-row INSERT ... RETURNING, then
+    stamp their party codes in a single executemany UPDATE. If the chunk trips a
+    constraint, it is replayed row by row so only the offending rows are reported."""
+    if not pending:
+        return []
+
+    insert_stmt = insert(Party).returning(Party.id, Party.gstin, sort_by_parameter_order=True)
+    try:
+        with db.begin_nested():
+            inserted = db.execute(insert_stmt, [payload for _, payload in pending]).all()
+    except IntegrityError:
+        inserted = []
+        for index, payload in pending:
+            try:
+                with db.begin_nested():
+                    inserted.append(db.execute(insert_stmt, [payload]).one())
+            except IntegrityError as error:
+                errors.append(_bulk_error(index, str(error.orig or error)))
+
+    party_ids = [row.id for row in inserted]
+    if party_ids:
+        db.execute(
+            update(Party),
+            [{"id": party_id, "party_code": _party_code_for_id(party_id)} for party_id in party_ids],
+        )
+        note_inserted_records(
+            db, Party, party_ids, grouped_values={"gstin": [row.gstin for row in inserted]}
+        )
+    return party_ids
+
+
 @router.post("/parties/bulk", response_model=BulkImportResult)
 async def bulk_create_parties(
     request: Request,
@@ -1626,68 +1975,59 @@ async def bulk_create_parties(
 ) -> BulkImportResult:
     rows = await _read_bulk_rows(request)
     errors: list[BulkImportError] = []
-    created_count = 0
     created_party_ids: list[int] = []
 
-    for index, row in enumerate(rows, start=1):
-        if not isinstance(row, dict):
-            errors.append(_bulk_error(index, "Row must be an object"))
-            continue
+    # Resolve every lookup once up front; rows are then validated in memory and
+    # only touch the database when a whole chunk is inserted.
+    active_categories = _load_active_party_categories(db)
+    known_gstins = {
+        gstin.upper()
+        for (gstin,) in db.query(Party.gstin).filter(Party.gstin.isnot(None)).all()
+        if gstin
+    }
 
-        row_payload = {
-            "party_name": _to_text(row.get("party_name") or row.get("name")),
-            "display_name": _to_text(row.get("display_name")) or None,
-            "party_type": _to_text(row.get("party_type") or row.get("type")) or "CUSTOMER",
-            "party_category": _to_text(row.get("party_category") or row.get("category")) or None,
-            "contact_person": _to_text(row.get("contact_person")) or None,
-            "designation": _to_text(row.get("designation")) or None,
-            "mobile": _to_text(row.get("mobile") or row.get("phone")) or None,
-            "whatsapp_no": _to_text(row.get("whatsapp_no")) or None,
-            "office_phone": _to_text(row.get("office_phone")) or None,
-            "email": _to_text(row.get("email")) or None,
-            "website": _to_text(row.get("website")) or None,
-            "address_line_1": _to_text(row.get("address_line_1") or row.get("address")) or None,
-            "address_line_2": _to_text(row.get("address_line_2")) or None,
-            "state": _to_text(row.get("state")) or None,
-            "city": _to_text(row.get("city")) or None,
-            "pincode": _to_text(row.get("pincode")) or None,
-            "country": _to_text(row.get("country")) or "India",
-            "gstin": _to_text(row.get("gstin")) or None,
-            "pan_number": _to_text(row.get("pan_number")) or None,
-            "registration_type": _to_text(row.get("registration_type")) or None,
-            "drug_license_number": _to_text(row.get("drug_license_number")) or None,
-            "fssai_number": _to_text(row.get("fssai_number")) or None,
-            "udyam_number": _to_text(row.get("udyam_number")) or None,
-            "credit_limit": _to_text(row.get("credit_limit")) or Decimal("0.00"),
-            "payment_terms": _to_text(row.get("payment_terms")) or None,
-            "opening_balance": _to_text(row.get("opening_balance")) or Decimal("0.00"),
-            "outstanding_tracking_mode": _to_text(row.get("outstanding_tracking_mode")) or None,
-            "is_active": True,
-        }
+    for chunk_start in range(0, len(rows), PARTY_IMPORT_CHUNK_SIZE):
+        pending: list[tuple[int, dict]] = []
+        chunk = rows[chunk_start : chunk_start + PARTY_IMPORT_CHUNK_SIZE]
+        for index, row in enumerate(chunk, start=chunk_start + 1):
+            if not isinstance(row, dict):
+                errors.append(_bulk_error(index, "Row must be an object"))
+                continue
 
-        try:
-            with db.begin_nested():
-                party_input = PartyCreate(**row_payload)
+            try:
+                party_input = PartyCreate(**_bulk_party_row_payload(row))
                 party_model_payload = _normalize_party_payload(party_input.model_dump())
-                party_model_payload["party_category"] = _validate_active_party_category_name(
-                    db, party_model_payload.get("party_category")
+                party_model_payload["party_category"] = _check_active_party_category(
+                    active_categories,
+                    party_model_payload.get("party_category"),
                 )
-                _ensure_unique_party_identifiers(
-                    db,
-                    gstin=party_model_payload.get("gstin"),
+                gstin = party_model_payload.get("gstin")
+                if gstin:
+                    if gstin.upper() in known_gstins:
+                        raise AppException(
+                            error_code="VALIDATION_ERROR",
+                            message="GSTIN already exists for another party",
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            details={"field": "gstin"},
+                        )
+                    known_gstins.add(gstin.upper())
+            except AppException as error:
+                errors.append(
+                    _bulk_error(index, error.message, (error.details or {}).get("field"))
                 )
-                party = Party(**party_model_payload)
-                db.add(party)
-                db.flush()
-                _assign_party_code(party)
-                created_party_ids.append(party.id)
-            created_count += 1
-        except AppException as error:
-            errors.append(
-                _bulk_error(index, error.message, (error.details or {}).get("field"))
-            )
-        except Exception as error:  # pydantic validation or db validation
-            errors.append(_bulk_error(index, str(error)))
+                continue
+            except Exception as error:  # pydantic validation
+                errors.append(_bulk_error(index, str(error)))
+                continue
+            pending.append((index, party_model_payload))
+
+        created_party_ids.extend(_insert_party_chunk(db, pending, errors))
+
+    created_count = len(created_party_ids)
+    errors.sort(key=lambda error: error.row)
+    if created_party_ids:
+        bump_data_version(db, "parties")
+        record_dashboard_delta(db, total_parties=created_count)
 
     try:
         db.commit()
@@ -1732,6 +2072,7 @@ def delete_party(
     party = _get_or_404(db, Party, party_id, "Party")
     before_snapshot = snapshot_model(party)
     party.is_active = False
+    bump_data_version(db, "parties")
     _commit_or_400(db, "Failed to deactivate party")
     write_audit_log(
         db,
@@ -1822,6 +2163,7 @@ def save_drug_license_verification_session(
         remarks=payload.remarks,
         slot=payload.slot,
     )
+    bump_data_version(db, "parties")
     _commit_or_400(db, "Failed to save verified drug licence data")
     write_audit_log(
         db,
@@ -1980,6 +2322,7 @@ def save_gst_verification_session(
         saved_by=current_user.id,
         remarks=payload.remarks,
     )
+    bump_data_version(db, "parties")
     _commit_or_400(db, "Failed to save verified GST data")
     write_audit_log(
         db,
@@ -2055,34 +2398,46 @@ def get_gst_verification_history_detail(
     return _serialize_gst_log(_get_gst_log_or_404(db, log_id))
 
 
-@router.get("/products", response_model=list[ProductRead])
-def list_products(
-    include_inactive: bool = Query(default=False),
-    db: Session = Depends(get_db),
-    current_user=Depends(require_permission("masters:view")),
-) -> list[ProductRead]:
-    _ = current_user
+def _load_products(db: Session, *, include_inactive: bool) -> list[ProductRead]:
     query = db.query(Product).options(joinedload(Product.default_warehouse)).order_by(Product.name.asc())
     if not include_inactive:
         query = query.filter(Product.is_active.is_(True))
-    return query.all()
+    return [ProductRead.model_validate(product) for product in query.all()]
 
 
-@router.get("/products/page", response_model=ProductListResponse)
-def list_products_page(
-    search: str | None = Query(default=None),
-    brand: str | None = Query(default=None),
-    category: str | None = Query(default=None),
-    default_warehouse_id: int | None = Query(default=None),
-    is_active: bool | None = Query(default=None),
-    decimal_allowed: bool | None = Query(default=None),
-    page: int = Query(default=1, ge=1),
-    page_size: int = Query(default=25, ge=1, le=200),
-    db: Session = Depends(get_db),
+@router.get(
+    "/products",
+    response_model=list[ProductRead],
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_products(
+    request: Request,
+    response: Response,
+    include_inactive: bool = Query(default=False),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(require_permission("masters:view")),
-) -> ProductListResponse:
-    """Server-side paginated/searchable product list for the Product Master table."""
+) -> list[ProductRead] | Response:
     _ = current_user
+    not_modified_response = await db.run_sync(
+        conditional_list_response, request, response, ("products", "warehouses")
+    )
+    if not_modified_response is not None:
+        return not_modified_response
+    return await db.run_sync(_load_products, include_inactive=include_inactive)
+
+
+def _load_products_page(
+    db: Session,
+    *,
+    search: str | None,
+    brand: str | None,
+    category: str | None,
+    default_warehouse_id: int | None,
+    is_active: bool | None,
+    decimal_allowed: bool | None,
+    page: int,
+    page_size: int,
+) -> ProductListResponse:
     query = db.query(Product).options(joinedload(Product.default_warehouse))
 
     if is_active is not None:
@@ -2098,30 +2453,137 @@ def list_products_page(
             query = query.filter(Product.quantity_precision > 0)
         else:
             query = query.filter(Product.quantity_precision == 0)
-    if search and search.strip():
-        pattern = f"%{search.strip().lower()}%"
-        query = query.filter(
-            or_(
-                func.lower(Product.sku).like(pattern),
-                func.lower(Product.name).like(pattern),
-                func.lower(func.coalesce(Product.display_name, "")).like(pattern),
-                func.lower(func.coalesce(Product.brand, "")).like(pattern),
-                func.lower(func.coalesce(Product.category, "")).like(pattern),
-                func.lower(func.coalesce(Product.rack_number, "")).like(pattern),
-                Product.default_warehouse.has(func.lower(Warehouse.name).like(pattern)),
-            )
-        )
-
-    total = query.count()
-    rows = (
-        query.order_by(Product.name.asc())
+    order_by = [Product.name.asc()]
+    text_search = build_text_search(db, search)
+    if text_search is not None:
+        document = product_search_document()
+        conditions = [text_search.matches(document)]
+        warehouse_ids = matching_warehouse_ids(db, text_search)
+        if warehouse_ids:
+            conditions.append(Product.default_warehouse_id.in_(warehouse_ids))
+        query = query.filter(or_(*conditions))
+        order_by.insert(0, text_search.rank(document))
+
+    # The total rides along as a window aggregate instead of a second COUNT query.
+    page_rows = (
+        query.add_columns(func.count().over())
+        .order_by(*order_by)
         .offset((page - 1) * page_size)
         .limit(page_size)
         .all()
     )
+    rows = [product for product, _total in page_rows]
+    total = page_rows[0][1] if page_rows else (query.count() if page > 1 else 0)
     return ProductListResponse(total=total, page=page, page_size=page_size, data=rows)
 
 
+@router.get(
+    "/products/page",
+    response_model=ProductListResponse,
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_products_page(
+    search: str | None = Query(default=None),
+    brand: str | None = Query(default=None),
+    category: str | None = Query(default=None),
+    default_warehouse_id: int | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    decimal_allowed: bool | None = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=25, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(require_permission("masters:view")),
+) -> ProductListResponse:
+    """Server-side paginated/searchable product list for the Product Master table."""
+    _ = current_user
+    return await db.run_sync(
+        _load_products_page,
+        search=search,
+        brand=brand,
+        category=category,
+        default_warehouse_id=default_warehouse_id,
+        is_active=is_active,
+        decimal_allowed=decimal_allowed,
+        page=page,
+        page_size=page_size,
+    )
+
+
+def _load_product_summaries(
+    db: Session,
+    *,
+    include_inactive: bool,
+    brand: str | None,
+    category: str | None,
+    search: str | None,
+    cursor: str | None,
+    limit: int,
+    fields: str | None,
+) -> ProductSummaryPage:
+    stmt = select().select_from(Product).outerjoin(
+        Warehouse, Warehouse.id == Product.default_warehouse_id
+    )
+    if not include_inactive:
+        stmt = stmt.where(Product.is_active.is_(True))
+    if brand:
+        stmt = stmt.where(Product.brand == brand)
+    if category:
+        stmt = stmt.where(Product.category == category)
+    text_search = build_text_search(db, search)
+    if text_search is not None:
+        stmt = stmt.where(text_search.matches(product_search_document()))
+    columns = {
+        name: Warehouse.name if name == "default_warehouse_name" else getattr(Product, name)
+        for name in ProductSummary.model_fields
+    }
+    items, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns=columns,
+        fields=parse_fields(fields, list(columns)),
+        sort_keys=[Product.name, Product.id],
+        descending=False,
+        cursor=cursor,
+        limit=limit,
+    )
+    return ProductSummaryPage(
+        items=[ProductSummary.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/products/summary",
+    response_model=ProductSummaryPage,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_product_summaries(
+    include_inactive: bool = Query(default=False),
+    brand: str | None = Query(default=None),
+    category: str | None = Query(default=None),
+    search: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    fields: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(require_permission("masters:view")),
+) -> ProductSummaryPage:
+    """Cursor-paginated product list ordered by name; pass ``next_cursor`` back as
+    ``cursor`` and ``fields`` (comma separated) for a sparse projection."""
+    _ = current_user
+    return await db.run_sync(
+        _load_product_summaries,
+        include_inactive=include_inactive,
+        brand=brand,
+        category=category,
+        search=search,
+        cursor=cursor,
+        limit=limit,
+        fields=fields,
+    )
+
+
 @router.get("/products/categories", response_model=list[str])
 def list_product_categories(
     db: Session = Depends(get_db),
@@ -2165,6 +2627,8 @@ def create_product(
     )
     product = Product(**payload_data)
     db.add(product)
+    bump_data_version(db, "products")
+    record_dashboard_delta(db, total_products=1)
     _commit_or_400(
         db,
         "Failed to create product. SKU must be unique",
@@ -2186,125 +2650,177 @@ def create_product(
     return product
 
 
+def _import_decimal(value: object) -> Decimal | None:
+    text = _to_text(value)
+    return Decimal(text) if text else None
+
+
+def _build_product_import_row(
+    lookups: _ProductImportLookups,
+    row: dict,
+    sku: str,
+) -> dict:
+    brand_name = _validate_brand_for_import(
+        lookups,
+        _to_text(row.get("manufacturer") or row.get("brand")),
+    )
+
+    gst_rate_value: Decimal | None = None
+    gst_rate_raw = _to_text(row.get("gst_rate"))
+    if gst_rate_raw:
+        try:
+            gst_rate_value = Decimal(gst_rate_raw).quantize(Decimal("0.01"))
+        except InvalidOperation as error:
+            raise AppException(
+                error_code="VALIDATION_ERROR",
+                message="Invalid GST rate",
+                details={"field": "gst_rate"},
+            ) from error
+        if gst_rate_value not in lookups.tax_rates:
+            raise AppException(
+                error_code="VALIDATION_ERROR",
+                message="GST rate does not exist in active tenant tax rates",
+                details={"field": "gst_rate"},
+            )
+
+    default_warehouse_id = _validate_default_warehouse_for_import(
+        lookups,
+        _to_text(row.get("default_warehouse_id")),
+        _to_text(row.get("default_warehouse_code") or row.get("warehouse_code")),
+    )
+    product_input = ProductCreate(
+        sku=sku,
+        name=_to_text(row.get("product_name") or row.get("name")),
+        display_name=_to_text(row.get("display_name")) or None,
+        brand=brand_name,
+        category=_to_text(row.get("category")) or None,
+        uom=_to_text(row.get("uom")),
+        decimal_allowed=_parse_import_bool(row.get("decimal_allowed"), default=False),
+        barcode=_to_text(row.get("barcode")) or None,
+        hsn=_to_text(row.get("hsn")) or None,
+        gst_rate=gst_rate_value,
+        default_warehouse_id=default_warehouse_id,
+        rack_number=_validate_rack_for_import(
+            lookups,
+            warehouse_id=default_warehouse_id,
+            rack_number=_to_text(row.get("rack_number")) or None,
+        ),
+        default_purchase_rate=_import_decimal(row.get("default_purchase_rate")),
+        default_sale_rate=_import_decimal(row.get("default_sale_rate")),
+        mrp=_import_decimal(row.get("mrp")),
+        is_active=_parse_import_bool(row.get("is_active"), default=True),
+    )
+    product_data = product_input.model_dump()
+    product_data["unit_price"] = unit_price_from_mrp(product_input.mrp, product_input.gst_rate)
+    return product_data
+
+
+def _insert_product_chunk(
+    db: Session,
+    pending: list[tuple[int, dict]],
+    errors: list[BulkImportError],
+) -> int:
+    """Insert validated product rows as one multi-row INSERT ... RETURNING; on a
+    constraint error the chunk is replayed row by row so only the offending rows
+    are reported. Returns how many rows were inserted."""
+    if not pending:
+        return 0
+
+    insert_stmt = insert(Product).returning(Product.id, Product.name, sort_by_parameter_order=True)
+    try:
+        with db.begin_nested():
+            inserted = db.execute(insert_stmt, [product_data for _, product_data in pending]).all()
+    except IntegrityError:
+        inserted = []
+        for index, product_data in pending:
+            try:
+                with db.begin_nested():
+                    inserted.append(db.execute(insert_stmt, [product_data]).one())
+            except IntegrityError as error:
+                errors.append(_bulk_error(index, str(error.orig or error)))
+
+    if inserted:
+        note_inserted_records(
+            db,
+            Product,
+            [row.id for row in inserted],
+            grouped_values={"name": [row.name for row in inserted]},
+        )
+    return len(inserted)
+
+
 @router.post("/items/bulk", response_model=BulkImportResult)
 async def bulk_create_items(
     request: Request,
+    dry_run: bool = Query(default=False),
     db: Session = Depends(get_db),
     current_user=Depends(require_permission("masters:manage")),
 ) -> BulkImportResult:
+    """Bulk product import. Rows are validated against master lookups loaded once per
+    import and inserted in chunks; with ``dry_run`` nothing is written and
+    ``created_count`` reports how many rows would be created."""
     _ = current_user
     rows = await _read_bulk_rows(request)
     errors: list[BulkImportError] = []
     created_count = 0
 
-    valid_tax_rates = {
-        Decimal(str(rate_percent)).quantize(Decimal("0.01"))
-        for (rate_percent,) in db.query(TaxRate.rate_percent)
-        .filter(TaxRate.is_active.is_(True))
-        .all()
-    }
-    existing_skus = {sku for (sku,) in db.query(Product.sku).all()}
+    lookups = _load_product_import_lookups(db)
     seen_skus: set[str] = set()
 
-    for index, row in enumerate(rows, start=1):
-        if not isinstance(row, dict):
-            errors.append(_bulk_error(index, "Row must be an object"))
-            continue
-
-        sku = _to_text(row.get("sku"))
-        if not sku:
-            errors.append(_bulk_error(index, "SKU is required", "sku"))
-            continue
-        if sku in seen_skus or sku in existing_skus:
-            errors.append(_bulk_error(index, "SKU must be unique", "sku"))
-            continue
+    for chunk_start in range(0, len(rows), PRODUCT_IMPORT_CHUNK_SIZE):
+        pending: list[tuple[int, dict]] = []
+        chunk = rows[chunk_start : chunk_start + PRODUCT_IMPORT_CHUNK_SIZE]
+        for index, row in enumerate(chunk, start=chunk_start + 1):
+            if not isinstance(row, dict):
+                errors.append(_bulk_error(index, "Row must be an object"))
+                continue
 
-        try:
-            brand_name = _validate_active_brand_name(
-                db,
-                _to_text(row.get("manufacturer") or row.get("brand")),
-            )
-        except AppException as error:
-            errors.append(_bulk_error(index, error.message, (error.details or {}).get("field")))
-            continue
+            sku = _to_text(row.get("sku"))
+            if not sku:
+                errors.append(_bulk_error(index, "SKU is required", "sku"))
+                continue
+            if sku in seen_skus or sku in lookups.skus:
+                errors.append(_bulk_error(index, "SKU must be unique", "sku"))
+                continue
 
-        gst_rate_value: Decimal | None = None
-        gst_rate_raw = _to_text(row.get("gst_rate"))
-        if gst_rate_raw:
             try:
-                gst_rate_value = Decimal(gst_rate_raw).quantize(Decimal("0.01"))
-            except InvalidOperation:
-                errors.append(_bulk_error(index, "Invalid GST rate", "gst_rate"))
+                product_data = _build_product_import_row(lookups, row, sku)
+            except AppException as error:
+                errors.append(_bulk_error(index, error.message, (error.details or {}).get("field")))
                 continue
-
-            if gst_rate_value not in valid_tax_rates:
-                errors.append(
-                    _bulk_error(index, "GST rate does not exist in active tenant tax rates", "gst_rate")
-                )
+            except Exception as error:  # pydantic validation or malformed numbers
+                errors.append(_bulk_error(index, str(error)))
                 continue
-
-        try:
-            default_warehouse_id_text = _to_text(row.get("default_warehouse_id"))
-            default_warehouse_code_text = _to_text(
-                row.get("default_warehouse_code") or row.get("warehouse_code")
-            )
-            with db.begin_nested():
-                default_warehouse_id = _validate_default_warehouse_for_import(
-                    db,
-                    default_warehouse_id_text,
-                    default_warehouse_code_text,
-                )
-                product_input = ProductCreate(
-                    sku=sku,
-                    name=_to_text(row.get("product_name") or row.get("name")),
-                    display_name=_to_text(row.get("display_name")) or None,
-                    brand=brand_name,
-                    category=_to_text(row.get("category")) or None,
-                    uom=_to_text(row.get("uom")),
-                    decimal_allowed=_parse_import_bool(row.get("decimal_allowed"), default=False),
-                    barcode=_to_text(row.get("barcode")) or None,
-                    hsn=_to_text(row.get("hsn")) or None,
-                    gst_rate=gst_rate_value,
-                    default_warehouse_id=default_warehouse_id,
-                    rack_number=_validate_rack_for_import(
-                        db,
-                        warehouse_id=default_warehouse_id,
-                        rack_number=_to_text(row.get("rack_number")) or None,
-                    ),
-                    default_purchase_rate=Decimal(_to_text(row.get("default_purchase_rate")))
-                    if _to_text(row.get("default_purchase_rate"))
-                    else None,
-                    default_sale_rate=Decimal(_to_text(row.get("default_sale_rate")))
-                    if _to_text(row.get("default_sale_rate"))
-                    else None,
-                    mrp=Decimal(_to_text(row.get("mrp"))) if _to_text(row.get("mrp")) else None,
-                    is_active=_parse_import_bool(row.get("is_active"), default=True),
-                )
-                product_data = product_input.model_dump()
-                product_data["unit_price"] = unit_price_from_mrp(
-                    product_input.mrp, product_input.gst_rate
-                )
-                product = Product(**product_data)
-                db.add(product)
-                db.flush()
             seen_skus.add(sku)
-            created_count += 1
-        except Exception as error:
-            errors.append(_bulk_error(index, str(error)))
+            pending.append((index, product_data))
 
-    try:
-        db.commit()
-    except IntegrityError as error:
-        db.rollback()
-        raise AppException(
-            error_code="VALIDATION_ERROR",
-            message="Failed to commit bulk item import",
-        ) from error
+        if dry_run:
+            created_count += len(pending)
+        else:
+            created_count += _insert_product_chunk(db, pending, errors)
+
+    errors.sort(key=lambda error: error.row)
+
+    if dry_run:
+        _rollback_with_tenant_context(db)
+    else:
+        if created_count:
+            bump_data_version(db, "products")
+            record_dashboard_delta(db, total_products=created_count)
+        try:
+            db.commit()
+        except IntegrityError as error:
+            db.rollback()
+            raise AppException(
+                error_code="VALIDATION_ERROR",
+                message="Failed to commit bulk item import",
+            ) from error
 
     return BulkImportResult(
         created_count=created_count,
         failed_count=len(errors),
         errors=errors,
+        dry_run=dry_run,
     )
 
 
@@ -2376,6 +2892,7 @@ def update_product(
     for field, value in changed_fields.items():
         setattr(product, field, value)
 
+    bump_data_version(db, "products")
     _commit_or_400(db, "Failed to update product")
     write_audit_log(
         db,
@@ -2410,6 +2927,7 @@ def delete_product(
         )
     before_snapshot = snapshot_model(product)
     product.is_active = False
+    bump_data_version(db, "products")
     _commit_or_400(db, "Failed to deactivate product")
     write_audit_log(
         db,
@@ -2466,27 +2984,37 @@ def item_import_template(
     )
 
 
-@router.get("/warehouses", response_model=list[WarehouseRead])
-def list_warehouses(
-    include_inactive: bool = Query(default=False),
-    db: Session = Depends(get_db),
-    current_user=Depends(require_permission("masters:view")),
-) -> list[WarehouseRead]:
-    _ = current_user
+def _load_warehouses(db: Session, *, include_inactive: bool) -> list[WarehouseRead]:
     query = db.query(Warehouse).order_by(Warehouse.name.asc())
     if not include_inactive:
         query = query.filter(Warehouse.is_active.is_(True))
-    return query.all()
+    return [WarehouseRead.model_validate(warehouse) for warehouse in query.all()]
 
 
-@router.get("/racks", response_model=list[RackRead])
-def list_racks(
-    warehouse_id: int | None = Query(default=None),
+@router.get(
+    "/warehouses",
+    response_model=list[WarehouseRead],
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_warehouses(
+    request: Request,
+    response: Response,
     include_inactive: bool = Query(default=False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(require_permission("masters:view")),
-) -> list[RackRead]:
+) -> list[WarehouseRead] | Response:
     _ = current_user
+    not_modified_response = await db.run_sync(
+        conditional_list_response, request, response, ("warehouses",)
+    )
+    if not_modified_response is not None:
+        return not_modified_response
+    return await db.run_sync(_load_warehouses, include_inactive=include_inactive)
+
+
+def _load_racks(
+    db: Session, *, warehouse_id: int | None, include_inactive: bool
+) -> list[RackRead]:
     query = (
         db.query(Rack)
         .options(joinedload(Rack.warehouse))
@@ -2497,7 +3025,24 @@ def list_racks(
         query = query.filter(Rack.warehouse_id == warehouse_id)
     if not include_inactive:
         query = query.filter(Rack.is_active.is_(True)).filter(Warehouse.is_active.is_(True))
-    return query.all()
+    return [RackRead.model_validate(rack) for rack in query.all()]
+
+
+@router.get(
+    "/racks",
+    response_model=list[RackRead],
+    dependencies=[Depends(limit_concurrency("master_lists"))],
+)
+async def list_racks(
+    warehouse_id: int | None = Query(default=None),
+    include_inactive: bool = Query(default=False),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(require_permission("masters:view")),
+) -> list[RackRead]:
+    _ = current_user
+    return await db.run_sync(
+        _load_racks, warehouse_id=warehouse_id, include_inactive=include_inactive
+    )
 
 
 @router.post("/racks", response_model=RackRead, status_code=status.HTTP_201_CREATED)
@@ -2549,6 +3094,8 @@ def create_warehouse(
     _ = current_user
     warehouse = Warehouse(**payload.model_dump())
     db.add(warehouse)
+    bump_data_version(db, "warehouses")
+    record_dashboard_delta(db, total_warehouses=1)
     _commit_or_400(
         db,
         "Failed to create warehouse. Code must be unique",
@@ -2600,6 +3147,7 @@ def update_warehouse(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(warehouse, field, value)
 
+    bump_data_version(db, "warehouses")
     _commit_or_400(db, "Failed to update warehouse")
     db.refresh(warehouse)
     return warehouse
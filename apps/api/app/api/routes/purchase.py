@@ -1,26 +1,38 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.core.database import get_db
 from app.core.exceptions import AppException
+from app.core.idempotency import IdempotentRequest, idempotent_request
 from app.core.permissions import require_permission
 from app.models.party import Party
 from app.models.purchase import GRN, GRNLine, PurchaseOrder, PurchaseOrderLine
 from app.models.purchase_bill import PurchaseBill
 from app.models.user import User
+from app.models.warehouse import Warehouse
 from app.schemas.purchase import (
     GrnAttachBillPayload,
     GRNCreateFromBill,
     GRNCreateFromPO,
     GRNResponse,
+    GRNSummary,
+    GRNSummaryPage,
     GRNUpdate,
     PurchaseOrderCreate,
     PurchaseOrderList,
     PurchaseOrderResponse,
     PurchaseOrderUpdate,
 )
+from app.services.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    fetch_keyset_page,
+    parse_fields,
+)
 from app.services.purchase import (
     approve_po,
     attach_bill_to_grn,
@@ -166,6 +178,54 @@ def create_grn_from_purchase_bill(
     return create_grn_from_bill(db, purchase_bill_id, payload, current_user.id)
 
 
+def _grn_filters(
+    *,
+    search: str | None,
+    status_filter: str | None,
+    supplier_id: int | None,
+    warehouse_id: int | None,
+    po_number: str | None,
+    bill_number: str | None,
+    grn_number: str | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> list[ColumnElement[bool]]:
+    # Related-number filters use id subqueries so the same conditions work for the
+    # full list and the summary list without depending on which tables are joined.
+    filters: list[ColumnElement[bool]] = []
+    if status_filter:
+        filters.append(GRN.status == status_filter)
+    if supplier_id is not None:
+        filters.append(GRN.supplier_id == supplier_id)
+    if warehouse_id is not None:
+        filters.append(GRN.warehouse_id == warehouse_id)
+    if date_from is not None:
+        filters.append(GRN.received_date >= date_from)
+    if date_to is not None:
+        filters.append(GRN.received_date <= date_to)
+    if grn_number:
+        filters.append(GRN.grn_number.ilike(f"%{grn_number.strip()}%"))
+    if po_number:
+        filters.append(
+            GRN.purchase_order_id.in_(
+                select(PurchaseOrder.id).where(PurchaseOrder.po_number.ilike(f"%{po_number.strip()}%"))
+            )
+        )
+    if bill_number:
+        filters.append(
+            GRN.purchase_bill_id.in_(
+                select(PurchaseBill.id).where(PurchaseBill.bill_number.ilike(f"%{bill_number.strip()}%"))
+            )
+        )
+    if search:
+        like_search = f"%{search.strip()}%"
+        filters.append(
+            GRN.grn_number.ilike(like_search)
+            | GRN.supplier_id.in_(select(Party.id).where(Party.name.ilike(like_search)))
+        )
+    return filters
+
+
 @router.get("/grn", response_model=list[GRNResponse])
 def list_grns(
     search: str | None = Query(default=None),
@@ -181,7 +241,7 @@ def list_grns(
     current_user: User = Depends(require_permission("grn:view")),
 ) -> list[GRNResponse]:
     _ = current_user
-    query = (
+    return (
         db.query(GRN)
         .options(
             selectinload(GRN.purchase_order),
@@ -193,31 +253,112 @@ def list_grns(
             selectinload(GRN.lines).selectinload(GRNLine.product),
             selectinload(GRN.lines).selectinload(GRNLine.batch_lines),
         )
+        .filter(
+            *_grn_filters(
+                search=search,
+                status_filter=status_filter,
+                supplier_id=supplier_id,
+                warehouse_id=warehouse_id,
+                po_number=po_number,
+                bill_number=bill_number,
+                grn_number=grn_number,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        )
         .order_by(GRN.created_at.desc())
+        .all()
     )
-    if status_filter:
-        query = query.filter(GRN.status == status_filter)
-    if supplier_id is not None:
-        query = query.filter(GRN.supplier_id == supplier_id)
-    if warehouse_id is not None:
-        query = query.filter(GRN.warehouse_id == warehouse_id)
-    if date_from is not None:
-        query = query.filter(GRN.received_date >= date_from)
-    if date_to is not None:
-        query = query.filter(GRN.received_date <= date_to)
-    if grn_number:
-        query = query.filter(GRN.grn_number.ilike(f"%{grn_number.strip()}%"))
-    if po_number:
-        query = query.join(GRN.purchase_order).filter(PurchaseOrder.po_number.ilike(f"%{po_number.strip()}%"))
-    if bill_number:
-        query = query.join(GRN.purchase_bill).filter(PurchaseBill.bill_number.ilike(f"%{bill_number.strip()}%"))
-    if search:
-        like_search = f"%{search.strip()}%"
-        query = query.join(GRN.supplier).filter(
-            (GRN.grn_number.ilike(like_search))
-            | (Party.name.ilike(like_search))
+
+
+def _grn_summary_columns() -> dict[str, ColumnElement]:
+    line_totals = select(GRNLine.grn_id).where(GRNLine.grn_id == GRN.id).correlate(GRN)
+    return {
+        "id": GRN.id,
+        "grn_number": GRN.grn_number,
+        "purchase_order_id": GRN.purchase_order_id,
+        "po_number": PurchaseOrder.po_number,
+        "purchase_bill_id": GRN.purchase_bill_id,
+        "purchase_bill_number": PurchaseBill.bill_number,
+        "supplier_id": GRN.supplier_id,
+        "supplier_name": Party.name,
+        "warehouse_id": GRN.warehouse_id,
+        "warehouse_name": Warehouse.name,
+        "status": GRN.status,
+        "received_date": GRN.received_date,
+        "posted_at": GRN.posted_at,
+        "created_at": GRN.created_at,
+        "updated_at": GRN.updated_at,
+        "total_products": line_totals.with_only_columns(func.count(GRNLine.id)).scalar_subquery(),
+        "total_received_qty": line_totals.with_only_columns(
+            func.coalesce(func.sum(GRNLine.received_qty_total), 0)
+        ).scalar_subquery(),
+    }
+
+
+@router.get(
+    "/grn/summary",
+    response_model=GRNSummaryPage,
+    response_model_exclude_unset=True,
+)
+def list_grn_summaries(
+    search: str | None = Query(default=None),
+    status_filter: str | None = Query(default=None, alias="status"),
+    supplier_id: int | None = Query(default=None),
+    warehouse_id: int | None = Query(default=None),
+    po_number: str | None = Query(default=None),
+    bill_number: str | None = Query(default=None),
+    grn_number: str | None = Query(default=None),
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    fields: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("grn:view")),
+) -> GRNSummaryPage:
+    """Cursor-paginated GRN list without line items, newest first.
+
+    Pass ``next_cursor`` back as ``cursor`` for the following page and ``fields``
+    (comma separated) to return only some columns. Use ``GET /grn/{grn_id}`` for lines.
+    """
+    _ = current_user
+    columns = _grn_summary_columns()
+    stmt = (
+        select()
+        .select_from(GRN)
+        .outerjoin(PurchaseOrder, PurchaseOrder.id == GRN.purchase_order_id)
+        .outerjoin(PurchaseBill, PurchaseBill.id == GRN.purchase_bill_id)
+        .outerjoin(Party, Party.id == GRN.supplier_id)
+        .outerjoin(Warehouse, Warehouse.id == GRN.warehouse_id)
+        .where(
+            *_grn_filters(
+                search=search,
+                status_filter=status_filter,
+                supplier_id=supplier_id,
+                warehouse_id=warehouse_id,
+                po_number=po_number,
+                bill_number=bill_number,
+                grn_number=grn_number,
+                date_from=date_from,
+                date_to=date_to,
+            )
         )
-    return query.all()
+    )
+    items, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns=columns,
+        fields=parse_fields(fields, list(GRNSummary.model_fields)),
+        sort_keys=[GRN.created_at, GRN.id],
+        descending=True,
+        cursor=cursor,
+        limit=limit,
+    )
+    return GRNSummaryPage(
+        items=[GRNSummary.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/grn/{grn_id}", response_model=GRNResponse)
@@ -262,8 +403,9 @@ def post_grn_route(
     grn_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("grn:post")),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
 ) -> GRNResponse:
-    return post_grn(db, grn_id, current_user.id)
+    return idempotency.run(db, lambda: post_grn(db, grn_id, current_user.id, commit=False))
 
 
 @router.post("/grn/{grn_id}/cancel", response_model=GRNResponse)
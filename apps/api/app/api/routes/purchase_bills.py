@@ -1,21 +1,25 @@
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.permissions import require_permission
+from app.models.enums import PurchaseBillStatus
 from app.models.user import User
 from app.schemas.purchase_bill import (
     PurchaseBillListResponse,
     PurchaseBillResponse,
+    PurchaseBillSummaryPage,
     PurchaseBillUpdate,
 )
+from app.services.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from app.services.purchase_bill import (
     cancel_purchase_bill,
     get_document_attachment,
     get_purchase_bill,
+    list_purchase_bill_summaries,
     list_purchase_bills,
     post_purchase_bill,
     update_purchase_bill,
@@ -35,6 +39,33 @@ def list_purchase_bill_route(
     return PurchaseBillListResponse(items=list_purchase_bills(db))
 
 
+@router.get(
+    "/purchase-bills/summary",
+    response_model=PurchaseBillSummaryPage,
+    response_model_exclude_unset=True,
+)
+def list_purchase_bill_summary_route(
+    status_filter: PurchaseBillStatus | None = Query(default=None, alias="status"),
+    supplier_id: int | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    fields: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("purchase_bill:view")),
+) -> PurchaseBillSummaryPage:
+    """Cursor-paginated bill list; pass ``next_cursor`` back as ``cursor`` and
+    ``fields`` (comma separated) for a sparse projection."""
+    _ = current_user
+    return list_purchase_bill_summaries(
+        db,
+        status=status_filter,
+        supplier_id=supplier_id,
+        cursor=cursor,
+        limit=limit,
+        fields=fields,
+    )
+
+
 @router.get("/purchase-bills/{bill_id}", response_model=PurchaseBillResponse)
 def get_purchase_bill_route(
     bill_id: int,
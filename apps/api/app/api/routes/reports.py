@@ -1,13 +1,18 @@
+from collections.abc import Callable
 from datetime import date
 from decimal import Decimal
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.concurrency import limit_concurrency
+from app.core.http_cache import etag_matches, not_modified, set_cache_headers
 from app.core.permissions import require_permission
+from app.core.tenant import get_read_db, iter_read_rows, run_read_in_threadpool
 from app.models.batch import Batch
 from app.models.enums import PartyCategory, PartyType, PurchaseOrderStatus
 from app.models.party import Party
@@ -16,14 +21,23 @@ from app.models.purchase import GRN
 from app.models.purchase_bill import PurchaseBill
 from app.models.user import User
 from app.models.warehouse import Warehouse
-from app.reports.current_stock import CurrentStockFilters, get_current_stock_report
+from app.reports.current_stock import (
+    CurrentStockFilters,
+    get_current_stock_report,
+    iter_current_stock_rows,
+)
 from app.reports.data_quality.common import DataQualityReportFilters
 from app.reports.data_quality.compliance_gaps import get_compliance_gaps_report
 from app.reports.data_quality.duplicate_masters import get_duplicate_masters_report
 from app.reports.data_quality.invalid_references import get_invalid_references_report
 from app.reports.data_quality.missing_fields import get_missing_fields_report
-from app.reports.dead_stock import DeadStockReportFilters, get_dead_stock_report
-from app.reports.expiry import ExpiryReportFilters, get_expiry_report
+from app.reports.dead_stock import (
+    DeadStockReportFilters,
+    get_dead_stock_report,
+    iter_dead_stock_rows,
+)
+from app.reports.expiry import ExpiryReportFilters, get_expiry_report, iter_expiry_rows
+from app.reports.export import ExportFormat, export_response, unpaged
 from app.reports.masters.brand_item_report import get_brand_item_report
 from app.reports.masters.brand_summary_report import get_brand_summary_report
 from app.reports.masters.category_item_report import get_category_item_report
@@ -42,7 +56,11 @@ from app.reports.masters.rack_report import get_rack_report
 from app.reports.masters.warehouse_coverage import get_warehouse_coverage_report
 from app.reports.masters.warehouse_item_summary import get_warehouse_item_summary_report
 from app.reports.masters.warehouse_utilization import get_warehouse_utilization_report
-from app.reports.opening_stock import OpeningStockFilters, get_opening_stock_report
+from app.reports.opening_stock import (
+    OpeningStockFilters,
+    get_opening_stock_report,
+    iter_opening_stock_rows,
+)
 from app.reports.purchase_analytics.common import (
     PurchaseAnalyticsFilters,
     build_summary_metric,
@@ -64,38 +82,72 @@ from app.reports.purchase_analytics.supplier_lead_time import (
 from app.reports.purchase_analytics.supplier_price_comparison import (
     get_supplier_price_comparison_report,
 )
-from app.reports.purchase_register import PurchaseRegisterFilters, get_purchase_register_report
+from app.reports.purchase_register import (
+    PurchaseRegisterFilters,
+    get_purchase_register_report,
+    iter_purchase_register_rows,
+)
 from app.reports.stock_ageing import StockAgeingFilters, get_stock_ageing_report
-from app.reports.stock_inward import StockInwardFilters, get_stock_inward_report
-from app.reports.stock_movement import StockMovementFilters, get_stock_movement_report
+from app.reports.stock_inward import (
+    StockInwardFilters,
+    get_stock_inward_report,
+    iter_stock_inward_rows,
+)
+from app.reports.stock_movement import (
+    StockMovementFilters,
+    get_stock_movement_report,
+    iter_stock_movement_rows,
+)
 from app.reports.stock_source_traceability import (
     StockSourceTraceabilityFilters,
     get_current_stock_source_detail,
     get_stock_source_traceability_report,
+    iter_stock_source_traceability_rows,
 )
 from app.schemas.reports import (
     CurrentStockReportResponse,
+    CurrentStockReportRow,
     CurrentStockSourceDetailResponse,
     DataQualityFilterOptionsResponse,
     DeadStockReportResponse,
+    DeadStockReportRow,
     ExpiryReportResponse,
+    ExpiryReportRow,
     GenericTabularReportResponse,
     MasterReportFilterOptionsResponse,
     OpeningStockReportResponse,
+    OpeningStockReportRow,
     PurchaseAnalyticsDashboardResponse,
     PurchaseAnalyticsFilterOptionsResponse,
     PurchaseAnalyticsReportResponse,
     PurchaseRegisterReportResponse,
+    PurchaseRegisterReportRow,
     ReportEntityOption,
+    ReportFilterOption,
+    ReportFilterOptionPage,
     ReportFilterOptionsResponse,
     ReportSummaryMetric,
     StockAgeingReportResponse,
+    StockAgeingReportRow,
     StockInwardReportResponse,
+    StockInwardReportRow,
     StockMovementReportResponse,
+    StockMovementReportRow,
     StockSourceTraceabilityReportResponse,
+    StockSourceTraceabilityReportRow,
+)
+from app.services.filter_options import (
+    DEFAULT_OPTION_LIMIT,
+    MAX_OPTION_LIMIT,
+    FilterOptionKind,
+    cached_filter_options,
+    filter_options_etag,
+    search_filter_options,
 )
 
-router = APIRouter()
+T = TypeVar("T")
+
+router = APIRouter(dependencies=[Depends(limit_concurrency("reports"))])
 
 
 def _parse_csv_ints(raw: str | None) -> tuple[int, ...]:
@@ -266,13 +318,20 @@ def _purchase_analytics_response(
     )
 
 
-@router.get("/filter-options", response_model=ReportFilterOptionsResponse)
-def report_filter_options(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("reports:view")),
-) -> ReportFilterOptionsResponse:
-    _ = current_user
+async def _all_rows(db: AsyncSession, report: Callable[..., tuple], filters: Any) -> list:
+    """Every row of a Python-paged report, built in the threadpool for an export."""
+    return (await run_read_in_threadpool(db, report, unpaged(filters)))[1]
+
+
+def _cached_options(db: Session, scope: str, etag: str, build: Callable[[Session], T]) -> T:
+    return cached_filter_options(db, scope, etag, lambda: build(db))
 
+
+REPORT_OPTION_SOURCES = ("products", "parties", "warehouses", "batches")
+PURCHASE_ANALYTICS_OPTION_SOURCES = ("products", "parties", "warehouses", "purchase_bills", "grns")
+
+
+def _build_report_filter_options(db: Session) -> ReportFilterOptionsResponse:
     products = db.execute(
         select(Product.id, Product.name, Product.sku).order_by(Product.name.asc())
     ).all()
@@ -309,13 +368,8 @@ def report_filter_options(
     )
 
 
-@router.get("/masters/filter-options", response_model=MasterReportFilterOptionsResponse)
-def master_report_filter_options(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("reports:view")),
-) -> MasterReportFilterOptionsResponse:
-    _ = current_user
-    base = report_filter_options(db=db, current_user=current_user)
+def _build_master_report_filter_options(db: Session) -> MasterReportFilterOptionsResponse:
+    base = _build_report_filter_options(db)
     states = db.execute(
         select(Party.state).where(Party.state.isnot(None)).distinct().order_by(Party.state.asc())
     ).scalars()
@@ -331,8 +385,64 @@ def master_report_filter_options(
     )
 
 
+@router.get("/filter-options", response_model=ReportFilterOptionsResponse)
+async def report_filter_options(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("reports:view")),
+) -> ReportFilterOptionsResponse | Response:
+    """Full option lists, revalidated with ``If-None-Match``; large tenants should
+    prefer the ``/filter-options/{kind}`` typeahead lookups."""
+    _ = current_user
+    etag = await db.run_sync(filter_options_etag, "report", REPORT_OPTION_SOURCES)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+    return await run_read_in_threadpool(
+        db, _cached_options, "report", etag, _build_report_filter_options
+    )
+
+
+@router.get("/filter-options/{kind}", response_model=ReportFilterOptionPage)
+async def search_report_filter_options(
+    kind: FilterOptionKind,
+    q: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_OPTION_LIMIT, ge=1, le=MAX_OPTION_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("reports:view")),
+) -> ReportFilterOptionPage:
+    """Typeahead lookup for one filter; pass ``next_cursor`` back as ``cursor``."""
+    _ = current_user
+    items, next_cursor = await db.run_sync(
+        search_filter_options, kind, q=q, cursor=cursor, limit=limit
+    )
+    return ReportFilterOptionPage(
+        items=[ReportFilterOption.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/masters/filter-options", response_model=MasterReportFilterOptionsResponse)
+async def master_report_filter_options(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("reports:view")),
+) -> MasterReportFilterOptionsResponse | Response:
+    _ = current_user
+    etag = await db.run_sync(filter_options_etag, "masters", REPORT_OPTION_SOURCES)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+    return await run_read_in_threadpool(
+        db, _cached_options, "masters", etag, _build_master_report_filter_options
+    )
+
+
 @router.get("/data-quality/filter-options", response_model=DataQualityFilterOptionsResponse)
-def data_quality_filter_options(
+async def data_quality_filter_options(
     current_user: User = Depends(require_permission("reports:view")),
 ) -> DataQualityFilterOptionsResponse:
     _ = current_user
@@ -344,16 +454,9 @@ def data_quality_filter_options(
     )
 
 
-@router.get(
-    "/purchase-analytics/filter-options",
-    response_model=PurchaseAnalyticsFilterOptionsResponse,
-)
-def purchase_analytics_filter_options(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("purchase_analytics:view")),
+def _build_purchase_analytics_filter_options(
+    db: Session,
 ) -> PurchaseAnalyticsFilterOptionsResponse:
-    _ = current_user
-
     products = db.execute(
         select(Product.id, Product.name, Product.sku).order_by(Product.name.asc())
     ).all()
@@ -408,20 +511,68 @@ def purchase_analytics_filter_options(
     )
 
 
+@router.get(
+    "/purchase-analytics/filter-options",
+    response_model=PurchaseAnalyticsFilterOptionsResponse,
+)
+async def purchase_analytics_filter_options(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("purchase_analytics:view")),
+) -> PurchaseAnalyticsFilterOptionsResponse | Response:
+    _ = current_user
+    etag = await db.run_sync(
+        filter_options_etag, "purchase_analytics", PURCHASE_ANALYTICS_OPTION_SOURCES
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+    return await run_read_in_threadpool(
+        db,
+        _cached_options,
+        "purchase_analytics",
+        etag,
+        _build_purchase_analytics_filter_options,
+    )
+
+
+@router.get(
+    "/purchase-analytics/filter-options/{kind}",
+    response_model=ReportFilterOptionPage,
+)
+async def search_purchase_analytics_filter_options(
+    kind: FilterOptionKind,
+    q: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_OPTION_LIMIT, ge=1, le=MAX_OPTION_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("purchase_analytics:view")),
+) -> ReportFilterOptionPage:
+    _ = current_user
+    items, next_cursor = await db.run_sync(
+        search_filter_options, kind, q=q, cursor=cursor, limit=limit
+    )
+    return ReportFilterOptionPage(
+        items=[ReportFilterOption.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
 @router.get(
     "/purchase-analytics/dashboard",
     response_model=PurchaseAnalyticsDashboardResponse,
 )
-def purchase_analytics_dashboard(
+async def purchase_analytics_dashboard(
     date_from: date | None = None,
     date_to: date | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
 ) -> PurchaseAnalyticsDashboardResponse:
     _ = current_user
     filters = _purchase_analytics_filters(date_from=date_from, date_to=date_to, page_size=500)
-    events = load_purchase_events(db, filters)
-    receipt_records = load_purchase_order_receipt_records(db, filters)
+    events = await run_read_in_threadpool(db, load_purchase_events, filters)
+    receipt_records = await run_read_in_threadpool(db, load_purchase_order_receipt_records, filters)
 
     total_purchase_value = sum((event.value for event in events), start=Decimal("0"))
     lead_time_days = [
@@ -477,7 +628,7 @@ def purchase_analytics_dashboard(
     "/purchase-analytics/purchase-cost-trend",
     response_model=PurchaseAnalyticsReportResponse,
 )
-def purchase_cost_trend_report(
+async def purchase_cost_trend_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     brand_values: str | None = None,
@@ -490,9 +641,10 @@ def purchase_cost_trend_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
-) -> PurchaseAnalyticsReportResponse:
+) -> PurchaseAnalyticsReportResponse | StreamingResponse:
     _ = current_user
     filters = _purchase_analytics_filters(
         product_id=product_id,
@@ -508,7 +660,15 @@ def purchase_cost_trend_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary, charts, meta = get_purchase_cost_trend_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_purchase_cost_trend_report, filters),
+            export_format,
+            "purchase-analytics-purchase-cost-trend",
+        )
+    total, data, summary, charts, meta = await run_read_in_threadpool(
+        db, get_purchase_cost_trend_report, filters
+    )
     return _purchase_analytics_response(
         total=total,
         page=page,
@@ -524,7 +684,7 @@ def purchase_cost_trend_report(
     "/purchase-analytics/seasonal-purchase-pattern",
     response_model=PurchaseAnalyticsReportResponse,
 )
-def seasonal_purchase_pattern_report(
+async def seasonal_purchase_pattern_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     brand_values: str | None = None,
@@ -538,9 +698,10 @@ def seasonal_purchase_pattern_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
-) -> PurchaseAnalyticsReportResponse:
+) -> PurchaseAnalyticsReportResponse | StreamingResponse:
     _ = current_user
     filters = _purchase_analytics_filters(
         product_id=product_id,
@@ -557,7 +718,15 @@ def seasonal_purchase_pattern_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary, charts, meta = get_seasonal_purchase_pattern_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_seasonal_purchase_pattern_report, filters),
+            export_format,
+            "purchase-analytics-seasonal-purchase-pattern",
+        )
+    total, data, summary, charts, meta = await run_read_in_threadpool(
+        db, get_seasonal_purchase_pattern_report, filters
+    )
     return _purchase_analytics_response(
         total=total,
         page=page,
@@ -573,7 +742,7 @@ def seasonal_purchase_pattern_report(
     "/purchase-analytics/supplier-lead-time",
     response_model=PurchaseAnalyticsReportResponse,
 )
-def supplier_lead_time_report(
+async def supplier_lead_time_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     brand_values: str | None = None,
@@ -586,9 +755,10 @@ def supplier_lead_time_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
-) -> PurchaseAnalyticsReportResponse:
+) -> PurchaseAnalyticsReportResponse | StreamingResponse:
     _ = current_user
     filters = _purchase_analytics_filters(
         product_id=product_id,
@@ -604,7 +774,15 @@ def supplier_lead_time_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary, charts, meta = get_supplier_lead_time_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_supplier_lead_time_report, filters),
+            export_format,
+            "purchase-analytics-supplier-lead-time",
+        )
+    total, data, summary, charts, meta = await run_read_in_threadpool(
+        db, get_supplier_lead_time_report, filters
+    )
     return _purchase_analytics_response(
         total=total,
         page=page,
@@ -620,7 +798,7 @@ def supplier_lead_time_report(
     "/purchase-analytics/supplier-price-comparison",
     response_model=PurchaseAnalyticsReportResponse,
 )
-def supplier_price_comparison_report(
+async def supplier_price_comparison_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     brand_values: str | None = None,
@@ -633,9 +811,10 @@ def supplier_price_comparison_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
-) -> PurchaseAnalyticsReportResponse:
+) -> PurchaseAnalyticsReportResponse | StreamingResponse:
     _ = current_user
     filters = _purchase_analytics_filters(
         product_id=product_id,
@@ -651,7 +830,15 @@ def supplier_price_comparison_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary, charts, meta = get_supplier_price_comparison_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_supplier_price_comparison_report, filters),
+            export_format,
+            "purchase-analytics-supplier-price-comparison",
+        )
+    total, data, summary, charts, meta = await run_read_in_threadpool(
+        db, get_supplier_price_comparison_report, filters
+    )
     return _purchase_analytics_response(
         total=total,
         page=page,
@@ -667,7 +854,7 @@ def supplier_price_comparison_report(
     "/purchase-analytics/po-fulfillment-quality",
     response_model=PurchaseAnalyticsReportResponse,
 )
-def po_fulfillment_quality_report(
+async def po_fulfillment_quality_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     brand_values: str | None = None,
@@ -680,9 +867,10 @@ def po_fulfillment_quality_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("purchase_analytics:view")),
-) -> PurchaseAnalyticsReportResponse:
+) -> PurchaseAnalyticsReportResponse | StreamingResponse:
     _ = current_user
     filters = _purchase_analytics_filters(
         product_id=product_id,
@@ -698,7 +886,15 @@ def po_fulfillment_quality_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary, charts, meta = get_po_fulfillment_quality_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_po_fulfillment_quality_report, filters),
+            export_format,
+            "purchase-analytics-po-fulfillment-quality",
+        )
+    total, data, summary, charts, meta = await run_read_in_threadpool(
+        db, get_po_fulfillment_quality_report, filters
+    )
     return _purchase_analytics_response(
         total=total,
         page=page,
@@ -711,7 +907,7 @@ def po_fulfillment_quality_report(
 
 
 @router.get("/expiry", response_model=ExpiryReportResponse)
-def expiry_report(
+async def expiry_report(
     warehouse_id: int | None = None,
     product_id: int | None = None,
     warehouse_ids: str | None = None,
@@ -724,9 +920,10 @@ def expiry_report(
     include_expired: bool = False,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> ExpiryReportResponse:
+) -> ExpiryReportResponse | StreamingResponse:
     _ = current_user
     filters = ExpiryReportFilters(
         warehouse_id=warehouse_id,
@@ -742,12 +939,19 @@ def expiry_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_expiry_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_expiry_rows, filters),
+            export_format,
+            "expiry",
+            columns=list(ExpiryReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_expiry_report, filters)
     return ExpiryReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
 @router.get("/stock-inward", response_model=StockInwardReportResponse)
-def stock_inward_report(
+async def stock_inward_report(
     date_from: date | None = None,
     date_to: date | None = None,
     supplier_id: int | None = None,
@@ -762,9 +966,10 @@ def stock_inward_report(
     expiry_status: Literal["all", "expiring_30", "expired", "safe"] | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> StockInwardReportResponse:
+) -> StockInwardReportResponse | StreamingResponse:
     _ = current_user
     filters = StockInwardFilters(
         date_from=date_from,
@@ -782,12 +987,19 @@ def stock_inward_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_stock_inward_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_stock_inward_rows, filters),
+            export_format,
+            "stock-inward",
+            columns=list(StockInwardReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_stock_inward_report, filters)
     return StockInwardReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
 @router.get("/purchase-register", response_model=PurchaseRegisterReportResponse)
-def purchase_register_report(
+async def purchase_register_report(
     status: PurchaseOrderStatus | None = None,
     supplier_id: int | None = None,
     supplier_ids: str | None = None,
@@ -800,9 +1012,10 @@ def purchase_register_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> PurchaseRegisterReportResponse:
+) -> PurchaseRegisterReportResponse | StreamingResponse:
     _ = current_user
     filters = PurchaseRegisterFilters(
         status=status,
@@ -818,12 +1031,19 @@ def purchase_register_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_purchase_register_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_purchase_register_rows, filters),
+            export_format,
+            "purchase-register",
+            columns=list(PurchaseRegisterReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_purchase_register_report, filters)
     return PurchaseRegisterReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
 @router.get("/stock-movement", response_model=StockMovementReportResponse)
-def stock_movement_report(
+async def stock_movement_report(
     product_id: int | None = None,
     product_ids: str | None = None,
     warehouse_id: int | None = None,
@@ -836,9 +1056,10 @@ def stock_movement_report(
     movement_type: Literal["inward", "outward"] | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> StockMovementReportResponse:
+) -> StockMovementReportResponse | StreamingResponse:
     _ = current_user
     filters = StockMovementFilters(
         product_id=product_id,
@@ -854,7 +1075,14 @@ def stock_movement_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_stock_movement_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_stock_movement_rows, filters),
+            export_format,
+            "stock-movement",
+            columns=list(StockMovementReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_stock_movement_report, filters)
     return StockMovementReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
@@ -862,7 +1090,7 @@ def stock_movement_report(
     "/stock-source-traceability",
     response_model=StockSourceTraceabilityReportResponse,
 )
-def stock_source_traceability_report(
+async def stock_source_traceability_report(
     date_from: date | None = None,
     date_to: date | None = None,
     supplier_id: int | None = None,
@@ -877,9 +1105,10 @@ def stock_source_traceability_report(
     bill_number: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> StockSourceTraceabilityReportResponse:
+) -> StockSourceTraceabilityReportResponse | StreamingResponse:
     _ = current_user
     filters = StockSourceTraceabilityFilters(
         date_from=date_from,
@@ -894,7 +1123,14 @@ def stock_source_traceability_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_stock_source_traceability_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_stock_source_traceability_rows, filters),
+            export_format,
+            "stock-source-traceability",
+            columns=list(StockSourceTraceabilityReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_stock_source_traceability_report, filters)
     return StockSourceTraceabilityReportResponse(
         total=total,
         page=page,
@@ -904,16 +1140,17 @@ def stock_source_traceability_report(
 
 
 @router.get("/masters/warehouse-item-summary", response_model=GenericTabularReportResponse)
-def masters_warehouse_item_summary(
+async def masters_warehouse_item_summary(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -923,19 +1160,28 @@ def masters_warehouse_item_summary(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_warehouse_item_summary_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_warehouse_item_summary_report, filters),
+            export_format,
+            "masters-warehouse-item-summary",
+        )
+    total, data, summary = await run_read_in_threadpool(
+        db, get_warehouse_item_summary_report, filters
+    )
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/rack-report", response_model=GenericTabularReportResponse)
-def masters_rack_report(
+async def masters_rack_report(
     warehouse_ids: str | None = None,
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -943,20 +1189,27 @@ def masters_rack_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_rack_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_rack_report, filters),
+            export_format,
+            "masters-rack-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_rack_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/warehouse-utilization", response_model=GenericTabularReportResponse)
-def masters_warehouse_utilization(
+async def masters_warehouse_utilization(
     warehouse_ids: str | None = None,
     active_status: str | None = None,
     inactivity_days: int = Query(default=30, ge=1),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -965,20 +1218,29 @@ def masters_warehouse_utilization(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_warehouse_utilization_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_warehouse_utilization_report, filters),
+            export_format,
+            "masters-warehouse-utilization",
+        )
+    total, data, summary = await run_read_in_threadpool(
+        db, get_warehouse_utilization_report, filters
+    )
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/warehouse-coverage", response_model=GenericTabularReportResponse)
-def masters_warehouse_coverage(
+async def masters_warehouse_coverage(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -987,21 +1249,28 @@ def masters_warehouse_coverage(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_warehouse_coverage_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_warehouse_coverage_report, filters),
+            export_format,
+            "masters-warehouse-coverage",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_warehouse_coverage_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/brand-item-report", response_model=GenericTabularReportResponse)
-def masters_brand_item_report(
+async def masters_brand_item_report(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1011,20 +1280,27 @@ def masters_brand_item_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_brand_item_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_brand_item_report, filters),
+            export_format,
+            "masters-brand-item-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_brand_item_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/category-item-report", response_model=GenericTabularReportResponse)
-def masters_category_item_report(
+async def masters_category_item_report(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1033,21 +1309,28 @@ def masters_category_item_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_category_item_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_category_item_report, filters),
+            export_format,
+            "masters-category-item-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_category_item_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/item-utilization", response_model=GenericTabularReportResponse)
-def masters_item_utilization(
+async def masters_item_utilization(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     product_ids: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1057,21 +1340,28 @@ def masters_item_utilization(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_item_utilization_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_item_utilization_report, filters),
+            export_format,
+            "masters-item-utilization",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_item_utilization_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/item-distribution", response_model=GenericTabularReportResponse)
-def masters_item_distribution(
+async def masters_item_distribution(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     product_ids: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1081,20 +1371,27 @@ def masters_item_distribution(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_item_distribution_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_item_distribution_report, filters),
+            export_format,
+            "masters-item-distribution",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_item_distribution_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/item-directory", response_model=GenericTabularReportResponse)
-def masters_item_directory(
+async def masters_item_directory(
     brand_values: str | None = None,
     search: str | None = None,
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         brand_values=brand_values,
@@ -1103,12 +1400,18 @@ def masters_item_directory(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_item_directory_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_item_directory_report, filters),
+            export_format,
+            "masters-item-directory",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_item_directory_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/party-directory", response_model=GenericTabularReportResponse)
-def masters_party_directory(
+async def masters_party_directory(
     party_types: str | None = None,
     party_categories: str | None = None,
     states: str | None = None,
@@ -1117,9 +1420,10 @@ def masters_party_directory(
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         party_types=party_types,
@@ -1131,21 +1435,28 @@ def masters_party_directory(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_party_directory_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_party_directory_report, filters),
+            export_format,
+            "masters-party-directory",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_party_directory_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/party-type-report", response_model=GenericTabularReportResponse)
-def masters_party_type_report(
+async def masters_party_type_report(
     party_types: str | None = None,
     party_categories: str | None = None,
     states: str | None = None,
     active_status: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         party_types=party_types,
@@ -1155,21 +1466,28 @@ def masters_party_type_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_party_type_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_party_type_report, filters),
+            export_format,
+            "masters-party-type-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_party_type_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/party-geography-report", response_model=GenericTabularReportResponse)
-def masters_party_geography_report(
+async def masters_party_geography_report(
     party_types: str | None = None,
     party_categories: str | None = None,
     states: str | None = None,
     cities: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         party_types=party_types,
@@ -1179,20 +1497,27 @@ def masters_party_geography_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_party_geography_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_party_geography_report, filters),
+            export_format,
+            "masters-party-geography-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_party_geography_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/party-commercial-report", response_model=GenericTabularReportResponse)
-def masters_party_commercial_report(
+async def masters_party_commercial_report(
     party_types: str | None = None,
     party_categories: str | None = None,
     states: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         party_types=party_types,
@@ -1201,12 +1526,18 @@ def masters_party_commercial_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_party_commercial_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_party_commercial_report, filters),
+            export_format,
+            "masters-party-commercial-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_party_commercial_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/party-activity-report", response_model=GenericTabularReportResponse)
-def masters_party_activity_report(
+async def masters_party_activity_report(
     party_types: str | None = None,
     party_categories: str | None = None,
     states: str | None = None,
@@ -1214,9 +1545,10 @@ def masters_party_activity_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         party_types=party_types,
@@ -1227,20 +1559,27 @@ def masters_party_activity_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_party_activity_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_party_activity_report, filters),
+            export_format,
+            "masters-party-activity-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_party_activity_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/brand-summary-report", response_model=GenericTabularReportResponse)
-def masters_brand_summary_report(
+async def masters_brand_summary_report(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1249,20 +1588,27 @@ def masters_brand_summary_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_brand_summary_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_brand_summary_report, filters),
+            export_format,
+            "masters-brand-summary-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_brand_summary_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/category-summary-report", response_model=GenericTabularReportResponse)
-def masters_category_summary_report(
+async def masters_category_summary_report(
     warehouse_ids: str | None = None,
     brand_values: str | None = None,
     category_values: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1271,19 +1617,26 @@ def masters_category_summary_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_category_summary_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_category_summary_report, filters),
+            export_format,
+            "masters-category-summary-report",
+        )
+    total, data, summary = await run_read_in_threadpool(db, get_category_summary_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/masters/low-usage-unused-warehouses", response_model=GenericTabularReportResponse)
-def masters_low_usage_unused_warehouses(
+async def masters_low_usage_unused_warehouses(
     warehouse_ids: str | None = None,
     inactivity_days: int = Query(default=30, ge=1),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _master_filters(
         warehouse_ids=warehouse_ids,
@@ -1291,19 +1644,28 @@ def masters_low_usage_unused_warehouses(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_low_usage_unused_warehouses_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_low_usage_unused_warehouses_report, filters),
+            export_format,
+            "masters-low-usage-unused-warehouses",
+        )
+    total, data, summary = await run_read_in_threadpool(
+        db, get_low_usage_unused_warehouses_report, filters
+    )
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/data-quality/missing-fields", response_model=GenericTabularReportResponse)
-def data_quality_missing_fields(
+async def data_quality_missing_fields(
     entity_types: str | None = None,
     missing_field_type: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _dq_filters(
         entity_types=entity_types,
@@ -1311,19 +1673,26 @@ def data_quality_missing_fields(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_missing_fields_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_missing_fields_report, filters),
+            export_format,
+            "data-quality-missing-fields",
+        )
+    total, data, summary = await db.run_sync(get_missing_fields_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/data-quality/duplicate-masters", response_model=GenericTabularReportResponse)
-def data_quality_duplicate_masters(
+async def data_quality_duplicate_masters(
     entity_types: str | None = None,
     duplicate_type: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _dq_filters(
         entity_types=entity_types,
@@ -1331,19 +1700,26 @@ def data_quality_duplicate_masters(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_duplicate_masters_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_duplicate_masters_report, filters),
+            export_format,
+            "data-quality-duplicate-masters",
+        )
+    total, data, summary = await db.run_sync(get_duplicate_masters_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/data-quality/compliance-gaps", response_model=GenericTabularReportResponse)
-def data_quality_compliance_gaps(
+async def data_quality_compliance_gaps(
     entity_types: str | None = None,
     compliance_type: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _dq_filters(
         entity_types=entity_types,
@@ -1351,26 +1727,39 @@ def data_quality_compliance_gaps(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_compliance_gaps_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_compliance_gaps_report, filters),
+            export_format,
+            "data-quality-compliance-gaps",
+        )
+    total, data, summary = await db.run_sync(get_compliance_gaps_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/data-quality/invalid-references", response_model=GenericTabularReportResponse)
-def data_quality_invalid_references(
+async def data_quality_invalid_references(
     entity_types: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> GenericTabularReportResponse:
+) -> GenericTabularReportResponse | StreamingResponse:
     _ = current_user
     filters = _dq_filters(entity_types=entity_types, page=page, page_size=page_size)
-    total, data, summary = get_invalid_references_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_invalid_references_report, filters),
+            export_format,
+            "data-quality-invalid-references",
+        )
+    total, data, summary = await db.run_sync(get_invalid_references_report, filters)
     return _generic_response(total=total, page=page, page_size=page_size, summary=summary, data=data)
 
 
 @router.get("/dead-stock", response_model=DeadStockReportResponse)
-def dead_stock_report(
+async def dead_stock_report(
     warehouse_id: int | None = None,
     warehouse_ids: str | None = None,
     product_id: int | None = None,
@@ -1380,9 +1769,10 @@ def dead_stock_report(
     inactivity_days: int = Query(default=90, ge=1),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> DeadStockReportResponse:
+) -> DeadStockReportResponse | StreamingResponse:
     _ = current_user
     filters = DeadStockReportFilters(
         warehouse_id=warehouse_id,
@@ -1395,12 +1785,19 @@ def dead_stock_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_dead_stock_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_dead_stock_rows, filters),
+            export_format,
+            "dead-stock",
+            columns=list(DeadStockReportRow.model_fields),
+        )
+    total, data = await db.run_sync(get_dead_stock_report, filters)
     return DeadStockReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
 @router.get("/stock-ageing", response_model=StockAgeingReportResponse)
-def stock_ageing_report(
+async def stock_ageing_report(
     warehouse_id: int | None = None,
     warehouse_ids: str | None = None,
     product_id: int | None = None,
@@ -1409,9 +1806,10 @@ def stock_ageing_report(
     category_values: str | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> StockAgeingReportResponse:
+) -> StockAgeingReportResponse | StreamingResponse:
     _ = current_user
     filters = StockAgeingFilters(
         warehouse_id=warehouse_id,
@@ -1423,12 +1821,19 @@ def stock_ageing_report(
         page=page,
         page_size=page_size,
     )
-    total, data = get_stock_ageing_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            await _all_rows(db, get_stock_ageing_report, filters),
+            export_format,
+            "stock-ageing",
+            columns=list(StockAgeingReportRow.model_fields),
+        )
+    total, data = await run_read_in_threadpool(db, get_stock_ageing_report, filters)
     return StockAgeingReportResponse(total=total, page=page, page_size=page_size, data=data)
 
 
 @router.get("/opening-stock", response_model=OpeningStockReportResponse)
-def opening_stock_report(
+async def opening_stock_report(
     brand_values: str | None = None,
     category_values: str | None = None,
     product_ids: str | None = None,
@@ -1438,9 +1843,10 @@ def opening_stock_report(
     date_to: date | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> OpeningStockReportResponse:
+) -> OpeningStockReportResponse | StreamingResponse:
     _ = current_user
     filters = OpeningStockFilters(
         brand_values=_parse_csv_strings(brand_values),
@@ -1453,7 +1859,14 @@ def opening_stock_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_opening_stock_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_opening_stock_rows, filters),
+            export_format,
+            "opening-stock",
+            columns=list(OpeningStockReportRow.model_fields),
+        )
+    total, data, summary = await db.run_sync(get_opening_stock_report, filters)
     return OpeningStockReportResponse(
         total=total,
         page=page,
@@ -1464,7 +1877,7 @@ def opening_stock_report(
 
 
 @router.get("/current-stock", response_model=CurrentStockReportResponse)
-def current_stock_report(
+async def current_stock_report(
     brand_values: str | None = None,
     category_values: str | None = None,
     product_ids: str | None = None,
@@ -1477,9 +1890,10 @@ def current_stock_report(
     stock_source: Literal["all", "opening", "non_opening"] | None = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    export_format: ExportFormat | None = Query(default=None, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
-) -> CurrentStockReportResponse:
+) -> CurrentStockReportResponse | StreamingResponse:
     _ = current_user
     filters = CurrentStockFilters(
         brand_values=_parse_csv_strings(brand_values),
@@ -1495,7 +1909,14 @@ def current_stock_report(
         page=page,
         page_size=page_size,
     )
-    total, data, summary = get_current_stock_report(db, filters)
+    if export_format is not None:
+        return export_response(
+            iter_read_rows(db, iter_current_stock_rows, filters),
+            export_format,
+            "current-stock",
+            columns=list(CurrentStockReportRow.model_fields),
+        )
+    total, data, summary = await db.run_sync(get_current_stock_report, filters)
     return CurrentStockReportResponse(
         total=total,
         page=page,
@@ -1509,16 +1930,16 @@ def current_stock_report(
     "/current-stock/source-details",
     response_model=CurrentStockSourceDetailResponse,
 )
-def current_stock_source_details(
+async def current_stock_source_details(
     warehouse_id: int,
     product_id: int,
     batch_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("reports:view")),
 ) -> CurrentStockSourceDetailResponse:
     _ = current_user
-    detail = get_current_stock_source_detail(
-        db,
+    detail = await db.run_sync(
+        get_current_stock_source_detail,
         warehouse_id=warehouse_id,
         product_id=product_id,
         batch_id=batch_id,
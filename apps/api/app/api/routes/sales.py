@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session, selectinload
 
 from app.core.database import get_db
 from app.core.exceptions import AppException
+from app.core.idempotency import IdempotentRequest, idempotent_request
 from app.core.permissions import require_permission
 from app.models.sales import DispatchNote, SalesOrder, StockReservation
 from app.models.user import User
@@ -153,8 +154,11 @@ def post_dispatch_note_route(
     dispatch_note_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("dispatch:post")),
+    idempotency: IdempotentRequest = Depends(idempotent_request),
 ) -> DispatchNoteResponse:
-    return post_dispatch_note(db, dispatch_note_id, current_user.id)
+    return idempotency.run(
+        db, lambda: post_dispatch_note(db, dispatch_note_id, current_user.id, commit=False)
+    )
 
 
 @router.post("/dispatch-notes/{dispatch_note_id}/cancel", response_model=DispatchNoteResponse)
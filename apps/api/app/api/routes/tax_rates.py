@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -11,6 +11,7 @@ from app.models.tax_rate import TaxRate
 from app.models.user import User
 from app.schemas.tax_rate import TaxRateCreate, TaxRateRead, TaxRateUpdate
 from app.services.audit import snapshot_model, write_audit_log
+from app.services.data_versions import bump_data_version, conditional_list_response
 from app.services.tax_rates import initialize_tenant_tax_rates
 
 router = APIRouter()
@@ -18,11 +19,16 @@ router = APIRouter()
 
 @router.get("", response_model=list[TaxRateRead])
 def list_tax_rates(
+    request: Request,
+    response: Response,
     include_inactive: bool = Query(default=False),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("tax:view")),
-) -> list[TaxRateRead]:
+) -> list[TaxRateRead] | Response:
     _ = current_user
+    not_modified_response = conditional_list_response(db, request, response, ("tax_rates",))
+    if not_modified_response is not None:
+        return not_modified_response
     initialize_tenant_tax_rates(db)
 
     query = db.query(TaxRate).order_by(TaxRate.rate_percent.asc(), TaxRate.code.asc())
@@ -42,6 +48,7 @@ def create_tax_rate(
 
     record = TaxRate(**payload.model_dump())
     db.add(record)
+    bump_data_version(db, "tax_rates")
     _commit_or_validation_error(db, "Failed to create tax rate")
     _write_tax_audit_log_safe(
         db,
@@ -85,6 +92,7 @@ def update_tax_rate(
     for field, value in updates.items():
         setattr(record, field, value)
 
+    bump_data_version(db, "tax_rates")
     _commit_or_validation_error(db, "Failed to update tax rate")
     _write_tax_audit_log_safe(
         db,
@@ -120,6 +128,7 @@ def deactivate_tax_rate(
 
     before_snapshot = snapshot_model(record)
     record.is_active = False
+    bump_data_version(db, "tax_rates")
     _commit_or_validation_error(db, "Failed to deactivate tax rate")
     _write_tax_audit_log_safe(
         db,
@@ -0,0 +1,13 @@
+"""Throughput benchmarks against a synthetic tenant on a local Postgres.
+
+* :mod:`app.benchmarks.generator` bulk-fills a fresh tenant with a named
+  volume profile;
+* :mod:`app.benchmarks.scenarios` times GRN posting, sales order confirmation
+  and dispatch, bulk imports and every report endpoint through the ASGI app;
+* :mod:`app.benchmarks.baseline` stores p50/p95 latency and query counts per
+  profile and reports regressions against them;
+* :mod:`app.benchmarks.pricing` times the document pricing engine on
+  1,000-line documents without a database.
+
+``python -m app.benchmarks --help`` ties them together.
+"""
@@ -0,0 +1,199 @@
+"""Benchmark command line.
+
+Usage (from apps/api, against the database in DATABASE_URL):
+    python -m app.benchmarks generate --org bench --profile standard [--replace]
+    python -m app.benchmarks run --org bench --profile standard [--only 'report:*']
+    python -m app.benchmarks run --org bench --profile standard --update-baseline
+    python -m app.benchmarks pricing [--lines 1000]
+
+``run`` exits with status 1 when a scenario regresses against the stored
+baseline for the profile or misses its absolute budget, like the 100k-item
+import's one minute. ``pricing`` needs no database; it times the
+document pricing engine on large in-memory documents.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import timedelta
+from fnmatch import fnmatch
+from pathlib import Path
+from secrets import token_urlsafe
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.benchmarks.baseline import (
+    DEFAULT_BASELINE_PATH,
+    find_budget_overruns,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from app.benchmarks.generator import PROFILES, generate_tenant
+from app.benchmarks.pricing import DEFAULT_LINE_COUNT, run_pricing_benchmark
+from app.benchmarks.scenarios import build_scenarios, load_context, run_scenario
+from app.core.database import SessionLocal
+from app.core.security import create_access_token, get_password_hash
+from app.core.tenancy import build_tenant_schema_name, quote_schema_name
+from app.main import app
+from app.models.user import User
+from app.services.rbac import assign_roles_to_user, ensure_rbac_seeded
+from app.services.tenancy import provision_organization_schema, run_tenant_job
+from app.testing import ensure_manufacturer
+
+
+def _bench_user(org: str) -> tuple[dict[str, str], int]:
+    """A local org admin bound to ``org``, as the e2e test tools create."""
+    email = f"benchmark@{org}.bench"
+    with SessionLocal() as db:
+        org_admin_role = ensure_rbac_seeded(db)["ORG_ADMIN"]
+        user = db.query(User).filter(User.email == email).first()
+        if user is None:
+            user = User(
+                email=email,
+                full_name="Benchmark Runner",
+                hashed_password=get_password_hash(token_urlsafe(24)),
+                auth_provider="LOCAL",
+                organization_slug=org,
+                is_active=True,
+                is_superuser=False,
+                role_id=org_admin_role.id,
+            )
+            db.add(user)
+            db.flush()
+            assign_roles_to_user(db, user, [org_admin_role.id])
+            db.commit()
+        token = create_access_token(str(user.id), expires_delta=timedelta(hours=12))
+        return {"Authorization": f"Bearer {token}"}, user.id
+
+
+def _generate(args: argparse.Namespace) -> int:
+    schema_name = build_tenant_schema_name(args.org)
+    with SessionLocal() as db:
+        if args.replace:
+            db.execute(text(f"DROP SCHEMA IF EXISTS {quote_schema_name(schema_name)} CASCADE"))
+            db.commit()
+        provision_organization_schema(
+            db, slug=args.org, name=f"Benchmark {args.org}", max_users=10
+        )
+
+    headers, user_id = _bench_user(args.org)
+    # The first request mirrors the benchmark user into the tenant schema, so the
+    # generated documents and audit rows can reference it.
+    ensure_manufacturer(TestClient(app), headers, "Sun Pharma")
+
+    started_at = perf_counter()
+    written = run_tenant_job(
+        args.org,
+        lambda db: generate_tenant(db, PROFILES[args.profile], created_by=user_id),
+    )
+    for table_name, rows in written.items():
+        print(f"{table_name:>26} {rows:>10,}")
+    print(f"Generated {args.profile!r} data in {schema_name} in {perf_counter() - started_at:.1f}s")
+    return 0
+
+
+def _print_header() -> None:
+    print(f"{'scenario':<56} {'n':>4} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'queries':>8}")
+
+
+def _print_result(result) -> None:
+    print(
+        f"{result.name:<56} {result.iterations:>4} {result.p50_ms:>9.1f} "
+        f"{result.p95_ms:>9.1f} {result.max_ms:>9.1f} {result.queries:>8}"
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    client = TestClient(app)
+    headers, _user_id = _bench_user(args.org)
+    ctx = run_tenant_job(args.org, lambda db: load_context(db, client, headers))
+    scenarios = [
+        scenario
+        for scenario in build_scenarios()
+        if not args.only or any(fnmatch(scenario.name, pattern) for pattern in args.only)
+    ]
+
+    results = []
+    _print_header()
+    for scenario in scenarios:
+        result = run_scenario(ctx, scenario, iterations=args.iterations, warmup=args.warmup)
+        results.append(result)
+        _print_result(result)
+
+    overruns = find_budget_overruns(
+        results,
+        {scenario.name: scenario.budget_ms for scenario in scenarios if scenario.budget_ms},
+    )
+    for overrun in overruns:
+        print(f"OVER BUDGET {overrun.describe()}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, args.profile, results)
+        print(f"Recorded {len(results)} results for {args.profile!r} in {args.baseline}")
+        return 1 if overruns else 0
+
+    baseline = load_baseline(args.baseline, args.profile)
+    if not baseline:
+        print(f"No {args.profile!r} baseline in {args.baseline}; nothing to compare")
+        return 1 if overruns else 0
+    regressions = find_regressions(
+        results,
+        baseline,
+        latency_tolerance=args.latency_tolerance,
+        latency_floor_ms=args.latency_floor_ms,
+        query_tolerance=args.query_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression.describe()}")
+    return 1 if regressions or overruns else 0
+
+
+def _pricing(args: argparse.Namespace) -> int:
+    _print_header()
+    for result in run_pricing_benchmark(line_count=args.lines, iterations=args.iterations):
+        _print_result(result)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="provision and fill a benchmark tenant")
+    generate.add_argument("--org", default="bench")
+    generate.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    generate.add_argument(
+        "--replace", action="store_true", help="drop the tenant schema before generating"
+    )
+    generate.set_defaults(handler=_generate)
+
+    run = commands.add_parser("run", help="run the scenarios and check for regressions")
+    run.add_argument("--org", default="bench")
+    run.add_argument("--profile", choices=sorted(PROFILES), default="standard")
+    run.add_argument("--only", action="append", help="glob of scenario names; repeatable")
+    run.add_argument("--iterations", type=int, help="override every scenario's iterations")
+    run.add_argument(
+        "--warmup", type=int, help="override every scenario's warm-up runs (default 2)"
+    )
+    run.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    run.add_argument("--update-baseline", action="store_true")
+    run.add_argument("--latency-tolerance", type=float, default=0.25)
+    run.add_argument("--latency-floor-ms", type=float, default=5.0)
+    run.add_argument("--query-tolerance", type=int, default=0)
+    run.set_defaults(handler=_run)
+
+    pricing = commands.add_parser("pricing", help="time the document pricing engine")
+    pricing.add_argument("--lines", type=int, default=DEFAULT_LINE_COUNT)
+    pricing.add_argument("--iterations", type=int, default=50)
+    pricing.set_defaults(handler=_pricing)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Stored benchmark results and the regression check against them.
+
+``benchmarks/baseline.json`` holds one result set per tenant profile, since
+numbers from different volumes are not comparable. A scenario regresses when
+its p95 latency grows beyond the relative tolerance (and an absolute floor, so
+millisecond-scale endpoints do not flap), or when any iteration runs more SQL
+statements than the baseline allows; query counts are deterministic, so they
+catch N+1 regressions that timing noise would hide.
+"""
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from math import ceil
+from pathlib import Path
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parents[2] / "benchmarks" / "baseline.json"
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    # The most SQL statements any single iteration executed.
+    queries: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    allowed: float
+
+    def describe(self) -> str:
+        return (
+            f"{self.scenario}: {self.metric} {self.current:g} exceeds {self.allowed:g} "
+            f"(baseline {self.baseline:g})"
+        )
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile, so p95 of 20 samples is the 19th slowest."""
+    ordered = sorted(values)
+    return ordered[max(ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def summarize(name: str, samples: Sequence[tuple[float, int]]) -> ScenarioResult:
+    """Fold ``(seconds, query_count)`` samples into a result."""
+    millis = [seconds * 1000 for seconds, _queries in samples]
+    return ScenarioResult(
+        name=name,
+        iterations=len(samples),
+        p50_ms=round(percentile(millis, 0.50), 2),
+        p95_ms=round(percentile(millis, 0.95), 2),
+        max_ms=round(max(millis), 2),
+        queries=max(queries for _seconds, queries in samples),
+    )
+
+
+def _read(path: Path) -> dict[str, dict[str, dict]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_baseline(path: Path, profile: str) -> dict[str, ScenarioResult]:
+    stored = _read(path).get(profile, {})
+    return {name: ScenarioResult(name=name, **values) for name, values in stored.items()}
+
+
+def save_baseline(path: Path, profile: str, results: Iterable[ScenarioResult]) -> None:
+    """Replace ``profile``'s results and keep the other profiles' as they were."""
+    stored = _read(path)
+    stored[profile] = {
+        result.name: {key: value for key, value in asdict(result).items() if key != "name"}
+        for result in results
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # sort_keys keeps the diff of a re-recorded baseline readable.
+    path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def find_budget_overruns(
+    results: Iterable[ScenarioResult], budgets: Mapping[str, float]
+) -> list[Regression]:
+    """Scenarios whose slowest iteration missed their absolute ``budget_ms``."""
+    return [
+        Regression(result.name, "max_ms", budgets[result.name], result.max_ms, budgets[result.name])
+        for result in results
+        if result.name in budgets and result.max_ms > budgets[result.name]
+    ]
+
+
+def find_regressions(
+    results: Iterable[ScenarioResult],
+    baseline: dict[str, ScenarioResult],
+    *,
+    latency_tolerance: float = 0.25,
+    latency_floor_ms: float = 5.0,
+    query_tolerance: int = 0,
+) -> list[Regression]:
+    """Scenarios without a baseline entry are new and never regress."""
+    regressions: list[Regression] = []
+    for result in results:
+        recorded = baseline.get(result.name)
+        if recorded is None:
+            continue
+        allowed_ms = max(
+            recorded.p95_ms * (1 + latency_tolerance), recorded.p95_ms + latency_floor_ms
+        )
+        if result.p95_ms > allowed_ms:
+            regressions.append(
+                Regression(result.name, "p95_ms", recorded.p95_ms, result.p95_ms, allowed_ms)
+            )
+        allowed_queries = recorded.queries + query_tolerance
+        if result.queries > allowed_queries:
+            regressions.append(
+                Regression(
+                    result.name, "queries", recorded.queries, result.queries, allowed_queries
+                )
+            )
+    return regressions
@@ -0,0 +1,719 @@
+"""Bulk synthetic data for a benchmark tenant.
+
+The API helpers in ``app.testing`` create one entity per request, which is far
+too slow for realistic volumes. :func:`generate_tenant` writes every table with
+set-based ``INSERT ... SELECT`` statements over ``generate_series`` in the
+tenant's search path, deriving pseudo-random but repeatable values from row
+numbers and ids, so a profile always produces the same shape of data.
+
+The rows are as consistent as the posting services would have left them:
+every closed purchase order has a posted GRN with one batch per line, every
+GRN batch line has its inward ledger row and provenance, dispatch movements
+never take a batch below zero and ``stock_summary`` is the sum of the ledger.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from math import ceil
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    add_months,
+    ensure_monthly_partitions,
+    month_start,
+)
+from app.models.brand import Brand
+from app.models.company_settings import CompanySettings
+from app.models.product import Product
+from app.models.uom import Uom
+from app.services.dashboard import refresh_dashboard_snapshot
+from app.services.data_quality import rescan_data_quality_findings
+from app.services.data_versions import bump_data_version
+
+
+@dataclass(frozen=True)
+class TenantProfile:
+    products: int
+    parties: int
+    warehouses: int
+    purchase_orders: int
+    lines_per_order: int
+    # Inward GRN movements come first; dispatches fill the rest of the budget.
+    ledger_rows: int
+    audit_logs: int
+    history_months: int = 24
+
+
+PROFILES: dict[str, TenantProfile] = {
+    "tiny": TenantProfile(
+        products=40,
+        parties=12,
+        warehouses=2,
+        purchase_orders=30,
+        lines_per_order=2,
+        ledger_rows=150,
+        audit_logs=60,
+        history_months=3,
+    ),
+    "small": TenantProfile(
+        products=2_000,
+        parties=300,
+        warehouses=4,
+        purchase_orders=4_000,
+        lines_per_order=2,
+        ledger_rows=50_000,
+        audit_logs=12_000,
+        history_months=12,
+    ),
+    "standard": TenantProfile(
+        products=50_000,
+        parties=5_000,
+        warehouses=8,
+        purchase_orders=100_000,
+        lines_per_order=2,
+        ledger_rows=2_000_000,
+        audit_logs=300_000,
+    ),
+}
+
+# Every twentieth order stays approved and unreceived, like a live order book.
+_OPEN_ORDER_EVERY = 20
+
+_MOLECULES = [
+    "Paracetamol",
+    "Amoxicillin",
+    "Azithromycin",
+    "Metformin",
+    "Atorvastatin",
+    "Amlodipine",
+    "Pantoprazole",
+    "Cetirizine",
+    "Ibuprofen",
+    "Diclofenac",
+    "Losartan",
+    "Omeprazole",
+    "Montelukast",
+    "Levocetirizine",
+    "Ciprofloxacin",
+    "Telmisartan",
+]
+_STRENGTHS = ["5mg", "10mg", "20mg", "40mg", "50mg", "100mg", "250mg", "500mg", "650mg"]
+_FORMS = ["Tablet", "Capsule", "Syrup", "Suspension", "Injection", "Drops", "Ointment", "Gel"]
+_MANUFACTURERS = [
+    "Sun Pharma",
+    "Cipla",
+    "Lupin",
+    "Mankind",
+    "Alkem",
+    "Torrent",
+    "Zydus",
+    "Glenmark",
+    "Intas",
+    "Abbott",
+    "Micro Labs",
+    "Dr Reddys",
+]
+_UOMS = ["BOX", "STRIP", "BOTTLE", "VIAL", "TUBE"]
+# (city, state, GST state code, pincode)
+_CITIES = [
+    ("Mumbai", "Maharashtra", "27", "400001"),
+    ("Pune", "Maharashtra", "27", "411001"),
+    ("Ahmedabad", "Gujarat", "24", "380001"),
+    ("Bengaluru", "Karnataka", "29", "560001"),
+    ("Chennai", "Tamil Nadu", "33", "600001"),
+    ("Hyderabad", "Telangana", "36", "500001"),
+    ("Kolkata", "West Bengal", "19", "700001"),
+    ("Jaipur", "Rajasthan", "08", "302001"),
+    ("Lucknow", "Uttar Pradesh", "09", "226001"),
+    ("Indore", "Madhya Pradesh", "23", "452001"),
+]
+_TRADE_NAMES = ["Shree", "Sai", "Om", "Ganesh", "Balaji", "Krishna", "Lakshmi", "Apollo", "Jeevan"]
+
+
+def generate_tenant(
+    db: Session,
+    profile: TenantProfile,
+    *,
+    created_by: int,
+    today: date | None = None,
+) -> dict[str, int]:
+    """Fill an empty tenant schema with ``profile``'s volumes; the caller commits.
+
+    Returns the number of rows written per table.
+    """
+    if db.scalar(select(func.count()).select_from(Product)):
+        raise ValueError("Benchmark data must be generated into a tenant without products")
+
+    today = today or date.today()
+    history_start = add_months(month_start(today), 1 - profile.history_months)
+    ensure_monthly_partitions(
+        db,
+        today=history_start,
+        months_ahead=profile.history_months + PARTITION_MONTHS_AHEAD,
+    )
+
+    closed_orders = profile.purchase_orders - profile.purchase_orders // _OPEN_ORDER_EVERY
+    receipts = closed_orders * profile.lines_per_order
+    dispatches = max(profile.ledger_rows - receipts, 0)
+    dispatches_per_batch = ceil(dispatches / receipts) if receipts else 0
+    params = {
+        "user_id": created_by,
+        "today": today,
+        "history_start": history_start,
+        # Orders stop two weeks back so every receipt and dispatch is in the past.
+        "order_span_days": max((today - timedelta(days=15) - history_start).days, 1),
+        "products": profile.products,
+        "suppliers": max(profile.parties // 5, 1),
+        "customers": max(profile.parties - max(profile.parties // 5, 1), 0),
+        "warehouses": profile.warehouses,
+        "purchase_orders": profile.purchase_orders,
+        "lines_per_order": profile.lines_per_order,
+        "open_order_every": _OPEN_ORDER_EVERY,
+        # Large enough that every dispatch takes at least one unit and the batch
+        # keeps a tenth of what it received.
+        "min_order_qty": max(20, 2 * dispatches_per_batch),
+        "dispatches": dispatches,
+        "dispatches_per_batch": dispatches_per_batch,
+        "audit_logs": profile.audit_logs,
+        "molecules": _MOLECULES,
+        "strengths": _STRENGTHS,
+        "forms": _FORMS,
+        "manufacturers": _MANUFACTURERS,
+        "uoms": _UOMS,
+        "cities": [city for city, _state, _code, _pin in _CITIES],
+        "states": [state for _city, state, _code, _pin in _CITIES],
+        "state_codes": [code for _city, _state, code, _pin in _CITIES],
+        "pincodes": [pin for _city, _state, _code, pin in _CITIES],
+        "trade_names": _TRADE_NAMES,
+    }
+
+    # Purchase tax splits need the company's own GSTIN and state.
+    db.execute(
+        insert(CompanySettings)
+        .values(
+            id=1,
+            company_name="Benchmark Pharma Pvt Ltd",
+            city="Mumbai",
+            state="Maharashtra",
+            pincode="400001",
+            gst_number="27AAACB1234A1Z5",
+            pan_number="AAACB1234A",
+        )
+        .on_conflict_do_nothing(index_elements=[CompanySettings.id])
+    )
+    db.execute(
+        insert(Brand)
+        .values([{"name": name, "is_active": True} for name in _MANUFACTURERS])
+        .on_conflict_do_nothing(index_elements=[Brand.name])
+    )
+    db.execute(
+        insert(Uom)
+        .values([{"name": name, "is_active": True} for name in _UOMS])
+        .on_conflict_do_nothing(index_elements=[Uom.name])
+    )
+    written: dict[str, int] = {}
+    for table_name, statement in _STATEMENTS:
+        result = db.execute(text(statement), params)
+        if table_name is not None:
+            written[table_name] = written.get(table_name, 0) + max(result.rowcount, 0)
+
+    bump_data_version(
+        db, "brands", "uoms", "parties", "products", "warehouses", "batches", "grns", "purchase_bills"
+    )
+    refresh_dashboard_snapshot(db, today)
+    rescan_data_quality_findings(db)
+    for table_name in written:
+        db.execute(text(f"ANALYZE {table_name}"))
+    return written
+
+
+_ARRAY_PICK = "(CAST(:{name} AS text[]))[1 + ({index}) % cardinality(CAST(:{name} AS text[]))]"
+
+
+def _pick(name: str, index: str) -> str:
+    return _ARRAY_PICK.format(name=name, index=index)
+
+
+# (table whose rowcount is reported, statement); ``None`` marks bookkeeping.
+_STATEMENTS: list[tuple[str | None, str]] = [
+    (
+        "warehouses",
+        f"""
+        INSERT INTO warehouses (name, code, address, is_active)
+        SELECT {_pick("cities", "g - 1")} || ' Depot ' || g,
+               'WH-' || lpad(g::text, 2, '0'),
+               'Plot ' || g || ', MIDC, ' || {_pick("cities", "g - 1")},
+               TRUE
+        FROM generate_series(1, :warehouses) AS g
+        """,
+    ),
+    (
+        "parties",
+        f"""
+        INSERT INTO parties (
+            name, party_type, party_category, contact_person, phone, email, address,
+            city, state, pincode, country, gstin, pan_number, registration_type,
+            gst_verified_status, gst_verified_at, credit_limit, opening_balance, is_active
+        )
+        SELECT {_pick("trade_names", "g")} || ' Pharma Distributors ' || g,
+               'SUPPLIER',
+               CASE WHEN g % 3 = 0 THEN 'STOCKIST' ELSE 'DISTRIBUTOR' END,
+               'Manager ' || g,
+               '98' || lpad(g::text, 8, '0'),
+               'orders' || g || '@supplier.example',
+               'Unit ' || g || ', Pharma Market',
+               {_pick("cities", "g")},
+               {_pick("states", "g")},
+               {_pick("pincodes", "g")},
+               'India',
+               gstin,
+               substr(gstin, 3, 10),
+               'REGISTERED',
+               'VERIFIED',
+               now(),
+               0,
+               0,
+               TRUE
+        FROM generate_series(1, :suppliers) AS g
+        CROSS JOIN LATERAL (
+            SELECT {_pick("state_codes", "g")} || 'AAB'
+                   || chr(65 + g % 26) || chr(65 + (g / 26) % 26)
+                   || lpad((g % 10000)::text, 4, '0') || 'F1Z' || (g % 10) AS gstin
+        ) AS identity
+        """,
+    ),
+    (
+        "parties",
+        f"""
+        INSERT INTO parties (
+            name, party_type, party_category, phone, address, city, state, pincode,
+            country, credit_limit, opening_balance, is_active
+        )
+        SELECT {_pick("trade_names", "g * 7")} || ' Medicals ' || g,
+               'CUSTOMER',
+               CASE g % 10 WHEN 0 THEN 'HOSPITAL' WHEN 1 THEN 'PHARMACY' ELSE 'RETAILER' END,
+               '97' || lpad(g::text, 8, '0'),
+               'Shop ' || g || ', Main Road',
+               {_pick("cities", "g * 3")},
+               {_pick("states", "g * 3")},
+               {_pick("pincodes", "g * 3")},
+               'India',
+               50000,
+               0,
+               TRUE
+        FROM generate_series(1, :customers) AS g
+        """,
+    ),
+    (
+        "products",
+        f"""
+        INSERT INTO products (
+            sku, name, brand, category, uom, hsn, gst_rate, default_purchase_rate,
+            default_sale_rate, mrp, unit_price, is_active
+        )
+        SELECT 'SKU-' || lpad(g::text, 6, '0'),
+               {_pick("molecules", "g")} || ' ' || {_pick("strengths", "g / 16")}
+                   || ' ' || {_pick("forms", "g / 144")},
+               {_pick("manufacturers", "g / 3")},
+               {_pick("forms", "g / 144")},
+               {_pick("uoms", "g")},
+               '300490' || lpad((g % 100)::text, 2, '0'),
+               gst_rate,
+               round(mrp * 0.55, 2),
+               round(mrp * 0.75, 2),
+               mrp,
+               round(mrp * 100 / (100 + gst_rate), 2),
+               g % 50 <> 0
+        FROM generate_series(1, :products) AS g
+        CROSS JOIN LATERAL (
+            SELECT CASE WHEN g % 3 = 0 THEN 12 ELSE 5 END AS gst_rate,
+                   20.50 + (g * 37) % 980 AS mrp
+        ) AS pricing
+        """,
+    ),
+    (
+        None,
+        """
+        CREATE TEMP TABLE _bench_products ON COMMIT DROP AS
+        SELECT row_number() OVER (ORDER BY id) - 1 AS n, id, default_purchase_rate, gst_rate
+        FROM products
+        """,
+    ),
+    (
+        None,
+        """
+        CREATE TEMP TABLE _bench_suppliers ON COMMIT DROP AS
+        SELECT row_number() OVER (ORDER BY id) - 1 AS n, id
+        FROM parties
+        WHERE party_type = 'SUPPLIER'
+        """,
+    ),
+    (
+        None,
+        """
+        CREATE TEMP TABLE _bench_warehouses ON COMMIT DROP AS
+        SELECT row_number() OVER (ORDER BY id) - 1 AS n, id
+        FROM warehouses
+        """,
+    ),
+    (
+        "purchase_orders",
+        """
+        INSERT INTO purchase_orders (
+            id, po_number, supplier_id, warehouse_id, status, order_date, expected_date,
+            tax_type, subtotal, discount_percent, discount_amount, taxable_value,
+            gst_percent, cgst_percent, sgst_percent, igst_percent, cgst_amount,
+            sgst_amount, igst_amount, adjustment, final_total, created_by, created_at
+        )
+        SELECT o.id,
+               'PO-' || to_char(o.order_date, 'YYYYMMDD') || '-' || lpad(o.id::text, 6, '0'),
+               s.id,
+               w.id,
+               CAST(
+                   CASE WHEN o.g % :open_order_every = 0 THEN 'APPROVED' ELSE 'CLOSED' END
+                   AS purchase_order_status_enum
+               ),
+               o.order_date,
+               o.order_date + 7,
+               'INTRA_STATE',
+               0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+               :user_id,
+               o.order_date + time '09:30'
+        FROM (
+            SELECT g,
+                   nextval(pg_get_serial_sequence('purchase_orders', 'id')) AS id,
+                   CAST(:history_start AS date) + (g * 7919) % :order_span_days AS order_date
+            FROM generate_series(1, :purchase_orders) AS g
+        ) AS o
+        JOIN _bench_suppliers AS s ON s.n = (o.g * 31) % :suppliers
+        JOIN _bench_warehouses AS w ON w.n = o.g % :warehouses
+        """,
+    ),
+    (
+        "purchase_order_lines",
+        """
+        INSERT INTO purchase_order_lines (
+            purchase_order_id, product_id, ordered_qty, received_qty, unit_cost, free_qty,
+            discount_amount, taxable_value, gst_percent, cgst_percent, sgst_percent,
+            igst_percent, cgst_amount, sgst_amount, igst_amount, tax_amount, line_total
+        )
+        SELECT l.po_id, l.product_id, l.qty,
+               CASE WHEN l.closed THEN l.qty ELSE 0 END,
+               l.unit_cost, 0, 0, l.taxable, l.gst, l.gst / 2, l.gst / 2, 0,
+               l.half_tax, l.half_tax, 0, 2 * l.half_tax, l.taxable + 2 * l.half_tax
+        FROM (
+            SELECT po.id AS po_id,
+                   po.status = 'CLOSED' AS closed,
+                   p.id AS product_id,
+                   p.default_purchase_rate AS unit_cost,
+                   p.gst_rate AS gst,
+                   q.qty,
+                   round(q.qty * p.default_purchase_rate, 2) AS taxable,
+                   round(q.qty * p.default_purchase_rate * p.gst_rate / 200, 2) AS half_tax
+            FROM purchase_orders AS po
+            CROSS JOIN generate_series(1, :lines_per_order) AS k
+            CROSS JOIN LATERAL (
+                SELECT :min_order_qty + (po.id * 13 + k * 7) % 181 AS qty
+            ) AS q
+            JOIN _bench_products AS p ON p.n = (po.id * 7919 + k * 104729) % :products
+        ) AS l
+        """,
+    ),
+    (
+        None,
+        """
+        UPDATE purchase_orders AS po
+        SET subtotal = t.taxable,
+            taxable_value = t.taxable,
+            cgst_amount = t.half_tax,
+            sgst_amount = t.half_tax,
+            final_total = t.total
+        FROM (
+            SELECT purchase_order_id,
+                   sum(taxable_value) AS taxable,
+                   sum(cgst_amount) AS half_tax,
+                   sum(line_total) AS total
+            FROM purchase_order_lines
+            GROUP BY purchase_order_id
+        ) AS t
+        WHERE po.id = t.purchase_order_id
+        """,
+    ),
+    (
+        None,
+        """
+        CREATE TEMP TABLE _bench_receipts ON COMMIT DROP AS
+        SELECT row_number() OVER (ORDER BY pol.id) - 1 AS n,
+               pol.id AS po_line_id,
+               po.id AS po_id,
+               po.supplier_id,
+               po.warehouse_id,
+               pol.product_id,
+               p.name AS product_name,
+               p.mrp,
+               pol.ordered_qty,
+               pol.received_qty,
+               pol.unit_cost,
+               po.order_date + 3 + po.id % 8 AS received_date,
+               'B' || to_char(po.order_date, 'YYMM') || lpad(pol.id::text, 7, '0') AS batch_no,
+               po.order_date + 180 + (pol.id * 17) % 720 AS expiry_date,
+               po.order_date - 30 - pol.id % 60 AS mfg_date,
+               CAST(NULL AS integer) AS batch_id,
+               CAST(NULL AS integer) AS grn_id,
+               CAST(NULL AS varchar) AS grn_number,
+               CAST(NULL AS integer) AS grn_line_id,
+               CAST(NULL AS integer) AS grn_batch_line_id
+        FROM purchase_order_lines AS pol
+        JOIN purchase_orders AS po ON po.id = pol.purchase_order_id
+        JOIN products AS p ON p.id = pol.product_id
+        WHERE po.status = 'CLOSED'
+        """,
+    ),
+    (
+        "batches",
+        """
+        INSERT INTO batches (product_id, batch_no, expiry_date, mfg_date, mrp)
+        SELECT product_id, batch_no, expiry_date, mfg_date, mrp
+        FROM _bench_receipts
+        """,
+    ),
+    (
+        None,
+        """
+        UPDATE _bench_receipts AS r
+        SET batch_id = b.id
+        FROM batches AS b
+        WHERE b.batch_no = r.batch_no AND b.product_id = r.product_id
+        """,
+    ),
+    (
+        "grns",
+        """
+        INSERT INTO grns (
+            grn_number, purchase_order_id, supplier_id, warehouse_id, status,
+            received_date, posted_at, posted_by, created_by, created_at
+        )
+        SELECT 'GRN-' || upper(substr(md5('grn:' || po_id), 1, 10)),
+               po_id,
+               supplier_id,
+               warehouse_id,
+               CAST('POSTED' AS grn_status_enum),
+               received_date,
+               received_date + time '11:00',
+               :user_id,
+               :user_id,
+               received_date + time '10:00'
+        FROM (
+            SELECT DISTINCT po_id, supplier_id, warehouse_id, received_date
+            FROM _bench_receipts
+        ) AS received
+        """,
+    ),
+    (
+        None,
+        """
+        UPDATE _bench_receipts AS r
+        SET grn_id = g.id, grn_number = g.grn_number
+        FROM grns AS g
+        WHERE g.purchase_order_id = r.po_id
+        """,
+    ),
+    (
+        "grn_lines",
+        """
+        INSERT INTO grn_lines (
+            grn_id, po_line_id, product_id, product_name_snapshot, ordered_qty_snapshot,
+            received_qty_total, free_qty_total, batch_id, received_qty, free_qty,
+            unit_cost, expiry_date
+        )
+        SELECT grn_id, po_line_id, product_id, product_name, ordered_qty, received_qty, 0,
+               batch_id, received_qty, 0, unit_cost, expiry_date
+        FROM _bench_receipts
+        """,
+    ),
+    (
+        None,
+        """
+        UPDATE _bench_receipts AS r
+        SET grn_line_id = gl.id
+        FROM grn_lines AS gl
+        WHERE gl.po_line_id = r.po_line_id
+        """,
+    ),
+    (
+        "grn_batch_lines",
+        """
+        INSERT INTO grn_batch_lines (
+            grn_line_id, batch_no, expiry_date, mfg_date, mrp, received_qty, free_qty,
+            unit_cost, batch_id
+        )
+        SELECT grn_line_id, batch_no, expiry_date, mfg_date, mrp, received_qty, 0,
+               unit_cost, batch_id
+        FROM _bench_receipts
+        """,
+    ),
+    (
+        None,
+        """
+        UPDATE _bench_receipts AS r
+        SET grn_batch_line_id = bl.id
+        FROM grn_batch_lines AS bl
+        WHERE bl.grn_line_id = r.grn_line_id
+        """,
+    ),
+    (
+        "inventory_ledger",
+        """
+        INSERT INTO inventory_ledger (
+            txn_type, reason, ref_type, ref_id, warehouse_id, product_id, batch_id, qty,
+            unit_cost, created_by, created_at
+        )
+        SELECT CAST('IN' AS inventory_txn_type_enum),
+               CAST('PURCHASE_GRN' AS inventory_reason_enum),
+               'GRN',
+               grn_number,
+               warehouse_id,
+               product_id,
+               batch_id,
+               received_qty,
+               unit_cost,
+               :user_id,
+               received_date + time '11:00'
+        FROM _bench_receipts
+        """,
+    ),
+    (
+        "stock_source_provenance",
+        """
+        INSERT INTO stock_source_provenance (
+            ledger_id, supplier_id, purchase_order_id, grn_id, grn_line_id,
+            grn_batch_line_id, warehouse_id, product_id, batch_id, batch_no, expiry_date,
+            inward_date, received_qty, free_qty, unit_cost_snapshot
+        )
+        SELECT l.id, r.supplier_id, r.po_id, r.grn_id, r.grn_line_id, r.grn_batch_line_id,
+               r.warehouse_id, r.product_id, r.batch_id, r.batch_no, r.expiry_date,
+               r.received_date, r.received_qty, 0, r.unit_cost
+        FROM _bench_receipts AS r
+        JOIN inventory_ledger AS l ON l.batch_id = r.batch_id AND l.reason = 'PURCHASE_GRN'
+        """,
+    ),
+    (
+        "inventory_ledger",
+        """
+        INSERT INTO inventory_ledger (
+            txn_type, reason, ref_type, ref_id, warehouse_id, product_id, batch_id, qty,
+            created_by, created_at
+        )
+        SELECT CAST('OUT' AS inventory_txn_type_enum),
+               CAST('SALES_DISPATCH' AS inventory_reason_enum),
+               'DISPATCH',
+               'DSP-' || upper(substr(md5(r.po_line_id || ':' || j), 1, 10)),
+               r.warehouse_id,
+               r.product_id,
+               r.batch_id,
+               -greatest(1, floor(r.received_qty * 0.9 / :dispatches_per_batch)),
+               :user_id,
+               r.received_date + time '16:00'
+                   + (j * (CAST(:today AS date) - r.received_date) / (:dispatches_per_batch + 1))
+                   * interval '1 day'
+        FROM _bench_receipts AS r
+        CROSS JOIN generate_series(1, :dispatches_per_batch) AS j
+        WHERE r.n * :dispatches_per_batch + j <= :dispatches
+        """,
+    ),
+    (
+        "stock_summary",
+        """
+        INSERT INTO stock_summary (
+            warehouse_id, product_id, batch_id, qty_on_hand, expiry_date, updated_at
+        )
+        SELECT l.warehouse_id, l.product_id, l.batch_id, sum(l.qty), b.expiry_date,
+               max(l.created_at)
+        FROM inventory_ledger AS l
+        JOIN batches AS b ON b.id = l.batch_id
+        GROUP BY l.warehouse_id, l.product_id, l.batch_id, b.expiry_date
+        """,
+    ),
+    (
+        None,
+        """
+        CREATE TEMP TABLE _bench_orders ON COMMIT DROP AS
+        SELECT row_number() OVER (ORDER BY id) - 1 AS n, id, po_number, status, final_total,
+               created_at
+        FROM purchase_orders
+        """,
+    ),
+    (
+        "audit_logs",
+        """
+        INSERT INTO audit_logs (
+            entity_type, entity_id, module, action, performed_by, timestamp, summary,
+            before_snapshot, after_snapshot, metadata
+        )
+        SELECT 'PO',
+               po.id,
+               'Purchase',
+               (ARRAY['CREATE', 'APPROVE', 'UPDATE'])[1 + (a / :purchase_orders) % 3],
+               :user_id,
+               least(po.created_at + (a / :purchase_orders) * interval '1 hour', now()),
+               'Purchase order ' || po.po_number,
+               CASE WHEN a >= :purchase_orders
+                   THEN json_build_object('po_number', po.po_number, 'status', 'DRAFT')
+               END,
+               json_build_object(
+                   'po_number', po.po_number, 'status', po.status, 'final_total', po.final_total
+               ),
+               json_build_object('po_number', po.po_number)
+        FROM generate_series(0, :audit_logs / 2 - 1) AS a
+        JOIN _bench_orders AS po ON po.n = a % :purchase_orders
+        """,
+    ),
+    (
+        "audit_logs",
+        """
+        INSERT INTO audit_logs (
+            entity_type, entity_id, module, action, performed_by, timestamp, summary,
+            after_snapshot, metadata
+        )
+        SELECT 'GRN',
+               g.id,
+               'Purchase',
+               'POST',
+               :user_id,
+               g.posted_at,
+               'Posted ' || g.grn_number,
+               json_build_object('grn_number', g.grn_number, 'status', g.status),
+               json_build_object('grn_number', g.grn_number)
+        FROM grns AS g
+        ORDER BY g.id
+        LIMIT (:audit_logs - :audit_logs / 2) / 2
+        """,
+    ),
+    (
+        "audit_logs",
+        """
+        INSERT INTO audit_logs (
+            entity_type, entity_id, module, action, performed_by, timestamp, summary,
+            before_snapshot, after_snapshot
+        )
+        SELECT 'PRODUCT',
+               p.id,
+               'Masters',
+               'UPDATE',
+               :user_id,
+               CAST(:history_start AS date) + (a * 13) % :order_span_days + time '12:00',
+               'Updated ' || p.sku,
+               json_build_object('sku', p.sku, 'mrp', p.mrp - 1),
+               json_build_object('sku', p.sku, 'mrp', p.mrp)
+        FROM generate_series(
+            0, :audit_logs - :audit_logs / 2 - (:audit_logs - :audit_logs / 2) / 2 - 1
+        ) AS a
+        JOIN _bench_products AS bp ON bp.n = (a * 7919) % :products
+        JOIN products AS p ON p.id = bp.id
+        """,
+    ),
+]
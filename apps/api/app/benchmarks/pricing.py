@@ -0,0 +1,77 @@
+"""Microbenchmark for the document pricing engine.
+
+Prices large in-memory documents shaped like each document type, with no
+database involved, so the numbers isolate the per-line arithmetic.
+"""
+
+from collections.abc import Callable
+from decimal import Decimal
+from random import Random
+from time import perf_counter
+
+from app.benchmarks.baseline import ScenarioResult, summarize
+from app.services.pricing import INTER_STATE, INTRA_STATE, PricingLine, price_document
+
+DEFAULT_LINE_COUNT = 1000
+_GST_RATES = tuple(Decimal(rate) for rate in ("0.00", "5.00", "12.00", "18.00"))
+
+
+def build_lines(count: int, *, kind: str, seed: int = 7) -> list[PricingLine]:
+    """``count`` lines priced the way a ``kind`` document prices them."""
+    rng = Random(seed)
+    lines = []
+    for _ in range(count):
+        qty = Decimal(rng.randint(1, 500))
+        unit_price = Decimal(rng.randint(100, 250_000)) / 100
+        if kind == "purchase_order":
+            line = PricingLine(
+                qty=qty,
+                unit_price=unit_price,
+                gst_percent=rng.choice(_GST_RATES),
+                discount_percent=Decimal("2.50"),
+            )
+        elif kind == "sales_order":
+            line = PricingLine(
+                qty=qty, unit_price=unit_price, discount_percent=Decimal(rng.randint(0, 10))
+            )
+        else:
+            line = PricingLine(
+                qty=qty, unit_price=unit_price, discount_amount=Decimal(rng.randint(0, 500)) / 100
+            )
+        lines.append(line)
+    return lines
+
+
+def _scenarios(line_count: int) -> dict[str, Callable[[], object]]:
+    purchase_lines = build_lines(line_count, kind="purchase_order")
+    sales_lines = build_lines(line_count, kind="sales_order")
+    bill_lines = build_lines(line_count, kind="purchase_bill")
+    return {
+        f"pricing:purchase_order:intra_state:{line_count}": lambda: price_document(
+            purchase_lines, tax_type=INTRA_STATE, adjustment=Decimal("-0.40")
+        ),
+        f"pricing:purchase_order:inter_state:{line_count}": lambda: price_document(
+            purchase_lines, tax_type=INTER_STATE
+        ),
+        f"pricing:sales_order:{line_count}": lambda: price_document(sales_lines),
+        f"pricing:purchase_bill:{line_count}": lambda: price_document(bill_lines),
+    }
+
+
+def run_pricing_benchmark(
+    *,
+    line_count: int = DEFAULT_LINE_COUNT,
+    iterations: int = 50,
+    warmup: int = 3,
+) -> list[ScenarioResult]:
+    results = []
+    for name, price in _scenarios(line_count).items():
+        for _ in range(warmup):
+            price()
+        samples = []
+        for _ in range(iterations):
+            started_at = perf_counter()
+            price()
+            samples.append((perf_counter() - started_at, 0))
+        results.append(summarize(name, samples))
+    return results
@@ -0,0 +1,345 @@
+"""End-to-end benchmark scenarios against a generated tenant.
+
+A scenario drives the real ASGI app through ``TestClient`` like the workflow
+tests do, so every middleware, dependency and commit is part of the timing.
+Only :attr:`Scenario.run` is timed; :attr:`Scenario.prepare` creates what the
+timed step consumes (a draft GRN to post, a sales order to confirm). Query
+counts come from the ``Server-Timing`` header that ``app.main`` adds to every
+response. A scenario with a :attr:`Scenario.budget_ms` also has an absolute
+target, checked whether or not a baseline exists.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.routes.reports import router as reports_router
+from app.benchmarks.baseline import ScenarioResult, summarize
+from app.models.batch import Batch
+from app.models.enums import GSTVerifiedStatus
+from app.models.inventory import StockSummary
+from app.models.party import Party
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+
+_SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries')
+BULK_IMPORT_ROWS = 200
+# The product import's target: a full 100k-item catalogue in under a minute.
+LARGE_ITEM_IMPORT_ROWS = 100_000
+LARGE_ITEM_IMPORT_BUDGET_MS = 60_000.0
+
+
+class BenchmarkError(RuntimeError):
+    pass
+
+
+@dataclass
+class BenchmarkContext:
+    """The client, credentials and generated rows the scenarios work with."""
+
+    client: TestClient
+    headers: dict[str, str]
+    supplier_id: int
+    customer_id: int
+    warehouse_id: int
+    warehouse_code: str
+    product_id: int
+    product_sku: str
+    gst_rate: str
+    brand: str
+    batch_id: int
+    queries: int = 0
+
+    def request(self, method: str, url: str, *, expected: int = 200, **kwargs: Any) -> Any:
+        response = self.client.request(method, url, headers=self.headers, **kwargs)
+        if response.status_code != expected:
+            raise BenchmarkError(
+                f"{method} {url} returned {response.status_code}: {response.text[:500]}"
+            )
+        match = _SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+        if match:
+            self.queries += int(match.group(1))
+        return response.json()
+
+
+def load_context(db: Session, client: TestClient, headers: dict[str, str]) -> BenchmarkContext:
+    """Pick a verified supplier, a customer and the fullest unexpired batch."""
+    supplier_id = db.scalar(
+        select(Party.id)
+        .where(Party.party_type == "SUPPLIER")
+        .where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+        .order_by(Party.id)
+        .limit(1)
+    )
+    customer_id = db.scalar(
+        select(Party.id).where(Party.party_type == "CUSTOMER").order_by(Party.id).limit(1)
+    )
+    stock = db.execute(
+        select(StockSummary.batch_id, Product, Warehouse.id, Warehouse.code)
+        .join(Product, Product.id == StockSummary.product_id)
+        .join(Warehouse, Warehouse.id == StockSummary.warehouse_id)
+        .join(Batch, Batch.id == StockSummary.batch_id)
+        .where(Product.is_active.is_(True))
+        .where(Batch.expiry_date > date.today() + timedelta(days=180))
+        .order_by(StockSummary.qty_on_hand.desc(), StockSummary.id)
+        .limit(1)
+    ).first()
+    if supplier_id is None or customer_id is None or stock is None:
+        raise BenchmarkError("The tenant has no generated benchmark data")
+    batch_id, product, warehouse_id, warehouse_code = stock
+    return BenchmarkContext(
+        client=client,
+        headers=headers,
+        supplier_id=supplier_id,
+        customer_id=customer_id,
+        warehouse_id=warehouse_id,
+        warehouse_code=warehouse_code,
+        product_id=product.id,
+        product_sku=product.sku,
+        gst_rate=str(product.gst_rate or 0),
+        brand=product.brand,
+        batch_id=batch_id,
+    )
+
+
+def _no_preparation(_ctx: BenchmarkContext) -> None:
+    return None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    run: Callable[[BenchmarkContext, Any], None]
+    prepare: Callable[[BenchmarkContext], Any] = _no_preparation
+    iterations: int = 20
+    # Overrides the runner's warm-up count, for scenarios too heavy to repeat.
+    warmup: int | None = None
+    # Slowest acceptable iteration, regardless of the stored baseline.
+    budget_ms: float | None = None
+
+
+def run_scenario(
+    ctx: BenchmarkContext,
+    scenario: Scenario,
+    *,
+    iterations: int | None = None,
+    warmup: int | None = None,
+) -> ScenarioResult:
+    if warmup is None:
+        warmup = 2 if scenario.warmup is None else scenario.warmup
+    samples: list[tuple[float, int]] = []
+    for index in range(warmup + (iterations or scenario.iterations)):
+        state = scenario.prepare(ctx)
+        ctx.queries = 0
+        started_at = perf_counter()
+        scenario.run(ctx, state)
+        elapsed = perf_counter() - started_at
+        if index >= warmup:
+            samples.append((elapsed, ctx.queries))
+    return summarize(scenario.name, samples)
+
+
+def _tag() -> str:
+    return uuid4().hex[:10].upper()
+
+
+def _prepare_draft_grn(ctx: BenchmarkContext) -> int:
+    po = ctx.request(
+        "POST",
+        "/purchase/po",
+        expected=201,
+        json={
+            "supplier_id": ctx.supplier_id,
+            "warehouse_id": ctx.warehouse_id,
+            "lines": [
+                {
+                    "product_id": ctx.product_id,
+                    "ordered_qty": "50",
+                    "unit_cost": "42.00",
+                    "free_qty": "0",
+                }
+            ],
+        },
+    )
+    ctx.request("POST", f"/purchase/po/{po['id']}/approve")
+    grn = ctx.request(
+        "POST",
+        f"/purchase/grn/from-po/{po['id']}",
+        expected=201,
+        json={
+            "lines": [
+                {
+                    "po_line_id": po["lines"][0]["id"],
+                    "received_qty": "50",
+                    "free_qty": "0",
+                    "batch_no": f"BENCH-{_tag()}",
+                    "expiry_date": (date.today() + timedelta(days=730)).isoformat(),
+                }
+            ],
+        },
+    )
+    return grn["id"]
+
+
+def _post_grn(ctx: BenchmarkContext, grn_id: int) -> None:
+    ctx.request("POST", f"/purchase/grn/{grn_id}/post")
+
+
+def _prepare_sales_order(ctx: BenchmarkContext) -> dict:
+    return ctx.request(
+        "POST",
+        "/sales-orders",
+        expected=201,
+        json={
+            "customer_id": ctx.customer_id,
+            "warehouse_id": ctx.warehouse_id,
+            "lines": [
+                {
+                    "product_id": ctx.product_id,
+                    "ordered_qty": "1",
+                    "unit_price": "25.00",
+                    "discount_percent": "0",
+                    "gst_rate": ctx.gst_rate,
+                }
+            ],
+        },
+    )
+
+
+def _confirm_and_dispatch(ctx: BenchmarkContext, order: dict) -> None:
+    ctx.request("POST", f"/sales-orders/{order['id']}/confirm")
+    dispatch = ctx.request(
+        "POST",
+        f"/dispatch-notes/from-sales-order/{order['id']}",
+        expected=201,
+        json={
+            "lines": [
+                {
+                    "sales_order_line_id": order["lines"][0]["id"],
+                    "batch_id": ctx.batch_id,
+                    "dispatched_qty": "1",
+                }
+            ],
+        },
+    )
+    ctx.request("POST", f"/dispatch-notes/{dispatch['id']}/post")
+
+
+def _bulk_import(url: str) -> Callable[[BenchmarkContext, list[dict]], None]:
+    def _run(ctx: BenchmarkContext, rows: list[dict]) -> None:
+        result = ctx.request("POST", url, json={"rows": rows})
+        if result["failed_count"]:
+            raise BenchmarkError(f"{url} rejected rows: {result['errors'][:3]}")
+
+    return _run
+
+
+def _item_rows(count: int) -> Callable[[BenchmarkContext], list[dict]]:
+    def _prepare(ctx: BenchmarkContext) -> list[dict]:
+        tag = _tag()
+        return [
+            {
+                "sku": f"IMP-{tag}-{index:06d}",
+                "product_name": f"Imported Item {tag} {index}",
+                "manufacturer": ctx.brand,
+                "uom": "BOX",
+                "gst_rate": "5",
+            }
+            for index in range(count)
+        ]
+
+    return _prepare
+
+
+def _party_rows(_ctx: BenchmarkContext) -> list[dict]:
+    tag = _tag()
+    return [
+        {
+            "party_name": f"Imported Chemist {tag} {index}",
+            "party_category": "RETAILER",
+            "mobile": f"96{index:08d}",
+            "city": "Pune",
+            "pincode": "411001",
+        }
+        for index in range(BULK_IMPORT_ROWS)
+    ]
+
+
+def _opening_stock_rows(ctx: BenchmarkContext) -> list[dict]:
+    tag = _tag()
+    expiry_date = (date.today() + timedelta(days=540)).isoformat()
+    return [
+        {
+            "sku": ctx.product_sku,
+            "warehouse_code": ctx.warehouse_code,
+            "batch_no": f"OPEN-{tag}-{index:04d}",
+            "expiry_date": expiry_date,
+            "qty": "10",
+        }
+        for index in range(BULK_IMPORT_ROWS)
+    ]
+
+
+def _get(path: str) -> Callable[[BenchmarkContext, None], None]:
+    def _run(ctx: BenchmarkContext, _state: None) -> None:
+        ctx.request("GET", path)
+
+    return _run
+
+
+def report_paths() -> list[str]:
+    """Every report endpoint that can be called without parameters."""
+    paths: list[str] = []
+    for route in reports_router.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if "filter-options" in route.path or route.dependant.path_params:
+            continue
+        if any(param.field_info.is_required() for param in route.dependant.query_params):
+            continue
+        paths.append(f"/reports{route.path}")
+    return paths
+
+
+def build_scenarios() -> list[Scenario]:
+    return [
+        Scenario("grn_post", run=_post_grn, prepare=_prepare_draft_grn),
+        Scenario("so_confirm_dispatch", run=_confirm_and_dispatch, prepare=_prepare_sales_order),
+        Scenario(
+            "import_items",
+            run=_bulk_import("/masters/items/bulk"),
+            prepare=_item_rows(BULK_IMPORT_ROWS),
+            iterations=5,
+        ),
+        Scenario(
+            "import_items_100k",
+            run=_bulk_import("/masters/items/bulk"),
+            prepare=_item_rows(LARGE_ITEM_IMPORT_ROWS),
+            iterations=1,
+            warmup=0,
+            budget_ms=LARGE_ITEM_IMPORT_BUDGET_MS,
+        ),
+        Scenario(
+            "import_parties",
+            run=_bulk_import("/masters/parties/bulk"),
+            prepare=_party_rows,
+            iterations=5,
+        ),
+        Scenario(
+            "import_opening_stock",
+            run=_bulk_import("/inventory/opening-stock/bulk"),
+            prepare=_opening_stock_rows,
+            iterations=5,
+        ),
+        Scenario("dashboard", run=_get("/dashboard/metrics")),
+        *(Scenario(f"report:{path}", run=_get(path), iterations=10) for path in report_paths()),
+    ]
@@ -0,0 +1,93 @@
+"""Concurrency limits per route group.
+
+Endpoints on the async database stack no longer queue for threadpool workers,
+so nothing else stops a burst of heavy reports from taking every database
+connection. A route group ("reports", "master_lists") admits at most
+``settings.route_concurrency_limits[group]`` requests at a time; the rest wait
+on the event loop and get a 503 after ``route_concurrency_timeout_seconds``.
+
+A route joins a group with ``Depends(limit_concurrency(group))``. Tenant routes
+take the slot earlier than that, in :func:`hold_route_slot`, which the tenant
+context depends on first: a request waiting for a slot must not already hold a
+database connection.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import Request, status
+
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+
+settings = get_settings()
+
+_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+# Each limit_concurrency dependency and its group, so hold_route_slot can find
+# the group of the route being served.
+_GROUPS: dict[Callable[..., AsyncGenerator[None, None]], str] = {}
+
+
+def _semaphore(group: str, limit: int) -> asyncio.Semaphore:
+    semaphore = _SEMAPHORES.get(group)
+    if semaphore is None:
+        semaphore = _SEMAPHORES[group] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+@asynccontextmanager
+async def _slot(group: str) -> AsyncIterator[None]:
+    limit = settings.route_concurrency_limits.get(group, 0)
+    if limit <= 0:
+        yield
+        return
+    semaphore = _semaphore(group, limit)
+    try:
+        await asyncio.wait_for(
+            semaphore.acquire(), timeout=settings.route_concurrency_timeout_seconds
+        )
+    except asyncio.TimeoutError as error:
+        raise AppException(
+            error_code="SERVER_BUSY",
+            message="Too many concurrent requests; please retry shortly",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        ) from error
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+def limit_concurrency(group: str) -> Callable[[Request], AsyncGenerator[None, None]]:
+    """Dependency that holds one of ``group``'s slots for the rest of the request."""
+
+    async def _hold_slot(request: Request) -> AsyncGenerator[None, None]:
+        if getattr(request.state, "concurrency_group", None) == group:
+            # Already taken by hold_route_slot.
+            yield
+            return
+        async with _slot(group):
+            yield
+
+    _GROUPS[_hold_slot] = group
+    return _hold_slot
+
+
+async def hold_route_slot(request: Request) -> AsyncGenerator[None, None]:
+    """Hold the slot of the route's ``limit_concurrency`` group, if it has one."""
+    route = request.scope.get("route")
+    group = next(
+        (
+            _GROUPS[dependency.dependency]
+            for dependency in getattr(route, "dependencies", ())
+            if dependency.dependency in _GROUPS
+        ),
+        None,
+    )
+    if group is None:
+        yield
+        return
+    async with _slot(group):
+        request.state.concurrency_group = group
+        yield
@@ -1,6 +1,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +29,35 @@ class Settings(BaseSettings):
     setu_gst_base_url: str = "https://apisetu.gov.in"
     setu_client_id: str | None = None  # API Setu client id (X-APISETU-CLIENTID)
     setu_gst_key: str | None = None  # API Setu API key (X-APISETU-APIKEY)
+    # Requests issuing more SQL statements than this are logged and counted; 0 disables.
+    request_query_budget: int = 100
+    async_db_pool_size: int = 10
+    async_db_max_overflow: int = 10
+    # Concurrent requests allowed per route group on the async stack, e.g.
+    # "reports=8,master_lists=16"; waiting longer than the timeout returns 503.
+    route_concurrency_limits: dict[str, int] = {"reports": 8, "master_lists": 16}
+    route_concurrency_timeout_seconds: float = 30.0
+    # Optional streaming replica for report, dashboard and list reads (see app.core.replica).
+    read_replica_url: str | None = None
+    read_replica_max_lag_seconds: float = 5.0
+    read_replica_lag_check_seconds: float = 1.0
+    read_after_write_window_seconds: float = 10.0
+    # Tenants a consolidated report queries at once, one pooled connection each;
+    # keep it within async_db_pool_size + async_db_max_overflow.
+    consolidated_report_concurrency: int = 8
+    # "delta" stores only changed fields in audit snapshots, with a full keyframe
+    # every audit_keyframe_interval rows per record; "full" stores every snapshot whole.
+    audit_snapshot_mode: Literal["full", "delta"] = "delta"
+    audit_keyframe_interval: int = 20
+    # How postings take stock rows another posting holds: "wait" queues for them;
+    # "nowait" and "skip_locked" back off and retry, then answer 503 (see lock_stock).
+    stock_lock_mode: Literal["wait", "nowait", "skip_locked"] = "wait"
+    stock_lock_attempts: int = 5
+    stock_lock_backoff_seconds: float = 0.05
+    # Posting responses kept per Idempotency-Key, and how long a retry waits for
+    # the first request with its key before answering 409 (see app.core.idempotency).
+    idempotency_key_ttl_hours: int = 24
+    idempotency_wait_seconds: float = 30.0
 
     model_config = SettingsConfigDict(
         env_file=(str(APP_DIR / ".env"), str(REPO_ROOT / ".env")),
@@ -44,6 +74,14 @@ class Settings(BaseSettings):
             return [item.strip() for item in value.split(",") if item.strip()]
         return value
 
+    @field_validator("route_concurrency_limits", mode="before")
+    @classmethod
+    def parse_concurrency_limits(cls, value: str | dict[str, int]) -> dict[str, int]:
+        if isinstance(value, str):
+            pairs = (item.split("=", maxsplit=1) for item in value.split(",") if item.strip())
+            return {name.strip(): int(limit) for name, limit in pairs}
+        return value
+
     @field_validator("database_url", mode="before")
     @classmethod
     def require_postgres_database(cls, value: str) -> str:
@@ -58,6 +96,13 @@ class Settings(BaseSettings):
 
         return normalized
 
+    @field_validator("read_replica_url", mode="before")
+    @classmethod
+    def normalize_replica_url(cls, value: str | None) -> str | None:
+        if not value or not value.strip():
+            return None
+        return cls.require_postgres_database(value)
+
     @field_validator("secret_key")
     @classmethod
     def require_non_placeholder_secret_key(cls, value: str) -> str:
@@ -1,28 +1,77 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+    note_request_tenant,
+)
 from app.core.tenancy import quote_schema_name
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 IS_POSTGRES = settings.database_url.startswith("postgresql")
 
 
-if IS_POSTGRES:
-    @event.listens_for(engine, "checkout")
-    def _reset_search_path_on_checkout(dbapi_connection, _connection_record, _connection_proxy):
-        # Every pooled connection starts from the public schema to avoid tenant bleed.
-        cursor = dbapi_connection.cursor()
-        try:
-            cursor.execute("SET search_path TO public")
-        finally:
-            cursor.close()
+def _reset_search_path_on_checkout(dbapi_connection, _connection_record, _connection_proxy):
+    # Every pooled connection starts from the public schema to avoid tenant bleed.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SET search_path TO public")
+    finally:
+        cursor.close()
+
+
+def create_tenant_engine(database_url: str) -> Engine:
+    """Instrumented engine whose checkouts start from the public schema."""
+    sync_engine = create_engine(database_url, pool_pre_ping=True, poolclass=TimedQueuePool)
+    instrument_engine(sync_engine)
+    if IS_POSTGRES:
+        event.listen(sync_engine, "checkout", _reset_search_path_on_checkout)
+    return sync_engine
+
+
+engine = create_tenant_engine(settings.database_url)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def create_tenant_async_engine(database_url: str) -> AsyncEngine:
+    """Instrumented async engine whose checkouts start from the public schema."""
+    async_engine = create_async_engine(
+        database_url,
+        pool_pre_ping=True,
+        poolclass=TimedAsyncQueuePool,
+        pool_size=settings.async_db_pool_size,
+        max_overflow=settings.async_db_max_overflow,
+    )
+    instrument_engine(async_engine.sync_engine)
+    if IS_POSTGRES:
+        event.listen(async_engine.sync_engine, "checkout", _reset_search_path_on_checkout)
+    return async_engine
+
+
+def async_session_factory(async_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+    )
+
+
+# Read-heavy endpoints (reports, master lists) run on the event loop against this
+# engine instead of holding one of the threadpool's workers for the whole query.
+async_engine = create_tenant_async_engine(settings.database_url)
+AsyncSessionLocal = async_session_factory(async_engine)
 
 
 class Base(DeclarativeBase):
@@ -32,19 +81,67 @@ class Base(DeclarativeBase):
 def set_tenant_search_path(db: Session, schema_name: str) -> None:
     if not IS_POSTGRES:
         return
+    # Unbound while setting it here, so _apply_tenant_search_path does not set it twice.
+    db.info.pop("tenant_schema", None)
     db.execute(text(f"SET search_path TO {quote_schema_name(schema_name)}, public"))
     db.info["tenant_schema"] = schema_name
+    note_request_tenant(schema_name)
+
+
+def bind_tenant_search_path(db: Session, schema_name: str) -> None:
+    """Bind ``db`` to ``schema_name`` without checking out a connection.
+
+    The search_path is set by :func:`_apply_tenant_search_path` once the session
+    begins a transaction, so a session that is never used costs nothing.
+    """
+    if not IS_POSTGRES:
+        return
+    db.info["tenant_schema"] = schema_name
+    note_request_tenant(schema_name)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_tenant_search_path(session: Session, _transaction, connection) -> None:
+    # Each transaction may run on a freshly checked-out connection, which starts
+    # from public; re-apply the tenant the session is bound to.
+    schema_name = session.info.get("tenant_schema")
+    if IS_POSTGRES and schema_name:
+        connection.exec_driver_sql(f"SET search_path TO {quote_schema_name(schema_name)}, public")
+
+
+async def set_tenant_search_path_async(db: AsyncSession, schema_name: str) -> None:
+    """:func:`set_tenant_search_path` for an :class:`AsyncSession`."""
+    if not IS_POSTGRES:
+        return
+    db.info.pop("tenant_schema", None)
+    await db.execute(text(f"SET search_path TO {quote_schema_name(schema_name)}, public"))
+    db.info["tenant_schema"] = schema_name
+    note_request_tenant(schema_name)
 
 
 def reset_search_path(db: Session) -> None:
     if not IS_POSTGRES:
         return
+    db.info.pop("tenant_schema", None)
+    if not db.in_transaction():
+        # No connection held: the next checkout starts from public anyway.
+        return
     try:
         db.execute(text("SET search_path TO public"))
     except SQLAlchemyError:
         db.rollback()
-    finally:
-        db.info.pop("tenant_schema", None)
+
+
+@contextmanager
+def tenant_session(schema_name: str | None, session_factory=SessionLocal) -> Iterator[Session]:
+    """Short-lived session bound to ``schema_name``, for work off the request's session."""
+    with session_factory() as db:
+        if schema_name:
+            bind_tenant_search_path(db, schema_name)
+        try:
+            yield db
+        finally:
+            reset_search_path(db)
 
 
 def _session_scope() -> Generator[Session, None, None]:
@@ -63,3 +160,4 @@ def get_db():
 def get_public_db():
     # Distinct dependency callable so auth/public lookups do not share the tenant-bound session.
     yield from _session_scope()
+
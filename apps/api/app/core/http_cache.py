@@ -0,0 +1,41 @@
+"""Conditional GET support.
+
+Cacheable endpoints compute a strong ETag from a cheap data-version lookup
+and compare it with ``If-None-Match`` before loading or serializing anything,
+answering ``304 Not Modified`` when the client's copy is still current.
+``Cache-Control: private, no-cache`` lets browsers keep the body but makes
+them revalidate on every use, so a change is visible on the next request.
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    # If-None-Match uses the weak comparison function, so W/ prefixes are ignored.
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
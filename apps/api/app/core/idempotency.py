@@ -0,0 +1,203 @@
+"""``Idempotency-Key`` support for posting endpoints.
+
+Clients on unreliable networks retry posts whose response they never saw. A
+route opted in with ``Depends(idempotent_request)`` passes its work to
+:meth:`IdempotentRequest.run` without committing it; ``run`` commits. When the
+request carries an ``Idempotency-Key`` header, the response is stored in the
+tenant's ``idempotency_keys`` table under the caller, route and key for
+``settings.idempotency_key_ttl_hours``:
+
+* the response row is written in the posting's own transaction, so either
+  both commit or neither does, and a retry can never post a second time;
+* a retry after that is answered from the row, marked ``Idempotent-Replayed``,
+  without running any of the post;
+* a retry while the first is still running waits for it on a transaction-level
+  advisory lock on the key. The lock is the first thing the posting's own
+  transaction takes, so the request needs no second connection and waits while
+  holding no row locks; commit or rollback releases it. The retry then finds the
+  stored response, or none if the first request failed and it runs the post
+  itself. Waiting longer than ``settings.idempotency_wait_seconds`` returns 409.
+
+Only successful responses are stored. Reusing a key for a different request
+(another document, or another body) is rejected with 422. Expired rows are
+replaced by the next request with their key; :func:`purge_expired_idempotency_keys`
+deletes the rest, e.g. from ``run_tenant_job``.
+"""
+
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from fastapi import Depends, Header, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core import replica
+from app.core.config import get_settings
+from app.core.database import set_tenant_search_path
+from app.core.exceptions import AppException
+from app.core.tenant import get_token_payload, resolve_request_tenant_schema
+from app.models.idempotency import IdempotencyKey
+
+settings = get_settings()
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+@dataclass(frozen=True)
+class IdempotentRequest:
+    key: str | None
+    tenant_schema: str | None
+    # The caller's replica.token_subject, so one user's key never answers another's.
+    subject: str
+    # The route template, e.g. "/purchase/grn/{grn_id}/post".
+    route: str
+    request_hash: str
+    status_code: int
+    response_model: Any
+
+    def run(self, db: Session, post: Callable[[], Any]) -> JSONResponse:
+        """``post()`` at most once per key, then commit ``db``; ``post`` must not commit."""
+        if self.key is None or self.tenant_schema is None:
+            return self._commit(db, post)
+
+        self._wait_for_key(db)
+        stored = db.execute(
+            select(
+                IdempotencyKey.request_hash,
+                IdempotencyKey.status_code,
+                IdempotencyKey.response_body,
+            ).where(*self._matches(), IdempotencyKey.expires_at > func.now())
+        ).one_or_none()
+        if stored is not None:
+            db.rollback()
+            return self._replay(stored)
+        # Stored and committed with the lock, so the next waiter sees it.
+        return self._commit(db, post, store=True)
+
+    def _commit(self, db: Session, post: Callable[[], Any], *, store: bool = False) -> JSONResponse:
+        try:
+            body = self.response_model.model_validate(post(), from_attributes=True).model_dump(
+                mode="json"
+            )
+            if store:
+                db.execute(self._store(body))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        tenant_schema = db.info.get("tenant_schema")
+        if isinstance(tenant_schema, str) and tenant_schema:
+            set_tenant_search_path(db, tenant_schema)
+        return JSONResponse(content=body, status_code=self.status_code)
+
+    def _matches(self) -> tuple:
+        return (
+            IdempotencyKey.subject == self.subject,
+            IdempotencyKey.route == self.route,
+            IdempotencyKey.key == self.key,
+        )
+
+    def _lock_id(self) -> int:
+        digest = hashlib.sha256(
+            "\x1f".join(
+                (self.tenant_schema or "", self.subject, self.route, self.key or "")
+            ).encode()
+        ).digest()
+        return int.from_bytes(digest[:8], "big", signed=True)
+
+    def _wait_for_key(self, db: Session) -> None:
+        # lock_timeout is set for this one lock and put back afterwards, so the
+        # posting's own row locks keep the session's timeout.
+        previous = db.scalar(
+            text(
+                "SELECT current_setting('lock_timeout'), "
+                "set_config('lock_timeout', :timeout, true)"
+            ),
+            {"timeout": f"{int(settings.idempotency_wait_seconds * 1000)}ms"},
+        )
+        try:
+            db.execute(select(func.pg_advisory_xact_lock(self._lock_id())))
+            db.execute(
+                text("SELECT set_config('lock_timeout', :previous, true)"),
+                {"previous": previous},
+            )
+        except OperationalError as error:
+            db.rollback()
+            if getattr(error.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            raise AppException(
+                error_code="IDEMPOTENCY_KEY_IN_PROGRESS",
+                message="A request with this Idempotency-Key is still being processed",
+                status_code=409,
+            ) from None
+
+    def _store(self, body: Any):
+        stmt = insert(IdempotencyKey).values(
+            subject=self.subject,
+            route=self.route,
+            key=self.key,
+            request_hash=self.request_hash,
+            status_code=self.status_code,
+            response_body=body,
+            expires_at=func.now() + timedelta(hours=settings.idempotency_key_ttl_hours),
+        )
+        # Only an expired row can be in the way: a live one would have been replayed.
+        return stmt.on_conflict_do_update(
+            constraint="uq_idempotency_keys_subject_route_key",
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "status_code": stmt.excluded.status_code,
+                "response_body": stmt.excluded.response_body,
+                "created_at": func.now(),
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+
+    def _replay(self, stored) -> JSONResponse:
+        if stored.request_hash != self.request_hash:
+            raise AppException(
+                error_code="IDEMPOTENCY_KEY_REUSED",
+                message="This Idempotency-Key was already used for a different request",
+                status_code=422,
+            )
+        return JSONResponse(
+            content=stored.response_body,
+            status_code=stored.status_code,
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+
+async def idempotent_request(
+    request: Request,
+    idempotency_key: str | None = Header(default=None, max_length=255),
+    payload: dict = Depends(get_token_payload),
+    tenant_schema: str | None = Depends(resolve_request_tenant_schema),
+) -> IdempotentRequest:
+    route = request.scope["route"]
+    digest = hashlib.sha256()
+    for part in (request.method.encode(), request.url.path.encode(), await request.body()):
+        digest.update(part)
+        digest.update(b"\x1f")
+    return IdempotentRequest(
+        key=idempotency_key or None,
+        tenant_schema=tenant_schema,
+        subject=replica.token_subject(payload) or "",
+        route=route.path_format,
+        request_hash=digest.hexdigest(),
+        status_code=route.status_code or 200,
+        response_model=route.response_model,
+    )
+
+
+def purge_expired_idempotency_keys(db: Session) -> int:
+    """Delete keys past their TTL; the caller commits."""
+    return db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.expires_at <= func.now())
+    ).rowcount
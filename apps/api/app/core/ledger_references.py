@@ -0,0 +1,130 @@
+"""Referential integrity for columns that hold ``inventory_ledger`` ids.
+
+A foreign key to a partitioned table has to include the partition key, and
+closing a fiscal year moves whole ledger partitions to
+``inventory_ledger_archive``, so these columns cannot be foreign keys. Each
+referencing table instead gets a constraint trigger that rejects an insert or
+update whose id is in neither the ledger nor its archive, raising the same
+``foreign_key_violation`` a foreign key would. Ledger rows are insert-only and
+leave the ledger only for the archive, so nothing checks deletes.
+"""
+
+from sqlalchemy import text
+
+from app.core.partitions import _qualified, _target_schema
+
+# referencing table -> its columns holding inventory_ledger ids
+LEDGER_REFERENCES: dict[str, tuple[str, ...]] = {
+    "stock_adjustments": ("ledger_id",),
+    "stock_corrections": ("out_ledger_id", "in_ledger_id"),
+    "stock_source_provenance": ("ledger_id",),
+}
+LEDGER_REFERENCE_FUNCTION = "check_inventory_ledger_reference"
+
+_FUNCTION_BODY = """
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    ref_column text;
+    ref_id bigint;
+    found_row boolean;
+BEGIN
+    FOREACH ref_column IN ARRAY TG_ARGV LOOP
+        ref_id := (to_jsonb(NEW) ->> ref_column)::bigint;
+        CONTINUE WHEN ref_id IS NULL;
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM %I.inventory_ledger WHERE id = $1)',
+            TG_TABLE_SCHEMA
+        ) INTO found_row USING ref_id;
+        IF NOT found_row
+            AND to_regclass(format('%I.inventory_ledger_archive', TG_TABLE_SCHEMA)) IS NOT NULL
+        THEN
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM %I.inventory_ledger_archive WHERE id = $1)',
+                TG_TABLE_SCHEMA
+            ) INTO found_row USING ref_id;
+        END IF;
+        IF NOT found_row THEN
+            RAISE foreign_key_violation USING MESSAGE = format(
+                'insert or update on table "%s" violates ledger reference: '
+                '%s=%s is not present in inventory_ledger',
+                TG_TABLE_NAME, ref_column, ref_id
+            );
+        END IF;
+    END LOOP;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def trigger_name(table_name: str) -> str:
+    return f"{table_name}_ledger_reference"
+
+
+def _trigger_exists(bind, schema_name: str | None, table_name: str) -> bool:
+    return bool(
+        bind.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_trigger "
+                "WHERE tgrelid = to_regclass(:table_name) AND tgname = :trigger_name)"
+            ),
+            {
+                "table_name": _qualified(schema_name, table_name),
+                "trigger_name": trigger_name(table_name),
+            },
+        ).scalar_one()
+    )
+
+
+def _table_exists(bind, schema_name: str | None, table_name: str) -> bool:
+    return (
+        bind.execute(
+            text("SELECT to_regclass(:table_name)"),
+            {"table_name": _qualified(schema_name, table_name)},
+        ).scalar_one()
+        is not None
+    )
+
+
+def ensure_ledger_reference_triggers(
+    bind,
+    *,
+    schema_name: str | None = None,
+    table_names=tuple(LEDGER_REFERENCES),
+) -> list[str]:
+    """Add the missing ledger reference triggers; returns the tables that got one.
+
+    Without ``schema_name`` the tables are resolved through the search path.
+    Tables that do not exist yet are left alone.
+    """
+    created: list[str] = []
+    for table_name in table_names:
+        if not _table_exists(bind, schema_name, table_name) or _trigger_exists(
+            bind, schema_name, table_name
+        ):
+            continue
+        function = _qualified(schema_name, LEDGER_REFERENCE_FUNCTION)
+        columns = LEDGER_REFERENCES[table_name]
+        arguments = ", ".join(f"'{column}'" for column in columns)
+        bind.execute(text(f"CREATE OR REPLACE FUNCTION {function}() {_FUNCTION_BODY}"))
+        bind.execute(
+            text(
+                f"CREATE CONSTRAINT TRIGGER {trigger_name(table_name)} "
+                f"AFTER INSERT OR UPDATE OF {', '.join(columns)} "
+                f"ON {_qualified(schema_name, table_name)} "
+                f"FOR EACH ROW EXECUTE FUNCTION {function}({arguments})"
+            )
+        )
+        created.append(table_name)
+    return created
+
+
+def create_ledger_reference_trigger(target, connection, **_kw) -> None:
+    """``after_create`` hook for the tables in :data:`LEDGER_REFERENCES`."""
+    if connection.dialect.name != "postgresql":
+        return
+    ensure_ledger_reference_triggers(
+        connection,
+        schema_name=_target_schema(target, connection),
+        table_names=(target.name,),
+    )
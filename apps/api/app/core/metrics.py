@@ -0,0 +1,320 @@
+"""Per-request SQL and latency instrumentation.
+
+The HTTP middleware in ``app.main`` opens a :class:`RequestMetrics` for every
+request. The cursor hooks and pool class installed by ``app.core.database``
+add to whichever request is active in the current context, so a request's
+query count, DB time, rows and pool wait are known when its response leaves.
+Completed requests feed in-process Prometheus-style histograms, labelled by
+route template and tenant, that ``GET /metrics`` renders in the text format.
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_TENANT = "public"
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestMetrics:
+    query_count: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+    pool_wait_seconds: float = 0.0
+    tenant: str | None = None
+    # Statement text, kept only while a StatementRecorder is active.
+    statements: list[str] | None = None
+
+
+@dataclass
+class RecordedRequest:
+    method: str
+    route: str
+    metrics: RequestMetrics
+
+
+@dataclass
+class StatementRecorder:
+    """Completed requests, with their SQL, seen while :func:`record_statements` is open."""
+
+    requests: list[RecordedRequest] = field(default_factory=list)
+
+
+_current_request: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+# Not a context variable: the test client serves requests on another thread.
+_recorders: list[StatementRecorder] = []
+
+
+@contextmanager
+def record_statements() -> Iterator[StatementRecorder]:
+    recorder = StatementRecorder()
+    _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorders.remove(recorder)
+
+
+def begin_request_metrics() -> tuple[RequestMetrics, Token[RequestMetrics | None]]:
+    metrics = RequestMetrics(statements=[] if _recorders else None)
+    return metrics, _current_request.set(metrics)
+
+
+def end_request_metrics(token: Token[RequestMetrics | None]) -> None:
+    _current_request.reset(token)
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    return _current_request.get()
+
+
+def note_request_tenant(schema_name: str) -> None:
+    metrics = _current_request.get()
+    if metrics is not None:
+        metrics.tenant = schema_name
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    # Kept on the execution context, which dies with the statement even when it
+    # fails, rather than on the long-lived pooled connection.
+    if context is not None:
+        context._query_started_at = perf_counter()
+
+
+def _after_cursor_execute(_conn, cursor, statement, _parameters, context, _executemany) -> None:
+    started_at = getattr(context, "_query_started_at", None)
+    metrics = _current_request.get()
+    if metrics is None:
+        return
+    metrics.query_count += 1
+    if metrics.statements is not None:
+        metrics.statements.append(statement)
+    if started_at is not None:
+        metrics.db_seconds += perf_counter() - started_at
+    if cursor.description is not None and cursor.rowcount > 0:
+        metrics.rows += cursor.rowcount
+
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'|%\(\w+\)s|\$\d+|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"\?(?:::\w+(?:\[\])?)?"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_ROW_LIST = re.compile(r"\(\s*\(\?, \.\.\.\)(?:\s*,\s*\(\?, \.\.\.\))*\s*\)")
+
+
+def statement_fingerprint(statement: str) -> str:
+    """``statement`` with literals, bind parameters and IN lists reduced to ``?``.
+
+    Statements that differ only in their values share a fingerprint, so an N+1
+    loop shows up as one fingerprint repeated N times.
+    """
+    fingerprint = _LITERAL.sub("?", " ".join(statement.split()))
+    fingerprint = _PLACEHOLDER_LIST.sub("(?, ...)", fingerprint)
+    return _ROW_LIST.sub("((?, ...), ...)", fingerprint)
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class _TimedPoolMixin:
+    """Charges the time spent acquiring a connection to the request."""
+
+    def connect(self):
+        started_at = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            metrics = _current_request.get()
+            if metrics is not None:
+                metrics.pool_wait_seconds += perf_counter() - started_at
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+        label_names: Sequence[str],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.label_names = tuple(label_names)
+        # labels -> (per-bucket counts, sum, count)
+        self._series: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Sequence[str], value: float) -> None:
+        key = tuple(labels)
+        with self._lock:
+            bucket_counts, total, count = self._series.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    bucket_counts[index] += 1
+            self._series[key] = (bucket_counts, total + value, count + 1)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((key, (list(b), s, c)) for key, (b, s, c) in self._series.items())
+        for key, (bucket_counts, total, count) in series:
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts, strict=True):
+                labels = _format_labels((*self.label_names, "le"), (*key, f"{upper_bound:g}"))
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            labels = _format_labels((*self.label_names, "le"), (*key, "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {total:g}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Sequence[str]) -> None:
+        key = tuple(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {value}")
+        return lines
+
+
+_REQUEST_LABELS = ("method", "route", "tenant")
+_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_DURATION = Histogram(
+    "medhaone_http_request_duration_seconds",
+    "Wall-clock time spent handling the request.",
+    _SECONDS_BUCKETS,
+    _REQUEST_LABELS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "medhaone_http_request_db_queries",
+    "SQL statements executed while handling the request.",
+    (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+    _REQUEST_LABELS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "medhaone_http_request_db_seconds",
+    "Time spent executing SQL while handling the request.",
+    _SECONDS_BUCKETS,
+    _REQUEST_LABELS,
+)
+REQUEST_DB_ROWS = Histogram(
+    "medhaone_http_request_db_rows",
+    "Rows returned by SQL statements while handling the request.",
+    (1, 10, 100, 1000, 10000, 100000),
+    _REQUEST_LABELS,
+)
+REQUEST_POOL_WAIT = Histogram(
+    "medhaone_http_request_pool_wait_seconds",
+    "Time spent acquiring pooled database connections for the request.",
+    (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    _REQUEST_LABELS,
+)
+QUERY_BUDGET_EXCEEDED = Counter(
+    "medhaone_http_query_budget_exceeded_total",
+    "Requests that executed more SQL statements than the configured budget.",
+    _REQUEST_LABELS,
+)
+_METRICS: tuple[Histogram | Counter, ...] = (
+    REQUEST_DURATION,
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_SECONDS,
+    REQUEST_DB_ROWS,
+    REQUEST_POOL_WAIT,
+    QUERY_BUDGET_EXCEEDED,
+)
+
+
+def record_request(
+    *,
+    method: str,
+    route: str,
+    duration_seconds: float,
+    metrics: RequestMetrics,
+    query_budget: int,
+) -> None:
+    labels = (method, route, metrics.tenant or UNKNOWN_TENANT)
+    for recorder in _recorders:
+        recorder.requests.append(RecordedRequest(method=method, route=route, metrics=metrics))
+    REQUEST_DURATION.observe(labels, duration_seconds)
+    REQUEST_DB_QUERIES.observe(labels, metrics.query_count)
+    REQUEST_DB_SECONDS.observe(labels, metrics.db_seconds)
+    REQUEST_DB_ROWS.observe(labels, metrics.rows)
+    REQUEST_POOL_WAIT.observe(labels, metrics.pool_wait_seconds)
+    if query_budget > 0 and metrics.query_count > query_budget:
+        QUERY_BUDGET_EXCEEDED.inc(labels)
+        logger.warning(
+            "Request exceeded SQL query budget",
+            extra={
+                "method": method,
+                "route": route,
+                "tenant": labels[2],
+                "query_count": metrics.query_count,
+                "query_budget": query_budget,
+                "db_ms": round(metrics.db_seconds * 1000, 1),
+            },
+        )
+
+
+def server_timing_header(metrics: RequestMetrics, duration_seconds: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={metrics.db_seconds * 1000:.1f};desc="{metrics.query_count} queries / {metrics.rows} rows"',
+            f"pool;dur={metrics.pool_wait_seconds * 1000:.1f}",
+            f"total;dur={duration_seconds * 1000:.1f}",
+        ]
+    )
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
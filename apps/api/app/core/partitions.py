@@ -0,0 +1,249 @@
+"""Monthly range partitions for the insert-only ledger and audit tables.
+
+``inventory_ledger`` (by ``created_at``) and ``audit_logs`` (by ``timestamp``)
+are declared ``PARTITION BY RANGE`` on their time column. Each UTC calendar
+month lives in a ``<table>_pYYYYMM`` partition that inherits the parent's
+indexes, including a BRIN index on the time column, so every B-tree stays the
+size of one month and a closed month can be detached with
+``ALTER TABLE ... DETACH PARTITION`` without rewriting anything. A
+``<table>_default`` partition catches rows outside the prepared months so an
+insert never fails.
+
+:func:`ensure_monthly_partitions` keeps the current month and the next
+``PARTITION_MONTHS_AHEAD`` months prepared. It runs when the tables are
+created and from the tenant repair path, and accepts a ``Session`` or a
+``Connection``.
+
+Queries prune partitions when they compare the key column itself against
+timezone-aware bounds (``created_at >= :start``); wrapping the column, as in
+``date(created_at) >= :day``, makes Postgres scan every month.
+"""
+
+from datetime import date, datetime, time, timezone
+
+from sqlalchemy import text
+
+from app.core.tenancy import quote_schema_name
+
+# table name -> partition key column
+PARTITIONED_TABLES: dict[str, str] = {
+    "inventory_ledger": "created_at",
+    "audit_logs": "timestamp",
+}
+PARTITION_MONTHS_AHEAD = 3
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table_name: str, month: date) -> str:
+    return f"{table_name}_p{month:%Y%m}"
+
+
+def utc_day_start(day: date) -> datetime:
+    """Midnight UTC of ``day``, as a partition-prunable lower/upper bound."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive query-string datetimes as UTC, like the partition bounds."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _qualified(schema_name: str | None, name: str) -> str:
+    return f"{quote_schema_name(schema_name)}.{name}" if schema_name else name
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def is_partitioned(bind, table_name: str, *, schema_name: str | None = None) -> bool:
+    return bool(
+        bind.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:parent))"
+            ),
+            {"parent": _qualified(schema_name, table_name)},
+        ).scalar_one()
+    )
+
+
+def _partition_names(bind, parent: str) -> set[str]:
+    return set(
+        bind.execute(
+            text(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = to_regclass(:parent)
+                """
+            ),
+            {"parent": parent},
+        ).scalars()
+    )
+
+
+def _create_month_partition(
+    bind,
+    *,
+    schema_name: str | None,
+    table_name: str,
+    month: date,
+) -> None:
+    key = PARTITIONED_TABLES[table_name]
+    parent = _qualified(schema_name, table_name)
+    partition = _qualified(schema_name, partition_name(table_name, month))
+    default = _qualified(schema_name, f"{table_name}_default")
+    bounds = f"FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+    in_range = f"{key} >= {_bound(month)} AND {key} < {_bound(add_months(month, 1))}"
+
+    stranded = bind.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")
+    ).scalar_one()
+    if not stranded:
+        bind.execute(text(f"CREATE TABLE {partition} PARTITION OF {parent} FOR VALUES {bounds}"))
+        return
+
+    # Postgres refuses to add a partition whose range already has rows in the
+    # default partition, so those rows move into the new table before it is
+    # attached.
+    bind.execute(text(f"CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS)"))
+    bind.execute(
+        text(
+            f"""
+            WITH moved AS (DELETE FROM {default} WHERE {in_range} RETURNING *)
+            INSERT INTO {partition} SELECT * FROM moved
+            """
+        )
+    )
+    bind.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {partition} FOR VALUES {bounds}"))
+
+
+def ensure_monthly_partitions(
+    bind,
+    *,
+    schema_name: str | None = None,
+    today: date | None = None,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    table_names: tuple[str, ...] = tuple(PARTITIONED_TABLES),
+) -> list[str]:
+    """Create any missing default and monthly partitions; returns the new names.
+
+    Without ``schema_name`` the tables are resolved through the search path.
+    Tables that are not (yet) partitioned are left alone.
+    """
+    current = month_start(today or date.today())
+    created: list[str] = []
+    for table_name in table_names:
+        if not is_partitioned(bind, table_name, schema_name=schema_name):
+            continue
+        parent = _qualified(schema_name, table_name)
+        existing = _partition_names(bind, parent)
+
+        default_name = f"{table_name}_default"
+        if default_name not in existing:
+            bind.execute(
+                text(
+                    f"CREATE TABLE {_qualified(schema_name, default_name)} "
+                    f"PARTITION OF {parent} DEFAULT"
+                )
+            )
+            created.append(default_name)
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            name = partition_name(table_name, month)
+            if name in existing:
+                continue
+            _create_month_partition(bind, schema_name=schema_name, table_name=table_name, month=month)
+            created.append(name)
+    return created
+
+
+def archive_months_before(
+    bind,
+    *,
+    table_name: str,
+    archive_table: str,
+    cutoff: date,
+    schema_name: str | None = None,
+) -> int:
+    """Move every ``table_name`` row before the month start ``cutoff`` to ``archive_table``.
+
+    Whole monthly partitions are detached and attached to the archive (which
+    must be range-partitioned on the same key), so no rows are rewritten; only
+    rows parked in the default partition are copied. Returns the rows moved.
+    """
+    key = PARTITIONED_TABLES[table_name]
+    parent = _qualified(schema_name, table_name)
+    archive = _qualified(schema_name, archive_table)
+    moved = bind.execute(
+        text(f"SELECT count(*) FROM {parent} WHERE {key} < {_bound(cutoff)}")
+    ).scalar_one()
+
+    prefix = f"{table_name}_p"
+    for name in sorted(_partition_names(bind, parent)):
+        if not name.startswith(prefix):
+            continue
+        month = date(int(name[len(prefix) : len(prefix) + 4]), int(name[-2:]), 1)
+        if month >= cutoff:
+            continue
+        partition = _qualified(schema_name, name)
+        archived_name = f"{archive_table}_p{month:%Y%m}"
+        bind.execute(text(f"ALTER TABLE {parent} DETACH PARTITION {partition}"))
+        bind.execute(text(f"ALTER TABLE {partition} RENAME TO {archived_name}"))
+        bind.execute(
+            text(
+                f"ALTER TABLE {archive} ATTACH PARTITION {_qualified(schema_name, archived_name)} "
+                f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+            )
+        )
+
+    default = _qualified(schema_name, f"{table_name}_default")
+    bind.execute(
+        text(
+            f"""
+            WITH moved AS (DELETE FROM {default} WHERE {key} < {_bound(cutoff)} RETURNING *)
+            INSERT INTO {archive} SELECT * FROM moved
+            """
+        )
+    )
+    return int(moved)
+
+
+def _target_schema(target, connection) -> str | None:
+    translate_map = connection.get_execution_options().get("schema_translate_map") or {}
+    return translate_map.get(target.schema, target.schema)
+
+
+def create_initial_partitions(target, connection, **_kw) -> None:
+    """``after_create`` hook for the partitioned models (used by ``create_all``)."""
+    if connection.dialect.name != "postgresql":
+        return
+    ensure_monthly_partitions(
+        connection,
+        schema_name=_target_schema(target, connection),
+        table_names=(target.name,),
+    )
+
+
+def create_default_partition(target, connection, **_kw) -> None:
+    """``after_create`` hook for partitioned tables whose months are attached later."""
+    if connection.dialect.name != "postgresql":
+        return
+    schema_name = _target_schema(target, connection)
+    connection.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {_qualified(schema_name, f'{target.name}_default')} "
+            f"PARTITION OF {_qualified(schema_name, target.name)} DEFAULT"
+        )
+    )
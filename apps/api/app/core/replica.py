@@ -0,0 +1,143 @@
+"""Optional read replica for reports, the dashboard and list endpoints.
+
+When ``settings.read_replica_url`` is set, ``get_read_db`` (in
+``app.core.tenant``) serves reads from the replica unless one of the staleness
+guards sends them back to the primary:
+
+* the replica's replay lag, sampled at most every
+  ``read_replica_lag_check_seconds``, is above ``read_replica_max_lag_seconds``
+  or could not be measured;
+* the same user made a successful write less than
+  ``read_after_write_window_seconds`` ago, so they always see their own change.
+
+Writes are noted per process by the HTTP middleware in ``app.main``; with
+several workers a user may still land on another worker right after a write,
+which the lag guard bounds.
+"""
+
+import logging
+from time import monotonic
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.core.database import (
+    async_session_factory,
+    create_tenant_async_engine,
+    create_tenant_engine,
+)
+from app.core.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Zero while the standby has replayed everything it received: an idle primary
+# sends no new transactions, so the last replay timestamp alone would look stale.
+_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+replica_engine: AsyncEngine | None = None
+ReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+# For report builders that run in the threadpool rather than on the event loop.
+replica_sync_engine: Engine | None = None
+ReplicaSyncSessionLocal: sessionmaker[Session] | None = None
+
+_lag_sample: tuple[float, float | None] | None = None
+_RECENT_WRITES: dict[str, float] = {}
+
+
+def configure_read_replica(database_url: str | None) -> None:
+    """(Re)create the replica engine; ``None`` routes every read to the primary."""
+    global replica_engine, ReplicaSessionLocal, replica_sync_engine, ReplicaSyncSessionLocal
+    global _lag_sample
+    if replica_engine is not None:
+        # Called outside the event loop, so drop the pool rather than closing it.
+        replica_engine.sync_engine.dispose(close=False)
+        replica_sync_engine.dispose()
+    _lag_sample = None
+    if not database_url:
+        replica_engine = ReplicaSessionLocal = None
+        replica_sync_engine = ReplicaSyncSessionLocal = None
+        return
+    replica_engine = create_tenant_async_engine(database_url)
+    ReplicaSessionLocal = async_session_factory(replica_engine)
+    replica_sync_engine = create_tenant_engine(database_url)
+    ReplicaSyncSessionLocal = sessionmaker(autoflush=False, bind=replica_sync_engine)
+
+
+def token_subject(payload: dict) -> str | None:
+    """Stable user key for local (``sub``) and RBAC (org + ``userId``) tokens."""
+    if payload.get("sub") is not None:
+        return f"local:{payload['sub']}"
+    if payload.get("userId") is not None:
+        return f"{payload.get('organizationId')}:{payload['userId']}"
+    return None
+
+
+def note_write(subject: str | None) -> None:
+    if subject is None:
+        return
+    now = monotonic()
+    _RECENT_WRITES[subject] = now
+    # Keep the map bounded by dropping entries whose window has passed.
+    if len(_RECENT_WRITES) > 10_000:
+        horizon = now - settings.read_after_write_window_seconds
+        for key in [key for key, wrote_at in _RECENT_WRITES.items() if wrote_at < horizon]:
+            del _RECENT_WRITES[key]
+
+
+def note_write_for_authorization(authorization_header: str | None) -> None:
+    """Record a successful write by the bearer of ``authorization_header``."""
+    if replica_engine is None or not authorization_header:
+        return
+    scheme, _, token = authorization_header.partition(" ")
+    if scheme.lower() != "bearer":
+        return
+    payload, _token_source = decode_access_token(token.strip())
+    if payload:
+        note_write(token_subject(payload))
+
+
+def wrote_recently(subject: str | None) -> bool:
+    wrote_at = _RECENT_WRITES.get(subject) if subject is not None else None
+    if wrote_at is None:
+        return False
+    return monotonic() - wrote_at < settings.read_after_write_window_seconds
+
+
+async def _measure_lag() -> float | None:
+    try:
+        async with replica_engine.connect() as connection:
+            return float((await connection.execute(_LAG_SQL)).scalar_one())
+    except (SQLAlchemyError, OSError):
+        logger.warning("Read replica lag check failed; reading from the primary", exc_info=True)
+        return None
+
+
+async def replica_lag_seconds() -> float | None:
+    """The sampled replay lag, or ``None`` when the replica is unreachable."""
+    global _lag_sample
+    now = monotonic()
+    if _lag_sample is None or now - _lag_sample[0] >= settings.read_replica_lag_check_seconds:
+        _lag_sample = (now, await _measure_lag())
+    return _lag_sample[1]
+
+
+async def use_replica_for(subject: str | None) -> bool:
+    if replica_engine is None or wrote_recently(subject):
+        return False
+    lag = await replica_lag_seconds()
+    return lag is not None and lag <= settings.read_replica_max_lag_seconds
+
+
+configure_read_replica(settings.read_replica_url)
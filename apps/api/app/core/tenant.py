@@ -1,33 +1,58 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import AsyncGenerator, Callable, Iterator
+from datetime import date
+from typing import Any, TypeVar
 
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.core import replica
+from app.core.concurrency import hold_route_slot
 from app.core.config import get_settings
 from app.core.database import (
     IS_POSTGRES,
+    AsyncSessionLocal,
     SessionLocal,
+    bind_tenant_search_path,
     get_db,
+    get_public_db,
     reset_search_path,
     set_tenant_search_path,
+    tenant_session,
 )
 from app.core.exceptions import AppException
+from app.core.ledger_references import ensure_ledger_reference_triggers
+from app.core.partitions import ensure_monthly_partitions, is_partitioned, month_start
 from app.core.security import decode_access_token
 from app.core.tenancy import build_tenant_schema_name, quote_schema_name, validate_org_slug
+from app.models.batch import BATCH_IDENTITY_COLUMNS
 from app.models.role import Role
 from app.models.user import User
+from app.services.data_quality import rescan_data_quality_findings
 from app.services.rbac import assign_roles_to_user, ensure_rbac_seeded
+from app.services.search import SEARCH_INDEXES, search_document_sql
 
 bearer_scheme = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 _SCHEMA_COMPATIBILITY_CHECKED: set[str] = set()
+_TIME_PARTITIONS_CHECKED: set[tuple[str, date]] = set()
+# Token payload of a request whose user record is copied into the tenant when
+# its session first begins a transaction (see ensure_tenant_db_context).
+_PENDING_LOCAL_USER = "pending_local_user"
+_VERSIONED_DOCUMENT_TABLES = (
+    "purchase_orders",
+    "grns",
+    "sales_orders",
+    "dispatch_notes",
+    "purchase_bills",
+)
 settings = get_settings()
 
 
@@ -53,25 +78,138 @@ def get_token_payload(
 
 def resolve_request_tenant_schema(
     payload: dict = Depends(get_token_payload),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_public_db),
 ) -> str | None:
+    # The public lookups share the auth session rather than the request's
+    # tenant session, which stays untouched until the route uses it.
     return _resolve_tenant_schema_from_payload(payload=payload, db=db, allow_superuser_bypass=True)
 
 
 def ensure_tenant_db_context(
+    _slot: None = Depends(hold_route_slot),
     db: Session = Depends(get_db),
     payload: dict = Depends(get_token_payload),
     tenant_schema: str | None = Depends(resolve_request_tenant_schema),
 ) -> None:
+    """Bind the request's session to the caller's tenant.
+
+    The route's concurrency slot is taken first, so a queued request holds no
+    connection. Nothing here keeps one either: the schema is repaired on a
+    short-lived session by :func:`prepare_tenant_schema`, and ``db`` is bound
+    lazily, the caller's user record being copied into the tenant when ``db``
+    begins its first transaction. Routes that only read through
+    :func:`get_read_db` therefore never check ``db`` out.
+    """
     if tenant_schema is None:
         return
 
-    local_user = _get_local_user_snapshot(db, payload)
-    set_tenant_search_path(db, tenant_schema)
-    _ensure_runtime_schema_compatibility(db, tenant_schema)
-    _assert_tenant_search_path(db, tenant_schema)
-    if local_user is not None:
-        _ensure_local_user_record_in_tenant_schema(db, local_user)
+    prepare_tenant_schema(tenant_schema)
+    bind_tenant_search_path(db, tenant_schema)
+    db.info[_PENDING_LOCAL_USER] = payload
+    if db.in_transaction():
+        # Already in use, so its transaction has begun: bind it now.
+        set_tenant_search_path(db, tenant_schema)
+        _sync_local_user_on_begin(db, None, db.connection())
+
+
+def prepare_tenant_schema(tenant_schema: str) -> None:
+    """Bring ``tenant_schema`` up to date on a session of its own.
+
+    Returns without checking out a connection once this process has verified
+    the schema and its partitions for the current month.
+    """
+    if not IS_POSTGRES or _tenant_schema_prepared(tenant_schema):
+        return
+    with tenant_session(tenant_schema) as db:
+        _ensure_runtime_schema_compatibility(db, tenant_schema)
+        db.commit()
+
+
+def _tenant_schema_prepared(tenant_schema: str) -> bool:
+    return (
+        tenant_schema in _SCHEMA_COMPATIBILITY_CHECKED
+        and (tenant_schema, month_start(date.today())) in _TIME_PARTITIONS_CHECKED
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _sync_local_user_on_begin(session: Session, _transaction, connection) -> None:
+    payload = session.info.pop(_PENDING_LOCAL_USER, None)
+    tenant_schema = session.info.get("tenant_schema")
+    if payload is None or not tenant_schema:
+        return
+
+    # A session of its own on the same connection and transaction, since the
+    # request's session may be in the middle of a flush here.
+    with Session(bind=connection) as bootstrap:
+        bootstrap.execute(text("SET search_path TO public"))
+        local_user = _get_local_user_snapshot(bootstrap, payload)
+        set_tenant_search_path(bootstrap, tenant_schema)
+        _assert_tenant_search_path(bootstrap, tenant_schema)
+        if local_user is not None:
+            _ensure_local_user_record_in_tenant_schema(bootstrap, local_user)
+
+
+async def get_read_db(
+    payload: dict = Depends(get_token_payload),
+    tenant_schema: str | None = Depends(resolve_request_tenant_schema),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Tenant-bound async session for read-only endpoints.
+
+    Served by the read replica when one is configured and fresh enough for this
+    user (see :mod:`app.core.replica`), otherwise by the primary. Reads need no
+    local user record, so once the tenant schema has been prepared a replica
+    read checks out no primary connection.
+    """
+    if tenant_schema is not None and IS_POSTGRES and not _tenant_schema_prepared(tenant_schema):
+        await run_in_threadpool(prepare_tenant_schema, tenant_schema)
+    use_replica = await replica.use_replica_for(replica.token_subject(payload))
+    session_factory = replica.ReplicaSessionLocal if use_replica else AsyncSessionLocal
+    async with session_factory() as db:
+        db.info["read_source"] = "replica" if use_replica else "primary"
+        if tenant_schema is not None:
+            bind_tenant_search_path(db.sync_session, tenant_schema)
+        yield db
+
+
+def _sync_read_target(db: AsyncSession) -> tuple[sessionmaker[Session], str | None]:
+    if db.info.get("read_source") == "replica" and replica.ReplicaSyncSessionLocal is not None:
+        return replica.ReplicaSyncSessionLocal, db.info.get("tenant_schema")
+    return SessionLocal, db.info.get("tenant_schema")
+
+
+async def run_read_in_threadpool(db: AsyncSession, read: Callable[..., T], *args: Any) -> T:
+    """``read(session, *args)`` in the threadpool instead of ``db.run_sync``.
+
+    ``session`` is a short-lived sync session on the database and tenant ``db``
+    reads from. For builders that do most of their work in Python (master,
+    ageing and analytics reports, unpaged exports), which would otherwise hold
+    the event loop for as long as they run.
+    """
+    session_factory, tenant_schema = _sync_read_target(db)
+
+    def _read() -> T:
+        with tenant_session(tenant_schema, session_factory) as sync_db:
+            return read(sync_db, *args)
+
+    return await run_in_threadpool(_read)
+
+
+def iter_read_rows(
+    db: AsyncSession, rows: Callable[..., Iterator[T]], *args: Any
+) -> Iterator[T]:
+    """``rows(session, *args)`` on a sync session opened when the export starts streaming.
+
+    The response iterates it in the threadpool; the session reads from the same
+    database and tenant as ``db`` and is closed when the export ends.
+    """
+    session_factory, tenant_schema = _sync_read_target(db)
+
+    def _stream() -> Iterator[T]:
+        with tenant_session(tenant_schema, session_factory) as sync_db:
+            yield from rows(sync_db, *args)
+
+    return _stream()
 
 
 def validate_tenant_header_or_raise(authorization_header: str | None) -> None:
@@ -550,7 +688,12 @@ def _assert_tenant_search_path(db: Session, expected_schema: str) -> None:
 
 
 def _ensure_runtime_schema_compatibility(db: Session, schema_name: str) -> None:
-    if not IS_POSTGRES or schema_name in _SCHEMA_COMPATIBILITY_CHECKED:
+    if not IS_POSTGRES:
+        return
+    if schema_name in _SCHEMA_COMPATIBILITY_CHECKED:
+        # Partitions roll forward with the calendar, so they are rechecked once
+        # per month even after the rest of the schema has been verified.
+        _auto_repair_time_partitions(db, schema_name)
         return
 
     users_table_exists = db.execute(
@@ -946,6 +1089,19 @@ def _ensure_runtime_schema_compatibility(db: Session, schema_name: str) -> None:
         _auto_repair_party_master_columns(db, schema_name)
         _auto_repair_drug_license_verification_tables(db, schema_name)
 
+    _auto_repair_search_indexes(db, schema_name)
+    _auto_repair_data_versions_table(db, schema_name)
+    _auto_repair_dashboard_snapshots_table(db, schema_name)
+    _auto_repair_time_partitions(db, schema_name)
+    _auto_repair_period_close_tables(db, schema_name)
+    _auto_repair_batch_identity_index(db, schema_name)
+    _auto_repair_audit_snapshot_seq(db, schema_name)
+    _auto_repair_data_quality_findings(db, schema_name)
+    _auto_repair_stock_summary_expiry(db, schema_name)
+    _auto_repair_document_versions(db, schema_name)
+    _auto_repair_idempotency_keys(db, schema_name)
+    _auto_repair_ledger_reference_triggers(db, schema_name)
+
     # Compatibility repairs may commit DDL, and pooled checkouts default back to public.
     # Rebind the tenant schema before the request continues.
     if schema_name != "public":
@@ -1175,7 +1331,7 @@ def _auto_repair_inventory_tables(db: Session, schema_name: str) -> None:
             text(
                 f"""
                 CREATE TABLE IF NOT EXISTS {ledger_table} (
-                    id SERIAL PRIMARY KEY,
+                    id SERIAL NOT NULL,
                     txn_type inventory_txn_type_enum NOT NULL,
                     reason inventory_reason_enum NOT NULL,
                     ref_type VARCHAR(50) NULL,
@@ -1186,8 +1342,9 @@ def _auto_repair_inventory_tables(db: Session, schema_name: str) -> None:
                     qty NUMERIC(18, 3) NOT NULL,
                     unit_cost NUMERIC(14, 4) NULL,
                     {created_by_column_sql}
-                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-                )
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    CONSTRAINT inventory_ledger_pkey PRIMARY KEY (id, created_at)
+                ) PARTITION BY RANGE (created_at)
                 """
             )
         )
@@ -1203,13 +1360,13 @@ def _auto_repair_inventory_tables(db: Session, schema_name: str) -> None:
                 """
             )
         )
-    if not _index_exists(db, schema_name, "ix_inventory_ledger_created_at"):
+    if not _index_exists(db, schema_name, "ix_inventory_ledger_created_at_brin"):
         did_ddl = True
         db.execute(
             text(
                 f"""
-                CREATE INDEX IF NOT EXISTS ix_inventory_ledger_created_at
-                ON {ledger_table} (created_at)
+                CREATE INDEX IF NOT EXISTS ix_inventory_ledger_created_at_brin
+                ON {ledger_table} USING brin (created_at)
                 """
             )
         )
@@ -1290,7 +1447,6 @@ def _auto_repair_purchase_tables(db: Session, schema_name: str) -> None:
     grn_lines_table = _build_quoted_schema_table(schema_name, "grn_lines")
     grn_batch_lines_table = _build_quoted_schema_table(schema_name, "grn_batch_lines")
     stock_source_provenance_table = _build_quoted_schema_table(schema_name, "stock_source_provenance")
-    inventory_ledger_table = _build_quoted_schema_table(schema_name, "inventory_ledger")
     batches_table = _build_quoted_schema_table(schema_name, "batches")
     purchase_bills_table = _build_quoted_schema_table(schema_name, "purchase_bills")
     purchase_bill_lines_table = _build_quoted_schema_table(schema_name, "purchase_bill_lines")
@@ -1645,7 +1801,7 @@ def _auto_repair_purchase_tables(db: Session, schema_name: str) -> None:
                         f"""
                         CREATE TABLE IF NOT EXISTS {stock_source_provenance_table} (
                             id SERIAL PRIMARY KEY,
-                            ledger_id INTEGER NOT NULL REFERENCES {inventory_ledger_table}(id),
+                            ledger_id INTEGER NOT NULL,
                             supplier_id INTEGER NOT NULL REFERENCES {parties_table}(id),
                             purchase_order_id INTEGER NOT NULL REFERENCES {po_table}(id),
                             purchase_bill_id {provenance_purchase_bill_fk_sql},
@@ -2237,6 +2393,259 @@ def _auto_repair_drug_license_verification_tables(db: Session, schema_name: str)
     )
 
 
+def _auto_repair_search_indexes(db: Session, schema_name: str) -> None:
+    trigram_schema = db.execute(
+        text(
+            """
+            SELECT n.nspname
+            FROM pg_extension e
+            JOIN pg_namespace n ON n.oid = e.extnamespace
+            WHERE e.extname = 'pg_trgm'
+            """
+        )
+    ).scalar_one_or_none()
+    if trigram_schema is None:
+        return
+    # The operator class is schema-qualified because pg_trgm may be installed outside
+    # the search path used while repairing (e.g. in a dedicated extensions schema).
+    trigram_ops = '"{}".gin_trgm_ops'.format(trigram_schema.replace('"', '""'))
+
+    for index_name, (table_name, columns) in SEARCH_INDEXES.items():
+        if not _table_exists(db, schema_name, table_name):
+            continue
+        if _index_exists(db, schema_name, index_name):
+            continue
+        db.execute(
+            text(
+                f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {_build_quoted_schema_table(schema_name, table_name)}
+                USING gin (({search_document_sql(columns)}) {trigram_ops})
+                """
+            )
+        )
+        db.commit()
+        logger.warning(
+            "Auto-repaired tenant schema to add missing search index",
+            extra={"schema": schema_name, "index": index_name},
+        )
+
+
+def _auto_repair_data_versions_table(db: Session, schema_name: str) -> None:
+    if _table_exists(db, schema_name, "data_versions"):
+        return
+
+    db.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {_build_quoted_schema_table(schema_name, "data_versions")} (
+                table_name VARCHAR(64) PRIMARY KEY,
+                version BIGINT NOT NULL DEFAULT 0,
+                changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add data versions table",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_dashboard_snapshots_table(db: Session, schema_name: str) -> None:
+    if _table_exists(db, schema_name, "dashboard_snapshots"):
+        return
+
+    table = _build_quoted_schema_table(schema_name, "dashboard_snapshots")
+    db.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                as_of DATE NULL,
+                total_products BIGINT NOT NULL DEFAULT 0,
+                total_parties BIGINT NOT NULL DEFAULT 0,
+                total_warehouses BIGINT NOT NULL DEFAULT 0,
+                stock_items_count BIGINT NOT NULL DEFAULT 0,
+                total_stock_value NUMERIC(24, 7) NOT NULL DEFAULT 0,
+                expiring_soon_count BIGINT NOT NULL DEFAULT 0,
+                open_purchase_orders BIGINT NOT NULL DEFAULT 0,
+                pending_dispatches BIGINT NOT NULL DEFAULT 0,
+                refreshed_at TIMESTAMPTZ NULL
+            )
+            """
+        )
+    )
+    db.execute(text(f"INSERT INTO {table} (id) VALUES (1) ON CONFLICT (id) DO NOTHING"))
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add dashboard snapshots table",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_time_partitions(db: Session, schema_name: str) -> None:
+    month = month_start(date.today())
+    if (schema_name, month) in _TIME_PARTITIONS_CHECKED:
+        return
+
+    # Tables still on the pre-partitioning layout are converted by the
+    # migration, not here; ensure_monthly_partitions skips them.
+    created = ensure_monthly_partitions(db, schema_name=schema_name, today=month)
+    if created:
+        db.commit()
+        logger.warning(
+            "Auto-repaired tenant schema to add time partitions",
+            extra={"schema": schema_name, "partitions": created},
+        )
+        if schema_name != "public":
+            set_tenant_search_path(db, schema_name)
+    _TIME_PARTITIONS_CHECKED.add((schema_name, month))
+
+
+def _auto_repair_period_close_tables(db: Session, schema_name: str) -> None:
+    # The archive is shaped after the partitioned ledger, so it waits for the
+    # partitioning migration on tenants that have not run it yet.
+    needs_archive = not _table_exists(
+        db, schema_name, "inventory_ledger_archive"
+    ) and is_partitioned(db, "inventory_ledger", schema_name=schema_name)
+    if _table_exists(db, schema_name, "inventory_period_closes") and not needs_archive:
+        return
+
+    checkpoints = _build_quoted_schema_table(schema_name, "inventory_checkpoints")
+    closes = _build_quoted_schema_table(schema_name, "inventory_period_closes")
+    warehouses = _build_quoted_schema_table(schema_name, "warehouses")
+    products = _build_quoted_schema_table(schema_name, "products")
+    batches = _build_quoted_schema_table(schema_name, "batches")
+    users = _build_quoted_schema_table(schema_name, "users")
+    db.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {checkpoints} (
+                id SERIAL PRIMARY KEY,
+                warehouse_id INTEGER NOT NULL REFERENCES {warehouses}(id),
+                product_id INTEGER NOT NULL REFERENCES {products}(id),
+                batch_id INTEGER NOT NULL REFERENCES {batches}(id),
+                is_opening BOOLEAN NOT NULL DEFAULT FALSE,
+                qty NUMERIC(18, 3) NOT NULL DEFAULT 0,
+                stock_value NUMERIC(24, 7) NOT NULL DEFAULT 0,
+                last_movement_at TIMESTAMPTZ NOT NULL,
+                closed_through DATE NOT NULL,
+                CONSTRAINT uq_inventory_checkpoints_bucket
+                    UNIQUE (warehouse_id, product_id, batch_id, is_opening)
+            )
+            """
+        )
+    )
+    db.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS ix_inventory_checkpoints_product "
+            f"ON {checkpoints} (product_id)"
+        )
+    )
+    if needs_archive:
+        ledger = _build_quoted_schema_table(schema_name, "inventory_ledger")
+        archive = _build_quoted_schema_table(schema_name, "inventory_ledger_archive")
+        db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {archive} (LIKE {ledger} INCLUDING CONSTRAINTS) "
+                "PARTITION BY RANGE (created_at)"
+            )
+        )
+        db.execute(
+            text(
+                f"ALTER TABLE {archive} ADD CONSTRAINT inventory_ledger_archive_pkey "
+                "PRIMARY KEY (id, created_at)"
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_inventory_ledger_archive_wh_prod "
+                f"ON {archive} (warehouse_id, product_id)"
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_inventory_ledger_archive_created_at_brin "
+                f"ON {archive} USING brin (created_at)"
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS "
+                f"{_build_quoted_schema_table(schema_name, 'inventory_ledger_archive_default')} "
+                f"PARTITION OF {archive} DEFAULT"
+            )
+        )
+    db.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {closes} (
+                id SERIAL PRIMARY KEY,
+                fiscal_year_end DATE NOT NULL UNIQUE,
+                cutoff_at TIMESTAMPTZ NOT NULL,
+                archived_rows INTEGER NOT NULL DEFAULT 0,
+                checkpoint_rows INTEGER NOT NULL DEFAULT 0,
+                closed_by INTEGER NOT NULL REFERENCES {users}(id),
+                closed_at TIMESTAMPTZ DEFAULT NOW()
+            )
+            """
+        )
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add fiscal-year close tables",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_batch_identity_index(db: Session, schema_name: str) -> None:
+    if not _table_exists(db, schema_name, "batches"):
+        return
+    if _index_exists(db, schema_name, "uq_batches_identity"):
+        return
+
+    batches_table = _build_quoted_schema_table(schema_name, "batches")
+    identity_columns = ", ".join(BATCH_IDENTITY_COLUMNS)
+    # Same steps as migration 20261019_0044: batches that only differ in NULLs
+    # keep their stock and are tagged through reference_id rather than merged.
+    db.execute(
+        text(
+            f"""
+            UPDATE {batches_table} AS batches
+            SET reference_id = left(
+                coalesce(batches.reference_id || ' ', '')
+                || 'DUPLICATE-' || batches.id || '-OF-' || ranked.canonical_id,
+                120
+            )
+            FROM (
+                SELECT id, min(id) OVER (PARTITION BY {identity_columns}) AS canonical_id
+                FROM {batches_table}
+            ) AS ranked
+            WHERE ranked.id = batches.id
+              AND ranked.id <> ranked.canonical_id
+            """
+        )
+    )
+    db.execute(
+        text(
+            f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_batches_identity
+            ON {batches_table} ({identity_columns}) NULLS NOT DISTINCT
+            """
+        )
+    )
+    db.execute(
+        text(f"ALTER TABLE {batches_table} DROP CONSTRAINT IF EXISTS uq_batch_product_metadata")
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add batch identity index",
+        extra={"schema": schema_name},
+    )
+
+
 def _build_quoted_schema_table(schema_name: str, table_name: str) -> str:
     return f'{quote_schema_name(schema_name)}.{table_name}'
 
@@ -2258,3 +2667,236 @@ def _allow_ephemeral_test_schema(db: Session, org_slug: str, expected_schema: st
         {"schema_name": expected_schema},
     ).scalar_one_or_none()
     return schema_exists is not None
+
+
+def _audit_log_columns(db: Session, schema_name: str) -> set[str]:
+    return set(
+        db.execute(
+            text(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = :schema_name
+                  AND table_name = 'audit_logs'
+                """
+            ),
+            {"schema_name": schema_name},
+        ).scalars()
+    )
+
+
+def _auto_repair_audit_snapshot_seq(db: Session, schema_name: str) -> None:
+    columns = _audit_log_columns(db, schema_name)
+    # Legacy audit tables (no performed_by) keep writing full snapshots.
+    if "performed_by" not in columns or "snapshot_seq" in columns:
+        return
+
+    audit_logs_table = _build_quoted_schema_table(schema_name, "audit_logs")
+    db.execute(text(f"ALTER TABLE {audit_logs_table} ADD COLUMN IF NOT EXISTS snapshot_seq INTEGER"))
+    db.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS ix_audit_logs_entity_history "
+            f"ON {audit_logs_table} (entity_type, entity_id, timestamp, id)"
+        )
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add audit_logs.snapshot_seq",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_data_quality_findings(db: Session, schema_name: str) -> None:
+    if not _table_exists(db, schema_name, "parties"):
+        return
+
+    if not _table_exists(db, schema_name, "data_quality_findings"):
+        findings_table = _build_quoted_schema_table(schema_name, "data_quality_findings")
+        db.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {findings_table} (
+                    id SERIAL PRIMARY KEY,
+                    report VARCHAR(32) NOT NULL,
+                    entity_type VARCHAR(32) NOT NULL,
+                    subject_key VARCHAR(255) NOT NULL,
+                    entity_id INTEGER NULL,
+                    entity_name VARCHAR(255) NULL,
+                    rules VARCHAR(64)[] NOT NULL,
+                    details VARCHAR(512) NULL,
+                    record_count INTEGER NULL,
+                    detected_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    checked_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    CONSTRAINT uq_data_quality_findings_subject
+                        UNIQUE (report, entity_type, subject_key)
+                )
+                """
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_data_quality_findings_rules "
+                f"ON {findings_table} USING gin (rules)"
+            )
+        )
+        db.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_data_quality_findings_detected_at "
+                f"ON {findings_table} (detected_at)"
+            )
+        )
+        db.commit()
+        logger.warning(
+            "Auto-repaired tenant schema to add data quality findings table",
+            extra={"schema": schema_name},
+        )
+
+    # The first full scan leaves a data_versions marker; until then the table
+    # only holds findings for records written since it was created.
+    data_versions_table = _build_quoted_schema_table(schema_name, "data_versions")
+    scanned = db.scalar(
+        text(f"SELECT 1 FROM {data_versions_table} WHERE table_name = 'data_quality_findings'")
+    )
+    if scanned:
+        return
+
+    set_tenant_search_path(db, schema_name)
+    rescan_data_quality_findings(db)
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema by scanning data quality findings",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_stock_summary_expiry(db: Session, schema_name: str) -> None:
+    # The second index is created last, so its presence means the repair finished.
+    if not _table_exists(db, schema_name, "stock_summary") or _index_exists(
+        db, schema_name, "ix_stock_summary_in_stock_wh_prod_expiry"
+    ):
+        return
+
+    stock_summary_table = _build_quoted_schema_table(schema_name, "stock_summary")
+    batches_table = _build_quoted_schema_table(schema_name, "batches")
+    db.execute(text(f"ALTER TABLE {stock_summary_table} ADD COLUMN IF NOT EXISTS expiry_date DATE"))
+    db.execute(
+        text(
+            f"""
+            UPDATE {stock_summary_table} AS s
+            SET expiry_date = b.expiry_date
+            FROM {batches_table} AS b
+            WHERE b.id = s.batch_id AND s.expiry_date IS NULL
+            """
+        )
+    )
+    db.execute(
+        text(
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_stock_summary_in_stock_expiry
+            ON {stock_summary_table} (expiry_date)
+            INCLUDE (warehouse_id, product_id, batch_id, qty_on_hand)
+            WHERE qty_on_hand > 0
+            """
+        )
+    )
+    db.execute(
+        text(
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_stock_summary_in_stock_wh_prod_expiry
+            ON {stock_summary_table} (warehouse_id, product_id, expiry_date, batch_id)
+            INCLUDE (qty_on_hand)
+            WHERE qty_on_hand > 0
+            """
+        )
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add stock_summary.expiry_date",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_document_versions(db: Session, schema_name: str) -> None:
+    versioned = set(
+        db.execute(
+            text(
+                """
+                SELECT table_name
+                FROM information_schema.columns
+                WHERE table_schema = :schema_name
+                  AND column_name = 'version'
+                """
+            ),
+            {"schema_name": schema_name},
+        ).scalars()
+    )
+    missing = [
+        table_name
+        for table_name in _VERSIONED_DOCUMENT_TABLES
+        if table_name not in versioned and _table_exists(db, schema_name, table_name)
+    ]
+    if not missing:
+        return
+
+    for table_name in missing:
+        quoted_table = _build_quoted_schema_table(schema_name, table_name)
+        db.execute(
+            text(
+                f"ALTER TABLE {quoted_table} "
+                "ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1"
+            )
+        )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add document version columns",
+        extra={"schema": schema_name, "tables": missing},
+    )
+
+
+def _auto_repair_idempotency_keys(db: Session, schema_name: str) -> None:
+    if not _table_exists(db, schema_name, "users") or _table_exists(
+        db, schema_name, "idempotency_keys"
+    ):
+        return
+
+    idempotency_keys_table = _build_quoted_schema_table(schema_name, "idempotency_keys")
+    db.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {idempotency_keys_table} (
+                id SERIAL PRIMARY KEY,
+                subject VARCHAR(255) NOT NULL,
+                route VARCHAR(255) NOT NULL,
+                key VARCHAR(255) NOT NULL,
+                request_hash VARCHAR(64) NOT NULL,
+                status_code INTEGER NOT NULL,
+                response_body JSON NOT NULL,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                expires_at TIMESTAMPTZ NOT NULL,
+                CONSTRAINT uq_idempotency_keys_subject_route_key UNIQUE (subject, route, key)
+            )
+            """
+        )
+    )
+    db.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS ix_idempotency_keys_expires_at "
+            f"ON {idempotency_keys_table} (expires_at)"
+        )
+    )
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to add idempotency keys table",
+        extra={"schema": schema_name},
+    )
+
+
+def _auto_repair_ledger_reference_triggers(db: Session, schema_name: str) -> None:
+    created = ensure_ledger_reference_triggers(db, schema_name=schema_name)
+    if not created:
+        return
+    db.commit()
+    logger.warning(
+        "Auto-repaired tenant schema to check ledger references",
+        extra={"schema": schema_name, "tables": created},
+    )
@@ -1,11 +1,21 @@
 from contextlib import asynccontextmanager
+from time import perf_counter
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core.metrics import (
+    UNMATCHED_ROUTE,
+    begin_request_metrics,
+    end_request_metrics,
+    record_request,
+    server_timing_header,
+)
+from app.core.replica import note_write_for_authorization
 from app.core.tenant import validate_tenant_header_or_raise
 from app.integrations.drug_license_verification.client import set_drug_license_verification_client
 from app.integrations.drug_license_verification.sfda_client import SFDADrugLicenseVerificationClient
@@ -15,8 +25,10 @@ from app.integrations.gst_verification.setu_client import SetuGSTVerificationCli
 from app.models import base  # noqa: F401
 from app.routers import TENANT_SCOPED_PREFIXES, public_router, tenant_router
 from app.services.rbac import bootstrap_rbac_if_ready
+from app.services.versioning import version_conflict
 
 settings = get_settings()
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 
 @asynccontextmanager
@@ -50,6 +62,12 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     return JSONResponse(status_code=exc.status_code, content=content)
 
 
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(request: Request, _exc: StaleDataError) -> JSONResponse:
+    # A versioned document changed between this request's read and its write.
+    return await app_exception_handler(request, version_conflict())
+
+
 @app.middleware("http")
 async def guard_tenant_context(request: Request, call_next):
     if request.url.path.startswith(TENANT_SCOPED_PREFIXES):
@@ -61,6 +79,36 @@ async def guard_tenant_context(request: Request, call_next):
     return await call_next(request)
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    metrics, token = begin_request_metrics()
+    started_at = perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request_metrics(token)
+    duration_seconds = perf_counter() - started_at
+
+    route = request.scope.get("route")
+    record_request(
+        method=request.method,
+        route=getattr(route, "path", UNMATCHED_ROUTE),
+        duration_seconds=duration_seconds,
+        metrics=metrics,
+        query_budget=settings.request_query_budget,
+    )
+    response.headers["Server-Timing"] = server_timing_header(metrics, duration_seconds)
+    return response
+
+
+@app.middleware("http")
+async def note_writes_for_read_routing(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        note_write_for_authorization(request.headers.get("authorization"))
+    return response
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
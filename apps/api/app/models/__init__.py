@@ -1,6 +1,9 @@
 from app.models.audit import AuditLog
 from app.models.batch import Batch
 from app.models.company_settings import CompanySettings
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.data_quality import DataQualityFinding
+from app.models.data_version import DataVersion
 from app.models.drug_license import DrugLicenseVerificationLog
 from app.models.enums import (
     DispatchNoteStatus,
@@ -19,9 +22,15 @@ from app.models.enums import (
     StockReservationStatus,
 )
 from app.models.gst_verification import GSTVerificationLog
+from app.models.idempotency import IdempotencyKey
 from app.models.inventory import InventoryLedger, StockSummary
 from app.models.login_audit import LoginAudit
 from app.models.party import Party
+from app.models.period_close import (
+    InventoryCheckpoint,
+    InventoryLedgerArchive,
+    InventoryPeriodClose,
+)
 from app.models.product import Product
 from app.models.purchase import (
     GRN,
@@ -58,8 +67,12 @@ __all__ = [
     "Product",
     "Batch",
     "CompanySettings",
+    "DashboardSnapshot",
+    "DataQualityFinding",
+    "DataVersion",
     "DrugLicenseVerificationLog",
     "GSTVerificationLog",
+    "IdempotencyKey",
     "AuditLog",
     "DocumentAttachment",
     "PurchaseOrder",
@@ -82,6 +95,9 @@ __all__ = [
     "RolePermission",
     "LoginAudit",
     "InventoryLedger",
+    "InventoryLedgerArchive",
+    "InventoryCheckpoint",
+    "InventoryPeriodClose",
     "StockSummary",
     "StockCorrection",
     "StockAdjustment",
@@ -1,15 +1,35 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    event,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.partitions import create_initial_partitions
 
 
 class AuditLog(Base):
+    """Append-only audit trail, range-partitioned by month on ``timestamp``."""
+
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "timestamp", name="audit_logs_pkey"),
+        Index("ix_audit_logs_timestamp_brin", "timestamp", postgresql_using="brin"),
+        Index("ix_audit_logs_entity_history", "entity_type", "entity_id", "timestamp", "id"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(autoincrement=True)
     entity_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     entity_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     module: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -28,5 +48,13 @@ class AuditLog(Base):
     before_snapshot: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     after_snapshot: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     metadata_json: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
+    # Position since the entity's last keyframe (see app.services.audit): NULL or 0
+    # rows hold full snapshots, later rows only the fields that changed.
+    snapshot_seq: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    __mapper_args__ = {"primary_key": [id]}
 
     user = relationship("User", back_populates="audit_logs")
+
+
+event.listen(AuditLog.__table__, "after_create", create_initial_partitions)
@@ -1,23 +1,31 @@
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Date, ForeignKey, Index, Numeric, String, UniqueConstraint
+from sqlalchemy import Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
+# What makes two batches the same batch. NULLs compare equal in the unique
+# index, so a batch without an MRP or reference id is still registered once.
+BATCH_IDENTITY_COLUMNS = (
+    "product_id",
+    "batch_no",
+    "expiry_date",
+    "mfg_date",
+    "mrp",
+    "reference_id",
+)
+
 
 class Batch(Base):
     __tablename__ = "batches"
     __table_args__ = (
-        UniqueConstraint(
-            "product_id",
-            "batch_no",
-            "expiry_date",
-            "mfg_date",
-            "mrp",
-            "reference_id",
-            name="uq_batch_product_metadata",
+        Index(
+            "uq_batches_identity",
+            *BATCH_IDENTITY_COLUMNS,
+            unique=True,
+            postgresql_nulls_not_distinct=True,
         ),
         Index("ix_batches_batch_no", "batch_no"),
         Index("ix_batches_expiry_date", "expiry_date"),
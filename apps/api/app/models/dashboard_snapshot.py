@@ -0,0 +1,33 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+DASHBOARD_SNAPSHOT_ID = 1
+
+
+class DashboardSnapshot(Base):
+    """Single-row dashboard KPI snapshot, kept current by the write paths.
+
+    ``as_of`` is the date the expiry window was computed for; a NULL or past
+    value marks the row for a full rebuild.
+    """
+
+    __tablename__ = "dashboard_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=DASHBOARD_SNAPSHOT_ID)
+    as_of: Mapped[date | None] = mapped_column(Date, nullable=True)
+    total_products: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_parties: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_warehouses: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    stock_items_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_stock_value: Mapped[Decimal] = mapped_column(
+        Numeric(24, 7), nullable=False, default=Decimal("0")
+    )
+    expiring_soon_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    open_purchase_orders: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    pending_dispatches: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    refreshed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
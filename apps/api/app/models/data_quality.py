@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class DataQualityFinding(Base):
+    """One open data-quality finding, kept current by app.services.data_quality.
+
+    ``subject_key`` is the record id for per-record findings and the repeated
+    value for duplicate groups. ``detected_at`` stays put while the finding
+    remains open; ``checked_at`` moves on every re-check.
+    """
+
+    __tablename__ = "data_quality_findings"
+    __table_args__ = (
+        UniqueConstraint(
+            "report", "entity_type", "subject_key", name="uq_data_quality_findings_subject"
+        ),
+        Index("ix_data_quality_findings_rules", "rules", postgresql_using="gin"),
+        Index("ix_data_quality_findings_detected_at", "detected_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    report: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    subject_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    entity_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    entity_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    rules: Mapped[list[str]] = mapped_column(ARRAY(String(64)), nullable=False)
+    details: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    record_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    detected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
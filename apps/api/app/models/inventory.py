@@ -1,16 +1,37 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, String, UniqueConstraint, func
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.partitions import create_initial_partitions
 from app.models.enums import InventoryReason, InventoryTxnType
 
 
 class InventoryLedger(Base):
+    """Insert-only stock movements, range-partitioned by month on ``created_at``.
+
+    The partition key has to be part of the table's primary key; the mapper
+    still identifies rows by ``id`` alone.
+    """
+
     __tablename__ = "inventory_ledger"
     __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at", name="inventory_ledger_pkey"),
         Index("ix_inventory_ledger_wh_prod", "warehouse_id", "product_id"),
         Index(
             "ix_inventory_ledger_wh_prod_batch_created",
@@ -20,11 +41,12 @@ class InventoryLedger(Base):
             "created_at",
         ),
         Index("ix_inventory_ledger_batch_id", "batch_id"),
-        Index("ix_inventory_ledger_created_at", "created_at"),
+        Index("ix_inventory_ledger_created_at_brin", "created_at", postgresql_using="brin"),
         Index("ix_inventory_ledger_reason", "reason"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(autoincrement=True)
     txn_type: Mapped[InventoryTxnType] = mapped_column(
         Enum(InventoryTxnType, name="inventory_txn_type_enum"), nullable=False
     )
@@ -39,7 +61,11 @@ class InventoryLedger(Base):
     qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
     unit_cost: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
     created_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __mapper_args__ = {"primary_key": [id]}
 
     warehouse = relationship("Warehouse", back_populates="inventory_ledgers")
     product = relationship("Product", back_populates="inventory_ledgers")
@@ -47,12 +73,16 @@ class InventoryLedger(Base):
     creator = relationship("User")
     source_provenance = relationship(
         "StockSourceProvenance",
+        primaryjoin="foreign(StockSourceProvenance.ledger_id) == InventoryLedger.id",
         back_populates="ledger",
         uselist=False,
         cascade="all, delete-orphan",
     )
 
 
+event.listen(InventoryLedger.__table__, "after_create", create_initial_partitions)
+
+
 class StockSummary(Base):
     __tablename__ = "stock_summary"
     __table_args__ = (
@@ -63,6 +93,23 @@ class StockSummary(Base):
             name="uq_stock_summary_wh_product_batch",
         ),
         Index("ix_stock_summary_wh_prod_qty", "warehouse_id", "product_id", "qty_on_hand"),
+        # Expiry and FEFO reads only look at positions with stock, so these
+        # cover exactly those rows and answer without visiting the heap.
+        Index(
+            "ix_stock_summary_in_stock_expiry",
+            "expiry_date",
+            postgresql_include=["warehouse_id", "product_id", "batch_id", "qty_on_hand"],
+            postgresql_where=text("qty_on_hand > 0"),
+        ),
+        Index(
+            "ix_stock_summary_in_stock_wh_prod_expiry",
+            "warehouse_id",
+            "product_id",
+            "expiry_date",
+            "batch_id",
+            postgresql_include=["qty_on_hand"],
+            postgresql_where=text("qty_on_hand > 0"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -70,6 +117,9 @@ class StockSummary(Base):
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
     batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
     qty_on_hand: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False, default=0)
+    # Copy of the batch's expiry, which never changes once the batch exists;
+    # set by the inventory service whenever it creates a position.
+    expiry_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
@@ -0,0 +1,109 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    event,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.core.partitions import create_default_partition
+from app.models.enums import InventoryReason, InventoryTxnType
+
+
+class InventoryLedgerArchive(Base):
+    """Ledger rows of closed fiscal years, column-for-column with ``inventory_ledger``.
+
+    Closed months are moved here by detaching their ``inventory_ledger``
+    partitions and attaching them to this table, so archiving rewrites no rows.
+    """
+
+    __tablename__ = "inventory_ledger_archive"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at", name="inventory_ledger_archive_pkey"),
+        Index("ix_inventory_ledger_archive_wh_prod", "warehouse_id", "product_id"),
+        Index(
+            "ix_inventory_ledger_archive_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, autoincrement=False)
+    txn_type: Mapped[InventoryTxnType] = mapped_column(
+        Enum(InventoryTxnType, name="inventory_txn_type_enum"), nullable=False
+    )
+    reason: Mapped[InventoryReason] = mapped_column(
+        Enum(InventoryReason, name="inventory_reason_enum"), nullable=False
+    )
+    ref_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    ref_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    warehouse_id: Mapped[int] = mapped_column(ForeignKey("warehouses.id"), nullable=False)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
+    batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
+    qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
+    unit_cost: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
+    created_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __mapper_args__ = {"primary_key": [id]}
+
+
+event.listen(InventoryLedgerArchive.__table__, "after_create", create_default_partition)
+
+
+class InventoryCheckpoint(Base):
+    """Carry-forward totals of every archived ledger row for one stock bucket.
+
+    Opening-stock entries are carried separately (``is_opening``) so reports
+    that split opening from other stock keep working after a close.
+    """
+
+    __tablename__ = "inventory_checkpoints"
+    __table_args__ = (
+        UniqueConstraint(
+            "warehouse_id",
+            "product_id",
+            "batch_id",
+            "is_opening",
+            name="uq_inventory_checkpoints_bucket",
+        ),
+        Index("ix_inventory_checkpoints_product", "product_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    warehouse_id: Mapped[int] = mapped_column(ForeignKey("warehouses.id"), nullable=False)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
+    batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
+    is_opening: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False, default=Decimal("0"))
+    stock_value: Mapped[Decimal] = mapped_column(
+        Numeric(24, 7), nullable=False, default=Decimal("0")
+    )
+    last_movement_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    closed_through: Mapped[date] = mapped_column(Date, nullable=False)
+
+
+class InventoryPeriodClose(Base):
+    __tablename__ = "inventory_period_closes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    fiscal_year_end: Mapped[date] = mapped_column(Date, nullable=False, unique=True)
+    cutoff_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    checkpoint_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    closed_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    closed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -8,10 +8,12 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -71,6 +73,12 @@ class PurchaseOrder(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    # Bumped by every UPDATE, which only matches the version it read: a write
+    # based on a stale read fails with StaleDataError instead of overwriting.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
+
     supplier = relationship("Party")
     warehouse = relationship("Warehouse")
     creator = relationship("User", foreign_keys=[created_by])
@@ -78,6 +86,7 @@ class PurchaseOrder(Base):
         "PurchaseOrderLine",
         back_populates="purchase_order",
         cascade="all, delete-orphan",
+        order_by="PurchaseOrderLine.id",
     )
     grns = relationship("GRN", back_populates="purchase_order")
 
@@ -195,13 +204,19 @@ class GRN(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
+
     purchase_order = relationship("PurchaseOrder", back_populates="grns")
     purchase_bill = relationship("PurchaseBill", foreign_keys=[purchase_bill_id])
     supplier = relationship("Party")
     warehouse = relationship("Warehouse")
     creator = relationship("User", foreign_keys=[created_by])
     poster = relationship("User", foreign_keys=[posted_by])
-    lines = relationship("GRNLine", back_populates="grn", cascade="all, delete-orphan")
+    lines = relationship(
+        "GRNLine", back_populates="grn", cascade="all, delete-orphan", order_by="GRNLine.id"
+    )
 
     @property
     def po_number(self) -> str | None:
@@ -289,7 +304,12 @@ class GRNLine(Base):
     purchase_bill_line = relationship("PurchaseBillLine")
     product = relationship("Product")
     batch = relationship("Batch")
-    batch_lines = relationship("GRNBatchLine", back_populates="grn_line", cascade="all, delete-orphan")
+    batch_lines = relationship(
+        "GRNBatchLine",
+        back_populates="grn_line",
+        cascade="all, delete-orphan",
+        order_by="GRNBatchLine.id",
+    )
 
     @property
     def purchase_order_line_id(self) -> int | None:
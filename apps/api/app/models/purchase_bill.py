@@ -9,10 +9,12 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -98,6 +100,10 @@ class PurchaseBill(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
     remarks: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     supplier = relationship("Party")
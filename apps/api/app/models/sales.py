@@ -8,10 +8,12 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -54,10 +56,19 @@ class SalesOrder(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
+
     customer = relationship("Party")
     warehouse = relationship("Warehouse")
     creator = relationship("User", foreign_keys=[created_by])
-    lines = relationship("SalesOrderLine", back_populates="sales_order", cascade="all, delete-orphan")
+    lines = relationship(
+        "SalesOrderLine",
+        back_populates="sales_order",
+        cascade="all, delete-orphan",
+        order_by="SalesOrderLine.id",
+    )
     reservations = relationship("StockReservation", back_populates="sales_order")
     dispatch_notes = relationship("DispatchNote", back_populates="sales_order")
 
@@ -157,6 +168,10 @@ class DispatchNote(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     posted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
+
     sales_order = relationship("SalesOrder", back_populates="dispatch_notes")
     customer = relationship("Party")
     warehouse = relationship("Warehouse")
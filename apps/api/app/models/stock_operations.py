@@ -1,10 +1,11 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Numeric, String, Text, event, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ledger_references import create_ledger_reference_trigger
 from app.models.enums import StockAdjustmentReason, StockAdjustmentType
 
 
@@ -25,8 +26,9 @@ class StockCorrection(Base):
     qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
     reason: Mapped[str] = mapped_column(String(120), nullable=False)
     remarks: Mapped[str | None] = mapped_column(Text, nullable=True)
-    out_ledger_id: Mapped[int | None] = mapped_column(ForeignKey("inventory_ledger.id"), nullable=True)
-    in_ledger_id: Mapped[int | None] = mapped_column(ForeignKey("inventory_ledger.id"), nullable=True)
+    # Ledger references are plain ids, checked by a trigger; see app.core.ledger_references.
+    out_ledger_id: Mapped[int | None] = mapped_column(nullable=True)
+    in_ledger_id: Mapped[int | None] = mapped_column(nullable=True)
     created_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
@@ -34,8 +36,14 @@ class StockCorrection(Base):
     product = relationship("Product")
     source_batch = relationship("Batch", foreign_keys=[source_batch_id])
     corrected_batch = relationship("Batch", foreign_keys=[corrected_batch_id])
-    out_ledger = relationship("InventoryLedger", foreign_keys=[out_ledger_id])
-    in_ledger = relationship("InventoryLedger", foreign_keys=[in_ledger_id])
+    out_ledger = relationship(
+        "InventoryLedger",
+        primaryjoin="foreign(StockCorrection.out_ledger_id) == InventoryLedger.id",
+    )
+    in_ledger = relationship(
+        "InventoryLedger",
+        primaryjoin="foreign(StockCorrection.in_ledger_id) == InventoryLedger.id",
+    )
     creator = relationship("User")
 
 
@@ -64,12 +72,19 @@ class StockAdjustment(Base):
     remarks: Mapped[str | None] = mapped_column(Text, nullable=True)
     before_qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
     after_qty: Mapped[Decimal] = mapped_column(Numeric(18, 3), nullable=False)
-    ledger_id: Mapped[int | None] = mapped_column(ForeignKey("inventory_ledger.id"), nullable=True)
+    ledger_id: Mapped[int | None] = mapped_column(nullable=True)
     created_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     warehouse = relationship("Warehouse")
     product = relationship("Product")
     batch = relationship("Batch")
-    ledger = relationship("InventoryLedger", foreign_keys=[ledger_id])
+    ledger = relationship(
+        "InventoryLedger",
+        primaryjoin="foreign(StockAdjustment.ledger_id) == InventoryLedger.id",
+    )
     creator = relationship("User")
+
+
+event.listen(StockCorrection.__table__, "after_create", create_ledger_reference_trigger)
+event.listen(StockAdjustment.__table__, "after_create", create_ledger_reference_trigger)
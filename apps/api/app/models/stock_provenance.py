@@ -1,10 +1,21 @@
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Date, DateTime, ForeignKey, Index, Numeric, String, UniqueConstraint, func
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    UniqueConstraint,
+    event,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ledger_references import create_ledger_reference_trigger
 
 
 class StockSourceProvenance(Base):
@@ -24,7 +35,9 @@ class StockSourceProvenance(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    ledger_id: Mapped[int] = mapped_column(ForeignKey("inventory_ledger.id"), nullable=False)
+    # Not a foreign key: inventory_ledger is partitioned and its primary key
+    # includes created_at. A trigger checks it instead (app.core.ledger_references).
+    ledger_id: Mapped[int] = mapped_column(nullable=False)
     supplier_id: Mapped[int] = mapped_column(ForeignKey("parties.id"), nullable=False)
     purchase_order_id: Mapped[int] = mapped_column(ForeignKey("purchase_orders.id"), nullable=False)
     purchase_bill_id: Mapped[int | None] = mapped_column(ForeignKey("purchase_bills.id"), nullable=True)
@@ -45,7 +58,11 @@ class StockSourceProvenance(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    ledger = relationship("InventoryLedger", back_populates="source_provenance")
+    ledger = relationship(
+        "InventoryLedger",
+        primaryjoin="foreign(StockSourceProvenance.ledger_id) == InventoryLedger.id",
+        back_populates="source_provenance",
+    )
     supplier = relationship("Party")
     purchase_order = relationship("PurchaseOrder")
     purchase_bill = relationship("PurchaseBill")
@@ -55,3 +72,6 @@ class StockSourceProvenance(Base):
     warehouse = relationship("Warehouse")
     product = relationship("Product")
     batch = relationship("Batch")
+
+
+event.listen(StockSourceProvenance.__table__, "after_create", create_ledger_reference_trigger)
@@ -0,0 +1,175 @@
+"""Reports consolidated across several tenant schemas.
+
+The caller decides which organizations the user may see; this module only
+checks that each slug names an active tenant. Every tenant runs the unchanged
+single-tenant report function in the threadpool on a sync session of its own,
+bound to that tenant's schema, and at most
+``settings.consolidated_report_concurrency`` tenants run at once, one pooled
+connection each. Consolidating twenty branches therefore takes about as long
+as the slowest of them, not their sum, and none of them runs on the event loop.
+
+Sorted outputs are merged lazily with :func:`heapq.merge`. For a paged report
+each tenant returns only the first ``page * page_size`` rows in the report's
+own order, which is all the requested page of the merge can draw from; the
+``sort_key`` passed in must therefore agree with the report's ORDER BY. Python
+compares strings by code point whatever the database's collation, so reports
+with text sort columns take a ``sort_collation`` filter, which the branches of
+:func:`run_consolidated_report` set to ``CODE_POINT_COLLATION``.
+"""
+
+import asyncio
+import heapq
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields, replace
+from itertools import islice
+from typing import Any, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core import replica
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, SessionLocal
+from app.core.exceptions import AppException
+from app.core.tenancy import build_tenant_schema_name, validate_org_slug
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+settings = get_settings()
+
+# For UTF-8 text, "C" orders strings by code point, as Python does.
+CODE_POINT_COLLATION = "C"
+
+
+@dataclass(slots=True)
+class ConsolidatedReport:
+    total: int
+    data: list[dict[str, Any]]
+    # Each tenant's own summary, keyed by organization slug.
+    summaries: dict[str, Any]
+
+
+def current_stock_order(row: Mapping[str, Any]) -> tuple:
+    """Merge key matching ``get_current_stock_report``'s ORDER BY in code-point order."""
+    return (row["product_name"], row["warehouse"], row["expiry_date"], row["batch"])
+
+
+def purchase_event_order(event) -> tuple:
+    """Merge key matching the order ``load_purchase_events`` returns."""
+    return (
+        event.source_date,
+        event.product_name,
+        event.supplier_name,
+        event.source_id,
+        event.source_line_id,
+    )
+
+
+async def _tenant_schemas(slugs: Sequence[str]) -> dict[str, str]:
+    safe_slugs = list(dict.fromkeys(validate_org_slug(slug) for slug in slugs))
+    if not safe_slugs:
+        return {}
+    async with AsyncSessionLocal() as db:
+        rows = (
+            await db.execute(
+                text(
+                    """
+                    SELECT id, schema_name
+                    FROM public.organizations
+                    WHERE id IN :slugs AND is_active IS TRUE
+                    """
+                ).bindparams(bindparam("slugs", expanding=True)),
+                {"slugs": safe_slugs},
+            )
+        ).all()
+    active = {row.id: row.schema_name for row in rows}
+    if any(active.get(slug) != build_tenant_schema_name(slug) for slug in safe_slugs):
+        raise AppException(
+            error_code="FORBIDDEN",
+            message="Organization context is invalid",
+            status_code=403,
+        )
+    return {slug: active[slug] for slug in safe_slugs}
+
+
+async def run_per_tenant(
+    slugs: Sequence[str],
+    report: Callable[..., T],
+    *args: Any,
+    concurrency: int | None = None,
+    subject: str | None = None,
+) -> dict[str, T]:
+    """``report(db, *args)`` in every tenant, concurrently; results in ``slugs`` order.
+
+    ``subject`` is the caller's :func:`replica.token_subject`, so a user who
+    just wrote reads from the primary like on single-tenant report routes.
+    """
+    schemas = await _tenant_schemas(slugs)
+    use_replica = await replica.use_replica_for(subject)
+    if use_replica and replica.ReplicaSyncSessionLocal is not None:
+        session_factory = replica.ReplicaSyncSessionLocal
+    else:
+        use_replica, session_factory = False, SessionLocal
+    gate = asyncio.Semaphore(concurrency or settings.consolidated_report_concurrency)
+
+    def _run(schema_name: str) -> T:
+        with session_factory() as db:
+            db.info["read_source"] = "replica" if use_replica else "primary"
+            # Not bind_tenant_search_path: the branches share one request's
+            # metrics, which would otherwise be labelled with whichever ran last.
+            # The search_path is applied when the session begins.
+            db.info["tenant_schema"] = schema_name
+            return report(db, *args)
+
+    async def _branch(schema_name: str) -> T:
+        async with gate:
+            return await run_in_threadpool(_run, schema_name)
+
+    results = await asyncio.gather(*(_branch(schema) for schema in schemas.values()))
+    return dict(zip(schemas, results, strict=True))
+
+
+def merge_sorted(
+    results: Mapping[str, Iterable[R]],
+    key: Callable[[R], Any],
+) -> Iterator[tuple[str, R]]:
+    """K-way merge of per-tenant sorted rows into ``(slug, row)`` pairs, lazily."""
+    return heapq.merge(
+        *(((slug, row) for row in rows) for slug, rows in results.items()),
+        key=lambda item: key(item[1]),
+    )
+
+
+async def run_consolidated_report(
+    slugs: Sequence[str],
+    report: Callable[[Session, Any], tuple],
+    filters: Any,
+    *,
+    sort_key: Callable[[Mapping[str, Any]], Any],
+    concurrency: int | None = None,
+    subject: str | None = None,
+) -> ConsolidatedReport:
+    """One page of a paged ``(total, rows, [summary])`` report over ``slugs``.
+
+    Rows gain an ``organization_slug`` column naming the tenant they came from.
+    """
+    overrides: dict[str, Any] = {"page": 1, "page_size": filters.page * filters.page_size}
+    if any(field.name == "sort_collation" for field in fields(filters)):
+        overrides["sort_collation"] = CODE_POINT_COLLATION
+    branch_filters = replace(filters, **overrides)
+    results = await run_per_tenant(
+        slugs, report, branch_filters, concurrency=concurrency, subject=subject
+    )
+
+    start = (filters.page - 1) * filters.page_size
+    merged = merge_sorted({slug: result[1] for slug, result in results.items()}, sort_key)
+    return ConsolidatedReport(
+        total=sum(result[0] for result in results.values()),
+        data=[
+            {"organization_slug": slug, **row}
+            for slug, row in islice(merged, start, start + filters.page_size)
+        ],
+        summaries={slug: result[2] if len(result) > 2 else None for slug, result in results.items()},
+    )
@@ -1,15 +1,16 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
 
-from sqlalchemy import and_, case, func, literal, not_, select
+from sqlalchemy import and_, case, func, literal, select
 from sqlalchemy.orm import Session
 
 from app.models.batch import Batch
-from app.models.inventory import InventoryLedger
 from app.models.product import Product
 from app.models.warehouse import Warehouse
-from app.reports.predicates import opening_entry_predicate
+from app.reports.export import stream_report_rows
+from app.reports.ledger_sources import stock_position_rows
 
 
 @dataclass(slots=True)
@@ -24,19 +25,16 @@ class CurrentStockFilters:
     expiry_status: str | None = None
     stock_status: str | None = None
     stock_source: str | None = None
+    # Orders the text columns under this collation instead of the database's.
+    sort_collation: str | None = None
     page: int = 1
     page_size: int = 50
 
 
-def get_current_stock_report(
-    db: Session,
-    filters: CurrentStockFilters,
-) -> tuple[int, list[dict[str, object]], dict[str, object]]:
-    available_qty_expr = func.coalesce(func.sum(InventoryLedger.qty), Decimal("0"))
-    stock_value_expr = func.coalesce(
-        func.sum(InventoryLedger.qty * func.coalesce(InventoryLedger.unit_cost, Decimal("0"))),
-        Decimal("0"),
-    )
+def _current_stock_stmt(filters: CurrentStockFilters, today: date):
+    positions = stock_position_rows(stock_source=filters.stock_source)
+    available_qty_expr = func.coalesce(func.sum(positions.c.qty), Decimal("0"))
+    stock_value_expr = func.coalesce(func.sum(positions.c.stock_value), Decimal("0"))
 
     stmt = (
         select(
@@ -54,12 +52,12 @@ def get_current_stock_report(
             available_qty_expr.label("available_qty"),
             literal(Decimal("0")).label("reserved_qty"),
             stock_value_expr.label("stock_value"),
-            func.max(InventoryLedger.created_at).label("last_movement_date"),
+            func.max(positions.c.last_movement_at).label("last_movement_date"),
         )
-        .select_from(InventoryLedger)
-        .join(Product, Product.id == InventoryLedger.product_id)
-        .join(Warehouse, Warehouse.id == InventoryLedger.warehouse_id)
-        .join(Batch, Batch.id == InventoryLedger.batch_id)
+        .select_from(positions)
+        .join(Product, Product.id == positions.c.product_id)
+        .join(Warehouse, Warehouse.id == positions.c.warehouse_id)
+        .join(Batch, Batch.id == positions.c.batch_id)
         .group_by(
             Product.id,
             Product.sku,
@@ -80,22 +78,15 @@ def get_current_stock_report(
     if filters.category_values:
         stmt = stmt.where(Product.hsn.in_(filters.category_values))
     if filters.product_ids:
-        stmt = stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        stmt = stmt.where(positions.c.product_id.in_(filters.product_ids))
     if filters.warehouse_ids:
-        stmt = stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        stmt = stmt.where(positions.c.warehouse_id.in_(filters.warehouse_ids))
     if filters.batch_nos:
         stmt = stmt.where(Batch.batch_no.in_(filters.batch_nos))
     if filters.expiry_from is not None:
         stmt = stmt.where(Batch.expiry_date >= filters.expiry_from)
     if filters.expiry_to is not None:
         stmt = stmt.where(Batch.expiry_date <= filters.expiry_to)
-    opening_predicate = opening_entry_predicate()
-    if filters.stock_source == "opening":
-        stmt = stmt.where(opening_predicate)
-    elif filters.stock_source == "non_opening":
-        stmt = stmt.where(not_(opening_predicate))
-
-    today = date.today()
     threshold = today + timedelta(days=30)
     if filters.expiry_status == "expired":
         stmt = stmt.where(Batch.expiry_date < today)
@@ -105,12 +96,54 @@ def get_current_stock_report(
         stmt = stmt.where(Batch.expiry_date > threshold)
 
     if filters.stock_status == "available":
-        stmt = stmt.having(func.sum(InventoryLedger.qty) > 0)
+        stmt = stmt.having(func.sum(positions.c.qty) > 0)
     elif filters.stock_status == "zero":
-        stmt = stmt.having(func.sum(InventoryLedger.qty) == 0)
+        stmt = stmt.having(func.sum(positions.c.qty) == 0)
     elif filters.stock_status == "negative":
-        stmt = stmt.having(func.sum(InventoryLedger.qty) < 0)
+        stmt = stmt.having(func.sum(positions.c.qty) < 0)
+
+    def _text(column):
+        return column if filters.sort_collation is None else column.collate(filters.sort_collation)
+
+    return stmt.order_by(
+        _text(Product.name).asc(),
+        _text(Warehouse.name).asc(),
+        Batch.expiry_date.asc(),
+        _text(Batch.batch_no).asc(),
+    )
+
+
+def _serialize_row(row) -> dict[str, object]:
+    return {
+        "sku": row["sku"],
+        "product_id": row["product_id"],
+        "product_name": row["product_name"],
+        "brand": row["brand"],
+        "category": row["category"],
+        "warehouse_id": row["warehouse_id"],
+        "warehouse": row["warehouse"],
+        "batch_id": row["batch_id"],
+        "batch": row["batch"],
+        "expiry_date": row["expiry_date"],
+        "available_qty": row["available_qty"] or Decimal("0"),
+        "reserved_qty": row["reserved_qty"] or Decimal("0"),
+        "stock_value": row["stock_value"] or Decimal("0"),
+        "last_movement_date": row["last_movement_date"],
+        "quantity_precision": row["quantity_precision"],
+    }
 
+
+def iter_current_stock_rows(db: Session, filters: CurrentStockFilters) -> Iterator[dict[str, object]]:
+    return stream_report_rows(db, _current_stock_stmt(filters, date.today()), _serialize_row)
+
+
+def get_current_stock_report(
+    db: Session,
+    filters: CurrentStockFilters,
+) -> tuple[int, list[dict[str, object]], dict[str, object]]:
+    today = date.today()
+    threshold = today + timedelta(days=30)
+    stmt = _current_stock_stmt(filters, today)
     base_subquery = stmt.order_by(None).subquery()
     total = int(db.execute(select(func.count()).select_from(base_subquery)).scalar_one())
 
@@ -143,37 +176,9 @@ def get_current_stock_report(
     ).mappings().one()
 
     rows = db.execute(
-        stmt.order_by(
-            Product.name.asc(),
-            Warehouse.name.asc(),
-            Batch.expiry_date.asc(),
-            Batch.batch_no.asc(),
-        )
-        .offset((filters.page - 1) * filters.page_size)
-        .limit(filters.page_size)
+        stmt.offset((filters.page - 1) * filters.page_size).limit(filters.page_size)
     ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        data.append(
-            {
-                "sku": row["sku"],
-                "product_id": row["product_id"],
-                "product_name": row["product_name"],
-                "brand": row["brand"],
-                "category": row["category"],
-                "warehouse_id": row["warehouse_id"],
-                "warehouse": row["warehouse"],
-                "batch_id": row["batch_id"],
-                "batch": row["batch"],
-                "expiry_date": row["expiry_date"],
-                "available_qty": row["available_qty"] or Decimal("0"),
-                "reserved_qty": row["reserved_qty"] or Decimal("0"),
-                "stock_value": row["stock_value"] or Decimal("0"),
-                "last_movement_date": row["last_movement_date"],
-                "quantity_precision": row["quantity_precision"],
-            }
-        )
+    data = [_serialize_row(row) for row in rows]
 
     summary = {
         "total_skus": int(summary_row["total_skus"] or 0),
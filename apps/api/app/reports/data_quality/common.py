@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from app.models.inventory import StockSummary
-from app.models.party import Party
-from app.models.product import Product
-from app.models.purchase import PurchaseOrder
-from app.models.purchase_bill import PurchaseBill
-from app.models.warehouse import Warehouse
+from app.models.data_quality import DataQualityFinding
+from app.services.data_quality import (
+    COMPLIANCE_GAPS,
+    DUPLICATE_MASTERS,
+    INVALID_REFERENCES,
+    MISSING_FIELDS,
+)
+
+_MASTER_ORDER = ("PARTY", "PRODUCT", "WAREHOUSE")
+_DOCUMENT_ORDER = ("STOCK_SUMMARY", "PURCHASE_ORDER", "PURCHASE_BILL")
 
 
 @dataclass(slots=True)
@@ -24,223 +29,136 @@ class DataQualityReportFilters:
     page_size: int = 50
 
 
-def _paginate_rows(
-    rows: list[dict[str, Any]],
+def _findings_report(
+    db: Session,
     filters: DataQualityReportFilters,
-) -> tuple[int, list[dict[str, Any]]]:
-    total = len(rows)
-    start = max(filters.page - 1, 0) * filters.page_size
-    return total, rows[start : start + filters.page_size]
+    *,
+    report: str,
+    label: str,
+    entity_order: tuple[str, ...],
+    sort_key,
+    build_row: Callable[[DataQualityFinding], dict[str, Any]],
+    entity_types: Collection[str] = (),
+    rules: Collection[str] = (),
+) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Page one report's stored findings and count them by rule."""
+    conditions = [DataQualityFinding.report == report]
+    if entity_types:
+        conditions.append(DataQualityFinding.entity_type.in_(entity_types))
+    if rules:
+        conditions.append(DataQualityFinding.rules.overlap(list(rules)))
+
+    total = db.scalar(select(func.count()).select_from(DataQualityFinding).where(*conditions)) or 0
+    findings = db.scalars(
+        select(DataQualityFinding)
+        .where(*conditions)
+        .order_by(
+            case(
+                {entity_type: index for index, entity_type in enumerate(entity_order)},
+                value=DataQualityFinding.entity_type,
+            ),
+            sort_key,
+            DataQualityFinding.id,
+        )
+        .offset(max(filters.page - 1, 0) * filters.page_size)
+        .limit(filters.page_size)
+    ).all()
+
+    rule = func.unnest(DataQualityFinding.rules).label("rule")
+    by_rule = db.execute(
+        select(rule, func.count().label("count"))
+        .where(*conditions)
+        .group_by(rule)
+        .order_by(func.count().desc(), rule)
+    ).all()
+    summary = [{"key": "rows", "label": label, "value": total}]
+    summary.extend(
+        {"key": f"rule:{row.rule}", "label": row.rule.replace("_", " ").title(), "value": row.count}
+        for row in by_rule
+    )
+    return total, [build_row(finding) for finding in findings], summary
 
 
 def get_missing_fields_report(
     db: Session,
     filters: DataQualityReportFilters,
 ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
-    rows: list[dict[str, Any]] = []
-    if not filters.entity_types or "PARTY" in filters.entity_types:
-        for party in db.scalars(select(Party).order_by(Party.name.asc())):
-            missing = []
-            if not party.gstin:
-                missing.append("gstin")
-            if not party.state:
-                missing.append("state")
-            if not party.contact_person:
-                missing.append("contact_person")
-            if missing:
-                rows.append(
-                    {
-                        "entity_type": "PARTY",
-                        "entity_name": party.name,
-                        "entity_id": party.id,
-                        "missing_fields": ", ".join(missing),
-                    }
-                )
-    if not filters.entity_types or "PRODUCT" in filters.entity_types:
-        for product in db.scalars(select(Product).order_by(Product.name.asc())):
-            missing = []
-            if not product.brand:
-                missing.append("brand")
-            if not product.hsn:
-                missing.append("category")
-            if product.gst_rate is None:
-                missing.append("gst_rate")
-            if missing:
-                rows.append(
-                    {
-                        "entity_type": "PRODUCT",
-                        "entity_name": product.name,
-                        "entity_id": product.id,
-                        "missing_fields": ", ".join(missing),
-                    }
-                )
-    if not filters.entity_types or "WAREHOUSE" in filters.entity_types:
-        for warehouse in db.scalars(select(Warehouse).order_by(Warehouse.name.asc())):
-            if not warehouse.address:
-                rows.append(
-                    {
-                        "entity_type": "WAREHOUSE",
-                        "entity_name": warehouse.name,
-                        "entity_id": warehouse.id,
-                        "missing_fields": "address",
-                    }
-                )
-
-    if filters.missing_field_type:
-        rows = [row for row in rows if filters.missing_field_type in str(row["missing_fields"]).split(", ")]
-    total, page_rows = _paginate_rows(rows, filters)
-    summary = [{"key": "rows", "label": "Records With Missing Fields", "value": len(rows)}]
-    return total, page_rows, summary
+    return _findings_report(
+        db,
+        filters,
+        report=MISSING_FIELDS,
+        label="Records With Missing Fields",
+        entity_order=_MASTER_ORDER,
+        sort_key=DataQualityFinding.entity_name,
+        entity_types=filters.entity_types,
+        rules=[filters.missing_field_type] if filters.missing_field_type else (),
+        build_row=lambda finding: {
+            "entity_type": finding.entity_type,
+            "entity_name": finding.entity_name,
+            "entity_id": finding.entity_id,
+            "missing_fields": ", ".join(finding.rules),
+        },
+    )
 
 
 def get_duplicate_masters_report(
     db: Session,
     filters: DataQualityReportFilters,
 ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
-    rows: list[dict[str, Any]] = []
-    duplicate_modes = set(filters.duplicate_type.split(",")) if filters.duplicate_type else set()
-    if not filters.entity_types or "PARTY" in filters.entity_types:
-        if not duplicate_modes or "party_gstin" in duplicate_modes:
-            for row in db.execute(
-                select(Party.gstin, func.count(Party.id).label("count"))
-                .where(Party.gstin.isnot(None))
-                .group_by(Party.gstin)
-                .having(func.count(Party.id) > 1)
-            ).mappings():
-                rows.append(
-                    {
-                        "entity_type": "PARTY",
-                        "duplicate_type": "party_gstin",
-                        "duplicate_value": row["gstin"],
-                        "record_count": row["count"],
-                    }
-                )
-    if not filters.entity_types or "PRODUCT" in filters.entity_types:
-        if not duplicate_modes or "product_name" in duplicate_modes:
-            for row in db.execute(
-                select(Product.name, func.count(Product.id).label("count"))
-                .group_by(Product.name)
-                .having(func.count(Product.id) > 1)
-            ).mappings():
-                rows.append(
-                    {
-                        "entity_type": "PRODUCT",
-                        "duplicate_type": "product_name",
-                        "duplicate_value": row["name"],
-                        "record_count": row["count"],
-                    }
-                )
-    if not filters.entity_types or "WAREHOUSE" in filters.entity_types:
-        if not duplicate_modes or "warehouse_name" in duplicate_modes:
-            for row in db.execute(
-                select(Warehouse.name, func.count(Warehouse.id).label("count"))
-                .group_by(Warehouse.name)
-                .having(func.count(Warehouse.id) > 1)
-            ).mappings():
-                rows.append(
-                    {
-                        "entity_type": "WAREHOUSE",
-                        "duplicate_type": "warehouse_name",
-                        "duplicate_value": row["name"],
-                        "record_count": row["count"],
-                    }
-                )
-    total, page_rows = _paginate_rows(rows, filters)
-    summary = [{"key": "rows", "label": "Duplicate Groups", "value": len(rows)}]
-    return total, page_rows, summary
+    return _findings_report(
+        db,
+        filters,
+        report=DUPLICATE_MASTERS,
+        label="Duplicate Groups",
+        entity_order=_MASTER_ORDER,
+        sort_key=DataQualityFinding.subject_key,
+        entity_types=filters.entity_types,
+        rules=filters.duplicate_type.split(",") if filters.duplicate_type else (),
+        build_row=lambda finding: {
+            "entity_type": finding.entity_type,
+            "duplicate_type": finding.rules[0],
+            "duplicate_value": finding.subject_key,
+            "record_count": finding.record_count,
+        },
+    )
 
 
 def get_compliance_gaps_report(
     db: Session,
     filters: DataQualityReportFilters,
 ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
-    rows: list[dict[str, Any]] = []
-    gap = filters.compliance_type
-    for party in db.scalars(select(Party).order_by(Party.name.asc())):
-        gaps = []
-        if not party.gstin:
-            gaps.append("missing_gstin")
-        if not party.pan_number:
-            gaps.append("missing_pan")
-        if not party.drug_license_number:
-            gaps.append("missing_drug_license")
-        if not party.fssai_number:
-            gaps.append("missing_fssai")
-        if gaps:
-            rows.append(
-                {
-                    "entity_type": "PARTY",
-                    "entity_name": party.name,
-                    "entity_id": party.id,
-                    "compliance_gaps": ", ".join(gaps),
-                }
-            )
-    if gap:
-        rows = [row for row in rows if gap in str(row["compliance_gaps"]).split(", ")]
-    total, page_rows = _paginate_rows(rows, filters)
-    summary = [{"key": "rows", "label": "Compliance Gaps", "value": len(rows)}]
-    return total, page_rows, summary
+    return _findings_report(
+        db,
+        filters,
+        report=COMPLIANCE_GAPS,
+        label="Compliance Gaps",
+        entity_order=("PARTY",),
+        sort_key=DataQualityFinding.entity_name,
+        rules=[filters.compliance_type] if filters.compliance_type else (),
+        build_row=lambda finding: {
+            "entity_type": finding.entity_type,
+            "entity_name": finding.entity_name,
+            "entity_id": finding.entity_id,
+            "compliance_gaps": ", ".join(finding.rules),
+        },
+    )
 
 
 def get_invalid_references_report(
     db: Session,
     filters: DataQualityReportFilters,
 ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
-    rows: list[dict[str, Any]] = []
-    for row in db.execute(
-        select(
-            StockSummary.id,
-            Product.name.label("product_name"),
-            Warehouse.name.label("warehouse_name"),
-            Product.is_active.label("product_is_active"),
-            Warehouse.is_active.label("warehouse_is_active"),
-        )
-        .join(Product, Product.id == StockSummary.product_id)
-        .join(Warehouse, Warehouse.id == StockSummary.warehouse_id)
-        .where((Product.is_active.is_(False)) | (Warehouse.is_active.is_(False)))
-    ).mappings():
-        rows.append(
-            {
-                "entity_type": "STOCK_SUMMARY",
-                "entity_id": row["id"],
-                "reference_issue": "inactive_master_reference",
-                "details": f"{row['product_name']} / {row['warehouse_name']}",
-            }
-        )
-
-    for row in db.execute(
-        select(
-            PurchaseOrder.id,
-            Party.name.label("supplier_name"),
-            Warehouse.name.label("warehouse_name"),
-        )
-        .join(Party, Party.id == PurchaseOrder.supplier_id)
-        .join(Warehouse, Warehouse.id == PurchaseOrder.warehouse_id)
-        .where((Party.is_active.is_(False)) | (Warehouse.is_active.is_(False)))
-    ).mappings():
-        rows.append(
-            {
-                "entity_type": "PURCHASE_ORDER",
-                "entity_id": row["id"],
-                "reference_issue": "inactive_master_reference",
-                "details": f"{row['supplier_name']} / {row['warehouse_name']}",
-            }
-        )
-
-    for row in db.execute(
-        select(PurchaseBill.id, Warehouse.name.label("warehouse_name"))
-        .join(Warehouse, Warehouse.id == PurchaseBill.warehouse_id)
-        .where(Warehouse.is_active.is_(False))
-    ).mappings():
-        rows.append(
-            {
-                "entity_type": "PURCHASE_BILL",
-                "entity_id": row["id"],
-                "reference_issue": "inactive_master_reference",
-                "details": row["warehouse_name"],
-            }
-        )
-
-    total, page_rows = _paginate_rows(rows, filters)
-    summary = [{"key": "rows", "label": "Invalid References", "value": len(rows)}]
-    return total, page_rows, summary
+    return _findings_report(
+        db,
+        filters,
+        report=INVALID_REFERENCES,
+        label="Invalid References",
+        entity_order=_DOCUMENT_ORDER,
+        sort_key=DataQualityFinding.entity_id,
+        build_row=lambda finding: {
+            "entity_type": finding.entity_type,
+            "entity_id": finding.entity_id,
+            "reference_issue": finding.rules[0],
+            "details": finding.details,
+        },
+    )
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -5,9 +6,11 @@ from decimal import Decimal
 from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
-from app.models.inventory import InventoryLedger, StockSummary
+from app.models.inventory import StockSummary
 from app.models.product import Product
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
+from app.reports.ledger_sources import stock_position_rows
 
 
 @dataclass(slots=True)
@@ -23,10 +26,7 @@ class DeadStockReportFilters:
     page_size: int = 50
 
 
-def get_dead_stock_report(
-    db: Session,
-    filters: DeadStockReportFilters,
-) -> tuple[int, list[dict[str, object]]]:
+def _dead_stock_stmt(filters: DeadStockReportFilters):
     stock_totals = (
         select(
             StockSummary.warehouse_id.label("warehouse_id"),
@@ -38,13 +38,14 @@ def get_dead_stock_report(
         .subquery()
     )
 
+    positions = stock_position_rows()
     last_movement = (
         select(
-            InventoryLedger.warehouse_id.label("warehouse_id"),
-            InventoryLedger.product_id.label("product_id"),
-            func.max(InventoryLedger.created_at).label("last_movement_date"),
+            positions.c.warehouse_id.label("warehouse_id"),
+            positions.c.product_id.label("product_id"),
+            func.max(positions.c.last_movement_at).label("last_movement_date"),
         )
-        .group_by(InventoryLedger.warehouse_id, InventoryLedger.product_id)
+        .group_by(positions.c.warehouse_id, positions.c.product_id)
         .subquery()
     )
 
@@ -87,35 +88,46 @@ def get_dead_stock_report(
     if filters.category_values:
         stmt = stmt.where(Product.hsn.in_(filters.category_values))
 
+    return stmt.order_by(
+        last_movement.c.last_movement_date.asc().nullsfirst(),
+        Product.name.asc(),
+        Warehouse.name.asc(),
+    )
+
+
+def _serialize_row(row, today: date) -> dict[str, object]:
+    last_movement_date = row["last_movement_date"]
+    days_since_movement = (
+        (today - last_movement_date.date()).days if last_movement_date is not None else None
+    )
+    return {
+        "product": row["product"],
+        "quantity_precision": row["quantity_precision"],
+        "warehouse": row["warehouse"],
+        "current_qty": row["current_qty"] or Decimal("0"),
+        "last_movement_date": last_movement_date,
+        "days_since_movement": days_since_movement,
+    }
+
+
+def iter_dead_stock_rows(db: Session, filters: DeadStockReportFilters) -> Iterator[dict[str, object]]:
+    today = date.today()
+    return stream_report_rows(db, _dead_stock_stmt(filters), lambda row: _serialize_row(row, today))
+
+
+def get_dead_stock_report(
+    db: Session,
+    filters: DeadStockReportFilters,
+) -> tuple[int, list[dict[str, object]]]:
+    stmt = _dead_stock_stmt(filters)
     count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
     total = int(db.execute(count_stmt).scalar_one())
 
     rows = db.execute(
-        stmt.order_by(
-            last_movement.c.last_movement_date.asc().nullsfirst(),
-            Product.name.asc(),
-            Warehouse.name.asc(),
-        )
-        .offset((filters.page - 1) * filters.page_size)
-        .limit(filters.page_size)
+        stmt.offset((filters.page - 1) * filters.page_size).limit(filters.page_size)
     ).mappings()
 
     today = date.today()
-    data: list[dict[str, object]] = []
-    for row in rows:
-        last_movement_date = row["last_movement_date"]
-        days_since_movement = (
-            (today - last_movement_date.date()).days if last_movement_date is not None else None
-        )
-        data.append(
-            {
-                "product": row["product"],
-                "quantity_precision": row["quantity_precision"],
-                "warehouse": row["warehouse"],
-                "current_qty": row["current_qty"] or Decimal("0"),
-                "last_movement_date": last_movement_date,
-                "days_since_movement": days_since_movement,
-            }
-        )
+    data = [_serialize_row(row, today) for row in rows]
 
     return total, data
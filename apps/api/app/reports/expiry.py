@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
@@ -9,6 +10,7 @@ from app.models.batch import Batch
 from app.models.inventory import StockSummary
 from app.models.product import Product
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
 
 
 @dataclass(slots=True)
@@ -27,11 +29,7 @@ class ExpiryReportFilters:
     page_size: int = 50
 
 
-def get_expiry_report(
-    db: Session,
-    filters: ExpiryReportFilters,
-) -> tuple[int, list[dict[str, object]]]:
-    today = date.today()
+def _expiry_stmt(filters: ExpiryReportFilters, today: date):
     threshold_date = today + timedelta(days=filters.expiry_within_days)
 
     stmt = (
@@ -40,7 +38,7 @@ def get_expiry_report(
             Product.quantity_precision.label("quantity_precision"),
             Batch.batch_no.label("batch"),
             Warehouse.name.label("warehouse"),
-            Batch.expiry_date.label("expiry_date"),
+            StockSummary.expiry_date.label("expiry_date"),
             StockSummary.qty_on_hand.label("current_qty"),
         )
         .select_from(StockSummary)
@@ -52,15 +50,17 @@ def get_expiry_report(
 
     if filters.expiry_status:
         if filters.expiry_status == "expired":
-            stmt = stmt.where(Batch.expiry_date < today)
+            stmt = stmt.where(StockSummary.expiry_date < today)
         elif filters.expiry_status == "expiring_30":
-            stmt = stmt.where(Batch.expiry_date >= today).where(Batch.expiry_date <= threshold_date)
+            stmt = stmt.where(StockSummary.expiry_date >= today).where(
+                StockSummary.expiry_date <= threshold_date
+            )
         elif filters.expiry_status == "safe":
-            stmt = stmt.where(Batch.expiry_date > threshold_date)
+            stmt = stmt.where(StockSummary.expiry_date > threshold_date)
     else:
-        stmt = stmt.where(Batch.expiry_date <= threshold_date)
+        stmt = stmt.where(StockSummary.expiry_date <= threshold_date)
         if not filters.include_expired:
-            stmt = stmt.where(Batch.expiry_date >= today)
+            stmt = stmt.where(StockSummary.expiry_date >= today)
     if filters.warehouse_id is not None:
         stmt = stmt.where(StockSummary.warehouse_id == filters.warehouse_id)
     if filters.warehouse_ids:
@@ -75,28 +75,41 @@ def get_expiry_report(
         stmt = stmt.where(Product.hsn.in_(filters.category_values))
     if filters.batch_nos:
         stmt = stmt.where(Batch.batch_no.in_(filters.batch_nos))
+    return stmt.order_by(
+        StockSummary.expiry_date.asc(), Product.name.asc(), Warehouse.name.asc()
+    )
+
+
+def _serialize_row(row, today: date) -> dict[str, object]:
+    expiry_date = row["expiry_date"]
+    return {
+        "product": row["product"],
+        "quantity_precision": row["quantity_precision"],
+        "batch": row["batch"],
+        "warehouse": row["warehouse"],
+        "expiry_date": expiry_date,
+        "days_to_expiry": (expiry_date - today).days,
+        "current_qty": row["current_qty"] or Decimal("0"),
+    }
+
+
+def iter_expiry_rows(db: Session, filters: ExpiryReportFilters) -> Iterator[dict[str, object]]:
+    today = date.today()
+    return stream_report_rows(db, _expiry_stmt(filters, today), lambda row: _serialize_row(row, today))
+
+
+def get_expiry_report(
+    db: Session,
+    filters: ExpiryReportFilters,
+) -> tuple[int, list[dict[str, object]]]:
+    today = date.today()
+    stmt = _expiry_stmt(filters, today)
     count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
     total = int(db.execute(count_stmt).scalar_one())
 
     rows = db.execute(
-        stmt.order_by(Batch.expiry_date.asc(), Product.name.asc(), Warehouse.name.asc())
-        .offset((filters.page - 1) * filters.page_size)
-        .limit(filters.page_size)
+        stmt.offset((filters.page - 1) * filters.page_size).limit(filters.page_size)
     ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        expiry_date = row["expiry_date"]
-        data.append(
-            {
-                "product": row["product"],
-                "quantity_precision": row["quantity_precision"],
-                "batch": row["batch"],
-                "warehouse": row["warehouse"],
-                "expiry_date": expiry_date,
-                "days_to_expiry": (expiry_date - today).days,
-                "current_qty": row["current_qty"] or Decimal("0"),
-            }
-        )
+    data = [_serialize_row(row, today) for row in rows]
 
     return total, data
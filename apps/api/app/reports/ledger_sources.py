@@ -0,0 +1,79 @@
+"""Ledger selectables that see through fiscal-year closes.
+
+Closing a fiscal year (:mod:`app.services.period_close`) folds every ledger
+row before the cutoff into carry-forward rows in ``inventory_checkpoints`` and
+moves those rows to ``inventory_ledger_archive``. Balance reports read
+:func:`stock_position_rows`, the checkpoints plus the live ledger, so their
+cost follows the open period rather than the tenant's age. Reports over a
+date range read :func:`ledger_history`, which only brings in the archive when
+the range starts before the last cutoff.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import func, not_, select, union_all
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Subquery
+
+from app.models.inventory import InventoryLedger
+from app.models.period_close import (
+    InventoryCheckpoint,
+    InventoryLedgerArchive,
+    InventoryPeriodClose,
+)
+from app.reports.predicates import opening_entry_predicate
+
+
+def stock_position_rows(*, stock_source: str | None = None) -> Subquery:
+    """Per-bucket rows with ``qty``, ``stock_value`` and ``last_movement_at``.
+
+    Summing them by (warehouse, product, batch) gives the same totals as
+    summing the full ledger history. ``stock_source`` is ``"opening"``,
+    ``"non_opening"`` or ``None`` for both.
+    """
+    checkpoint_rows = select(
+        InventoryCheckpoint.warehouse_id.label("warehouse_id"),
+        InventoryCheckpoint.product_id.label("product_id"),
+        InventoryCheckpoint.batch_id.label("batch_id"),
+        InventoryCheckpoint.qty.label("qty"),
+        InventoryCheckpoint.stock_value.label("stock_value"),
+        InventoryCheckpoint.last_movement_at.label("last_movement_at"),
+    )
+    ledger_rows = select(
+        InventoryLedger.warehouse_id,
+        InventoryLedger.product_id,
+        InventoryLedger.batch_id,
+        InventoryLedger.qty,
+        InventoryLedger.qty * func.coalesce(InventoryLedger.unit_cost, Decimal("0")),
+        InventoryLedger.created_at,
+    )
+    if stock_source == "opening":
+        checkpoint_rows = checkpoint_rows.where(InventoryCheckpoint.is_opening.is_(True))
+        ledger_rows = ledger_rows.where(opening_entry_predicate())
+    elif stock_source == "non_opening":
+        checkpoint_rows = checkpoint_rows.where(InventoryCheckpoint.is_opening.is_(False))
+        ledger_rows = ledger_rows.where(not_(opening_entry_predicate()))
+    return union_all(checkpoint_rows, ledger_rows).subquery("stock_positions")
+
+
+def latest_ledger_cutoff(db: Session) -> datetime | None:
+    return db.execute(select(func.max(InventoryPeriodClose.cutoff_at))).scalar_one()
+
+
+def ledger_history(db: Session, since: datetime | None):
+    """``InventoryLedger``, or an alias over ledger and archive when ``since`` needs it.
+
+    The result is used exactly like the ``InventoryLedger`` class in queries.
+    """
+    cutoff = latest_ledger_cutoff(db)
+    if cutoff is None or (since is not None and since >= cutoff):
+        return InventoryLedger
+
+    columns = InventoryLedger.__table__.columns
+    archive_columns = InventoryLedgerArchive.__table__.columns
+    history = union_all(
+        select(*columns),
+        select(*(archive_columns[column.name] for column in columns)),
+    ).subquery("inventory_ledger_history")
+    return aliased(InventoryLedger, history, adapt_on_names=True)
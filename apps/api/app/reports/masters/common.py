@@ -9,12 +9,12 @@ from typing import Any
 from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
-from app.models.inventory import InventoryLedger
 from app.models.party import Party
 from app.models.product import Product
 from app.models.purchase import GRN, PurchaseOrder
 from app.models.sales import SalesOrder
 from app.models.warehouse import Rack, Warehouse
+from app.reports.ledger_sources import stock_position_rows
 
 
 @dataclass(slots=True)
@@ -60,6 +60,7 @@ def _clone_filters(filters: MasterReportFilters, **updates: Any) -> MasterReport
 
 
 def _load_stock_positions(db: Session, filters: MasterReportFilters) -> list[dict[str, Any]]:
+    positions = stock_position_rows()
     stmt = (
         select(
             Product.id.label("product_id"),
@@ -71,17 +72,14 @@ def _load_stock_positions(db: Session, filters: MasterReportFilters) -> list[dic
             Warehouse.id.label("warehouse_id"),
             Warehouse.name.label("warehouse_name"),
             Warehouse.is_active.label("warehouse_is_active"),
-            InventoryLedger.batch_id.label("batch_id"),
-            func.coalesce(func.sum(InventoryLedger.qty), Decimal("0")).label("qty"),
-            func.coalesce(
-                func.sum(InventoryLedger.qty * func.coalesce(InventoryLedger.unit_cost, Decimal("0"))),
-                Decimal("0"),
-            ).label("stock_value"),
-            func.max(InventoryLedger.created_at).label("last_movement_date"),
+            positions.c.batch_id.label("batch_id"),
+            func.coalesce(func.sum(positions.c.qty), Decimal("0")).label("qty"),
+            func.coalesce(func.sum(positions.c.stock_value), Decimal("0")).label("stock_value"),
+            func.max(positions.c.last_movement_at).label("last_movement_date"),
         )
-        .select_from(InventoryLedger)
-        .join(Product, Product.id == InventoryLedger.product_id)
-        .join(Warehouse, Warehouse.id == InventoryLedger.warehouse_id)
+        .select_from(positions)
+        .join(Product, Product.id == positions.c.product_id)
+        .join(Warehouse, Warehouse.id == positions.c.warehouse_id)
         .group_by(
             Product.id,
             Product.sku,
@@ -92,15 +90,15 @@ def _load_stock_positions(db: Session, filters: MasterReportFilters) -> list[dic
             Warehouse.id,
             Warehouse.name,
             Warehouse.is_active,
-            InventoryLedger.batch_id,
+            positions.c.batch_id,
         )
-        .having(func.sum(InventoryLedger.qty) != 0)
+        .having(func.sum(positions.c.qty) != 0)
     )
 
     if filters.warehouse_ids:
-        stmt = stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        stmt = stmt.where(positions.c.warehouse_id.in_(filters.warehouse_ids))
     if filters.product_ids:
-        stmt = stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        stmt = stmt.where(positions.c.product_id.in_(filters.product_ids))
     if filters.brand_values:
         stmt = stmt.where(Product.brand.in_(filters.brand_values))
     if filters.category_values:
@@ -965,22 +963,36 @@ def get_inactive_parties_report(
     return total, page_rows, summary
 
 
-def get_brand_summary_report(
+def _add_stock_position_totals(
     db: Session,
     filters: MasterReportFilters,
-) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
-    total, rows, summary = get_brand_item_report(db, filters)
+    rows: list[dict[str, Any]],
+    *,
+    key: str,
+    filter_field: str,
+) -> None:
+    # One stock query for the whole page, grouped by ``key``, rather than one per row.
+    values = tuple(sorted({str(row[key]) for row in rows}))
+    positions_by_value: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    if values:
+        for position in _load_stock_positions(db, _clone_filters(filters, **{filter_field: values})):
+            positions_by_value[str(position[key])].append(position)
     for row in rows:
-        brand_positions = _load_stock_positions(
-            db,
-            _clone_filters(filters, brand_values=(str(row["brand"]),)),
-        )
-        row["warehouse_count"] = len({int(position["warehouse_id"]) for position in brand_positions})
+        positions = positions_by_value[str(row[key])]
+        row["warehouse_count"] = len({int(position["warehouse_id"]) for position in positions})
         row["last_movement_date"] = max(
-            (position["last_movement_date"] for position in brand_positions if position["last_movement_date"] is not None),
+            (position["last_movement_date"] for position in positions if position["last_movement_date"] is not None),
             default=None,
         )
         row["total_qty"] = row.pop("total_stock_qty")
+
+
+def get_brand_summary_report(
+    db: Session,
+    filters: MasterReportFilters,
+) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
+    total, rows, summary = get_brand_item_report(db, filters)
+    _add_stock_position_totals(db, filters, rows, key="brand", filter_field="brand_values")
     return total, rows, summary
 
 
@@ -989,17 +1001,7 @@ def get_category_summary_report(
     filters: MasterReportFilters,
 ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
     total, rows, summary = get_category_item_report(db, filters)
-    for row in rows:
-        category_positions = _load_stock_positions(
-            db,
-            _clone_filters(filters, category_values=(str(row["category"]),)),
-        )
-        row["warehouse_count"] = len({int(position["warehouse_id"]) for position in category_positions})
-        row["last_movement_date"] = max(
-            (position["last_movement_date"] for position in category_positions if position["last_movement_date"] is not None),
-            default=None,
-        )
-        row["total_qty"] = row.pop("total_stock_qty")
+    _add_stock_position_totals(db, filters, rows, key="category", filter_field="category_values")
     return total, rows, summary
 
 
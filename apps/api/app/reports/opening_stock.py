@@ -1,14 +1,18 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.partitions import utc_day_start
 from app.models.batch import Batch
 from app.models.inventory import InventoryLedger, StockSummary
 from app.models.product import Product
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
+from app.reports.ledger_sources import ledger_history
 from app.reports.predicates import opening_entry_predicate
 
 
@@ -25,13 +29,10 @@ class OpeningStockFilters:
     page_size: int = 50
 
 
-def get_opening_stock_report(
-    db: Session,
-    filters: OpeningStockFilters,
-) -> tuple[int, list[dict[str, object]], dict[str, object]]:
-    opening_qty_expr = func.coalesce(func.sum(InventoryLedger.qty), Decimal("0"))
+def _opening_stock_stmt(filters: OpeningStockFilters, ledger=InventoryLedger):
+    opening_qty_expr = func.coalesce(func.sum(ledger.qty), Decimal("0"))
     opening_value_expr = func.coalesce(
-        func.sum(InventoryLedger.qty * func.coalesce(InventoryLedger.unit_cost, Decimal("0"))),
+        func.sum(ledger.qty * func.coalesce(ledger.unit_cost, Decimal("0"))),
         Decimal("0"),
     )
 
@@ -48,20 +49,20 @@ def get_opening_stock_report(
             Batch.expiry_date.label("expiry_date"),
             opening_qty_expr.label("opening_qty"),
             opening_value_expr.label("opening_value"),
-            func.max(InventoryLedger.created_at).label("last_opening_date"),
+            func.max(ledger.created_at).label("last_opening_date"),
             func.coalesce(StockSummary.qty_on_hand, Decimal("0")).label("current_qty"),
         )
-        .select_from(InventoryLedger)
-        .join(Product, Product.id == InventoryLedger.product_id)
-        .join(Warehouse, Warehouse.id == InventoryLedger.warehouse_id)
-        .join(Batch, Batch.id == InventoryLedger.batch_id)
+        .select_from(ledger)
+        .join(Product, Product.id == ledger.product_id)
+        .join(Warehouse, Warehouse.id == ledger.warehouse_id)
+        .join(Batch, Batch.id == ledger.batch_id)
         .outerjoin(
             StockSummary,
-            (StockSummary.warehouse_id == InventoryLedger.warehouse_id)
-            & (StockSummary.product_id == InventoryLedger.product_id)
-            & (StockSummary.batch_id == InventoryLedger.batch_id),
+            (StockSummary.warehouse_id == ledger.warehouse_id)
+            & (StockSummary.product_id == ledger.product_id)
+            & (StockSummary.batch_id == ledger.batch_id),
         )
-        .where(opening_entry_predicate())
+        .where(opening_entry_predicate(ledger))
         .group_by(
             Product.id,
             Product.sku,
@@ -81,16 +82,59 @@ def get_opening_stock_report(
     if filters.category_values:
         stmt = stmt.where(Product.hsn.in_(filters.category_values))
     if filters.product_ids:
-        stmt = stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        stmt = stmt.where(ledger.product_id.in_(filters.product_ids))
     if filters.warehouse_ids:
-        stmt = stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        stmt = stmt.where(ledger.warehouse_id.in_(filters.warehouse_ids))
     if filters.batch_nos:
         stmt = stmt.where(Batch.batch_no.in_(filters.batch_nos))
     if filters.date_from is not None:
-        stmt = stmt.where(func.date(InventoryLedger.created_at) >= filters.date_from)
+        stmt = stmt.where(ledger.created_at >= utc_day_start(filters.date_from))
     if filters.date_to is not None:
-        stmt = stmt.where(func.date(InventoryLedger.created_at) <= filters.date_to)
+        stmt = stmt.where(
+            ledger.created_at < utc_day_start(filters.date_to + timedelta(days=1))
+        )
+
+    return stmt.order_by(
+        Product.name.asc(),
+        Warehouse.name.asc(),
+        Batch.expiry_date.asc(),
+        Batch.batch_no.asc(),
+    )
+
+
+def _serialize_row(row) -> dict[str, object]:
+    return {
+        "sku": row["sku"],
+        "product_name": row["product_name"],
+        "brand": row["brand"],
+        "category": row["category"],
+        "warehouse": row["warehouse"],
+        "batch": row["batch"],
+        "expiry_date": row["expiry_date"],
+        "opening_qty": row["opening_qty"] or Decimal("0"),
+        "opening_value": row["opening_value"] or Decimal("0"),
+        "last_opening_date": row["last_opening_date"],
+        "current_qty": row["current_qty"] or Decimal("0"),
+        "quantity_precision": row["quantity_precision"],
+    }
+
+
+def _ledger_for(db: Session, filters: OpeningStockFilters):
+    since = utc_day_start(filters.date_from) if filters.date_from is not None else None
+    return ledger_history(db, since)
 
+
+def iter_opening_stock_rows(db: Session, filters: OpeningStockFilters) -> Iterator[dict[str, object]]:
+    return stream_report_rows(
+        db, _opening_stock_stmt(filters, _ledger_for(db, filters)), _serialize_row
+    )
+
+
+def get_opening_stock_report(
+    db: Session,
+    filters: OpeningStockFilters,
+) -> tuple[int, list[dict[str, object]], dict[str, object]]:
+    stmt = _opening_stock_stmt(filters, _ledger_for(db, filters))
     base_subquery = stmt.order_by(None).subquery()
     total = int(db.execute(select(func.count()).select_from(base_subquery)).scalar_one())
 
@@ -107,34 +151,9 @@ def get_opening_stock_report(
     ).mappings().one()
 
     rows = db.execute(
-        stmt.order_by(
-            Product.name.asc(),
-            Warehouse.name.asc(),
-            Batch.expiry_date.asc(),
-            Batch.batch_no.asc(),
-        )
-        .offset((filters.page - 1) * filters.page_size)
-        .limit(filters.page_size)
+        stmt.offset((filters.page - 1) * filters.page_size).limit(filters.page_size)
     ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        data.append(
-            {
-                "sku": row["sku"],
-                "product_name": row["product_name"],
-                "brand": row["brand"],
-                "category": row["category"],
-                "warehouse": row["warehouse"],
-                "batch": row["batch"],
-                "expiry_date": row["expiry_date"],
-                "opening_qty": row["opening_qty"] or Decimal("0"),
-                "opening_value": row["opening_value"] or Decimal("0"),
-                "last_opening_date": row["last_opening_date"],
-                "current_qty": row["current_qty"] or Decimal("0"),
-                "quantity_precision": row["quantity_precision"],
-            }
-        )
+    data = [_serialize_row(row) for row in rows]
 
     summary = {
         "total_skus": int(summary_row["total_skus"] or 0),
@@ -4,10 +4,10 @@ from sqlalchemy.sql.elements import ColumnElement
 from app.models.inventory import InventoryLedger
 
 
-def opening_entry_predicate() -> ColumnElement[bool]:
+def opening_entry_predicate(ledger=InventoryLedger) -> ColumnElement[bool]:
     """Match both canonical and legacy opening-stock ledger markers."""
-    reason_upper = func.upper(func.cast(InventoryLedger.reason, String))
-    ref_type_upper = func.upper(func.coalesce(InventoryLedger.ref_type, ""))
+    reason_upper = func.upper(func.cast(ledger.reason, String))
+    ref_type_upper = func.upper(func.coalesce(ledger.ref_type, ""))
     return or_(
         reason_upper.in_(("OPENING_STOCK", "OPENING")),
         ref_type_upper == "OPENING",
@@ -338,7 +338,9 @@ def load_purchase_order_receipt_records(
     if not po_lines:
         return []
 
-    po_line_ids = [row["po_line_id"] for row in po_lines]
+    # A subquery rather than bound ids: a large tenant's lines exceed the
+    # protocol's 65535 parameter limit.
+    po_line_ids = select(po_lines_stmt.subquery().c.po_line_id)
     receipt_stmt = (
         select(
             GRN.purchase_order_id.label("po_id"),
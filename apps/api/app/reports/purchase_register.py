@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
@@ -10,6 +11,7 @@ from app.models.party import Party
 from app.models.product import Product
 from app.models.purchase import PurchaseOrder, PurchaseOrderLine
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
 
 
 @dataclass(slots=True)
@@ -28,10 +30,7 @@ class PurchaseRegisterFilters:
     page_size: int = 50
 
 
-def get_purchase_register_report(
-    db: Session,
-    filters: PurchaseRegisterFilters,
-) -> tuple[int, list[dict[str, object]]]:
+def _purchase_register_stmt(filters: PurchaseRegisterFilters):
     total_order_qty = func.coalesce(func.sum(PurchaseOrderLine.ordered_qty), Decimal("0"))
     total_received_qty = func.coalesce(func.sum(PurchaseOrderLine.received_qty), Decimal("0"))
 
@@ -84,28 +83,38 @@ def get_purchase_register_report(
     if filters.date_to is not None:
         stmt = stmt.where(PurchaseOrder.order_date <= filters.date_to)
 
+    return stmt.order_by(PurchaseOrder.order_date.desc(), PurchaseOrder.id.desc())
+
+
+def _serialize_row(row) -> dict[str, object]:
+    return {
+        "po_number": row["po_number"],
+        "supplier": row["supplier"],
+        "warehouse": row["warehouse"],
+        "order_date": row["order_date"],
+        "status": row["status"],
+        "total_order_qty": row["total_order_qty"] or Decimal("0"),
+        "total_received_qty": row["total_received_qty"] or Decimal("0"),
+        "pending_qty": row["pending_qty"] or Decimal("0"),
+        "total_value": row["total_value"],
+    }
+
+
+def iter_purchase_register_rows(
+    db: Session,
+    filters: PurchaseRegisterFilters,
+) -> Iterator[dict[str, object]]:
+    return stream_report_rows(db, _purchase_register_stmt(filters), _serialize_row)
+
+
+def get_purchase_register_report(
+    db: Session,
+    filters: PurchaseRegisterFilters,
+) -> tuple[int, list[dict[str, object]]]:
+    stmt = _purchase_register_stmt(filters)
     total = int(db.execute(select(func.count()).select_from(stmt.order_by(None).subquery())).scalar_one())
     offset = (filters.page - 1) * filters.page_size
-    rows = db.execute(
-        stmt.order_by(PurchaseOrder.order_date.desc(), PurchaseOrder.id.desc())
-        .offset(offset)
-        .limit(filters.page_size)
-    ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        data.append(
-            {
-                "po_number": row["po_number"],
-                "supplier": row["supplier"],
-                "warehouse": row["warehouse"],
-                "order_date": row["order_date"],
-                "status": row["status"],
-                "total_order_qty": row["total_order_qty"] or Decimal("0"),
-                "total_received_qty": row["total_received_qty"] or Decimal("0"),
-                "pending_qty": row["pending_qty"] or Decimal("0"),
-                "total_value": row["total_value"],
-            }
-        )
+    rows = db.execute(stmt.offset(offset).limit(filters.page_size)).mappings()
+    data = [_serialize_row(row) for row in rows]
 
     return total, data
@@ -1,16 +1,18 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
+from app.core.partitions import utc_day_start
 from app.models.enums import InventoryReason
-from app.models.inventory import InventoryLedger, StockSummary
+from app.models.inventory import StockSummary
 from app.models.product import Product
 from app.models.purchase import GRN
 from app.models.warehouse import Warehouse
+from app.reports.ledger_sources import ledger_history
 
 
 @dataclass(slots=True)
@@ -74,39 +76,45 @@ def get_stock_ageing_report(
     if not summary_rows:
         return 0, []
 
+    # Layers are allocated newest first and anything older than 90 days lands
+    # in the 90+ bucket either way, so older GRN layers (possibly archived by a
+    # fiscal-year close) never change the result.
+    layer_since = utc_day_start(date.today() - timedelta(days=91))
+    ledger = ledger_history(db, layer_since)
     layer_stmt = (
         select(
-            InventoryLedger.warehouse_id.label("warehouse_id"),
-            InventoryLedger.product_id.label("product_id"),
-            InventoryLedger.batch_id.label("batch_id"),
-            InventoryLedger.qty.label("qty"),
+            ledger.warehouse_id.label("warehouse_id"),
+            ledger.product_id.label("product_id"),
+            ledger.batch_id.label("batch_id"),
+            ledger.qty.label("qty"),
             GRN.posted_at.label("posted_at"),
-            InventoryLedger.id.label("ledger_id"),
+            ledger.id.label("ledger_id"),
         )
-        .select_from(InventoryLedger)
+        .select_from(ledger)
         .join(
             GRN,
             and_(
-                InventoryLedger.ref_type == "GRN",
-                InventoryLedger.ref_id == GRN.grn_number,
+                ledger.ref_type == "GRN",
+                ledger.ref_id == GRN.grn_number,
             ),
         )
-        .where(InventoryLedger.reason == InventoryReason.PURCHASE_GRN)
-        .where(InventoryLedger.qty > Decimal("0"))
+        .where(ledger.reason == InventoryReason.PURCHASE_GRN)
+        .where(ledger.qty > Decimal("0"))
         .where(GRN.posted_at.isnot(None))
+        .where(ledger.created_at >= layer_since)
     )
 
     if filters.warehouse_id is not None:
-        layer_stmt = layer_stmt.where(InventoryLedger.warehouse_id == filters.warehouse_id)
+        layer_stmt = layer_stmt.where(ledger.warehouse_id == filters.warehouse_id)
     if filters.warehouse_ids:
-        layer_stmt = layer_stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        layer_stmt = layer_stmt.where(ledger.warehouse_id.in_(filters.warehouse_ids))
     if filters.product_id is not None:
-        layer_stmt = layer_stmt.where(InventoryLedger.product_id == filters.product_id)
+        layer_stmt = layer_stmt.where(ledger.product_id == filters.product_id)
     if filters.product_ids:
-        layer_stmt = layer_stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        layer_stmt = layer_stmt.where(ledger.product_id.in_(filters.product_ids))
 
     layer_rows = db.execute(
-        layer_stmt.order_by(GRN.posted_at.asc(), InventoryLedger.id.asc())
+        layer_stmt.order_by(GRN.posted_at.asc(), ledger.id.asc())
     ).mappings()
 
     layers_by_key: dict[tuple[int, int, int], list[dict[str, object]]] = defaultdict(list)
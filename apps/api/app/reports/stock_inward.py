@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
@@ -5,6 +6,7 @@ from decimal import Decimal
 from sqlalchemy import String, and_, cast, func, select
 from sqlalchemy.orm import Session
 
+from app.core.partitions import utc_day_start
 from app.models.batch import Batch
 from app.models.enums import InventoryReason
 from app.models.inventory import InventoryLedger
@@ -13,6 +15,8 @@ from app.models.product import Product
 from app.models.purchase import GRN, GRNBatchLine, GRNLine, PurchaseOrder
 from app.models.user import User
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
+from app.reports.ledger_sources import ledger_history
 
 
 @dataclass(slots=True)
@@ -33,10 +37,7 @@ class StockInwardFilters:
     page_size: int = 50
 
 
-def get_stock_inward_report(
-    db: Session,
-    filters: StockInwardFilters,
-) -> tuple[int, list[dict[str, object]]]:
+def _stock_inward_stmt(filters: StockInwardFilters, ledger=InventoryLedger):
     line_totals = (
         select(
             GRNLine.grn_id.label("grn_id"),
@@ -53,7 +54,7 @@ def get_stock_inward_report(
 
     stmt = (
         select(
-            InventoryLedger.id.label("ledger_id"),
+            ledger.id.label("ledger_id"),
             GRN.grn_number.label("grn_number"),
             PurchaseOrder.po_number.label("po_number"),
             Party.name.label("supplier_name"),
@@ -62,36 +63,36 @@ def get_stock_inward_report(
             Product.quantity_precision.label("quantity_precision"),
             Batch.batch_no.label("batch_no"),
             Batch.expiry_date.label("expiry_date"),
-            func.coalesce(line_totals.c.qty_received, InventoryLedger.qty).label("qty_received"),
+            func.coalesce(line_totals.c.qty_received, ledger.qty).label("qty_received"),
             func.coalesce(line_totals.c.free_qty, Decimal("0")).label("free_qty"),
             GRN.received_date.label("received_date"),
             User.full_name.label("posted_by"),
         )
-        .select_from(InventoryLedger)
+        .select_from(ledger)
         .join(
             GRN,
             and_(
-                InventoryLedger.ref_type == "GRN",
-                GRN.grn_number == InventoryLedger.ref_id,
+                ledger.ref_type == "GRN",
+                GRN.grn_number == ledger.ref_id,
             ),
         )
         .join(PurchaseOrder, PurchaseOrder.id == GRN.purchase_order_id)
         .join(Party, Party.id == GRN.supplier_id)
-        .join(Warehouse, Warehouse.id == InventoryLedger.warehouse_id)
-        .join(Product, Product.id == InventoryLedger.product_id)
-        .join(Batch, Batch.id == InventoryLedger.batch_id)
+        .join(Warehouse, Warehouse.id == ledger.warehouse_id)
+        .join(Product, Product.id == ledger.product_id)
+        .join(Batch, Batch.id == ledger.batch_id)
         .outerjoin(
             line_totals,
             and_(
                 line_totals.c.grn_id == GRN.id,
-                line_totals.c.product_id == InventoryLedger.product_id,
-                line_totals.c.batch_id == InventoryLedger.batch_id,
+                line_totals.c.product_id == ledger.product_id,
+                line_totals.c.batch_id == ledger.batch_id,
             ),
         )
         # Some tenant schemas include an RBAC users table with text IDs; compare as text
         # so report queries remain stable regardless of users.id physical type.
         .outerjoin(User, cast(User.id, String) == cast(GRN.posted_by, String))
-        .where(InventoryLedger.reason == InventoryReason.PURCHASE_GRN)
+        .where(ledger.reason == InventoryReason.PURCHASE_GRN)
     )
 
     if filters.date_from is not None:
@@ -103,13 +104,13 @@ def get_stock_inward_report(
     if filters.supplier_ids:
         stmt = stmt.where(GRN.supplier_id.in_(filters.supplier_ids))
     if filters.warehouse_id is not None:
-        stmt = stmt.where(InventoryLedger.warehouse_id == filters.warehouse_id)
+        stmt = stmt.where(ledger.warehouse_id == filters.warehouse_id)
     if filters.warehouse_ids:
-        stmt = stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        stmt = stmt.where(ledger.warehouse_id.in_(filters.warehouse_ids))
     if filters.product_id is not None:
-        stmt = stmt.where(InventoryLedger.product_id == filters.product_id)
+        stmt = stmt.where(ledger.product_id == filters.product_id)
     if filters.product_ids:
-        stmt = stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        stmt = stmt.where(ledger.product_id.in_(filters.product_ids))
     if filters.brand_values:
         stmt = stmt.where(Product.brand.in_(filters.brand_values))
     if filters.category_values:
@@ -126,33 +127,48 @@ def get_stock_inward_report(
         elif filters.expiry_status == "safe":
             stmt = stmt.where(Batch.expiry_date > threshold)
 
+    return stmt.order_by(GRN.received_date.desc(), ledger.id.desc())
+
+
+def _serialize_row(row) -> dict[str, object]:
+    return {
+        "grn_number": row["grn_number"],
+        "po_number": row["po_number"],
+        "supplier_name": row["supplier_name"],
+        "warehouse_name": row["warehouse_name"],
+        "product_name": row["product_name"],
+        "quantity_precision": row["quantity_precision"],
+        "batch_no": row["batch_no"],
+        "expiry_date": row["expiry_date"],
+        "qty_received": row["qty_received"] or Decimal("0"),
+        "free_qty": row["free_qty"] or Decimal("0"),
+        "received_date": row["received_date"],
+        "posted_by": row["posted_by"],
+    }
+
+
+def _ledger_for(db: Session, filters: StockInwardFilters):
+    # GRN stock is posted on or after its received date.
+    since = utc_day_start(filters.date_from) if filters.date_from is not None else None
+    return ledger_history(db, since)
+
+
+def iter_stock_inward_rows(db: Session, filters: StockInwardFilters) -> Iterator[dict[str, object]]:
+    return stream_report_rows(
+        db, _stock_inward_stmt(filters, _ledger_for(db, filters)), _serialize_row
+    )
+
+
+def get_stock_inward_report(
+    db: Session,
+    filters: StockInwardFilters,
+) -> tuple[int, list[dict[str, object]]]:
+    stmt = _stock_inward_stmt(filters, _ledger_for(db, filters))
     count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
     total = int(db.execute(count_stmt).scalar_one())
 
     offset = (filters.page - 1) * filters.page_size
-    rows = db.execute(
-        stmt.order_by(GRN.received_date.desc(), InventoryLedger.id.desc())
-        .offset(offset)
-        .limit(filters.page_size)
-    ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        data.append(
-            {
-                "grn_number": row["grn_number"],
-                "po_number": row["po_number"],
-                "supplier_name": row["supplier_name"],
-                "warehouse_name": row["warehouse_name"],
-                "product_name": row["product_name"],
-                "quantity_precision": row["quantity_precision"],
-                "batch_no": row["batch_no"],
-                "expiry_date": row["expiry_date"],
-                "qty_received": row["qty_received"] or Decimal("0"),
-                "free_qty": row["free_qty"] or Decimal("0"),
-                "received_date": row["received_date"],
-                "posted_by": row["posted_by"],
-            }
-        )
+    rows = db.execute(stmt.offset(offset).limit(filters.page_size)).mappings()
+    data = [_serialize_row(row) for row in rows]
 
     return total, data
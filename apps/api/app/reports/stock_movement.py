@@ -1,10 +1,12 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+from datetime import date, timedelta
 from decimal import Decimal
 
 from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
+from app.core.partitions import utc_day_start
 from app.models.batch import Batch
 from app.models.inventory import InventoryLedger
 from app.models.party import Party
@@ -13,6 +15,8 @@ from app.models.purchase import GRN, PurchaseOrder
 from app.models.purchase_bill import PurchaseBill
 from app.models.stock_provenance import StockSourceProvenance
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
+from app.reports.ledger_sources import ledger_history
 
 
 @dataclass(slots=True)
@@ -31,20 +35,20 @@ class StockMovementFilters:
     page_size: int = 50
 
 
-def _movement_base_stmt(filters: StockMovementFilters):
-    qty_in_expr = case((InventoryLedger.qty > 0, InventoryLedger.qty), else_=Decimal("0"))
-    qty_out_expr = case((InventoryLedger.qty < 0, -InventoryLedger.qty), else_=Decimal("0"))
+def _movement_base_stmt(filters: StockMovementFilters, ledger=InventoryLedger):
+    qty_in_expr = case((ledger.qty > 0, ledger.qty), else_=Decimal("0"))
+    qty_out_expr = case((ledger.qty < 0, -ledger.qty), else_=Decimal("0"))
 
     stmt = (
         select(
-            InventoryLedger.id.label("ledger_id"),
-            InventoryLedger.created_at.label("transaction_date"),
-            InventoryLedger.reason.label("reason"),
-            InventoryLedger.ref_type.label("reference_type"),
-            InventoryLedger.ref_id.label("reference_id"),
-            InventoryLedger.warehouse_id.label("warehouse_id"),
-            InventoryLedger.product_id.label("product_id"),
-            InventoryLedger.batch_id.label("batch_id"),
+            ledger.id.label("ledger_id"),
+            ledger.created_at.label("transaction_date"),
+            ledger.reason.label("reason"),
+            ledger.ref_type.label("reference_type"),
+            ledger.ref_id.label("reference_id"),
+            ledger.warehouse_id.label("warehouse_id"),
+            ledger.product_id.label("product_id"),
+            ledger.batch_id.label("batch_id"),
             Product.name.label("product"),
             Product.quantity_precision.label("quantity_precision"),
             Batch.batch_no.label("batch"),
@@ -55,13 +59,13 @@ def _movement_base_stmt(filters: StockMovementFilters):
             GRN.grn_number.label("source_grn"),
             qty_in_expr.label("qty_in"),
             qty_out_expr.label("qty_out"),
-            InventoryLedger.qty.label("signed_qty"),
+            ledger.qty.label("signed_qty"),
         )
-        .select_from(InventoryLedger)
-        .join(Product, Product.id == InventoryLedger.product_id)
-        .join(Batch, Batch.id == InventoryLedger.batch_id)
-        .join(Warehouse, Warehouse.id == InventoryLedger.warehouse_id)
-        .outerjoin(StockSourceProvenance, StockSourceProvenance.ledger_id == InventoryLedger.id)
+        .select_from(ledger)
+        .join(Product, Product.id == ledger.product_id)
+        .join(Batch, Batch.id == ledger.batch_id)
+        .join(Warehouse, Warehouse.id == ledger.warehouse_id)
+        .outerjoin(StockSourceProvenance, StockSourceProvenance.ledger_id == ledger.id)
         .outerjoin(Party, Party.id == StockSourceProvenance.supplier_id)
         .outerjoin(PurchaseOrder, PurchaseOrder.id == StockSourceProvenance.purchase_order_id)
         .outerjoin(PurchaseBill, PurchaseBill.id == StockSourceProvenance.purchase_bill_id)
@@ -69,13 +73,13 @@ def _movement_base_stmt(filters: StockMovementFilters):
     )
 
     if filters.product_id is not None:
-        stmt = stmt.where(InventoryLedger.product_id == filters.product_id)
+        stmt = stmt.where(ledger.product_id == filters.product_id)
     if filters.product_ids:
-        stmt = stmt.where(InventoryLedger.product_id.in_(filters.product_ids))
+        stmt = stmt.where(ledger.product_id.in_(filters.product_ids))
     if filters.warehouse_id is not None:
-        stmt = stmt.where(InventoryLedger.warehouse_id == filters.warehouse_id)
+        stmt = stmt.where(ledger.warehouse_id == filters.warehouse_id)
     if filters.warehouse_ids:
-        stmt = stmt.where(InventoryLedger.warehouse_id.in_(filters.warehouse_ids))
+        stmt = stmt.where(ledger.warehouse_id.in_(filters.warehouse_ids))
     if filters.brand_values:
         stmt = stmt.where(Product.brand.in_(filters.brand_values))
     if filters.category_values:
@@ -83,18 +87,15 @@ def _movement_base_stmt(filters: StockMovementFilters):
     if filters.batch_nos:
         stmt = stmt.where(Batch.batch_no.in_(filters.batch_nos))
     if filters.date_from is not None:
-        stmt = stmt.where(
-            InventoryLedger.created_at >= datetime.combine(filters.date_from, time.min)
-        )
+        stmt = stmt.where(ledger.created_at >= utc_day_start(filters.date_from))
     if filters.date_to is not None:
         stmt = stmt.where(
-            InventoryLedger.created_at
-            < datetime.combine(filters.date_to + timedelta(days=1), time.min)
+            ledger.created_at < utc_day_start(filters.date_to + timedelta(days=1))
         )
     if filters.movement_type == "inward":
-        stmt = stmt.where(InventoryLedger.qty > 0)
+        stmt = stmt.where(ledger.qty > 0)
     elif filters.movement_type == "outward":
-        stmt = stmt.where(InventoryLedger.qty < 0)
+        stmt = stmt.where(ledger.qty < 0)
 
     return stmt
 
@@ -119,39 +120,64 @@ def _serialize_row(row, running_balance: Decimal) -> dict[str, object]:
     }
 
 
-def _postgres_report(db: Session, filters: StockMovementFilters) -> tuple[int, list[dict[str, object]]]:
-    stmt = _movement_base_stmt(filters)
-    total = int(db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one())
-
-    running_balance_expr = func.sum(InventoryLedger.qty).over(
+def _movement_report_stmt(stmt, ledger=InventoryLedger):
+    running_balance_expr = func.sum(ledger.qty).over(
         partition_by=(
-            InventoryLedger.warehouse_id,
-            InventoryLedger.product_id,
-            InventoryLedger.batch_id,
+            ledger.warehouse_id,
+            ledger.product_id,
+            ledger.batch_id,
         ),
-        order_by=(InventoryLedger.created_at.asc(), InventoryLedger.id.asc()),
+        order_by=(ledger.created_at.asc(), ledger.id.asc()),
+    )
+    return stmt.add_columns(running_balance_expr.label("running_balance")).order_by(
+        ledger.created_at.asc(), ledger.id.asc()
     )
 
+
+def _serialize_report_row(row) -> dict[str, object]:
+    return _serialize_row(row, row["running_balance"] or Decimal("0"))
+
+
+def _ledger_for(db: Session, filters: StockMovementFilters):
+    since = utc_day_start(filters.date_from) if filters.date_from is not None else None
+    return ledger_history(db, since)
+
+
+def _postgres_report(db: Session, filters: StockMovementFilters) -> tuple[int, list[dict[str, object]]]:
+    ledger = _ledger_for(db, filters)
+    stmt = _movement_base_stmt(filters, ledger)
+    total = int(db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one())
+
     rows = db.execute(
-        stmt.add_columns(running_balance_expr.label("running_balance"))
-        .order_by(InventoryLedger.created_at.asc(), InventoryLedger.id.asc())
+        _movement_report_stmt(stmt, ledger)
         .offset((filters.page - 1) * filters.page_size)
         .limit(filters.page_size)
     ).mappings()
 
-    data = [
-        _serialize_row(row, row["running_balance"] or Decimal("0"))
-        for row in rows
-    ]
+    data = [_serialize_report_row(row) for row in rows]
     return total, data
 
 
-def get_stock_movement_report(
-    db: Session,
-    filters: StockMovementFilters,
-) -> tuple[int, list[dict[str, object]]]:
+def _require_postgres(db: Session) -> None:
     bind = db.get_bind()
     dialect_name = bind.dialect.name if bind is not None else ""
     if dialect_name != "postgresql":
         raise RuntimeError("Stock movement reporting requires PostgreSQL")
+
+
+def iter_stock_movement_rows(db: Session, filters: StockMovementFilters) -> Iterator[dict[str, object]]:
+    _require_postgres(db)
+    ledger = _ledger_for(db, filters)
+    return stream_report_rows(
+        db,
+        _movement_report_stmt(_movement_base_stmt(filters, ledger), ledger),
+        _serialize_report_row,
+    )
+
+
+def get_stock_movement_report(
+    db: Session,
+    filters: StockMovementFilters,
+) -> tuple[int, list[dict[str, object]]]:
+    _require_postgres(db)
     return _postgres_report(db, filters)
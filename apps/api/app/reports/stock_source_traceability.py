@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
@@ -13,6 +14,7 @@ from app.models.purchase import GRN, PurchaseOrder
 from app.models.purchase_bill import PurchaseBill
 from app.models.stock_provenance import StockSourceProvenance
 from app.models.warehouse import Warehouse
+from app.reports.export import stream_report_rows
 
 
 @dataclass(slots=True)
@@ -99,6 +101,40 @@ def _traceability_base_stmt(filters: StockSourceTraceabilityFilters):
     return stmt
 
 
+def _serialize_row(row) -> dict[str, object]:
+    return {
+        "product_id": row["product_id"],
+        "warehouse_id": row["warehouse_id"],
+        "batch_id": row["batch_id"],
+        "product": row["product_name"],
+        "sku": row["sku"],
+        "batch_no": row["batch_no"],
+        "expiry_date": row["expiry_date"],
+        "warehouse": row["warehouse_name"],
+        "qty_on_hand": row["qty_on_hand"] or Decimal("0"),
+        "received_qty": row["received_qty"] or Decimal("0"),
+        "free_qty": row["free_qty"] or Decimal("0"),
+        "supplier_name": row["supplier_name"],
+        "po_number": row["po_number"],
+        "purchase_bill_number": row["bill_number"],
+        "grn_number": row["grn_number"],
+        "received_date": row["received_date"],
+        "unit_cost": row["unit_cost"],
+        "quantity_precision": row["quantity_precision"],
+    }
+
+
+def _ordered(stmt):
+    return stmt.order_by(StockSourceProvenance.inward_date.desc(), StockSourceProvenance.id.desc())
+
+
+def iter_stock_source_traceability_rows(
+    db: Session,
+    filters: StockSourceTraceabilityFilters,
+) -> Iterator[dict[str, object]]:
+    return stream_report_rows(db, _ordered(_traceability_base_stmt(filters)), _serialize_row)
+
+
 def get_stock_source_traceability_report(
     db: Session,
     filters: StockSourceTraceabilityFilters,
@@ -107,38 +143,9 @@ def get_stock_source_traceability_report(
     total = int(db.execute(select(func.count()).select_from(stmt.order_by(None).subquery())).scalar_one())
 
     rows = db.execute(
-        stmt.order_by(
-            StockSourceProvenance.inward_date.desc(),
-            StockSourceProvenance.id.desc(),
-        )
-        .offset((filters.page - 1) * filters.page_size)
-        .limit(filters.page_size)
+        _ordered(stmt).offset((filters.page - 1) * filters.page_size).limit(filters.page_size)
     ).mappings()
-
-    data: list[dict[str, object]] = []
-    for row in rows:
-        data.append(
-            {
-                "product_id": row["product_id"],
-                "warehouse_id": row["warehouse_id"],
-                "batch_id": row["batch_id"],
-                "product": row["product_name"],
-                "sku": row["sku"],
-                "batch_no": row["batch_no"],
-                "expiry_date": row["expiry_date"],
-                "warehouse": row["warehouse_name"],
-                "qty_on_hand": row["qty_on_hand"] or Decimal("0"),
-                "received_qty": row["received_qty"] or Decimal("0"),
-                "free_qty": row["free_qty"] or Decimal("0"),
-                "supplier_name": row["supplier_name"],
-                "po_number": row["po_number"],
-                "purchase_bill_number": row["bill_number"],
-                "grn_number": row["grn_number"],
-                "received_date": row["received_date"],
-                "unit_cost": row["unit_cost"],
-                "quantity_precision": row["quantity_precision"],
-            }
-        )
+    data = [_serialize_row(row) for row in rows]
 
     return total, data
 
@@ -1,3 +1,6 @@
+from datetime import date
+from decimal import Decimal
+
 from pydantic import BaseModel
 
 
@@ -6,3 +9,8 @@ class DashboardMetrics(BaseModel):
     total_parties: int
     total_warehouses: int
     stock_items_count: int
+    total_stock_value: Decimal
+    expiring_soon_count: int
+    open_purchase_orders: int
+    pending_dispatches: int
+    as_of: date
@@ -208,3 +208,32 @@ class StockAdjustmentListResponse(BaseModel):
     page: int
     page_size: int
     data: list[StockAdjustmentListItem]
+
+
+class PeriodCloseRequest(BaseModel):
+    fiscal_year_end: date
+
+
+class PeriodCloseResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    fiscal_year_end: date
+    cutoff_at: datetime
+    archived_rows: int
+    checkpoint_rows: int
+    closed_by: int
+    closed_at: datetime
+
+
+class StockBalanceMismatch(BaseModel):
+    warehouse_id: int
+    product_id: int
+    batch_id: int
+    ledger_qty: Decimal
+    summary_qty: Decimal
+
+
+class StockBalanceCheckResponse(BaseModel):
+    balanced: bool
+    mismatches: list[StockBalanceMismatch]
@@ -239,6 +239,29 @@ class PartyRead(PartyBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PartySummary(BaseModel):
+    """Party list row with the columns pickers and tables need; fields left out of a
+    ``fields=`` projection are omitted."""
+
+    id: int
+    party_code: str | None = None
+    name: str | None = None
+    display_name: str | None = None
+    party_type: PartyType | None = None
+    party_category: str | None = None
+    gstin: str | None = None
+    phone: str | None = None
+    city: str | None = None
+    state: str | None = None
+    is_active: bool | None = None
+    updated_at: datetime | None = None
+
+
+class PartySummaryPage(BaseModel):
+    items: list[PartySummary]
+    next_cursor: str | None = None
+
+
 class BulkImportError(BaseModel):
     row: int
     field: str | None = None
@@ -249,6 +272,7 @@ class BulkImportResult(BaseModel):
     created_count: int
     failed_count: int
     errors: list[BulkImportError]
+    dry_run: bool = False
 
 
 class WarehouseBase(BaseModel):
@@ -546,6 +570,32 @@ class ProductListResponse(BaseModel):
     data: list[ProductRead]
 
 
+class ProductSummary(BaseModel):
+    """Product list row with the columns pickers and tables need; fields left out of a
+    ``fields=`` projection are omitted."""
+
+    id: int
+    sku: str | None = None
+    name: str | None = None
+    display_name: str | None = None
+    brand: str | None = None
+    category: str | None = None
+    uom: str | None = None
+    hsn: str | None = None
+    gst_rate: Decimal | None = None
+    mrp: Decimal | None = None
+    quantity_precision: int | None = None
+    default_warehouse_id: int | None = None
+    default_warehouse_name: str | None = None
+    is_active: bool | None = None
+    updated_at: datetime | None = None
+
+
+class ProductSummaryPage(BaseModel):
+    items: list[ProductSummary]
+    next_cursor: str | None = None
+
+
 class DrugLicenseVerificationNormalizedResult(BaseModel):
     license_number: str
     holder_name: str | None = None
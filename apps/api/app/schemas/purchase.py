@@ -7,6 +7,8 @@ from app.models.enums import GrnStatus, PurchaseCreditNoteStatus, PurchaseOrderS
 
 
 class PurchaseOrderLineCreate(BaseModel):
+    # Set when editing to keep the existing line; otherwise matched by product.
+    id: int | None = None
     product_id: int
     ordered_qty: Decimal = Field(gt=0)
     unit_cost: Decimal | None = Field(default=None, ge=0)
@@ -27,7 +29,8 @@ class PurchaseOrderCreate(BaseModel):
 
 
 class PurchaseOrderUpdate(PurchaseOrderCreate):
-    pass
+    # The version the edit was based on; a stale one is rejected with 409.
+    version: int | None = None
 
 
 class PurchaseOrderLineResponse(BaseModel):
@@ -87,6 +90,7 @@ class PurchaseOrderResponse(BaseModel):
     created_by: int
     created_at: datetime
     updated_at: datetime
+    version: int
     lines: list[PurchaseOrderLineResponse]
 
     model_config = ConfigDict(from_attributes=True)
@@ -146,6 +150,7 @@ class GRNUpdate(BaseModel):
     received_date: date
     remarks: str | None = None
     lines: list[GRNLineCreateFromPO] = Field(min_length=1)
+    version: int | None = None
 
 
 class GrnAttachBillPayload(BaseModel):
@@ -215,6 +220,7 @@ class GRNResponse(BaseModel):
     created_by_name: str | None = None
     created_at: datetime
     updated_at: datetime
+    version: int
     total_products: int
     total_received_qty: Decimal
     lines: list[GRNLineResponse]
@@ -222,6 +228,33 @@ class GRNResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class GRNSummary(BaseModel):
+    """GRN list row without lines; fields left out of a ``fields=`` projection are omitted."""
+
+    id: int
+    grn_number: str | None = None
+    purchase_order_id: int | None = None
+    po_number: str | None = None
+    purchase_bill_id: int | None = None
+    purchase_bill_number: str | None = None
+    supplier_id: int | None = None
+    supplier_name: str | None = None
+    warehouse_id: int | None = None
+    warehouse_name: str | None = None
+    status: GrnStatus | None = None
+    received_date: date | None = None
+    posted_at: datetime | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    total_products: int | None = None
+    total_received_qty: Decimal | None = None
+
+
+class GRNSummaryPage(BaseModel):
+    items: list[GRNSummary]
+    next_cursor: str | None = None
+
+
 class PurchaseCreditNoteResponse(BaseModel):
     id: int
     credit_note_number: str
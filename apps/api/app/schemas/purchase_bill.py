@@ -42,6 +42,7 @@ class PurchaseBillUpdate(BaseModel):
     grn_id: int | None = None
     remarks: str | None = None
     lines: list[PurchaseBillLineUpdate] | None = None
+    version: int | None = None
 
 
 class DocumentAttachmentResponse(BaseModel):
@@ -103,6 +104,7 @@ class PurchaseBillResponse(BaseModel):
     created_by: int
     created_at: datetime
     updated_at: datetime
+    version: int
     remarks: str | None = None
     attachment: DocumentAttachmentResponse | None = None
     lines: list[PurchaseBillLineResponse]
@@ -114,6 +116,33 @@ class PurchaseBillListResponse(BaseModel):
     items: list[PurchaseBillResponse]
 
 
+class PurchaseBillSummary(BaseModel):
+    """Purchase bill list row without lines, attachment or extracted JSON; fields left
+    out of a ``fields=`` projection are omitted."""
+
+    id: int
+    bill_number: str | None = None
+    supplier_id: int | None = None
+    supplier_name_raw: str | None = None
+    supplier_gstin: str | None = None
+    bill_date: date | None = None
+    due_date: date | None = None
+    warehouse_id: int | None = None
+    status: PurchaseBillStatus | None = None
+    taxable_value: Decimal | None = None
+    total: Decimal | None = None
+    extraction_status: PurchaseBillExtractionStatus | None = None
+    purchase_order_id: int | None = None
+    grn_id: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class PurchaseBillSummaryPage(BaseModel):
+    items: list[PurchaseBillSummary]
+    next_cursor: str | None = None
+
+
 class PurchaseBillExtractionLine(BaseModel):
     description_raw: str
     hsn_code: str | None = None
@@ -246,6 +246,17 @@ class ReportEntityOption(BaseModel):
     label: str
 
 
+class ReportFilterOption(BaseModel):
+    id: int | None = None
+    value: str | None = None
+    label: str
+
+
+class ReportFilterOptionPage(BaseModel):
+    items: list[ReportFilterOption]
+    next_cursor: str | None = None
+
+
 class ReportFilterOptionsResponse(BaseModel):
     brands: list[str]
     categories: list[str]
@@ -7,6 +7,8 @@ from app.models.enums import DispatchNoteStatus, SalesOrderStatus, StockReservat
 
 
 class SalesOrderLineCreate(BaseModel):
+    # Set when editing to keep the existing line; otherwise matched by product.
+    id: int | None = None
     product_id: int
     ordered_qty: Decimal = Field(gt=0)
     unit_price: Decimal = Field(default=Decimal("0"), ge=0)
@@ -48,6 +50,7 @@ class SalesOrderUpdate(BaseModel):
     adjustment: Decimal | None = None
     total: Decimal | None = Field(default=None, ge=0)
     lines: list[SalesOrderLineCreate] | None = Field(default=None, min_length=1)
+    version: int | None = None
 
 
 class SalesOrderLineResponse(BaseModel):
@@ -87,6 +90,7 @@ class SalesOrderResponse(BaseModel):
     created_by: int
     created_at: datetime
     updated_at: datetime
+    version: int
     lines: list[SalesOrderLineResponse]
 
     model_config = ConfigDict(from_attributes=True)
@@ -172,6 +176,7 @@ class DispatchNoteResponse(BaseModel):
     posted_by: int | None = None
     created_at: datetime
     posted_at: datetime | None = None
+    version: int
     lines: list[DispatchLineResponse]
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,19 +1,54 @@
+"""Audit log writes, and the snapshot delta encoding behind them.
+
+With ``audit_snapshot_mode`` set to ``"delta"``, an audit row that has both a
+before and an after snapshot stores only the fields :func:`changed_fields`
+returns. Every ``audit_keyframe_interval``-th row of a record, and its first,
+is a keyframe that keeps both snapshots whole; ``snapshot_seq`` counts the
+rows since the last keyframe. Rows are encoded in one pass when the session
+flushes, so a request that audits many records looks up their positions with
+a single query.
+
+:func:`expand_snapshots` rebuilds the full views on read by replaying a
+record's rows from the nearest keyframe. Fields that changed without an audit
+row show their last audited value until the next keyframe.
+"""
+
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import text
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    and_,
+    event,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+    values,
+)
+from sqlalchemy import column as sql_column
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.inspection import inspect as sqlalchemy_inspect
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, SessionTransaction, aliased
 
+from app.core.config import get_settings
 from app.models.audit import AuditLog
 
+_PENDING_KEY = "pending_audit_snapshots"
+_POSITIONS_KEY = "audit_snapshot_positions"
+
+Snapshots = tuple[dict[str, Any] | None, dict[str, Any] | None]
+
 
 def _json_safe(value: Any) -> Any:
     if value is None:
@@ -52,6 +87,33 @@ def changed_fields(
     return [key for key in keys if before_snapshot.get(key) != after_snapshot.get(key)]
 
 
+def _is_legacy_audit_schema(db: Session) -> bool:
+    # Cached on the session: documents write an audit row per line, and the
+    # table's shape does not change underneath a request.
+    cache = db.info.setdefault("legacy_audit_schemas", {})
+    tenant_schema = db.info.get("tenant_schema")
+    if tenant_schema not in cache:
+        schema_name = str(
+            tenant_schema or db.execute(text("SELECT current_schema()")).scalar_one()
+        )
+        columns = set(
+            db.execute(
+                text(
+                    """
+                    SELECT column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = :schema_name
+                      AND table_name = 'audit_logs'
+                      AND column_name IN ('actor_user_id', 'performed_by')
+                    """
+                ),
+                {"schema_name": schema_name},
+            ).scalars()
+        )
+        cache[tenant_schema] = "actor_user_id" in columns and "performed_by" not in columns
+    return cache[tenant_schema]
+
+
 def write_audit_log(
     db: Session,
     *,
@@ -69,37 +131,7 @@ def write_audit_log(
     after_snapshot: dict[str, Any] | None = None,
     metadata: dict[str, Any] | None = None,
 ) -> AuditLog | None:
-    schema_name = str(db.info.get("tenant_schema") or db.execute(text("SELECT current_schema()")).scalar_one())
-    legacy_audit_schema = (
-        db.execute(
-            text(
-                """
-                SELECT 1
-                FROM information_schema.columns
-                WHERE table_schema = :schema_name
-                  AND table_name = 'audit_logs'
-                  AND column_name = 'actor_user_id'
-                """
-            ),
-            {"schema_name": schema_name},
-        ).scalar_one_or_none()
-        is not None
-        and db.execute(
-            text(
-                """
-                SELECT 1
-                FROM information_schema.columns
-                WHERE table_schema = :schema_name
-                  AND table_name = 'audit_logs'
-                  AND column_name = 'performed_by'
-                """
-            ),
-            {"schema_name": schema_name},
-        ).scalar_one_or_none()
-        is None
-    )
-
-    if legacy_audit_schema:
+    if _is_legacy_audit_schema(db):
         legacy_metadata = _json_safe(metadata) or {}
         if not isinstance(legacy_metadata, dict):
             legacy_metadata = {"metadata": legacy_metadata}
@@ -149,5 +181,172 @@ def write_audit_log(
         after_snapshot=_json_safe(after_snapshot),
         metadata_json=_json_safe(metadata),
     )
+    if not (
+        get_settings().audit_snapshot_mode == "delta"
+        and isinstance(audit.before_snapshot, dict)
+        and isinstance(audit.after_snapshot, dict)
+    ):
+        audit.snapshot_seq = 0
     db.add(audit)
+    db.info.setdefault(_PENDING_KEY, []).append(audit)
     return audit
+
+
+def _is_keyframe(snapshot_seq: int | None) -> bool:
+    return not snapshot_seq
+
+
+def _last_positions(db: Session, keys: set[tuple[str, int]]) -> dict[tuple[str, int], int]:
+    rows = db.execute(
+        select(AuditLog.entity_type, AuditLog.entity_id, AuditLog.snapshot_seq)
+        .where(tuple_(AuditLog.entity_type, AuditLog.entity_id).in_(keys))
+        .ext(distinct_on(AuditLog.entity_type, AuditLog.entity_id))
+        .order_by(
+            AuditLog.entity_type,
+            AuditLog.entity_id,
+            AuditLog.timestamp.desc(),
+            AuditLog.id.desc(),
+        )
+    )
+    return {(row.entity_type, row.entity_id): row.snapshot_seq or 0 for row in rows}
+
+
+@event.listens_for(Session, "before_flush")
+def _encode_pending_snapshots(session: Session, _flush_context, _instances) -> None:
+    pending: list[AuditLog] = session.info.pop(_PENDING_KEY, None) or []
+    if not pending:
+        return
+    positions: dict[tuple[str, int], int] = session.info.setdefault(_POSITIONS_KEY, {})
+    unknown = {
+        (audit.entity_type, audit.entity_id) for audit in pending if audit.snapshot_seq is None
+    } - positions.keys()
+    if unknown:
+        positions.update(_last_positions(session, unknown))
+
+    interval = max(get_settings().audit_keyframe_interval, 1)
+    for audit in pending:
+        key = (audit.entity_type, audit.entity_id)
+        if audit.snapshot_seq is None:
+            previous = positions.get(key)
+            if previous is None or previous + 1 >= interval:
+                audit.snapshot_seq = 0
+            else:
+                audit.snapshot_seq = previous + 1
+                fields = changed_fields(audit.before_snapshot, audit.after_snapshot)
+                audit.before_snapshot = {field: audit.before_snapshot.get(field) for field in fields}
+                audit.after_snapshot = {field: audit.after_snapshot.get(field) for field in fields}
+        positions[key] = audit.snapshot_seq
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_positions_after_commit(session: Session) -> None:
+    session.info.pop(_POSITIONS_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_positions_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_POSITIONS_KEY, None)
+
+
+def replay_snapshots(rows: Iterable[Any]) -> dict[int, Snapshots]:
+    """Full before/after views of audit rows given in timestamp order.
+
+    Each record's rows must run unbroken from a keyframe; a record whose chain
+    starts mid-way replays from an empty snapshot.
+    """
+    states: dict[tuple[str, int], dict[str, Any]] = {}
+    expanded: dict[int, Snapshots] = {}
+    for row in rows:
+        key = (row.entity_type, row.entity_id)
+        if _is_keyframe(row.snapshot_seq):
+            before, after = row.before_snapshot, row.after_snapshot
+            states[key] = dict(after) if isinstance(after, dict) else {}
+        else:
+            before = {**states.get(key, {}), **(row.before_snapshot or {})}
+            after = {**before, **(row.after_snapshot or {})}
+            states[key] = after
+        expanded[row.id] = (before, after)
+    return expanded
+
+
+def _position(log: AuditLog) -> tuple[Any, int]:
+    return log.timestamp, log.id
+
+
+def expand_snapshots(db: Session, logs: Sequence[AuditLog]) -> dict[int, Snapshots]:
+    """Full before/after views of ``logs``, keyed by audit log id.
+
+    Delta rows are replayed from their record's nearest earlier keyframe, with
+    one query for all the records involved.
+    """
+    expanded = {
+        log.id: (log.before_snapshot, log.after_snapshot)
+        for log in logs
+        if _is_keyframe(log.snapshot_seq)
+    }
+    spans: dict[tuple[str, int], list[AuditLog]] = {}
+    for log in logs:
+        if not _is_keyframe(log.snapshot_seq):
+            spans.setdefault((log.entity_type, log.entity_id), []).append(log)
+    if not spans:
+        return expanded
+
+    targets = values(
+        sql_column("entity_type", String),
+        sql_column("entity_id", Integer),
+        sql_column("from_at", DateTime(timezone=True)),
+        sql_column("from_id", Integer),
+        sql_column("until_at", DateTime(timezone=True)),
+        sql_column("until_id", Integer),
+        name="targets",
+    ).data(
+        [
+            (*key, *_position(min(span, key=_position)), *_position(max(span, key=_position)))
+            for key, span in spans.items()
+        ]
+    )
+    keyframe_log = aliased(AuditLog)
+    keyframe = (
+        select(keyframe_log.timestamp.label("at"), keyframe_log.id.label("id"))
+        .where(
+            keyframe_log.entity_type == targets.c.entity_type,
+            keyframe_log.entity_id == targets.c.entity_id,
+            or_(keyframe_log.snapshot_seq.is_(None), keyframe_log.snapshot_seq == 0),
+            tuple_(keyframe_log.timestamp, keyframe_log.id)
+            <= tuple_(targets.c.from_at, targets.c.from_id),
+        )
+        .order_by(keyframe_log.timestamp.desc(), keyframe_log.id.desc())
+        .limit(1)
+        .lateral("keyframe")
+    )
+    chain = (
+        select(
+            AuditLog.id,
+            AuditLog.entity_type,
+            AuditLog.entity_id,
+            AuditLog.snapshot_seq,
+            AuditLog.before_snapshot,
+            AuditLog.after_snapshot,
+        )
+        .select_from(targets)
+        .join(keyframe, true())
+        .join(
+            AuditLog,
+            and_(
+                AuditLog.entity_type == targets.c.entity_type,
+                AuditLog.entity_id == targets.c.entity_id,
+                tuple_(AuditLog.timestamp, AuditLog.id) >= tuple_(keyframe.c.at, keyframe.c.id),
+                tuple_(AuditLog.timestamp, AuditLog.id)
+                <= tuple_(targets.c.until_at, targets.c.until_id),
+            ),
+        )
+        .order_by(AuditLog.timestamp, AuditLog.id)
+    )
+    replayed = replay_snapshots(db.execute(chain))
+    for span in spans.values():
+        for log in span:
+            expanded[log.id] = replayed.get(log.id, (log.before_snapshot, log.after_snapshot))
+    return expanded
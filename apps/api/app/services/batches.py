@@ -0,0 +1,136 @@
+"""Batch registry: look up and create batches by identity, many at a time.
+
+A batch is identified by :data:`~app.models.batch.BATCH_IDENTITY_COLUMNS`,
+with NULLs comparing equal, and the ``uq_batches_identity`` index enforces it.
+:func:`resolve_batches` reads every requested identity with one query and
+creates the missing ones with ``INSERT ... ON CONFLICT DO NOTHING RETURNING``.
+A concurrent transaction that registers the same batch first therefore makes
+the insert skip that row instead of creating a duplicate; the row is then read
+back once the other transaction has committed.
+
+Resolved batches are remembered on the session until the transaction ends, so
+a GRN that validates its batches while saving and again while posting in the
+same request does not repeat the lookups.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy import event, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.models.batch import BATCH_IDENTITY_COLUMNS, Batch
+from app.services.data_versions import bump_data_version_on_commit
+
+_REGISTRY_KEY = "batch_registry"
+# Keeps each statement well under Postgres' bind parameter limit.
+_CHUNK_SIZE = 1000
+_MRP_PLACES = Decimal("0.01")
+
+
+class BatchKey(NamedTuple):
+    product_id: int
+    batch_no: str
+    expiry_date: date
+    mfg_date: date | None = None
+    mrp: Decimal | None = None
+    reference_id: str | None = None
+
+    @classmethod
+    def of(cls, batch: Batch) -> "BatchKey":
+        return cls(*(getattr(batch, column) for column in BATCH_IDENTITY_COLUMNS))
+
+
+def _normalized(key: BatchKey) -> BatchKey:
+    # ``batches.mrp`` is NUMERIC(12, 2), so compare MRPs the way they are stored.
+    if key.mrp is None:
+        return key
+    return key._replace(mrp=Decimal(key.mrp).quantize(_MRP_PLACES))
+
+
+def _sort_key(key: BatchKey) -> tuple:
+    return tuple((value is None, value if value is not None else 0) for value in key)
+
+
+def _chunks(keys: list[BatchKey]) -> Iterable[list[BatchKey]]:
+    for start in range(0, len(keys), _CHUNK_SIZE):
+        yield keys[start : start + _CHUNK_SIZE]
+
+
+def _registry(db: Session) -> dict[BatchKey, Batch]:
+    return db.info.setdefault(_REGISTRY_KEY, {})
+
+
+def _load(db: Session, keys: set[BatchKey], registry: dict[BatchKey, Batch]) -> None:
+    for chunk in _chunks(sorted(keys, key=_sort_key)):
+        candidates = db.scalars(
+            select(Batch).where(
+                tuple_(Batch.product_id, Batch.batch_no, Batch.expiry_date).in_(
+                    {(key.product_id, key.batch_no, key.expiry_date) for key in chunk}
+                )
+            )
+        )
+        for batch in candidates:
+            registry[BatchKey.of(batch)] = batch
+
+
+def _insert(db: Session, keys: set[BatchKey], registry: dict[BatchKey, Batch]) -> None:
+    created_any = False
+    # Sorted so concurrent registrations wait on each other in the same order.
+    for chunk in _chunks(sorted(keys, key=_sort_key)):
+        created = db.scalars(
+            insert(Batch)
+            .values([key._asdict() for key in chunk])
+            .on_conflict_do_nothing(index_elements=list(BATCH_IDENTITY_COLUMNS))
+            .returning(Batch)
+        )
+        for batch in created:
+            registry[BatchKey.of(batch)] = batch
+            created_any = True
+    if created_any:
+        bump_data_version_on_commit(db, "batches")
+
+
+def resolve_batches(
+    db: Session,
+    keys: Iterable[BatchKey],
+    *,
+    create_missing: bool = True,
+) -> dict[BatchKey, Batch]:
+    """The batch for every key, created when missing unless ``create_missing`` is off.
+
+    Keys without a batch are left out of the result when nothing is created.
+    """
+    requested = {key: _normalized(key) for key in keys}
+    registry = _registry(db)
+    missing = set(requested.values()) - registry.keys()
+    if missing:
+        _load(db, missing, registry)
+        missing -= registry.keys()
+    if missing and create_missing:
+        _insert(db, missing, registry)
+        missing -= registry.keys()
+        if missing:
+            # Registered by a concurrent transaction after our read.
+            _load(db, missing, registry)
+    return {key: registry[normalized] for key, normalized in requested.items() if normalized in registry}
+
+
+def resolve_batch(db: Session, key: BatchKey, *, create_missing: bool = True) -> Batch | None:
+    return resolve_batches(db, [key], create_missing=create_missing).get(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_batches_after_commit(session: Session) -> None:
+    session.info.pop(_REGISTRY_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_batches_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    # Savepoint rollbacks count too: they discard the batches inserted since.
+    session.info.pop(_REGISTRY_KEY, None)
@@ -0,0 +1,238 @@
+"""Incrementally maintained dashboard KPIs.
+
+The dashboard reads a single row, ``dashboard_snapshots.id = 1``. Write paths
+describe their effect on the figures with the ``record_*`` helpers below; the
+deltas are collected on the session and applied as one
+``UPDATE ... SET x = x + delta`` just before the transaction commits. The
+snapshot row is therefore locked only for the commit itself, always after any
+stock rows the transaction already holds, and a rolled-back transaction
+discards its deltas with everything else.
+
+"Expiring soon" depends on the calendar, so the row remembers the date its
+expiry window was computed for. The first read on a new day, or a scheduled
+``run_tenant_job(slug, refresh_dashboard_snapshot)``, rebuilds every figure
+from the source tables, which also repairs any drift from writes that bypass
+these helpers. The row is locked only to write the rebuilt figures.
+"""
+
+import operator
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from functools import reduce
+
+from sqlalchemy import and_, case, event, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql.selectable import ScalarSelect
+from sqlalchemy.types import Date
+
+from app.models.dashboard_snapshot import DASHBOARD_SNAPSHOT_ID, DashboardSnapshot
+from app.models.enums import DispatchNoteStatus, PurchaseOrderStatus
+from app.models.inventory import StockSummary
+from app.models.party import Party
+from app.models.product import Product
+from app.models.purchase import PurchaseOrder
+from app.models.sales import DispatchNote
+from app.models.warehouse import Warehouse
+from app.reports.ledger_sources import stock_position_rows
+
+EXPIRY_WINDOW_DAYS = 30
+OPEN_PURCHASE_ORDER_STATUSES = frozenset(
+    {PurchaseOrderStatus.APPROVED, PurchaseOrderStatus.PARTIALLY_RECEIVED}
+)
+PENDING_DISPATCH_STATUSES = frozenset({DispatchNoteStatus.DRAFT})
+
+_MASTER_COUNTERS = frozenset({"total_products", "total_parties", "total_warehouses"})
+_PENDING_KEY = "dashboard_deltas"
+
+
+@dataclass
+class _PendingDeltas:
+    counters: Counter[str] = field(default_factory=Counter)
+    stock_value: Decimal = Decimal("0")
+    # Newly in-stock (+1) or sold-out (-1) rows by batch expiry date; whether
+    # they fall in the expiry window is decided against the row's as_of.
+    in_stock_by_expiry: Counter[date] = field(default_factory=Counter)
+
+
+def _pending(db: Session) -> _PendingDeltas:
+    return db.info.setdefault(_PENDING_KEY, _PendingDeltas())
+
+
+def record_dashboard_delta(db: Session, **counters: int) -> None:
+    """Queue master-count changes, e.g. ``total_products=1`` after a create."""
+    pending = _pending(db)
+    for name, delta in counters.items():
+        if name not in _MASTER_COUNTERS:
+            raise ValueError(f"Unknown dashboard counter: {name}")
+        pending.counters[name] += delta
+
+
+def record_stock_movement(
+    db: Session,
+    *,
+    qty_before: Decimal,
+    qty_after: Decimal,
+    value_delta: Decimal,
+    expiry_date: date | None,
+) -> None:
+    pending = _pending(db)
+    pending.stock_value += value_delta
+    in_stock_delta = int(qty_after > 0) - int(qty_before > 0)
+    if in_stock_delta:
+        pending.counters["stock_items_count"] += in_stock_delta
+        if expiry_date is not None:
+            pending.in_stock_by_expiry[expiry_date] += in_stock_delta
+
+
+def record_purchase_order_status(
+    db: Session,
+    previous: PurchaseOrderStatus | None,
+    current: PurchaseOrderStatus,
+) -> None:
+    delta = int(current in OPEN_PURCHASE_ORDER_STATUSES) - int(
+        previous in OPEN_PURCHASE_ORDER_STATUSES
+    )
+    if delta:
+        _pending(db).counters["open_purchase_orders"] += delta
+
+
+def record_dispatch_note_status(
+    db: Session,
+    previous: DispatchNoteStatus | None,
+    current: DispatchNoteStatus,
+) -> None:
+    delta = int(current in PENDING_DISPATCH_STATUSES) - int(previous in PENDING_DISPATCH_STATUSES)
+    if delta:
+        _pending(db).counters["pending_dispatches"] += delta
+
+
+def _expiring_delta(expiry_date: date, delta: int):
+    # today <= expiry_date <= today + window, evaluated against the row's as_of.
+    window_start = expiry_date - timedelta(days=EXPIRY_WINDOW_DAYS)
+    in_window = and_(
+        DashboardSnapshot.as_of >= literal(window_start, Date),
+        DashboardSnapshot.as_of <= literal(expiry_date, Date),
+    )
+    return case((in_window, delta), else_=0)
+
+
+def _apply_pending_deltas(db: Session) -> None:
+    pending: _PendingDeltas | None = db.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+
+    values = {
+        name: getattr(DashboardSnapshot, name) + delta
+        for name, delta in pending.counters.items()
+        if delta
+    }
+    if pending.stock_value:
+        values["total_stock_value"] = DashboardSnapshot.total_stock_value + pending.stock_value
+    expiring = [
+        _expiring_delta(expiry_date, delta)
+        for expiry_date, delta in pending.in_stock_by_expiry.items()
+        if delta
+    ]
+    if expiring:
+        values["expiring_soon_count"] = reduce(
+            operator.add, expiring, DashboardSnapshot.expiring_soon_count
+        )
+    if not values:
+        return
+    db.execute(
+        update(DashboardSnapshot)
+        .where(DashboardSnapshot.id == DASHBOARD_SNAPSHOT_ID)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_deltas_before_commit(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    _apply_pending_deltas(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_deltas_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _figures_from_sources(today: date) -> dict[str, ScalarSelect]:
+    threshold = today + timedelta(days=EXPIRY_WINDOW_DAYS)
+    positions = stock_position_rows()
+    in_stock = select(func.count()).select_from(StockSummary).where(StockSummary.qty_on_hand > 0)
+    return {
+        "total_products": select(func.count()).select_from(Product).scalar_subquery(),
+        "total_parties": select(func.count()).select_from(Party).scalar_subquery(),
+        "total_warehouses": select(func.count()).select_from(Warehouse).scalar_subquery(),
+        "stock_items_count": in_stock.scalar_subquery(),
+        "total_stock_value": select(
+            func.coalesce(func.sum(positions.c.stock_value), Decimal("0"))
+        ).scalar_subquery(),
+        "expiring_soon_count": in_stock.where(StockSummary.expiry_date >= today)
+        .where(StockSummary.expiry_date <= threshold)
+        .scalar_subquery(),
+        "open_purchase_orders": select(func.count())
+        .select_from(PurchaseOrder)
+        .where(PurchaseOrder.status.in_(OPEN_PURCHASE_ORDER_STATUSES))
+        .scalar_subquery(),
+        "pending_dispatches": select(func.count())
+        .select_from(DispatchNote)
+        .where(DispatchNote.status.in_(PENDING_DISPATCH_STATUSES))
+        .scalar_subquery(),
+    }
+
+
+def refresh_dashboard_snapshot(db: Session, today: date | None = None) -> DashboardSnapshot:
+    """Rebuild every figure from the source tables; the caller commits.
+
+    The counting runs without the row lock. It reads the row in the same
+    statement, so deltas writers commit while it runs show up as the row's
+    change since then and are added on top of the counts under the lock.
+    """
+    today = today or date.today()
+    db.execute(
+        insert(DashboardSnapshot)
+        .values(id=DASHBOARD_SNAPSHOT_ID)
+        .on_conflict_do_nothing(index_elements=[DashboardSnapshot.id])
+    )
+    figures = _figures_from_sources(today)
+    counted = db.execute(
+        select(
+            *(figure.label(name) for name, figure in figures.items()),
+            *(getattr(DashboardSnapshot, name).label(f"seen_{name}") for name in figures),
+        ).where(DashboardSnapshot.id == DASHBOARD_SNAPSHOT_ID)
+    ).one()._mapping
+
+    snapshot = db.execute(
+        select(DashboardSnapshot)
+        .where(DashboardSnapshot.id == DASHBOARD_SNAPSHOT_ID)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalar_one()
+    for name in figures:
+        since_counted = getattr(snapshot, name) - counted[f"seen_{name}"]
+        setattr(snapshot, name, counted[name] + since_counted)
+    snapshot.as_of = today
+    snapshot.refreshed_at = datetime.now(timezone.utc)
+    db.flush()
+    # The rebuild already counts this transaction's own changes.
+    db.info.pop(_PENDING_KEY, None)
+    return snapshot
+
+
+def current_dashboard_snapshot(db: Session, today: date | None = None) -> DashboardSnapshot:
+    """The snapshot for ``today``: one primary-key read unless a rebuild is due."""
+    today = today or date.today()
+    snapshot = db.get(DashboardSnapshot, DASHBOARD_SNAPSHOT_ID)
+    if snapshot is not None and snapshot.as_of == today:
+        return snapshot
+    return refresh_dashboard_snapshot(db, today)
@@ -0,0 +1,423 @@
+"""Maintained findings behind the /reports/data-quality endpoints.
+
+Every check below is one SQL query that can be narrowed to a set of records.
+When a session flushes changes to parties, products, warehouses, purchase
+orders, purchase bills or stock summaries, the touched records are collected
+on the session, together with the values duplicate checks group by, both old
+and new. Just before the transaction commits, each affected check is re-run
+for that scope only: findings in scope that no longer hold are deleted and the
+rest are upserted into ``data_quality_findings``, keeping ``detected_at`` for
+findings that were already open. A rolled-back transaction discards its scope
+with everything else.
+
+Writes that bypass the ORM, such as bulk imports through core INSERTs, are not
+seen unless their writer passes the new ids to :func:`note_inserted_records`.
+:func:`rescan_data_quality_findings` re-runs every check unscoped and repairs
+them; schedule it with ``run_tenant_job(slug,
+rescan_data_quality_findings)``.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from itertools import chain
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    String,
+    any_,
+    case,
+    cast,
+    delete,
+    event,
+    exists,
+    false,
+    func,
+    inspect,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, array, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.models.data_quality import DataQualityFinding
+from app.models.inventory import StockSummary
+from app.models.party import Party
+from app.models.product import Product
+from app.models.purchase import PurchaseOrder
+from app.models.purchase_bill import PurchaseBill
+from app.models.warehouse import Warehouse
+from app.services.data_versions import bump_data_version
+
+MISSING_FIELDS = "missing_fields"
+DUPLICATE_MASTERS = "duplicate_masters"
+COMPLIANCE_GAPS = "compliance_gaps"
+INVALID_REFERENCES = "invalid_references"
+
+INACTIVE_MASTER_REFERENCE = "inactive_master_reference"
+
+_PENDING_KEY = "data_quality_scope"
+
+
+@dataclass
+class FindingScope:
+    # Record ids by entity type, and grouped values by duplicate rule.
+    records: defaultdict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
+    values: defaultdict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+
+@dataclass(frozen=True)
+class _Tracked:
+    entity_type: str
+    # Columns whose change can alter a finding; None means any column.
+    watched: tuple[str, ...] | None = None
+    # Duplicate rule -> the column it groups by.
+    duplicates: dict[str, str] = field(default_factory=dict)
+
+
+_TRACKED: dict[type, _Tracked] = {
+    Party: _Tracked("PARTY", duplicates={"party_gstin": "gstin"}),
+    Product: _Tracked("PRODUCT", duplicates={"product_name": "name"}),
+    Warehouse: _Tracked("WAREHOUSE", duplicates={"warehouse_name": "name"}),
+    PurchaseOrder: _Tracked("PURCHASE_ORDER", watched=("supplier_id", "warehouse_id")),
+    PurchaseBill: _Tracked("PURCHASE_BILL", watched=("warehouse_id",)),
+    # Quantities move constantly but never change a finding.
+    StockSummary: _Tracked("STOCK_SUMMARY", watched=()),
+}
+
+
+@dataclass(frozen=True)
+class _Check:
+    report: str
+    entity_type: str
+    # Scope keys (entity types or duplicate rules) that can change this check.
+    depends_on: tuple[str, ...]
+    # Finder: subject_key, entity_id, entity_name, rules, details, record_count.
+    find: Callable[[FindingScope | None], Select]
+    # The stored findings a scoped run of ``find`` re-derives.
+    owns: Callable[[FindingScope], ColumnElement[bool]]
+
+    def applies(self, scope: FindingScope) -> bool:
+        return any(scope.records.get(key) or scope.values.get(key) for key in self.depends_on)
+
+
+def _blank(column) -> ColumnElement[bool]:
+    return func.coalesce(column, "") == ""
+
+
+def _rules(*conditions: tuple[ColumnElement[bool], str]) -> ColumnElement:
+    """Array of the rules whose condition holds, in the order given."""
+    return func.array_remove(
+        array([case((condition, rule)) for condition, rule in conditions], type_=String),
+        null(),
+        type_=ARRAY(String),
+    )
+
+
+def _finding(
+    *,
+    subject_key,
+    rules,
+    entity_id=None,
+    entity_name=None,
+    details=None,
+    record_count=None,
+) -> Select:
+    def typed(value, type_):
+        return value if value is not None else cast(null(), type_)
+
+    return select(
+        subject_key.label("subject_key"),
+        typed(entity_id, Integer).label("entity_id"),
+        typed(entity_name, String).label("entity_name"),
+        rules.label("rules"),
+        typed(details, String).label("details"),
+        typed(record_count, Integer).label("record_count"),
+    )
+
+
+def _in(column, ids: set) -> ColumnElement[bool]:
+    # One array parameter, however many rows an import noted.
+    return column == any_(literal(sorted(ids), ARRAY(column.type))) if ids else false()
+
+
+def _record_check(report: str, entity_type: str, model, *conditions) -> _Check:
+    rules = _rules(*conditions)
+
+    def find(scope: FindingScope | None) -> Select:
+        stmt = _finding(
+            subject_key=cast(model.id, String),
+            entity_id=model.id,
+            entity_name=model.name,
+            rules=rules,
+        ).where(func.cardinality(rules) > 0)
+        if scope is not None:
+            stmt = stmt.where(_in(model.id, scope.records[entity_type]))
+        return stmt
+
+    return _Check(
+        report,
+        entity_type,
+        (entity_type,),
+        find,
+        lambda scope: _in(DataQualityFinding.entity_id, scope.records[entity_type]),
+    )
+
+
+def _duplicate_check(entity_type: str, rule: str, column) -> _Check:
+    def find(scope: FindingScope | None) -> Select:
+        stmt = (
+            _finding(
+                subject_key=column,
+                rules=array([literal(rule)], type_=String),
+                record_count=func.count(),
+            )
+            .where(column.isnot(None))
+            .group_by(column)
+            .having(func.count() > 1)
+        )
+        if scope is not None:
+            stmt = stmt.where(_in(column, scope.values[rule]))
+        return stmt
+
+    return _Check(
+        DUPLICATE_MASTERS,
+        entity_type,
+        (rule,),
+        find,
+        lambda scope: _in(DataQualityFinding.subject_key, scope.values[rule]),
+    )
+
+
+def _reference_check(
+    entity_type: str,
+    model,
+    references: dict[str, ColumnElement],
+    joined: Callable[[Select], Select],
+    inactive: ColumnElement[bool],
+    details: ColumnElement,
+) -> _Check:
+    """Documents pointing at inactive masters; ``references`` maps master types to FKs."""
+
+    def scoped(scope: FindingScope) -> ColumnElement[bool]:
+        return or_(
+            _in(model.id, scope.records[entity_type]),
+            *(_in(column, scope.records[master]) for master, column in references.items()),
+        )
+
+    def find(scope: FindingScope | None) -> Select:
+        stmt = joined(
+            _finding(
+                subject_key=cast(model.id, String),
+                entity_id=model.id,
+                rules=array([literal(INACTIVE_MASTER_REFERENCE)], type_=String),
+                details=details,
+            )
+        ).where(inactive)
+        if scope is not None:
+            stmt = stmt.where(scoped(scope))
+        return stmt
+
+    def owns(scope: FindingScope) -> ColumnElement[bool]:
+        # Deleted documents are named directly; the rest are found through the masters.
+        return or_(
+            _in(DataQualityFinding.entity_id, scope.records[entity_type]),
+            DataQualityFinding.entity_id.in_(select(model.id).where(scoped(scope))),
+        )
+
+    return _Check(INVALID_REFERENCES, entity_type, (entity_type, *references), find, owns)
+
+
+CHECKS: tuple[_Check, ...] = (
+    _record_check(
+        MISSING_FIELDS,
+        "PARTY",
+        Party,
+        (_blank(Party.gstin), "gstin"),
+        (_blank(Party.state), "state"),
+        (_blank(Party.contact_person), "contact_person"),
+    ),
+    _record_check(
+        MISSING_FIELDS,
+        "PRODUCT",
+        Product,
+        (_blank(Product.brand), "brand"),
+        # The category column is reported from the HSN code.
+        (_blank(Product.hsn), "category"),
+        (Product.gst_rate.is_(None), "gst_rate"),
+    ),
+    _record_check(MISSING_FIELDS, "WAREHOUSE", Warehouse, (_blank(Warehouse.address), "address")),
+    _record_check(
+        COMPLIANCE_GAPS,
+        "PARTY",
+        Party,
+        (_blank(Party.gstin), "missing_gstin"),
+        (_blank(Party.pan_number), "missing_pan"),
+        (_blank(Party.drug_license_number), "missing_drug_license"),
+        (_blank(Party.fssai_number), "missing_fssai"),
+    ),
+    _duplicate_check("PARTY", "party_gstin", Party.gstin),
+    _duplicate_check("PRODUCT", "product_name", Product.name),
+    _duplicate_check("WAREHOUSE", "warehouse_name", Warehouse.name),
+    _reference_check(
+        "STOCK_SUMMARY",
+        StockSummary,
+        {"PRODUCT": StockSummary.product_id, "WAREHOUSE": StockSummary.warehouse_id},
+        lambda stmt: stmt.join(Product, Product.id == StockSummary.product_id).join(
+            Warehouse, Warehouse.id == StockSummary.warehouse_id
+        ),
+        Product.is_active.is_(False) | Warehouse.is_active.is_(False),
+        Product.name + " / " + Warehouse.name,
+    ),
+    _reference_check(
+        "PURCHASE_ORDER",
+        PurchaseOrder,
+        {"PARTY": PurchaseOrder.supplier_id, "WAREHOUSE": PurchaseOrder.warehouse_id},
+        lambda stmt: stmt.join(Party, Party.id == PurchaseOrder.supplier_id).join(
+            Warehouse, Warehouse.id == PurchaseOrder.warehouse_id
+        ),
+        Party.is_active.is_(False) | Warehouse.is_active.is_(False),
+        Party.name + " / " + Warehouse.name,
+    ),
+    _reference_check(
+        "PURCHASE_BILL",
+        PurchaseBill,
+        {"WAREHOUSE": PurchaseBill.warehouse_id},
+        lambda stmt: stmt.join(Warehouse, Warehouse.id == PurchaseBill.warehouse_id),
+        Warehouse.is_active.is_(False),
+        cast(Warehouse.name, String),
+    ),
+)
+
+
+def _run_check(db: Session, check: _Check, scope: FindingScope | None) -> None:
+    found = check.find(scope).subquery()
+    stale = delete(DataQualityFinding).where(
+        DataQualityFinding.report == check.report,
+        DataQualityFinding.entity_type == check.entity_type,
+        check.owns(scope) if scope is not None else true(),
+        ~exists().where(found.c.subject_key == DataQualityFinding.subject_key),
+    )
+    db.execute(stale.execution_options(synchronize_session=False))
+
+    upsert = insert(DataQualityFinding).from_select(
+        [
+            "report",
+            "entity_type",
+            "subject_key",
+            "entity_id",
+            "entity_name",
+            "rules",
+            "details",
+            "record_count",
+        ],
+        select(literal(check.report), literal(check.entity_type), *found.c),
+    )
+    db.execute(
+        upsert.on_conflict_do_update(
+            constraint="uq_data_quality_findings_subject",
+            set_={
+                "entity_id": upsert.excluded.entity_id,
+                "entity_name": upsert.excluded.entity_name,
+                "rules": upsert.excluded.rules,
+                "details": upsert.excluded.details,
+                "record_count": upsert.excluded.record_count,
+                "checked_at": func.now(),
+            },
+        )
+    )
+
+
+def refresh_data_quality_findings(db: Session, scope: FindingScope) -> None:
+    """Re-run the checks ``scope`` can affect, for ``scope`` only; the caller commits."""
+    for check in CHECKS:
+        if check.applies(scope):
+            _run_check(db, check, scope)
+
+
+def rescan_data_quality_findings(db: Session) -> None:
+    """Re-run every check over the whole tenant; the caller commits."""
+    for check in CHECKS:
+        _run_check(db, check, None)
+    # Marks the tenant as scanned for the runtime schema repair.
+    bump_data_version(db, DataQualityFinding.__tablename__)
+
+
+def note_inserted_records(
+    db: Session,
+    model: type,
+    ids: Iterable[int],
+    grouped_values: Mapping[str, Iterable[str | None]] | None = None,
+) -> None:
+    """Queue rows a core INSERT added, which the flush listener never sees.
+
+    ``grouped_values`` maps a column a duplicate check groups by (e.g. "gstin")
+    to the values the rows were inserted with.
+    """
+    tracked = _TRACKED[model]
+    scope: FindingScope = db.info.setdefault(_PENDING_KEY, FindingScope())
+    scope.records[tracked.entity_type].update(ids)
+    for rule, attribute in tracked.duplicates.items():
+        scope.values[rule].update(
+            value for value in (grouped_values or {}).get(attribute, ()) if value
+        )
+
+
+def _is_relevant_change(session: Session, instance, tracked: _Tracked) -> bool:
+    if instance in session.new or instance in session.deleted:
+        return True
+    if tracked.watched is None:
+        return session.is_modified(instance, include_collections=False)
+    state = inspect(instance)
+    return any(state.attrs[name].history.has_changes() for name in tracked.watched)
+
+
+def _keep_previous_value(target, value, oldvalue, initiator) -> None:
+    """No-op; registering it with ``active_history`` is what matters."""
+
+
+# A rename must also re-check the group it leaves, so make the ORM load the
+# old value into the attribute history even when the instance was expired.
+for _model, _tracked in _TRACKED.items():
+    for _attribute in _tracked.duplicates.values():
+        event.listen(getattr(_model, _attribute), "set", _keep_previous_value, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_touched_records(session: Session, _flush_context) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        tracked = _TRACKED.get(type(instance))
+        if tracked is None or not _is_relevant_change(session, instance, tracked):
+            continue
+        scope: FindingScope = session.info.setdefault(_PENDING_KEY, FindingScope())
+        scope.records[tracked.entity_type].add(instance.id)
+        state = inspect(instance)
+        for rule, attribute in tracked.duplicates.items():
+            history = state.attrs[attribute].history
+            scope.values[rule].update(
+                value for value in chain(history.added, history.deleted, history.unchanged) if value
+            )
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_findings_before_commit(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    # Flush first so the last changes are collected too.
+    session.flush()
+    scope: FindingScope | None = session.info.pop(_PENDING_KEY, None)
+    if scope is not None:
+        refresh_data_quality_findings(session, scope)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_scope_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
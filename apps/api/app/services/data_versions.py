@@ -0,0 +1,125 @@
+"""Per-tenant, per-table change versions for conditional GETs on master lists.
+
+Every route that creates, updates or deletes master rows calls
+:func:`bump_data_version` inside the same transaction as the change, so the
+version commits or rolls back with it. ``changed_at`` is set from ``now()``,
+the transaction timestamp that also lands in the changed rows' ``updated_at``.
+List endpoints read the versions they depend on with one primary-key lookup
+and turn them into a strong ETag, so an unchanged list is answered with 304
+before any ORM query runs.
+
+Batches, GRNs and purchase bills are written by too many services to bump by
+hand. A flush that inserts or deletes one of their rows, or changes a column
+listed in ``_TRACKED_COLUMNS``, bumps the table's version when the transaction
+commits; writers of core INSERTs into them call :func:`bump_data_version_on_commit`.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import chain
+
+from fastapi import Request, Response
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.http_cache import etag_matches, make_etag, not_modified, set_cache_headers
+from app.core.metrics import UNKNOWN_TENANT
+from app.models.batch import Batch
+from app.models.data_version import DataVersion
+from app.models.purchase import GRN
+from app.models.purchase_bill import PurchaseBill
+
+# model -> the columns whose change moves its version; inserts and deletes always do.
+_TRACKED_COLUMNS: dict[type, tuple[str, ...]] = {
+    Batch: ("batch_no", "expiry_date"),
+    GRN: ("received_date",),
+    PurchaseBill: ("bill_date",),
+}
+_PENDING_KEY = "data_version_tables"
+
+
+def bump_data_version(db: Session, *table_names: str) -> None:
+    for table_name in table_names:
+        stmt = insert(DataVersion).values(table_name=table_name, version=1, changed_at=func.now())
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[DataVersion.table_name],
+                set_={"version": DataVersion.version + 1, "changed_at": func.now()},
+            )
+        )
+
+
+def bump_data_version_on_commit(db: Session, *table_names: str) -> None:
+    """:func:`bump_data_version` once, when the transaction commits."""
+    db.info.setdefault(_PENDING_KEY, set()).update(table_names)
+
+
+def read_data_versions(
+    db: Session, table_names: Sequence[str]
+) -> list[tuple[int, datetime | None]]:
+    """``(version, changed_at)`` of each of ``table_names``, in order, with one lookup."""
+    rows = db.execute(
+        select(DataVersion.table_name, DataVersion.version, DataVersion.changed_at).where(
+            DataVersion.table_name.in_(table_names)
+        )
+    ).all()
+    versions = {row.table_name: (row.version, row.changed_at) for row in rows}
+    return [versions.get(table_name, (0, None)) for table_name in table_names]
+
+
+def data_version_etag(db: Session, request: Request, table_names: Sequence[str]) -> str:
+    """Strong ETag for a list built from ``table_names`` with this request's query."""
+    return make_etag(
+        request.url.path,
+        request.url.query,
+        db.info.get("tenant_schema", UNKNOWN_TENANT),
+        *read_data_versions(db, table_names),
+    )
+
+
+def conditional_list_response(
+    db: Session,
+    request: Request,
+    response: Response,
+    table_names: Sequence[str],
+) -> Response | None:
+    """304 response when the client's copy is current; otherwise tag ``response``."""
+    etag = data_version_etag(db, request, table_names)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+    return None
+
+
+def _moves_version(session: Session, instance, columns: tuple[str, ...]) -> bool:
+    if instance in session.new or instance in session.deleted:
+        return True
+    state = inspect(instance)
+    return any(state.attrs[name].history.has_changes() for name in columns)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session: Session, _flush_context) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        columns = _TRACKED_COLUMNS.get(type(instance))
+        if columns is not None and _moves_version(session, instance, columns):
+            bump_data_version_on_commit(session, instance.__tablename__)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_tables_before_commit(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    session.flush()
+    table_names = session.info.pop(_PENDING_KEY, None)
+    if table_names:
+        bump_data_version(session, *sorted(table_names))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changed_tables_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,199 @@
+"""Report filter options: typeahead lookups and data-version caching.
+
+Large option sets (products, parties, batches) are searched a page at a time
+through :func:`search_filter_options`, which filters on the trigram-indexed
+search documents and pages on ``(name, id)`` with the shared keyset cursor.
+The fixed option payloads are versioned by :func:`filter_options_etag` from the
+``data_versions`` rows of the tables they are built from, so an unchanged
+tenant can be answered with 304 and a changed one is rebuilt once per version
+rather than on every screen open.
+"""
+
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any, Literal, TypeVar
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.http_cache import make_etag
+from app.core.metrics import UNKNOWN_TENANT
+from app.models.batch import Batch
+from app.models.party import Party
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+from app.services.data_versions import read_data_versions
+from app.services.pagination import fetch_keyset_page
+from app.services.search import (
+    TextSearch,
+    batch_search_document,
+    build_text_search,
+    party_search_document,
+    product_search_document,
+)
+
+FilterOptionKind = Literal[
+    "products", "suppliers", "warehouses", "brands", "categories", "batches", "states", "cities"
+]
+
+DEFAULT_OPTION_LIMIT = 20
+MAX_OPTION_LIMIT = 100
+
+PayloadT = TypeVar("PayloadT")
+
+_payload_cache: dict[tuple[str, str], tuple[str, Any]] = {}
+_payload_cache_lock = threading.Lock()
+
+
+def filter_options_etag(db: Session, name: str, sources: Sequence[str]) -> str:
+    """Strong ETag for the ``name`` payload built from the ``sources`` tables."""
+    tenant = db.info.get("tenant_schema", UNKNOWN_TENANT)
+    return make_etag(name, tenant, *read_data_versions(db, sources))
+
+
+def cached_filter_options(
+    db: Session,
+    name: str,
+    etag: str,
+    build: Callable[[], PayloadT],
+) -> PayloadT:
+    key = (db.info.get("tenant_schema", UNKNOWN_TENANT), name)
+    cached = _payload_cache.get(key)
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+    payload = build()
+    with _payload_cache_lock:
+        _payload_cache[key] = (etag, payload)
+    return payload
+
+
+def _entity_options(
+    db: Session,
+    stmt,
+    *,
+    id_column: ColumnElement[int],
+    name_column: ColumnElement[str],
+    sku_column: ColumnElement[str] | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    columns = {"id": id_column, "name": name_column}
+    if sku_column is not None:
+        columns["sku"] = sku_column
+    rows, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns=columns,
+        fields=list(columns),
+        sort_keys=[name_column, id_column],
+        descending=False,
+        cursor=cursor,
+        limit=limit,
+    )
+    items = [
+        {
+            "id": row["id"],
+            "label": f"{row['name']} ({row['sku']})" if sku_column is not None else row["name"],
+        }
+        for row in rows
+    ]
+    return items, next_cursor
+
+
+def _value_options(
+    db: Session,
+    stmt,
+    column: ColumnElement[str],
+    *,
+    text_search: TextSearch | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    stmt = stmt.where(column.isnot(None)).where(column != "").distinct()
+    if text_search is not None:
+        stmt = stmt.where(text_search.matches(func.lower(column)))
+    rows, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns={"value": column},
+        fields=["value"],
+        sort_keys=[column],
+        descending=False,
+        cursor=cursor,
+        limit=limit,
+    )
+    return [{"value": row["value"], "label": row["value"]} for row in rows], next_cursor
+
+
+def search_filter_options(
+    db: Session,
+    kind: FilterOptionKind,
+    *,
+    q: str | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    text_search = build_text_search(db, q)
+
+    if kind == "products":
+        stmt = select().select_from(Product)
+        if text_search is not None:
+            stmt = stmt.where(text_search.matches(product_search_document()))
+        return _entity_options(
+            db,
+            stmt,
+            id_column=Product.id,
+            name_column=Product.name,
+            sku_column=Product.sku,
+            cursor=cursor,
+            limit=limit,
+        )
+    if kind == "suppliers":
+        stmt = select().select_from(Party)
+        if text_search is not None:
+            stmt = stmt.where(text_search.matches(party_search_document()))
+        return _entity_options(
+            db,
+            stmt,
+            id_column=Party.id,
+            name_column=Party.name,
+            sku_column=None,
+            cursor=cursor,
+            limit=limit,
+        )
+    if kind == "warehouses":
+        stmt = select().select_from(Warehouse)
+        if text_search is not None:
+            stmt = stmt.where(text_search.matches(func.lower(Warehouse.name)))
+        return _entity_options(
+            db,
+            stmt,
+            id_column=Warehouse.id,
+            name_column=Warehouse.name,
+            sku_column=None,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    stmt = select()
+    if kind == "batches":
+        stmt = stmt.select_from(Batch)
+        column: ColumnElement[str] = Batch.batch_no
+        if text_search is not None:
+            stmt = stmt.where(text_search.matches(batch_search_document()))
+    elif kind in ("brands", "categories"):
+        stmt = stmt.select_from(Product)
+        column = Product.brand if kind == "brands" else Product.hsn
+        if text_search is not None and kind == "brands":
+            # Brand is part of the indexed product document; matching it first
+            # narrows the scan to candidate products before the exact check.
+            stmt = stmt.where(text_search.matches(product_search_document()))
+    else:
+        stmt = stmt.select_from(Party)
+        column = Party.state if kind == "states" else Party.city
+        if text_search is not None and kind == "cities":
+            stmt = stmt.where(text_search.matches(party_search_document()))
+    return _value_options(
+        db, stmt, column, text_search=text_search, cursor=cursor, limit=limit
+    )
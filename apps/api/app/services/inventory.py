@@ -1,15 +1,29 @@
+import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Literal
 
-from sqlalchemy import select
+from sqlalchemy import Integer, column, func, literal, select, tuple_, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.models.batch import Batch
 from app.models.enums import InventoryReason, InventoryTxnType
 from app.models.inventory import InventoryLedger, StockSummary
 from app.models.product import Product
 from app.models.warehouse import Warehouse
+from app.services.dashboard import record_stock_movement
+from app.services.data_quality import note_inserted_records
+
+settings = get_settings()
+
+StockKey = tuple[int, int, int]
+StockLockMode = Literal["wait", "nowait", "skip_locked"]
+_LOCK_NOT_AVAILABLE = "55P03"
 
 
 class InventoryError(AppException):
@@ -22,6 +36,21 @@ class InventoryResult:
     summary: StockSummary
 
 
+@dataclass(frozen=True)
+class StockMovement:
+    warehouse_id: int
+    product_id: int
+    batch_id: int
+    qty: Decimal
+    unit_cost: Decimal | None = None
+    # Overrides the posting's ref_id on this movement's ledger row.
+    ref_id: str | None = None
+
+    @property
+    def key(self) -> StockKey:
+        return (self.warehouse_id, self.product_id, self.batch_id)
+
+
 def _as_decimal(value: Decimal | float | int) -> Decimal:
     return Decimal(str(value))
 
@@ -30,23 +59,6 @@ def _raise_inventory_error(*, error_code: str, message: str, status_code: int =
     raise InventoryError(error_code=error_code, message=message, status_code=status_code)
 
 
-def _load_summary_for_update(
-    db: Session,
-    *,
-    warehouse_id: int,
-    product_id: int,
-    batch_id: int,
-) -> StockSummary | None:
-    stmt = (
-        select(StockSummary)
-        .where(StockSummary.warehouse_id == warehouse_id)
-        .where(StockSummary.product_id == product_id)
-        .where(StockSummary.batch_id == batch_id)
-        .with_for_update()
-    )
-    return db.execute(stmt).scalar_one_or_none()
-
-
 def _ensure_valid_refs(db: Session, *, warehouse_id: int, product_id: int, batch_id: int) -> None:
     warehouse = db.get(Warehouse, warehouse_id)
     if not warehouse:
@@ -112,77 +124,331 @@ def _create_ledger(
     return ledger
 
 
-def stock_in(
+def _record_dashboard_movement(
     db: Session,
     *,
-    warehouse_id: int,
-    product_id: int,
-    batch_id: int,
-    qty: Decimal,
+    summary: StockSummary,
+    qty_before: Decimal,
+    ledger: InventoryLedger,
+) -> None:
+    batch = db.get(Batch, ledger.batch_id)
+    record_stock_movement(
+        db,
+        qty_before=qty_before,
+        qty_after=_as_decimal(summary.qty_on_hand),
+        value_delta=ledger.qty * (ledger.unit_cost or Decimal("0")),
+        expiry_date=batch.expiry_date if batch else None,
+    )
+
+
+def _load_movement_batches(db: Session, movements: Sequence[StockMovement]) -> dict[int, Batch]:
+    """:func:`_ensure_valid_refs` for every movement, with one query per master."""
+    warehouse_ids = set(
+        db.scalars(
+            select(Warehouse.id).where(Warehouse.id.in_({m.warehouse_id for m in movements}))
+        )
+    )
+    product_ids = set(
+        db.scalars(select(Product.id).where(Product.id.in_({m.product_id for m in movements})))
+    )
+    batches = {
+        batch.id: batch
+        for batch in db.scalars(
+            select(Batch).where(Batch.id.in_({m.batch_id for m in movements}))
+        )
+    }
+    for movement in movements:
+        if movement.warehouse_id not in warehouse_ids:
+            _raise_inventory_error(
+                error_code="NOT_FOUND",
+                message="Warehouse not found",
+                status_code=404,
+            )
+        if movement.product_id not in product_ids:
+            _raise_inventory_error(
+                error_code="NOT_FOUND",
+                message="Product not found",
+                status_code=404,
+            )
+        batch = batches.get(movement.batch_id)
+        if not batch:
+            _raise_inventory_error(
+                error_code="NOT_FOUND",
+                message="Batch not found",
+                status_code=404,
+            )
+        if batch.product_id != movement.product_id:
+            _raise_inventory_error(
+                error_code="INVALID_STATE",
+                message="Batch does not belong to the selected product",
+                status_code=400,
+            )
+    return batches
+
+
+class _StockBusyError(Exception):
+    pass
+
+
+def _key_filter(keys: Sequence[StockKey]):
+    return tuple_(StockSummary.warehouse_id, StockSummary.product_id, StockSummary.batch_id).in_(
+        keys
+    )
+
+
+def _create_summaries(db: Session, keys: Sequence[StockKey]) -> None:
+    # Inserted in key order too: ON CONFLICT skips positions that exist and
+    # waits on one that another posting is still creating, like a row lock.
+    wanted = values(
+        column("warehouse_id", Integer),
+        column("product_id", Integer),
+        column("batch_id", Integer),
+        name="wanted",
+    ).data(list(keys))
+    created_ids = db.scalars(
+        pg_insert(StockSummary)
+        .from_select(
+            ["warehouse_id", "product_id", "batch_id", "qty_on_hand", "expiry_date"],
+            select(
+                wanted.c.warehouse_id,
+                wanted.c.product_id,
+                wanted.c.batch_id,
+                literal(Decimal("0")),
+                Batch.expiry_date,
+            )
+            .join(Batch, Batch.id == wanted.c.batch_id)
+            .order_by(wanted.c.warehouse_id, wanted.c.product_id, wanted.c.batch_id),
+        )
+        .on_conflict_do_nothing(constraint="uq_stock_summary_wh_product_batch")
+        .returning(StockSummary.id)
+    ).all()
+    if created_ids:
+        note_inserted_records(db, StockSummary, created_ids)
+
+
+def _select_summaries(
+    db: Session, keys: Sequence[StockKey], mode: StockLockMode
+) -> dict[StockKey, StockSummary]:
+    stmt = (
+        select(StockSummary)
+        .where(_key_filter(keys))
+        .order_by(StockSummary.warehouse_id, StockSummary.product_id, StockSummary.batch_id)
+        .with_for_update(nowait=mode == "nowait", skip_locked=mode == "skip_locked")
+        # A position read earlier in this session must not keep its stale quantity.
+        .execution_options(populate_existing=True)
+    )
+    summaries = {
+        (summary.warehouse_id, summary.product_id, summary.batch_id): summary
+        for summary in db.scalars(stmt)
+    }
+    if mode == "skip_locked":
+        existing = db.scalar(select(func.count()).select_from(StockSummary).where(_key_filter(keys)))
+        if len(summaries) < existing:
+            raise _StockBusyError
+    return summaries
+
+
+def lock_stock(
+    db: Session,
+    keys: Iterable[StockKey],
+    *,
+    create: Iterable[StockKey] = (),
+    mode: StockLockMode | None = None,
+) -> dict[StockKey, StockSummary]:
+    """Lock every stock position a posting touches, in one canonical order.
+
+    Locking line by line, in document order, lets two postings that share
+    positions each hold one the other needs. Here every ``(warehouse, product,
+    batch)`` key is locked up front, sorted, so postings only ever queue behind
+    one another. Positions in ``create`` are first inserted, also sorted, if
+    they do not exist; the result maps each existing key to its locked row.
+
+    ``mode`` (default ``settings.stock_lock_mode``) chooses what happens when a
+    position is already locked: ``"wait"`` queues for it, while ``"nowait"``
+    and ``"skip_locked"`` give up at once, back off exponentially from
+    ``settings.stock_lock_backoff_seconds`` and try again, up to
+    ``settings.stock_lock_attempts`` times before answering 503 STOCK_BUSY.
+    Re-locking positions this transaction already holds never waits, so a
+    document may call this once for all of its lines and post them afterwards
+    in as many steps as it likes.
+    """
+    to_create = sorted(set(create))
+    ordered = sorted(set(keys) | set(to_create))
+    if not ordered:
+        return {}
+    if to_create:
+        _create_summaries(db, to_create)
+
+    mode = mode or settings.stock_lock_mode
+    if mode == "wait":
+        return _select_summaries(db, ordered, mode)
+
+    attempts = max(1, settings.stock_lock_attempts)
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(settings.stock_lock_backoff_seconds * 2 ** (attempt - 1))
+        try:
+            # A savepoint, so that a failed attempt releases whatever it locked.
+            with db.begin_nested():
+                return _select_summaries(db, ordered, mode)
+        except _StockBusyError:
+            continue
+        except OperationalError as error:
+            if getattr(error.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+    raise InventoryError(
+        error_code="STOCK_BUSY",
+        message="Stock is being posted by another document; please retry shortly",
+        status_code=503,
+    )
+
+
+def _post_movements(
+    db: Session,
+    movements: Sequence[StockMovement],
+    *,
+    txn_type: InventoryTxnType,
     reason: InventoryReason,
     created_by: int,
-    unit_cost: Decimal | None = None,
-    ref_type: str | None = None,
-    ref_id: str | None = None,
-    commit: bool = True,
-) -> InventoryResult:
-    qty_dec = _as_decimal(qty)
-    if qty_dec <= 0:
+    ref_type: str | None,
+    ref_id: str | None,
+) -> list[InventoryResult]:
+    quantities = [_as_decimal(movement.qty) for movement in movements]
+    if any(qty <= 0 for qty in quantities):
         _raise_inventory_error(
             error_code="INVALID_QUANTITY",
             message="Quantity must be greater than zero",
         )
+    if not movements:
+        return []
+
+    batches = _load_movement_batches(db, movements)
+    keys = {movement.key for movement in movements}
+    summaries = lock_stock(db, keys, create=keys if txn_type == InventoryTxnType.IN else ())
+
+    results: list[InventoryResult] = []
+    for movement, qty in zip(movements, quantities, strict=True):
+        summary = summaries.get(movement.key)
+        qty_before = _as_decimal(summary.qty_on_hand) if summary else Decimal("0")
+        if txn_type == InventoryTxnType.OUT:
+            if qty_before < qty:
+                _raise_inventory_error(
+                    error_code="INSUFFICIENT_STOCK",
+                    message="Insufficient stock for stock out",
+                )
+            qty = -qty
+        summary.qty_on_hand = qty_before + qty
 
-    try:
-        _ensure_valid_refs(db, warehouse_id=warehouse_id, product_id=product_id, batch_id=batch_id)
-
-        summary = _load_summary_for_update(
+        # InventoryLedger is immutable by design: insert-only, never updated or deleted.
+        ledger = InventoryLedger(
+            txn_type=txn_type,
+            reason=reason,
+            warehouse_id=movement.warehouse_id,
+            product_id=movement.product_id,
+            batch_id=movement.batch_id,
+            qty=qty,
+            unit_cost=_as_decimal(movement.unit_cost) if movement.unit_cost is not None else None,
+            created_by=created_by,
+            ref_type=ref_type,
+            ref_id=movement.ref_id or ref_id,
+        )
+        db.add(ledger)
+        record_stock_movement(
             db,
-            warehouse_id=warehouse_id,
-            product_id=product_id,
-            batch_id=batch_id,
+            qty_before=qty_before,
+            qty_after=_as_decimal(summary.qty_on_hand),
+            value_delta=qty * (ledger.unit_cost or Decimal("0")),
+            expiry_date=batches[movement.batch_id].expiry_date,
         )
-        if not summary:
-            summary = StockSummary(
-                warehouse_id=warehouse_id,
-                product_id=product_id,
-                batch_id=batch_id,
-                qty_on_hand=Decimal("0"),
-            )
-            db.add(summary)
-            db.flush()
+        results.append(InventoryResult(ledger=ledger, summary=summary))
+    # The ledger inserts and summary updates go out as one batch each.
+    db.flush()
+    return results
 
-        summary.qty_on_hand = _as_decimal(summary.qty_on_hand) + qty_dec
 
-        ledger = _create_ledger(
+def stock_in_many(
+    db: Session,
+    movements: Sequence[StockMovement],
+    *,
+    reason: InventoryReason,
+    created_by: int,
+    ref_type: str | None = None,
+    ref_id: str | None = None,
+) -> list[InventoryResult]:
+    """:func:`stock_in` for every movement in a fixed number of statements.
+
+    The caller commits.
+    """
+    return _post_movements(
+        db,
+        movements,
+        txn_type=InventoryTxnType.IN,
+        reason=reason,
+        created_by=created_by,
+        ref_type=ref_type,
+        ref_id=ref_id,
+    )
+
+
+def stock_out_many(
+    db: Session,
+    movements: Sequence[StockMovement],
+    *,
+    reason: InventoryReason,
+    created_by: int,
+    ref_type: str | None = None,
+    ref_id: str | None = None,
+) -> list[InventoryResult]:
+    """:func:`stock_out` for every movement in a fixed number of statements.
+
+    The caller commits.
+    """
+    return _post_movements(
+        db,
+        movements,
+        txn_type=InventoryTxnType.OUT,
+        reason=reason,
+        created_by=created_by,
+        ref_type=ref_type,
+        ref_id=ref_id,
+    )
+
+
+def _post_single_movement(
+    db: Session,
+    movement: StockMovement,
+    *,
+    txn_type: InventoryTxnType,
+    reason: InventoryReason,
+    created_by: int,
+    ref_type: str | None,
+    ref_id: str | None,
+    commit: bool,
+) -> InventoryResult:
+    try:
+        [result] = _post_movements(
             db,
-            txn_type=InventoryTxnType.IN,
+            [movement],
+            txn_type=txn_type,
             reason=reason,
-            warehouse_id=warehouse_id,
-            product_id=product_id,
-            batch_id=batch_id,
-            qty=qty_dec,
-            unit_cost=_as_decimal(unit_cost) if unit_cost is not None else None,
             created_by=created_by,
             ref_type=ref_type,
             ref_id=ref_id,
         )
         if commit:
             db.commit()
-        else:
-            db.flush()
     except Exception:
         if commit:
             db.rollback()
         raise
 
     if commit:
-        db.refresh(ledger)
-        db.refresh(summary)
-    return InventoryResult(ledger=ledger, summary=summary)
+        db.refresh(result.ledger)
+        db.refresh(result.summary)
+    return result
 
 
-def stock_out(
+def stock_in(
     db: Session,
     *,
     warehouse_id: int,
@@ -196,58 +462,42 @@ def stock_out(
     ref_id: str | None = None,
     commit: bool = True,
 ) -> InventoryResult:
-    qty_dec = _as_decimal(qty)
-    if qty_dec <= 0:
-        _raise_inventory_error(
-            error_code="INVALID_QUANTITY",
-            message="Quantity must be greater than zero",
-        )
-
-    try:
-        _ensure_valid_refs(db, warehouse_id=warehouse_id, product_id=product_id, batch_id=batch_id)
-
-        summary = _load_summary_for_update(
-            db,
-            warehouse_id=warehouse_id,
-            product_id=product_id,
-            batch_id=batch_id,
-        )
-
-        available = _as_decimal(summary.qty_on_hand) if summary else Decimal("0")
-        if available < qty_dec:
-            _raise_inventory_error(
-                error_code="INSUFFICIENT_STOCK",
-                message="Insufficient stock for stock out",
-            )
-
-        summary.qty_on_hand = available - qty_dec
+    return _post_single_movement(
+        db,
+        StockMovement(warehouse_id, product_id, batch_id, qty, unit_cost),
+        txn_type=InventoryTxnType.IN,
+        reason=reason,
+        created_by=created_by,
+        ref_type=ref_type,
+        ref_id=ref_id,
+        commit=commit,
+    )
 
-        ledger = _create_ledger(
-            db,
-            txn_type=InventoryTxnType.OUT,
-            reason=reason,
-            warehouse_id=warehouse_id,
-            product_id=product_id,
-            batch_id=batch_id,
-            qty=-qty_dec,
-            unit_cost=_as_decimal(unit_cost) if unit_cost is not None else None,
-            created_by=created_by,
-            ref_type=ref_type,
-            ref_id=ref_id,
-        )
-        if commit:
-            db.commit()
-        else:
-            db.flush()
-    except Exception:
-        if commit:
-            db.rollback()
-        raise
 
-    if commit:
-        db.refresh(ledger)
-        db.refresh(summary)
-    return InventoryResult(ledger=ledger, summary=summary)
+def stock_out(
+    db: Session,
+    *,
+    warehouse_id: int,
+    product_id: int,
+    batch_id: int,
+    qty: Decimal,
+    reason: InventoryReason,
+    created_by: int,
+    unit_cost: Decimal | None = None,
+    ref_type: str | None = None,
+    ref_id: str | None = None,
+    commit: bool = True,
+) -> InventoryResult:
+    return _post_single_movement(
+        db,
+        StockMovement(warehouse_id, product_id, batch_id, qty, unit_cost),
+        txn_type=InventoryTxnType.OUT,
+        reason=reason,
+        created_by=created_by,
+        ref_type=ref_type,
+        ref_id=ref_id,
+        commit=commit,
+    )
 
 
 def stock_adjust(
@@ -271,29 +521,16 @@ def stock_adjust(
     try:
         _ensure_valid_refs(db, warehouse_id=warehouse_id, product_id=product_id, batch_id=batch_id)
 
-        summary = _load_summary_for_update(
-            db,
-            warehouse_id=warehouse_id,
-            product_id=product_id,
-            batch_id=batch_id,
-        )
-
+        key = (warehouse_id, product_id, batch_id)
+        summary = lock_stock(db, {key}, create={key} if delta_dec > 0 else ()).get(key)
         if not summary:
-            if delta_dec < 0:
-                _raise_inventory_error(
-                    error_code="INSUFFICIENT_STOCK",
-                    message="Insufficient stock for negative adjustment",
-                )
-            summary = StockSummary(
-                warehouse_id=warehouse_id,
-                product_id=product_id,
-                batch_id=batch_id,
-                qty_on_hand=Decimal("0"),
+            _raise_inventory_error(
+                error_code="INSUFFICIENT_STOCK",
+                message="Insufficient stock for negative adjustment",
             )
-            db.add(summary)
-            db.flush()
 
-        new_qty = _as_decimal(summary.qty_on_hand) + delta_dec
+        qty_before = _as_decimal(summary.qty_on_hand)
+        new_qty = qty_before + delta_dec
         if new_qty < 0:
             _raise_inventory_error(
                 error_code="INSUFFICIENT_STOCK",
@@ -315,6 +552,7 @@ def stock_adjust(
             ref_type=None,
             ref_id=None,
         )
+        _record_dashboard_movement(db, summary=summary, qty_before=qty_before, ledger=ledger)
         if commit:
             db.commit()
         else:
@@ -0,0 +1,116 @@
+"""Synchronise a document's lines with the lines sent in an edit.
+
+Editing a draft sends the whole document back. Instead of clearing the line
+collection and inserting every line again, :func:`sync_lines` pairs each
+incoming row with an existing line, first by ``id`` when the client sent one
+and then by the line's natural key (first come, first served), and changes
+only what differs:
+
+* matched lines get the columns whose value changed, so an untouched line
+  costs nothing and an edited one a single narrow UPDATE;
+* unmatched rows become new lines, which the unit of work inserts in one
+  batch;
+* unmatched lines are removed from the collection, and the ``delete-orphan``
+  cascade deletes them in one batch.
+
+Line ids therefore survive an edit, along with anything that references them.
+"""
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from app.core.exceptions import AppException
+
+L = TypeVar("L")
+
+
+@dataclass
+class LineChanges(Generic[L]):
+    # One line per incoming row, in the order the rows were given.
+    lines: list[L] = field(default_factory=list)
+    created: list[L] = field(default_factory=list)
+    updated: list[L] = field(default_factory=list)
+    deleted: list[L] = field(default_factory=list)
+
+
+def _natural_key(source: Any, columns: tuple[str, ...]) -> Hashable:
+    if isinstance(source, Mapping):
+        return tuple(source.get(column) for column in columns)
+    return tuple(getattr(source, column) for column in columns)
+
+
+def _match_lines(
+    collection: Sequence[L],
+    rows: Sequence[Mapping[str, Any]],
+    natural_key: tuple[str, ...],
+) -> list[L | None]:
+    by_id = {line.id: line for line in collection if getattr(line, "id", None) is not None}
+    matches: list[L | None] = [None] * len(rows)
+    claimed: set[int] = set()
+    for index, row in enumerate(rows):
+        line_id = row.get("id")
+        if line_id is None:
+            continue
+        line = by_id.get(line_id)
+        if line is None or line_id in claimed:
+            raise AppException(
+                error_code="VALIDATION_ERROR",
+                message=f"Line {line_id} does not belong to this document",
+                status_code=400,
+                details={"line_id": line_id},
+            )
+        matches[index] = line
+        claimed.add(line_id)
+
+    unclaimed: dict[Hashable, deque[L]] = defaultdict(deque)
+    for line in collection:
+        if getattr(line, "id", None) not in claimed:
+            unclaimed[_natural_key(line, natural_key)].append(line)
+    for index, row in enumerate(rows):
+        if matches[index] is None and row.get("id") is None:
+            candidates = unclaimed.get(_natural_key(row, natural_key))
+            if candidates:
+                matches[index] = candidates.popleft()
+    return matches
+
+
+def sync_lines(
+    collection: list[L],
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    create: Callable[..., L],
+    natural_key: tuple[str, ...],
+) -> LineChanges[L]:
+    """Make ``collection`` hold one line per row of column values.
+
+    A row may carry the ``id`` of the line it edits; ``create`` builds a new
+    line from a row's columns (``id`` excluded). Columns missing from a row
+    are left as they are on matched lines.
+    """
+    changes: LineChanges[L] = LineChanges()
+    matches = _match_lines(collection, rows, natural_key)
+    kept = {id(line) for line in matches if line is not None}
+
+    for line in list(collection):
+        if id(line) not in kept:
+            collection.remove(line)
+            changes.deleted.append(line)
+
+    for row, line in zip(rows, matches, strict=True):
+        values = {column: value for column, value in row.items() if column != "id"}
+        if line is None:
+            line = create(**values)
+            collection.append(line)
+            changes.created.append(line)
+        else:
+            changed = {
+                column: value for column, value in values.items() if getattr(line, column) != value
+            }
+            for column, value in changed.items():
+                setattr(line, column, value)
+            if changed:
+                changes.updated.append(line)
+        changes.lines.append(line)
+    return changes
@@ -0,0 +1,122 @@
+"""Keyset pagination and sparse field projection for summary list endpoints.
+
+Summary lists select plain columns (no relationship graphs or line items) and
+page on their sort key plus ``id`` instead of OFFSET, so every page costs the
+same and rows created while a user scrolls do not shift later pages. The
+cursor is an opaque token holding the last row's sort-key values.
+"""
+
+import base64
+import json
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.exceptions import AppException
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+def parse_fields(fields: str | None, available: Sequence[str]) -> list[str]:
+    """Resolve a comma separated ``fields=`` value; ``id`` is always returned."""
+    if fields is None or not fields.strip():
+        return list(available)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested.difference(available))
+    if unknown:
+        raise AppException(
+            error_code="VALIDATION_ERROR",
+            message=f"Unknown fields: {', '.join(unknown)}",
+            status_code=400,
+            details={"field": "fields", "allowed": list(available)},
+        )
+    requested.add("id")
+    return [name for name in available if name in requested]
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_cursor_value(key: ColumnElement[Any], value: Any) -> Any:
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if not isinstance(value, python_type) or isinstance(value, bool):
+        raise TypeError(f"Expected {python_type.__name__} cursor value")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_cursor_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_keys: Sequence[ColumnElement[Any]]) -> list[Any]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list) or len(values) != len(sort_keys):
+            raise ValueError("Cursor does not match this list")
+        return [_decode_cursor_value(key, value) for key, value in zip(sort_keys, values, strict=True)]
+    except (ValueError, TypeError) as error:
+        raise AppException(
+            error_code="INVALID_CURSOR",
+            message="Invalid pagination cursor",
+            status_code=400,
+            details={"field": "cursor"},
+        ) from error
+
+
+def fetch_keyset_page(
+    db: Session,
+    stmt: Select[Any],
+    *,
+    columns: Mapping[str, ColumnElement[Any]],
+    fields: Sequence[str],
+    sort_keys: Sequence[ColumnElement[Any]],
+    descending: bool,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Fetch one page of ``fields`` from ``stmt`` (FROM/JOIN/WHERE only, no columns).
+
+    ``sort_keys`` must be non-null and end with a unique column (normally ``id``)
+    so the row-value comparison against the cursor is a strict total order.
+    """
+    if cursor:
+        after = decode_cursor(cursor, sort_keys)
+        position = tuple_(*sort_keys)
+        bound = tuple_(*(literal(value, key.type) for key, value in zip(sort_keys, after, strict=True)))
+        stmt = stmt.where(position < bound if descending else position > bound)
+
+    sort_labels = [f"_sort_{index}" for index in range(len(sort_keys))]
+    stmt = (
+        stmt.add_columns(
+            *(columns[name].label(name) for name in fields),
+            *(key.label(label) for key, label in zip(sort_keys, sort_labels, strict=True)),
+        )
+        .order_by(*(key.desc() if descending else key.asc() for key in sort_keys))
+        .limit(limit + 1)
+    )
+    rows = db.execute(stmt).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1][label] for label in sort_labels])
+    return [{name: row[name] for name in fields} for row in rows], next_cursor
@@ -0,0 +1,197 @@
+"""Fiscal-year close: carry-forward checkpoints plus ledger archival.
+
+:func:`close_fiscal_year` runs in one transaction:
+
+1. Locks ``inventory_ledger`` against writers and checks that checkpoints plus
+   the live ledger agree with ``stock_summary`` for every bucket.
+2. Folds every live ledger row before the cutoff (midnight UTC after the
+   fiscal year end) into ``inventory_checkpoints``, one row per (warehouse,
+   product, batch, opening flag), on top of earlier closes.
+3. Moves those rows to ``inventory_ledger_archive`` by re-attaching their
+   monthly partitions.
+4. Runs the balance check again; a difference raises and the whole close,
+   DDL included, rolls back.
+
+Reports combine the checkpoints with the live ledger through
+:mod:`app.reports.ledger_sources`.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi import status
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import AppException
+from app.core.partitions import archive_months_before, is_partitioned, utc_day_start
+from app.models.inventory import InventoryLedger, StockSummary
+from app.models.period_close import InventoryCheckpoint, InventoryPeriodClose
+from app.reports.ledger_sources import latest_ledger_cutoff, stock_position_rows
+from app.reports.predicates import opening_entry_predicate
+
+
+def stock_balance_mismatches(db: Session, *, limit: int = 50) -> list[dict[str, object]]:
+    """Buckets whose checkpoint-plus-ledger total differs from ``stock_summary``."""
+    positions = stock_position_rows()
+    ledger_totals = (
+        select(
+            positions.c.warehouse_id,
+            positions.c.product_id,
+            positions.c.batch_id,
+            func.sum(positions.c.qty).label("ledger_qty"),
+        )
+        .group_by(positions.c.warehouse_id, positions.c.product_id, positions.c.batch_id)
+        .subquery()
+    )
+    ledger_qty = func.coalesce(ledger_totals.c.ledger_qty, Decimal("0"))
+    summary_qty = func.coalesce(StockSummary.qty_on_hand, Decimal("0"))
+    rows = db.execute(
+        select(
+            func.coalesce(ledger_totals.c.warehouse_id, StockSummary.warehouse_id).label(
+                "warehouse_id"
+            ),
+            func.coalesce(ledger_totals.c.product_id, StockSummary.product_id).label("product_id"),
+            func.coalesce(ledger_totals.c.batch_id, StockSummary.batch_id).label("batch_id"),
+            ledger_qty.label("ledger_qty"),
+            summary_qty.label("summary_qty"),
+        )
+        .select_from(ledger_totals)
+        .outerjoin(
+            StockSummary,
+            and_(
+                StockSummary.warehouse_id == ledger_totals.c.warehouse_id,
+                StockSummary.product_id == ledger_totals.c.product_id,
+                StockSummary.batch_id == ledger_totals.c.batch_id,
+            ),
+            full=True,
+        )
+        .where(ledger_qty != summary_qty)
+        .order_by("warehouse_id", "product_id", "batch_id")
+        .limit(limit)
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+def _raise_on_mismatch(db: Session, stage: str) -> None:
+    mismatches = stock_balance_mismatches(db, limit=5)
+    if mismatches:
+        raise AppException(
+            error_code="STOCK_BALANCE_MISMATCH",
+            message=f"Ledger balances do not match stock summary {stage} the close",
+            status_code=status.HTTP_409_CONFLICT,
+            details={"mismatches": mismatches},
+        )
+
+
+def _validate_cutoff(db: Session, fiscal_year_end: date) -> date:
+    cutoff = fiscal_year_end + timedelta(days=1)
+    if cutoff.day != 1:
+        raise AppException(
+            error_code="VALIDATION_ERROR",
+            message="A fiscal year must end on the last day of a month",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if cutoff > date.today().replace(day=1):
+        raise AppException(
+            error_code="VALIDATION_ERROR",
+            message="Only fiscal years that ended before the current month can be closed",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    latest = latest_ledger_cutoff(db)
+    if latest is not None and utc_day_start(cutoff) <= latest:
+        raise AppException(
+            error_code="PERIOD_ALREADY_CLOSED",
+            message=f"Stock is already closed through {(latest.date() - timedelta(days=1))}",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    if not is_partitioned(db, "inventory_ledger"):
+        raise AppException(
+            error_code="LEDGER_NOT_PARTITIONED",
+            message="Run the database migrations before closing a fiscal year",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    return cutoff
+
+
+def _fold_into_checkpoints(db: Session, *, cutoff_at, fiscal_year_end: date) -> int:
+    is_opening = opening_entry_predicate()
+    closed_rows = (
+        select(
+            InventoryLedger.warehouse_id,
+            InventoryLedger.product_id,
+            InventoryLedger.batch_id,
+            is_opening,
+            func.sum(InventoryLedger.qty),
+            func.sum(InventoryLedger.qty * func.coalesce(InventoryLedger.unit_cost, Decimal("0"))),
+            func.max(InventoryLedger.created_at),
+            func.cast(fiscal_year_end, InventoryCheckpoint.closed_through.type),
+        )
+        .where(InventoryLedger.created_at < cutoff_at)
+        .group_by(
+            InventoryLedger.warehouse_id,
+            InventoryLedger.product_id,
+            InventoryLedger.batch_id,
+            is_opening,
+        )
+    )
+    stmt = insert(InventoryCheckpoint).from_select(
+        [
+            "warehouse_id",
+            "product_id",
+            "batch_id",
+            "is_opening",
+            "qty",
+            "stock_value",
+            "last_movement_at",
+            "closed_through",
+        ],
+        closed_rows,
+    )
+    upserted = db.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_inventory_checkpoints_bucket",
+            set_={
+                "qty": InventoryCheckpoint.qty + stmt.excluded.qty,
+                "stock_value": InventoryCheckpoint.stock_value + stmt.excluded.stock_value,
+                "last_movement_at": func.greatest(
+                    InventoryCheckpoint.last_movement_at, stmt.excluded.last_movement_at
+                ),
+                "closed_through": stmt.excluded.closed_through,
+            },
+        ).returning(InventoryCheckpoint.id)
+    )
+    return len(upserted.all())
+
+
+def close_fiscal_year(db: Session, *, fiscal_year_end: date, closed_by: int) -> InventoryPeriodClose:
+    """Close stock through ``fiscal_year_end``; the caller commits."""
+    cutoff = _validate_cutoff(db, fiscal_year_end)
+    cutoff_at = utc_day_start(cutoff)
+
+    # Writers queue behind the close; readers carry on until the partitions move.
+    db.execute(text("LOCK TABLE inventory_ledger IN EXCLUSIVE MODE"))
+    _raise_on_mismatch(db, "before")
+
+    checkpoint_rows = _fold_into_checkpoints(
+        db, cutoff_at=cutoff_at, fiscal_year_end=fiscal_year_end
+    )
+    archived_rows = archive_months_before(
+        db,
+        table_name="inventory_ledger",
+        archive_table="inventory_ledger_archive",
+        cutoff=cutoff,
+    )
+    _raise_on_mismatch(db, "after")
+
+    period_close = InventoryPeriodClose(
+        fiscal_year_end=fiscal_year_end,
+        cutoff_at=cutoff_at,
+        archived_rows=archived_rows,
+        checkpoint_rows=checkpoint_rows,
+        closed_by=closed_by,
+    )
+    db.add(period_close)
+    db.flush()
+    return period_close
@@ -0,0 +1,186 @@
+"""Line and header amounts for purchase orders, sales orders and purchase bills.
+
+:func:`price_document` prices a whole document in one pass over its lines.
+Every document type rounds at the same points: each line's gross, discount,
+taxable value and tax components are rounded half-up to paise, and the header
+amounts are sums of the rounded line amounts, so a header always equals the
+sum of its lines. The caller loads the products once per document with
+:func:`load_products` and passes each line's GST rate in.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+
+INTRA_STATE = "INTRA_STATE"
+INTER_STATE = "INTER_STATE"
+
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal("100")
+_PAISE = Decimal("0.01")
+
+
+def to_decimal(value: Decimal | float | int | str | None) -> Decimal:
+    if value is None:
+        return Decimal("0")
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def money(value: Decimal | float | int | str | None) -> Decimal:
+    return to_decimal(value).quantize(_PAISE, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True, slots=True)
+class PricingLine:
+    qty: Decimal
+    unit_price: Decimal
+    gst_percent: Decimal = _ZERO
+    discount_percent: Decimal = _ZERO
+    # An explicit discount, as printed on a supplier bill, wins over the percent.
+    discount_amount: Decimal | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LineAmounts:
+    gross: Decimal
+    discount_amount: Decimal
+    taxable_value: Decimal
+    gst_percent: Decimal
+    cgst_percent: Decimal
+    sgst_percent: Decimal
+    igst_percent: Decimal
+    cgst_amount: Decimal
+    sgst_amount: Decimal
+    igst_amount: Decimal
+    tax_amount: Decimal
+    line_total: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentAmounts:
+    lines: list[LineAmounts]
+    subtotal: Decimal
+    discount_amount: Decimal
+    taxable_value: Decimal
+    cgst_amount: Decimal
+    sgst_amount: Decimal
+    igst_amount: Decimal
+    tax_amount: Decimal
+    adjustment: Decimal
+    total: Decimal
+    # The rate shared by every taxed line, or zero when the lines differ.
+    gst_percent: Decimal
+    cgst_percent: Decimal
+    sgst_percent: Decimal
+    igst_percent: Decimal
+
+
+def split_gst(gst_percent: Decimal, tax_type: str | None) -> tuple[Decimal, Decimal, Decimal]:
+    """CGST, SGST and IGST rates for ``gst_percent`` under ``tax_type``.
+
+    Documents without a determined tax type carry no tax.
+    """
+    if gst_percent <= 0:
+        return _ZERO, _ZERO, _ZERO
+    if tax_type == INTRA_STATE:
+        half = money(gst_percent / 2)
+        return half, half, _ZERO
+    if tax_type == INTER_STATE:
+        return _ZERO, _ZERO, gst_percent
+    return _ZERO, _ZERO, _ZERO
+
+
+def document_total(taxable_value: Decimal, *charges: Decimal) -> Decimal:
+    return money(sum(charges, taxable_value))
+
+
+def price_document(
+    lines: Sequence[PricingLine],
+    *,
+    tax_type: str | None = None,
+    adjustment: Decimal = _ZERO,
+) -> DocumentAmounts:
+    # Documents tend to repeat a handful of rates, so split each rate once.
+    splits: dict[Decimal, tuple[Decimal, Decimal, Decimal]] = {}
+    priced: list[LineAmounts] = []
+    subtotal = discount_total = taxable_total = _ZERO
+    cgst_total = sgst_total = igst_total = _ZERO
+    taxed_rates: set[Decimal] = set()
+
+    for line in lines:
+        gross = money(line.qty * line.unit_price)
+        if line.discount_amount is not None:
+            discount = money(line.discount_amount)
+        else:
+            discount = money(gross * line.discount_percent / _HUNDRED)
+        taxable = gross - discount
+
+        gst_percent = line.gst_percent
+        rates = splits.get(gst_percent)
+        if rates is None:
+            rates = splits[gst_percent] = split_gst(gst_percent, tax_type)
+        cgst_percent, sgst_percent, igst_percent = rates
+        cgst = money(taxable * cgst_percent / _HUNDRED) if cgst_percent else _ZERO
+        sgst = money(taxable * sgst_percent / _HUNDRED) if sgst_percent else _ZERO
+        igst = money(taxable * igst_percent / _HUNDRED) if igst_percent else _ZERO
+        tax = cgst + sgst + igst
+
+        priced.append(
+            LineAmounts(
+                gross=gross,
+                discount_amount=discount,
+                taxable_value=taxable,
+                gst_percent=gst_percent,
+                cgst_percent=cgst_percent,
+                sgst_percent=sgst_percent,
+                igst_percent=igst_percent,
+                cgst_amount=cgst,
+                sgst_amount=sgst,
+                igst_amount=igst,
+                tax_amount=tax,
+                line_total=taxable + tax,
+            )
+        )
+        subtotal += gross
+        discount_total += discount
+        taxable_total += taxable
+        cgst_total += cgst
+        sgst_total += sgst
+        igst_total += igst
+        if gst_percent > 0:
+            taxed_rates.add(gst_percent)
+
+    adjustment = money(adjustment)
+    header_gst_percent = next(iter(taxed_rates)) if len(taxed_rates) == 1 else _ZERO
+    header_cgst, header_sgst, header_igst = split_gst(header_gst_percent, tax_type)
+    return DocumentAmounts(
+        lines=priced,
+        subtotal=subtotal,
+        discount_amount=discount_total,
+        taxable_value=taxable_total,
+        cgst_amount=cgst_total,
+        sgst_amount=sgst_total,
+        igst_amount=igst_total,
+        tax_amount=cgst_total + sgst_total + igst_total,
+        adjustment=adjustment,
+        total=document_total(taxable_total, cgst_total, sgst_total, igst_total, adjustment),
+        gst_percent=header_gst_percent,
+        cgst_percent=header_cgst,
+        sgst_percent=header_sgst,
+        igst_percent=header_igst,
+    )
+
+
+def load_products(db: Session, product_ids: Iterable[int]) -> dict[int, Product]:
+    """The products behind a document's lines, loaded with one query."""
+    wanted = set(product_ids)
+    if not wanted:
+        return {}
+    return {product.id: product for product in db.scalars(select(Product).where(Product.id.in_(wanted)))}
@@ -3,10 +3,12 @@ from __future__ import annotations
 import logging
 from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
 from uuid import uuid4
 
 from sqlalchemy import select, text
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.database import set_tenant_search_path
 from app.core.exceptions import AppException
@@ -45,7 +47,12 @@ from app.schemas.purchase import (
     PurchaseOrderUpdate,
 )
 from app.services.audit import snapshot_model, write_audit_log
-from app.services.inventory import stock_in
+from app.services.batches import BatchKey, resolve_batches
+from app.services.dashboard import record_purchase_order_status
+from app.services.inventory import StockMovement, stock_in_many
+from app.services.line_sync import sync_lines
+from app.services.pricing import LineAmounts, PricingLine, load_products, price_document
+from app.services.versioning import bump_version, check_version
 
 logger = logging.getLogger(__name__)
 
@@ -259,18 +266,11 @@ def _calculate_po_financials(
     *,
     payload: PurchaseOrderCreate,
     supplier: Party,
-) -> dict[str, Decimal | str | list[dict[str, Decimal]]]:
+) -> dict[str, Any]:
     discount_percent = _money(payload.discount_percent)
-    adjustment = _money(payload.adjustment)
     fallback_gst_percent = _money(payload.gst_percent)
-    product_ids = {line.product_id for line in payload.lines}
-    products = (
-        db.query(Product)
-        .filter(Product.id.in_(product_ids))
-        .all()
-    )
-    products_by_id = {product.id: product for product in products}
-    line_gst_percents: dict[int, Decimal] = {}
+    products_by_id = load_products(db, (line.product_id for line in payload.lines))
+    line_gst_percents: list[Decimal] = []
 
     for line in payload.lines:
         product = products_by_id.get(line.product_id)
@@ -282,88 +282,30 @@ def _calculate_po_financials(
             )
 
         product_gst_percent = _money(product.gst_rate or Decimal("0.00"))
-        line_gst_percents[line.product_id] = (
+        line_gst_percents.append(
             product_gst_percent if product_gst_percent > 0 else fallback_gst_percent
         )
 
-    requires_tax_context = any(gst_percent > 0 for gst_percent in line_gst_percents.values())
-
     tax_context = _determine_purchase_tax_context(
         db,
         supplier=supplier,
-        requires_tax_context=requires_tax_context,
+        requires_tax_context=any(gst_percent > 0 for gst_percent in line_gst_percents),
+    )
+    amounts = price_document(
+        [
+            PricingLine(
+                qty=_as_decimal(line.ordered_qty),
+                unit_price=_as_decimal(line.unit_cost or Decimal("0")),
+                gst_percent=gst_percent,
+                discount_percent=discount_percent,
+            )
+            for line, gst_percent in zip(payload.lines, line_gst_percents, strict=True)
+        ],
+        tax_type=str(tax_context["tax_type"]),
+        adjustment=payload.adjustment,
     )
 
-    line_financials: list[dict[str, Decimal]] = []
-    subtotal = Decimal("0.00")
-    discount_amount = Decimal("0.00")
-    taxable_value = Decimal("0.00")
-    cgst_amount = Decimal("0.00")
-    sgst_amount = Decimal("0.00")
-    igst_amount = Decimal("0.00")
-    distinct_line_gst_percents: set[Decimal] = set()
-
-    for line in payload.lines:
-        line_gst_percent = line_gst_percents[line.product_id]
-        line_subtotal = _money(
-            _as_decimal(line.ordered_qty) * _as_decimal(line.unit_cost or Decimal("0"))
-        )
-        line_discount_amount = _money((line_subtotal * discount_percent) / Decimal("100"))
-        line_taxable_value = _money(line_subtotal - line_discount_amount)
-        line_cgst_percent = Decimal("0.00")
-        line_sgst_percent = Decimal("0.00")
-        line_igst_percent = Decimal("0.00")
-
-        if line_gst_percent > 0:
-            if str(tax_context["tax_type"]) == "INTRA_STATE":
-                line_cgst_percent = _money(line_gst_percent / Decimal("2"))
-                line_sgst_percent = _money(line_gst_percent / Decimal("2"))
-            elif str(tax_context["tax_type"]) == "INTER_STATE":
-                line_igst_percent = line_gst_percent
-
-        line_cgst_amount = _money((line_taxable_value * line_cgst_percent) / Decimal("100"))
-        line_sgst_amount = _money((line_taxable_value * line_sgst_percent) / Decimal("100"))
-        line_igst_amount = _money((line_taxable_value * line_igst_percent) / Decimal("100"))
-        line_tax_amount = _money(line_cgst_amount + line_sgst_amount + line_igst_amount)
-        line_total = _money(line_taxable_value + line_tax_amount)
-
-        subtotal += line_subtotal
-        discount_amount += line_discount_amount
-        taxable_value += line_taxable_value
-        cgst_amount += line_cgst_amount
-        sgst_amount += line_sgst_amount
-        igst_amount += line_igst_amount
-        if line_gst_percent > 0:
-            distinct_line_gst_percents.add(line_gst_percent)
-        line_financials.append(
-            {
-                "discount_amount": line_discount_amount,
-                "taxable_value": line_taxable_value,
-                "gst_percent": line_gst_percent,
-                "cgst_percent": line_cgst_percent,
-                "sgst_percent": line_sgst_percent,
-                "igst_percent": line_igst_percent,
-                "cgst_amount": line_cgst_amount,
-                "sgst_amount": line_sgst_amount,
-                "igst_amount": line_igst_amount,
-                "tax_amount": line_tax_amount,
-                "line_total": line_total,
-            }
-        )
-
-    subtotal = _money(subtotal)
-    discount_amount = _money(discount_amount)
-    taxable_value = _money(taxable_value)
-    cgst_amount = _money(cgst_amount)
-    sgst_amount = _money(sgst_amount)
-    igst_amount = _money(igst_amount)
-    final_total = _money(taxable_value + cgst_amount + sgst_amount + igst_amount + adjustment)
-    header_gst_percent = distinct_line_gst_percents.pop() if len(distinct_line_gst_percents) == 1 else Decimal("0.00")
-    header_cgst_percent = _money(header_gst_percent / Decimal("2")) if str(tax_context["tax_type"]) == "INTRA_STATE" and header_gst_percent > 0 else Decimal("0.00")
-    header_sgst_percent = header_cgst_percent
-    header_igst_percent = header_gst_percent if str(tax_context["tax_type"]) == "INTER_STATE" and header_gst_percent > 0 else Decimal("0.00")
-
-    if final_total < 0:
+    if amounts.total < 0:
         _raise_purchase_error(
             error_code="VALIDATION_ERROR",
             message="Final total cannot be negative",
@@ -373,20 +315,20 @@ def _calculate_po_financials(
 
     return {
         "tax_type": str(tax_context["tax_type"]),
-        "subtotal": subtotal,
+        "subtotal": amounts.subtotal,
         "discount_percent": discount_percent,
-        "discount_amount": discount_amount,
-        "taxable_value": taxable_value,
-        "gst_percent": header_gst_percent,
-        "cgst_percent": header_cgst_percent,
-        "sgst_percent": header_sgst_percent,
-        "igst_percent": header_igst_percent,
-        "cgst_amount": cgst_amount,
-        "sgst_amount": sgst_amount,
-        "igst_amount": igst_amount,
-        "adjustment": adjustment,
-        "final_total": final_total,
-        "line_financials": line_financials,
+        "discount_amount": amounts.discount_amount,
+        "taxable_value": amounts.taxable_value,
+        "gst_percent": amounts.gst_percent,
+        "cgst_percent": amounts.cgst_percent,
+        "sgst_percent": amounts.sgst_percent,
+        "igst_percent": amounts.igst_percent,
+        "cgst_amount": amounts.cgst_amount,
+        "sgst_amount": amounts.sgst_amount,
+        "igst_amount": amounts.igst_amount,
+        "adjustment": amounts.adjustment,
+        "final_total": amounts.total,
+        "line_amounts": amounts.lines,
         "supplier_gstin": tax_context["supplier_gstin"],
         "supplier_state": tax_context["supplier_state"],
         "company_gstin": tax_context["company_gstin"],
@@ -394,6 +336,22 @@ def _calculate_po_financials(
     }
 
 
+def _po_line_amounts(amounts: LineAmounts) -> dict[str, Decimal]:
+    return {
+        "discount_amount": amounts.discount_amount,
+        "taxable_value": amounts.taxable_value,
+        "gst_percent": amounts.gst_percent,
+        "cgst_percent": amounts.cgst_percent,
+        "sgst_percent": amounts.sgst_percent,
+        "igst_percent": amounts.igst_percent,
+        "cgst_amount": amounts.cgst_amount,
+        "sgst_amount": amounts.sgst_amount,
+        "igst_amount": amounts.igst_amount,
+        "tax_amount": amounts.tax_amount,
+        "line_total": amounts.line_total,
+    }
+
+
 def _assert_product_exists(db: Session, product_id: int) -> None:
     if not db.get(Product, product_id):
         _raise_purchase_error(
@@ -436,54 +394,6 @@ def _assert_po_receivable(po: PurchaseOrder) -> None:
     )
 
 
-def _upsert_stock_source_provenance(
-    db: Session,
-    *,
-    ledger_id: int,
-    supplier_id: int,
-    purchase_order_id: int,
-    purchase_bill_id: int | None,
-    grn_id: int,
-    grn_line_id: int,
-    grn_batch_line_id: int,
-    warehouse_id: int,
-    product_id: int,
-    batch_id: int,
-    batch_no: str,
-    expiry_date: date,
-    inward_date: date,
-    received_qty: Decimal,
-    free_qty: Decimal,
-    unit_cost_snapshot: Decimal | None,
-) -> StockSourceProvenance:
-    provenance = (
-        db.query(StockSourceProvenance)
-        .filter(StockSourceProvenance.ledger_id == ledger_id)
-        .first()
-    )
-    if provenance is None:
-        provenance = StockSourceProvenance(ledger_id=ledger_id)
-        db.add(provenance)
-
-    provenance.supplier_id = supplier_id
-    provenance.purchase_order_id = purchase_order_id
-    provenance.purchase_bill_id = purchase_bill_id
-    provenance.grn_id = grn_id
-    provenance.grn_line_id = grn_line_id
-    provenance.grn_batch_line_id = grn_batch_line_id
-    provenance.warehouse_id = warehouse_id
-    provenance.product_id = product_id
-    provenance.batch_id = batch_id
-    provenance.batch_no = batch_no
-    provenance.expiry_date = expiry_date
-    provenance.inward_date = inward_date
-    provenance.received_qty = received_qty
-    provenance.free_qty = free_qty
-    provenance.unit_cost_snapshot = unit_cost_snapshot
-    db.flush()
-    return provenance
-
-
 def _refresh_grn_purchase_bill_provenance(
     db: Session,
     *,
@@ -648,9 +558,7 @@ def create_po(db: Session, payload: PurchaseOrderCreate, created_by: int) -> Pur
         db.flush()
         po.po_number = _format_po_number(po.id)
 
-        for index, line in enumerate(payload.lines):
-            _assert_product_exists(db, line.product_id)
-            line_financial = financials["line_financials"][index]
+        for line, line_amounts in zip(payload.lines, financials["line_amounts"], strict=True):
             po.lines.append(
                 PurchaseOrderLine(
                     product_id=line.product_id,
@@ -658,17 +566,7 @@ def create_po(db: Session, payload: PurchaseOrderCreate, created_by: int) -> Pur
                     received_qty=Decimal("0"),
                     unit_cost=line.unit_cost,
                     free_qty=_as_decimal(line.free_qty),
-                    discount_amount=_as_decimal(line_financial["discount_amount"]),
-                    taxable_value=_as_decimal(line_financial["taxable_value"]),
-                    gst_percent=_as_decimal(line_financial["gst_percent"]),
-                    cgst_percent=_as_decimal(line_financial["cgst_percent"]),
-                    sgst_percent=_as_decimal(line_financial["sgst_percent"]),
-                    igst_percent=_as_decimal(line_financial["igst_percent"]),
-                    cgst_amount=_as_decimal(line_financial["cgst_amount"]),
-                    sgst_amount=_as_decimal(line_financial["sgst_amount"]),
-                    igst_amount=_as_decimal(line_financial["igst_amount"]),
-                    tax_amount=_as_decimal(line_financial["tax_amount"]),
-                    line_total=_as_decimal(line_financial["line_total"]),
+                    **_po_line_amounts(line_amounts),
                     line_notes=line.line_notes,
                 )
             )
@@ -683,7 +581,7 @@ def create_po(db: Session, payload: PurchaseOrderCreate, created_by: int) -> Pur
             after_snapshot=snapshot_model(po),
         )
         _commit_with_tenant_context(db)
-    except AppException:
+    except (AppException, StaleDataError):
         db.rollback()
         raise
     except Exception:
@@ -719,13 +617,14 @@ def create_po(db: Session, payload: PurchaseOrderCreate, created_by: int) -> Pur
 
 
 def update_po(db: Session, po_id: int, payload: PurchaseOrderUpdate, user_id: int) -> PurchaseOrder:
-    po = _get_po_with_lines(db, po_id, lock=True)
+    po = _get_po_with_lines(db, po_id)
     if not po:
         _raise_purchase_error(
             error_code="NOT_FOUND",
             message="Purchase order not found",
             status_code=404,
         )
+    check_version(po, payload.version)
     if po.status != PurchaseOrderStatus.DRAFT:
         _raise_purchase_error(
             error_code="INVALID_STATE",
@@ -771,33 +670,26 @@ def update_po(db: Session, po_id: int, payload: PurchaseOrderUpdate, user_id: in
         po.igst_amount = _as_decimal(financials["igst_amount"])
         po.adjustment = _as_decimal(financials["adjustment"])
         po.final_total = _as_decimal(financials["final_total"])
-        po.lines.clear()
-        db.flush()
-
-        for index, line in enumerate(payload.lines):
-            _assert_product_exists(db, line.product_id)
-            line_financial = financials["line_financials"][index]
-            po.lines.append(
-                PurchaseOrderLine(
-                    product_id=line.product_id,
-                    ordered_qty=_as_decimal(line.ordered_qty),
-                    received_qty=Decimal("0"),
-                    unit_cost=line.unit_cost,
-                    free_qty=_as_decimal(line.free_qty),
-                    discount_amount=_as_decimal(line_financial["discount_amount"]),
-                    taxable_value=_as_decimal(line_financial["taxable_value"]),
-                    gst_percent=_as_decimal(line_financial["gst_percent"]),
-                    cgst_percent=_as_decimal(line_financial["cgst_percent"]),
-                    sgst_percent=_as_decimal(line_financial["sgst_percent"]),
-                    igst_percent=_as_decimal(line_financial["igst_percent"]),
-                    cgst_amount=_as_decimal(line_financial["cgst_amount"]),
-                    sgst_amount=_as_decimal(line_financial["sgst_amount"]),
-                    igst_amount=_as_decimal(line_financial["igst_amount"]),
-                    tax_amount=_as_decimal(line_financial["tax_amount"]),
-                    line_total=_as_decimal(line_financial["line_total"]),
-                    line_notes=line.line_notes,
-                )
+        rows = []
+        for line, line_amounts in zip(payload.lines, financials["line_amounts"], strict=True):
+            rows.append(
+                {
+                    "id": line.id,
+                    "product_id": line.product_id,
+                    "ordered_qty": _as_decimal(line.ordered_qty),
+                    "unit_cost": line.unit_cost,
+                    "free_qty": _as_decimal(line.free_qty),
+                    **_po_line_amounts(line_amounts),
+                    "line_notes": line.line_notes,
+                }
             )
+        sync_lines(
+            po.lines,
+            rows,
+            create=lambda **values: PurchaseOrderLine(received_qty=Decimal("0"), **values),
+            natural_key=("product_id",),
+        )
+        bump_version(po)
 
         _add_audit_log(
             db,
@@ -810,7 +702,7 @@ def update_po(db: Session, po_id: int, payload: PurchaseOrderUpdate, user_id: in
             after_snapshot=snapshot_model(po),
         )
         _commit_with_tenant_context(db)
-    except AppException:
+    except (AppException, StaleDataError):
         db.rollback()
         raise
     except Exception:
@@ -835,7 +727,7 @@ def update_po(db: Session, po_id: int, payload: PurchaseOrderUpdate, user_id: in
 
 
 def cancel_po(db: Session, po_id: int, user_id: int) -> PurchaseOrder:
-    po = _get_po_with_lines(db, po_id, lock=True)
+    po = _get_po_with_lines(db, po_id)
     if not po:
         _raise_purchase_error(
             error_code="NOT_FOUND",
@@ -951,6 +843,7 @@ def approve_po(db: Session, po_id: int, user_id: int) -> PurchaseOrder:
             status_code=409,
         )
 
+    record_purchase_order_status(db, po.status, PurchaseOrderStatus.APPROVED)
     po.status = PurchaseOrderStatus.APPROVED
     _add_audit_log(
         db,
@@ -1008,39 +901,34 @@ def _normalize_grn_batch_inputs(line_payload) -> list[GRNBatchLineCreate]:
     ]
 
 
-def _resolve_batch_for_grn_batch(
-    db: Session,
+def _check_selected_batch(
+    batch: Batch | None,
     *,
     product_id: int,
-    batch_id: int | None,
-    batch_no: str | None,
     expiry_date: date | None,
-    mfg_date: date | None,
-    mrp: Decimal | None,
-    create_if_missing: bool,
-) -> Batch | None:
-    if batch_id is not None:
-        batch = db.get(Batch, batch_id)
-        if not batch:
-            _raise_purchase_error(
-                error_code="BATCH_REQUIRED",
-                message="Provided batch_id does not exist",
-                status_code=400,
-            )
-        if batch.product_id != product_id:
-            _raise_purchase_error(
-                error_code="BATCH_REQUIRED",
-                message="Provided batch does not belong to the selected product",
-                status_code=400,
-            )
-        if expiry_date and expiry_date != batch.expiry_date:
-            _raise_purchase_error(
-                error_code="BATCH_REQUIRED",
-                message="Provided expiry_date does not match selected batch",
-                status_code=400,
-            )
-        return batch
+) -> Batch:
+    if not batch:
+        _raise_purchase_error(
+            error_code="BATCH_REQUIRED",
+            message="Provided batch_id does not exist",
+            status_code=400,
+        )
+    if batch.product_id != product_id:
+        _raise_purchase_error(
+            error_code="BATCH_REQUIRED",
+            message="Provided batch does not belong to the selected product",
+            status_code=400,
+        )
+    if expiry_date and expiry_date != batch.expiry_date:
+        _raise_purchase_error(
+            error_code="BATCH_REQUIRED",
+            message="Provided expiry_date does not match selected batch",
+            status_code=400,
+        )
+    return batch
 
+
+def _require_batch_identity(batch_no: str | None, expiry_date: date | None) -> None:
     if not batch_no or expiry_date is None:
         _raise_purchase_error(
             error_code="BATCH_REQUIRED",
@@ -1048,30 +936,55 @@ def _resolve_batch_for_grn_batch(
             status_code=400,
         )
 
-    stmt = (
-        select(Batch)
-        .where(Batch.product_id == product_id)
-        .where(Batch.batch_no == batch_no)
-        .where(Batch.expiry_date == expiry_date)
-        .where(Batch.mfg_date.is_(mfg_date) if mfg_date is None else Batch.mfg_date == mfg_date)
-        .where(Batch.mrp.is_(mrp) if mrp is None else Batch.mrp == mrp)
-    )
-    existing_batch = db.execute(stmt).scalar_one_or_none()
-    if existing_batch:
-        return existing_batch
-    if not create_if_missing:
-        return None
 
-    batch = Batch(
-        product_id=product_id,
-        batch_no=batch_no,
-        expiry_date=expiry_date,
-        mfg_date=mfg_date,
-        mrp=mrp,
+def _resolve_grn_batches(
+    db: Session,
+    rows: list[tuple[int, Any]],
+    *,
+    create_missing: bool,
+) -> list[Batch | None]:
+    """The batch each ``(product_id, batch row)`` refers to, in order.
+
+    A row either selects a batch by ``batch_id`` or names one by its batch
+    number, expiry, mfg date and MRP; named batches go through the batch
+    registry, which creates them when ``create_missing`` is set.
+    """
+    selected_ids = {row.batch_id for _product_id, row in rows if row.batch_id is not None}
+    selected = (
+        {batch.id: batch for batch in db.scalars(select(Batch).where(Batch.id.in_(selected_ids)))}
+        if selected_ids
+        else {}
     )
-    db.add(batch)
-    db.flush()
-    return batch
+    keys: list[BatchKey | None] = []
+    for product_id, row in rows:
+        if row.batch_id is not None:
+            keys.append(None)
+            continue
+        _require_batch_identity(row.batch_no, row.expiry_date)
+        keys.append(
+            BatchKey(
+                product_id=product_id,
+                batch_no=row.batch_no,
+                expiry_date=row.expiry_date,
+                mfg_date=row.mfg_date,
+                mrp=row.mrp,
+            )
+        )
+    named = resolve_batches(
+        db, [key for key in keys if key is not None], create_missing=create_missing
+    )
+
+    resolved: list[Batch | None] = []
+    for (product_id, row), key in zip(rows, keys, strict=True):
+        if key is None:
+            resolved.append(
+                _check_selected_batch(
+                    selected.get(row.batch_id), product_id=product_id, expiry_date=row.expiry_date
+                )
+            )
+        else:
+            resolved.append(named.get(key))
+    return resolved
 
 
 def _validate_bill_matches_po(
@@ -1126,9 +1039,9 @@ def _build_grn_draft(
         else {}
     )
     seen_po_lines: set[int] = set()
-
-    grn.lines.clear()
-    db.flush()
+    line_rows: list[dict] = []
+    batch_row_groups: list[list[dict]] = []
+    batch_inputs_by_line: list[list[GRNBatchLineCreate]] = []
 
     for line_payload in payload_lines:
         batch_inputs = _normalize_grn_batch_inputs(line_payload)
@@ -1196,67 +1109,77 @@ def _build_grn_draft(
                 status_code=404,
             )
 
-        primary_batch = None
-        if len(batch_inputs) == 1:
-            first_batch = batch_inputs[0]
-            primary_batch = _resolve_batch_for_grn_batch(
-                db,
-                product_id=po_line.product_id,
-                batch_id=first_batch.batch_id,
-                batch_no=first_batch.batch_no,
-                expiry_date=first_batch.expiry_date,
-                mfg_date=first_batch.mfg_date,
-                mrp=first_batch.mrp,
-                create_if_missing=False,
-            )
-
-        grn_line = GRNLine(
-            po_line_id=po_line.id,
-            purchase_bill_line_id=getattr(line_payload, "purchase_bill_line_id", None),
-            product_id=po_line.product_id,
-            product_name_snapshot=product.name,
-            ordered_qty_snapshot=_as_decimal(po_line.ordered_qty),
-            billed_qty_snapshot=_as_decimal(purchase_bill_line.qty) if purchase_bill_line is not None else None,
-            received_qty_total=total_received_qty,
-            free_qty_total=total_free_qty,
-            batch_id=primary_batch.id if primary_batch is not None else None,
-            received_qty=total_received_qty,
-            free_qty=total_free_qty,
-            unit_cost=(
-                batch_inputs[0].unit_cost
-                if batch_inputs[0].unit_cost is not None
-                else line_payload.unit_cost or po_line.unit_cost
-            ),
-            expiry_date=batch_inputs[0].expiry_date if len(batch_inputs) == 1 else None,
-            remarks=getattr(line_payload, "remarks", None),
+        line_rows.append(
+            {
+                "po_line_id": po_line.id,
+                "purchase_bill_line_id": getattr(line_payload, "purchase_bill_line_id", None),
+                "product_id": po_line.product_id,
+                "product_name_snapshot": product.name,
+                "ordered_qty_snapshot": _as_decimal(po_line.ordered_qty),
+                "billed_qty_snapshot": (
+                    _as_decimal(purchase_bill_line.qty) if purchase_bill_line is not None else None
+                ),
+                "received_qty_total": total_received_qty,
+                "free_qty_total": total_free_qty,
+                "batch_id": None,
+                "received_qty": total_received_qty,
+                "free_qty": total_free_qty,
+                "unit_cost": (
+                    batch_inputs[0].unit_cost
+                    if batch_inputs[0].unit_cost is not None
+                    else line_payload.unit_cost or po_line.unit_cost
+                ),
+                "expiry_date": batch_inputs[0].expiry_date if len(batch_inputs) == 1 else None,
+                "remarks": getattr(line_payload, "remarks", None),
+            }
         )
-
-        for batch_input in batch_inputs:
-            existing_batch = _resolve_batch_for_grn_batch(
-                db,
-                product_id=po_line.product_id,
-                batch_id=batch_input.batch_id,
-                batch_no=batch_input.batch_no,
-                expiry_date=batch_input.expiry_date,
-                mfg_date=batch_input.mfg_date,
-                mrp=batch_input.mrp,
-                create_if_missing=False,
-            )
-            grn_line.batch_lines.append(
-                GRNBatchLine(
-                    batch_no=batch_input.batch_no or (existing_batch.batch_no if existing_batch else ""),
-                    expiry_date=batch_input.expiry_date,
-                    mfg_date=batch_input.mfg_date,
-                    mrp=batch_input.mrp,
-                    received_qty=_as_decimal(batch_input.received_qty),
-                    free_qty=_as_decimal(batch_input.free_qty),
-                    unit_cost=batch_input.unit_cost or line_payload.unit_cost or po_line.unit_cost,
-                    batch_id=existing_batch.id if existing_batch is not None else None,
-                    remarks=batch_input.remarks,
-                )
-            )
-
-        grn.lines.append(grn_line)
+        batch_row_groups.append(
+            [
+                {
+                    "batch_id": None,
+                    "batch_no": batch_input.batch_no or "",
+                    "expiry_date": batch_input.expiry_date,
+                    "mfg_date": batch_input.mfg_date,
+                    "mrp": batch_input.mrp,
+                    "received_qty": _as_decimal(batch_input.received_qty),
+                    "free_qty": _as_decimal(batch_input.free_qty),
+                    "unit_cost": batch_input.unit_cost or line_payload.unit_cost or po_line.unit_cost,
+                    "remarks": batch_input.remarks,
+                }
+                for batch_input in batch_inputs
+            ]
+        )
+        batch_inputs_by_line.append(batch_inputs)
+
+    grn_lines = sync_lines(grn.lines, line_rows, create=GRNLine, natural_key=("po_line_id",)).lines
+    batch_rows: list[tuple[GRNLine, GRNBatchLine, GRNBatchLineCreate]] = []
+    for grn_line, rows, batch_inputs in zip(
+        grn_lines, batch_row_groups, batch_inputs_by_line, strict=True
+    ):
+        batch_lines = sync_lines(
+            grn_line.batch_lines,
+            rows,
+            create=GRNBatchLine,
+            natural_key=("batch_no", "expiry_date", "mfg_date", "mrp"),
+        ).lines
+        batch_rows.extend(
+            (grn_line, batch_line, batch_input)
+            for batch_line, batch_input in zip(batch_lines, batch_inputs, strict=True)
+        )
+
+    # Existing batches are linked while drafting; new ones are created on post.
+    existing_batches = _resolve_grn_batches(
+        db,
+        [(grn_line.product_id, batch_input) for grn_line, _batch_line, batch_input in batch_rows],
+        create_missing=False,
+    )
+    for (grn_line, batch_line, _batch_input), batch in zip(batch_rows, existing_batches, strict=True):
+        if batch is None:
+            continue
+        batch_line.batch_id = batch.id
+        batch_line.batch_no = batch_line.batch_no or batch.batch_no
+        if len(grn_line.batch_lines) == 1:
+            grn_line.batch_id = batch.id
 
 
 def create_grn_from_po(db: Session, po_id: int, payload: GRNCreateFromPO, created_by: int) -> GRN:
@@ -1378,13 +1301,14 @@ def create_grn_from_bill(
 
 
 def update_grn(db: Session, grn_id: int, payload: GRNUpdate, user_id: int) -> GRN:
-    grn = _get_grn_with_lines(db, grn_id, lock=True)
+    grn = _get_grn_with_lines(db, grn_id)
     if grn is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
             message="GRN not found",
             status_code=404,
         )
+    check_version(grn, payload.version)
     if grn.status != GrnStatus.DRAFT:
         _raise_purchase_error(
             error_code="INVALID_STATE",
@@ -1392,7 +1316,8 @@ def update_grn(db: Session, grn_id: int, payload: GRNUpdate, user_id: int) -> GR
             status_code=409,
         )
 
-    po = _get_po_with_lines(db, grn.purchase_order_id, lock=True)
+    # Unlocked: posting re-checks the PO under its lock.
+    po = _get_po_with_lines(db, grn.purchase_order_id)
     if po is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
@@ -1424,6 +1349,7 @@ def update_grn(db: Session, grn_id: int, payload: GRNUpdate, user_id: int) -> GR
             purchase_bill=purchase_bill,
             payload_lines=payload.lines,
         )
+        bump_version(grn)
         _add_audit_log(
             db,
             entity_type="GRN",
@@ -1448,21 +1374,21 @@ def update_grn(db: Session, grn_id: int, payload: GRNUpdate, user_id: int) -> GR
 
 
 def attach_bill_to_grn(db: Session, grn_id: int, purchase_bill_id: int, user_id: int) -> GRN:
-    grn = _get_grn_with_lines(db, grn_id, lock=True)
+    grn = _get_grn_with_lines(db, grn_id)
     if grn is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
             message="GRN not found",
             status_code=404,
         )
-    purchase_bill = _get_purchase_bill_with_lines(db, purchase_bill_id, lock=True)
+    purchase_bill = _get_purchase_bill_with_lines(db, purchase_bill_id)
     if purchase_bill is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
             message="Purchase bill not found",
             status_code=404,
         )
-    po = _get_po_with_lines(db, grn.purchase_order_id, lock=True)
+    po = _get_po_with_lines(db, grn.purchase_order_id)
     if po is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
@@ -1497,7 +1423,7 @@ def attach_bill_to_grn(db: Session, grn_id: int, purchase_bill_id: int, user_id:
 
 
 def cancel_grn(db: Session, grn_id: int, user_id: int) -> GRN:
-    grn = _get_grn_with_lines(db, grn_id, lock=True)
+    grn = _get_grn_with_lines(db, grn_id)
     if grn is None:
         _raise_purchase_error(
             error_code="NOT_FOUND",
@@ -1530,7 +1456,7 @@ def cancel_grn(db: Session, grn_id: int, user_id: int) -> GRN:
     return _get_grn_with_lines(db, grn_id)  # type: ignore[return-value]
 
 
-def post_grn(db: Session, grn_id: int, user_id: int) -> GRN:
+def post_grn(db: Session, grn_id: int, user_id: int, *, commit: bool = True) -> GRN:
     try:
         grn = _get_grn_with_lines(db, grn_id, lock=True)
         if not grn:
@@ -1624,66 +1550,67 @@ def post_grn(db: Session, grn_id: int, user_id: int) -> GRN:
                     status_code=400,
                 )
 
+            po_line.received_qty = _as_decimal(po_line.received_qty) + _as_decimal(
+                line.received_qty_total
+            )
+
+        batch_rows = [(line, batch_line) for line in grn.lines for batch_line in line.batch_lines]
+        resolved = _resolve_grn_batches(
+            db,
+            [(line.product_id, batch_line) for line, batch_line in batch_rows],
+            create_missing=True,
+        )
+        batches = {
+            batch_line.id: batch
+            for (_line, batch_line), batch in zip(batch_rows, resolved, strict=True)
+        }
+        movements: list[StockMovement] = []
+        for line in grn.lines:
             for index, batch_line in enumerate(line.batch_lines):
-                batch = _resolve_batch_for_grn_batch(
-                    db,
-                    product_id=line.product_id,
-                    batch_id=batch_line.batch_id,
-                    batch_no=batch_line.batch_no,
-                    expiry_date=batch_line.expiry_date,
-                    mfg_date=batch_line.mfg_date,
-                    mrp=batch_line.mrp,
-                    create_if_missing=True,
-                )
-                if batch is None:
-                    _raise_purchase_error(
-                        error_code="BATCH_REQUIRED",
-                        message="Failed to resolve batch for GRN posting",
-                        status_code=400,
-                    )
+                batch = batches[batch_line.id]
                 batch_line.batch_id = batch.id
                 if index == 0:
                     line.batch_id = batch.id
                     line.expiry_date = batch.expiry_date
-
-                total_stock_qty = _as_decimal(batch_line.received_qty) + _as_decimal(batch_line.free_qty)
-                inward_result = stock_in(
+                movements.append(
                     # Persist unit cost on immutable inward ledger rows for source traceability.
-                    db,
-                    warehouse_id=grn.warehouse_id,
-                    product_id=line.product_id,
-                    batch_id=batch.id,
-                    qty=total_stock_qty,
-                    reason=InventoryReason.PURCHASE_GRN,
-                    created_by=user_id,
-                    unit_cost=batch_line.unit_cost or line.unit_cost,
-                    ref_type="GRN",
-                    ref_id=grn.grn_number,
-                    commit=False,
-                )
-                _upsert_stock_source_provenance(
-                    db,
-                    ledger_id=inward_result.ledger.id,
-                    supplier_id=grn.supplier_id,
-                    purchase_order_id=grn.purchase_order_id,
-                    purchase_bill_id=grn.purchase_bill_id,
-                    grn_id=grn.id,
-                    grn_line_id=line.id,
-                    grn_batch_line_id=batch_line.id,
-                    warehouse_id=grn.warehouse_id,
-                    product_id=line.product_id,
-                    batch_id=batch.id,
-                    batch_no=batch.batch_no,
-                    expiry_date=batch.expiry_date,
-                    inward_date=grn.received_date,
-                    received_qty=_as_decimal(batch_line.received_qty),
-                    free_qty=_as_decimal(batch_line.free_qty),
-                    unit_cost_snapshot=batch_line.unit_cost or line.unit_cost,
+                    StockMovement(
+                        warehouse_id=grn.warehouse_id,
+                        product_id=line.product_id,
+                        batch_id=batch.id,
+                        qty=_as_decimal(batch_line.received_qty) + _as_decimal(batch_line.free_qty),
+                        unit_cost=batch_line.unit_cost or line.unit_cost,
+                    )
                 )
-
-            po_line.received_qty = _as_decimal(po_line.received_qty) + _as_decimal(
-                line.received_qty_total
+        inward_results = stock_in_many(
+            db,
+            movements,
+            reason=InventoryReason.PURCHASE_GRN,
+            created_by=user_id,
+            ref_type="GRN",
+            ref_id=grn.grn_number,
+        )
+        db.add_all(
+            StockSourceProvenance(
+                ledger_id=result.ledger.id,
+                supplier_id=grn.supplier_id,
+                purchase_order_id=grn.purchase_order_id,
+                purchase_bill_id=grn.purchase_bill_id,
+                grn_id=grn.id,
+                grn_line_id=line.id,
+                grn_batch_line_id=batch_line.id,
+                warehouse_id=grn.warehouse_id,
+                product_id=line.product_id,
+                batch_id=batches[batch_line.id].id,
+                batch_no=batches[batch_line.id].batch_no,
+                expiry_date=batches[batch_line.id].expiry_date,
+                inward_date=grn.received_date,
+                received_qty=_as_decimal(batch_line.received_qty),
+                free_qty=_as_decimal(batch_line.free_qty),
+                unit_cost_snapshot=batch_line.unit_cost or line.unit_cost,
             )
+            for (line, batch_line), result in zip(batch_rows, inward_results, strict=True)
+        )
 
         next_po_status = (
             PurchaseOrderStatus.CLOSED
@@ -1694,6 +1621,7 @@ def post_grn(db: Session, grn_id: int, user_id: int) -> GRN:
             else PurchaseOrderStatus.PARTIALLY_RECEIVED
         )
         PurchaseStateMachine.validate_po_transition(po.status, next_po_status)
+        record_purchase_order_status(db, po.status, next_po_status)
         po.status = next_po_status
 
         grn.status = GrnStatus.POSTED
@@ -1714,9 +1642,13 @@ def post_grn(db: Session, grn_id: int, user_id: int) -> GRN:
             },
             after_snapshot=snapshot_model(grn),
         )
-        _commit_with_tenant_context(db)
+        if commit:
+            _commit_with_tenant_context(db)
+        else:
+            db.flush()
     except Exception:
-        db.rollback()
+        if commit:
+            db.rollback()
         raise
 
     return _get_grn_with_lines(db, grn_id)  # type: ignore[return-value]
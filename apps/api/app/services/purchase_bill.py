@@ -7,7 +7,8 @@ from pathlib import Path
 from typing import Protocol
 from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import String, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_settings
@@ -22,9 +23,14 @@ from app.models.warehouse import Warehouse
 from app.schemas.purchase_bill import (
     PurchaseBillExtractionLine,
     PurchaseBillExtractionPayload,
+    PurchaseBillSummary,
+    PurchaseBillSummaryPage,
     PurchaseBillUpdate,
 )
 from app.services.audit import changed_fields, snapshot_model, write_audit_log
+from app.services.pagination import DEFAULT_PAGE_LIMIT, fetch_keyset_page, parse_fields
+from app.services.pricing import PricingLine, document_total, price_document
+from app.services.versioning import bump_version, check_version
 
 SUPPORTED_UPLOAD_TYPES = {
     "application/pdf",
@@ -218,31 +224,60 @@ def _match_supplier(db: Session, *, supplier_gstin: str | None, supplier_name: s
     return None
 
 
-def _match_product(db: Session, description_raw: str) -> Product | None:
-    normalized = _normalize_match_text(description_raw)
-    if not normalized:
-        return None
+def _normalized_column(column):
+    return func.regexp_replace(func.upper(column), r"[^A-Z0-9]+", "", "g")
+
+
+def _match_products(db: Session, descriptions: list[str]) -> list[Product | None]:
+    """The product each extracted description refers to, if exactly one does.
+
+    An exact SKU or normalized name match wins; otherwise the description must
+    contain exactly one product's SKU. Every line is matched by the same one
+    or two statements.
+    """
+    normalized = [_normalize_match_text(description) for description in descriptions]
+    wanted = {text for text in normalized if text}
+    if not wanted:
+        return [None] * len(descriptions)
 
-    exact_matches = (
-        db.query(Product)
-        .filter(
-            (func.upper(Product.sku) == normalized)
-            | (func.regexp_replace(func.upper(Product.name), r"[^A-Z0-9]+", "", "g") == normalized)
+    exact: dict[str, set[int]] = {}
+    products: dict[int, Product] = {}
+    exact_rows = db.scalars(
+        select(Product).where(
+            func.upper(Product.sku).in_(wanted) | _normalized_column(Product.name).in_(wanted)
         )
-        .limit(2)
-        .all()
     )
-    if len(exact_matches) == 1:
-        return exact_matches[0]
+    for product in exact_rows:
+        products[product.id] = product
+        for key in {(product.sku or "").upper(), _normalize_match_text(product.name)} & wanted:
+            exact.setdefault(key, set()).add(product.id)
+
+    containing: dict[str, set[int]] = {}
+    unresolved = {text for text in wanted if len(exact.get(text, ())) != 1}
+    if unresolved:
+        descriptions_table = select(
+            func.unnest(literal(sorted(unresolved), ARRAY(String))).label("text")
+        ).subquery()
+        contains_rows = db.execute(
+            select(descriptions_table.c.text, Product)
+            .join(
+                descriptions_table,
+                func.strpos(descriptions_table.c.text, _normalized_column(Product.sku)) > 0,
+            )
+            .where(Product.sku.is_not(None))
+            .where(Product.sku != "")
+        )
+        for text, product in contains_rows:
+            products[product.id] = product
+            containing.setdefault(text, set()).add(product.id)
 
-    contains_matches = [
-        product
-        for product in db.query(Product).all()
-        if product.sku and _normalize_match_text(product.sku) in normalized
-    ]
-    if len(contains_matches) == 1:
-        return contains_matches[0]
-    return None
+    matches: list[Product | None] = []
+    for text in normalized:
+        candidates = exact.get(text, set())
+        if len(candidates) != 1:
+            candidates = containing.get(text, set())
+        matches.append(products[next(iter(candidates))] if len(candidates) == 1 else None)
+    return matches
 
 
 def _ensure_optional_refs_exist(
@@ -286,8 +321,8 @@ def _apply_line_updates(
     db: Session,
 ) -> None:
     bill.lines.clear()
-    for line_payload in lines:
-        matched_product = _match_product(db, line_payload.description_raw)
+    matched_products = _match_products(db, [line.description_raw for line in lines])
+    for line_payload, matched_product in zip(lines, matched_products, strict=True):
         line_total = _money(
             line_payload.line_total
             if line_payload.line_total is not None
@@ -312,20 +347,29 @@ def _apply_line_updates(
 
 
 def _recalculate_totals(bill: PurchaseBill) -> None:
-    line_subtotal = _money(sum((_qty(line.qty) * _money(line.unit_price)) for line in bill.lines), "0")
-    line_discount = _money(sum((_money(line.discount_amount) for line in bill.lines), Decimal("0")))
+    amounts = price_document(
+        [
+            PricingLine(
+                qty=_qty(line.qty),
+                unit_price=_money(line.unit_price),
+                discount_amount=_money(line.discount_amount),
+            )
+            for line in bill.lines
+        ]
+    )
     if bill.subtotal == Decimal("0.00"):
-        bill.subtotal = line_subtotal
+        bill.subtotal = amounts.subtotal
     if bill.discount_amount == Decimal("0.00"):
-        bill.discount_amount = line_discount
+        bill.discount_amount = amounts.discount_amount
     if bill.taxable_value == Decimal("0.00"):
         bill.taxable_value = _money(bill.subtotal - bill.discount_amount)
-    bill.total = _money(
-        bill.taxable_value
-        + bill.cgst_amount
-        + bill.sgst_amount
-        + bill.igst_amount
-        + bill.adjustment
+    bill.total = _bill_total(bill)
+
+
+def _bill_total(bill: PurchaseBill) -> Decimal:
+    # Bills keep the tax amounts printed on the invoice rather than recomputing them.
+    return document_total(
+        bill.taxable_value, bill.cgst_amount, bill.sgst_amount, bill.igst_amount, bill.adjustment
     )
 
 
@@ -337,14 +381,7 @@ def _validate_bill_totals(bill: PurchaseBill) -> None:
             status_code=400,
             details={"field": "total"},
         )
-    expected_total = _money(
-        bill.taxable_value
-        + bill.cgst_amount
-        + bill.sgst_amount
-        + bill.igst_amount
-        + bill.adjustment
-    )
-    if abs(expected_total - _money(bill.total)) > Decimal("0.01"):
+    if abs(_bill_total(bill) - _money(bill.total)) > Decimal("0.01"):
         raise AppException(
             error_code="VALIDATION_ERROR",
             message="Bill total does not match taxable value plus taxes and adjustment",
@@ -400,6 +437,38 @@ def list_purchase_bills(db: Session) -> list[PurchaseBill]:
     )
 
 
+def list_purchase_bill_summaries(
+    db: Session,
+    *,
+    status: PurchaseBillStatus | None = None,
+    supplier_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    fields: str | None = None,
+) -> PurchaseBillSummaryPage:
+    """Newest-first bill list without lines, attachments or extraction payloads."""
+    columns = {name: getattr(PurchaseBill, name) for name in PurchaseBillSummary.model_fields}
+    stmt = select().select_from(PurchaseBill)
+    if status is not None:
+        stmt = stmt.where(PurchaseBill.status == status)
+    if supplier_id is not None:
+        stmt = stmt.where(PurchaseBill.supplier_id == supplier_id)
+    items, next_cursor = fetch_keyset_page(
+        db,
+        stmt,
+        columns=columns,
+        fields=parse_fields(fields, list(columns)),
+        sort_keys=[PurchaseBill.created_at, PurchaseBill.id],
+        descending=True,
+        cursor=cursor,
+        limit=limit,
+    )
+    return PurchaseBillSummaryPage(
+        items=[PurchaseBillSummary.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+    )
+
+
 def get_purchase_bill(db: Session, bill_id: int) -> PurchaseBill:
     return _get_purchase_bill_or_404(db, bill_id)
 
@@ -529,7 +598,8 @@ def update_purchase_bill(
     *,
     updated_by: int,
 ) -> PurchaseBill:
-    bill = _get_purchase_bill_or_404(db, bill_id, lock=True)
+    bill = _get_purchase_bill_or_404(db, bill_id)
+    check_version(bill, payload.version)
     if bill.status == PurchaseBillStatus.POSTED:
         raise AppException(
             error_code="CONFLICT",
@@ -581,6 +651,7 @@ def update_purchase_bill(
 
     _recalculate_totals(bill)
     _validate_bill_totals(bill)
+    bump_version(bill)
     db.flush()
 
     after_snapshot = _bill_snapshot(bill)
@@ -602,7 +673,7 @@ def update_purchase_bill(
 
 
 def verify_purchase_bill(db: Session, bill_id: int, *, verified_by: int) -> PurchaseBill:
-    bill = _get_purchase_bill_or_404(db, bill_id, lock=True)
+    bill = _get_purchase_bill_or_404(db, bill_id)
     if bill.status == PurchaseBillStatus.POSTED:
         raise AppException(
             error_code="CONFLICT",
@@ -689,7 +760,7 @@ def post_purchase_bill(db: Session, bill_id: int, *, posted_by: int) -> Purchase
 
 
 def cancel_purchase_bill(db: Session, bill_id: int, *, cancelled_by: int) -> PurchaseBill:
-    bill = _get_purchase_bill_or_404(db, bill_id, lock=True)
+    bill = _get_purchase_bill_or_404(db, bill_id)
     if bill.status == PurchaseBillStatus.POSTED:
         raise AppException(
             error_code="CONFLICT",
@@ -19,7 +19,6 @@ from app.models.enums import (
 )
 from app.models.inventory import StockSummary
 from app.models.party import Party
-from app.models.product import Product
 from app.models.sales import (
     DispatchLine,
     DispatchNote,
@@ -36,7 +35,11 @@ from app.schemas.sales import (
     StockAvailabilityResponse,
 )
 from app.services.audit import snapshot_model, write_audit_log
-from app.services.inventory import stock_out
+from app.services.dashboard import record_dispatch_note_status
+from app.services.inventory import StockMovement, stock_out_many
+from app.services.line_sync import sync_lines
+from app.services.pricing import PricingLine, load_products, price_document
+from app.services.versioning import bump_version, check_version
 
 
 def _as_decimal(value: Decimal | float | int | str | None) -> Decimal:
@@ -126,19 +129,11 @@ def _assert_master_refs(db: Session, *, customer_id: int, warehouse_id: int) ->
         )
 
 
-def _assert_product_exists(db: Session, product_id: int) -> Product:
-    product = db.get(Product, product_id)
-    if product is None:
-        _raise_sales_error(
-            error_code="NOT_FOUND",
-            message=f"Product not found: {product_id}",
-            status_code=404,
-        )
-    return product
+def _assert_batch_for_product(db: Session, *, batch_id: int, product_id: int) -> Batch:
+    return _check_batch_for_product(db.get(Batch, batch_id), product_id=product_id)
 
 
-def _assert_batch_for_product(db: Session, *, batch_id: int, product_id: int) -> Batch:
-    batch = db.get(Batch, batch_id)
+def _check_batch_for_product(batch: Batch | None, *, product_id: int) -> Batch:
     if batch is None:
         _raise_sales_error(
             error_code="NOT_FOUND",
@@ -210,22 +205,27 @@ def get_stock_availability(
         exclude_sales_order_id=exclude_sales_order_id,
     )
     candidate_rows = db.execute(
-        select(StockSummary, Batch)
+        select(
+            StockSummary.batch_id,
+            Batch.batch_no,
+            StockSummary.expiry_date,
+            StockSummary.qty_on_hand,
+        )
         .join(Batch, Batch.id == StockSummary.batch_id)
         .where(StockSummary.warehouse_id == warehouse_id)
         .where(StockSummary.product_id == product_id)
         .where(StockSummary.qty_on_hand > 0)
-        .order_by(Batch.expiry_date.asc(), Batch.id.asc())
+        .order_by(StockSummary.expiry_date.asc(), StockSummary.batch_id.asc())
     ).all()
 
     candidate_batches = [
         BatchAvailabilityResponse(
-            batch_id=batch.id,
-            batch_no=batch.batch_no,
-            expiry_date=batch.expiry_date,
-            qty_on_hand=_as_decimal(summary.qty_on_hand),
+            batch_id=row.batch_id,
+            batch_no=row.batch_no,
+            expiry_date=row.expiry_date,
+            qty_on_hand=_as_decimal(row.qty_on_hand),
         )
-        for summary, batch in candidate_rows
+        for row in candidate_rows
     ]
     return StockAvailabilityResponse(
         warehouse_id=warehouse_id,
@@ -237,6 +237,40 @@ def get_stock_availability(
     )
 
 
+def _available_qty_by_product(
+    db: Session,
+    *,
+    warehouse_id: int,
+    product_ids: set[int],
+    exclude_sales_order_id: int,
+) -> dict[int, Decimal]:
+    """``available_qty`` of :func:`get_stock_availability` for several products at once."""
+    available = {product_id: Decimal("0") for product_id in product_ids}
+    on_hand_rows = db.execute(
+        select(StockSummary.product_id, StockSummary.qty_on_hand)
+        .where(StockSummary.warehouse_id == warehouse_id)
+        .where(StockSummary.product_id.in_(product_ids))
+    )
+    for product_id, qty_on_hand in on_hand_rows:
+        available[product_id] += _as_decimal(qty_on_hand)
+    reservations = db.scalars(
+        select(StockReservation)
+        .where(StockReservation.warehouse_id == warehouse_id)
+        .where(StockReservation.product_id.in_(product_ids))
+        .where(StockReservation.status.in_(_active_reservation_statuses()))
+        .where(StockReservation.sales_order_id != exclude_sales_order_id)
+    )
+    for reservation in reservations:
+        remaining = (
+            _as_decimal(reservation.reserved_qty)
+            - _as_decimal(reservation.consumed_qty)
+            - _as_decimal(reservation.released_qty)
+        )
+        if remaining > 0:
+            available[reservation.product_id] -= remaining
+    return available
+
+
 def _add_sales_audit(
     db: Session,
     *,
@@ -267,12 +301,6 @@ def _add_sales_audit(
     )
 
 
-def _line_total(*, ordered_qty: Decimal, unit_price: Decimal, discount_percent: Decimal) -> Decimal:
-    gross = ordered_qty * unit_price
-    discount_amount = (gross * discount_percent) / Decimal("100")
-    return gross - discount_amount
-
-
 def _payload_has_field(payload: SalesOrderCreate | SalesOrderUpdate, field_name: str) -> bool:
     return field_name in getattr(payload, "model_fields_set", set())
 
@@ -282,32 +310,48 @@ def _sync_sales_order_lines(
     sales_order: SalesOrder,
     lines_payload,
 ) -> None:
-    sales_order.lines.clear()
-    db.flush()
-    subtotal = Decimal("0")
+    products = load_products(db, (line.product_id for line in lines_payload))
     for line in lines_payload:
-        product = _assert_product_exists(db, line.product_id)
-        line_total = _line_total(
-            ordered_qty=_as_decimal(line.ordered_qty),
-            unit_price=_as_decimal(line.unit_price),
-            discount_percent=_as_decimal(line.discount_percent),
-        )
-        subtotal += line_total
-        sales_order.lines.append(
-            SalesOrderLine(
-                product_id=line.product_id,
-                ordered_qty=_as_decimal(line.ordered_qty),
-                reserved_qty=Decimal("0"),
-                dispatched_qty=Decimal("0"),
+        if line.product_id not in products:
+            _raise_sales_error(
+                error_code="NOT_FOUND",
+                message=f"Product not found: {line.product_id}",
+                status_code=404,
+            )
+    # Sales order tax is entered on the header, so lines are priced before tax.
+    amounts = price_document(
+        [
+            PricingLine(
+                qty=_as_decimal(line.ordered_qty),
                 unit_price=_as_decimal(line.unit_price),
                 discount_percent=_as_decimal(line.discount_percent),
-                line_total=line_total,
-                gst_rate=_as_decimal(line.gst_rate),
-                hsn_code=line.hsn_code or product.hsn,
-                remarks=line.remarks,
             )
-        )
-    sales_order.subtotal = subtotal
+            for line in lines_payload
+        ]
+    )
+    rows = [
+        {
+            "id": line.id,
+            "product_id": line.product_id,
+            "ordered_qty": _as_decimal(line.ordered_qty),
+            "unit_price": _as_decimal(line.unit_price),
+            "discount_percent": _as_decimal(line.discount_percent),
+            "line_total": line_amounts.line_total,
+            "gst_rate": _as_decimal(line.gst_rate),
+            "hsn_code": line.hsn_code or products[line.product_id].hsn,
+            "remarks": line.remarks,
+        }
+        for line, line_amounts in zip(lines_payload, amounts.lines, strict=True)
+    ]
+    sync_lines(
+        sales_order.lines,
+        rows,
+        create=lambda **values: SalesOrderLine(
+            reserved_qty=Decimal("0"), dispatched_qty=Decimal("0"), **values
+        ),
+        natural_key=("product_id",),
+    )
+    sales_order.subtotal = amounts.taxable_value
 
 
 def _apply_financials(sales_order: SalesOrder, payload: SalesOrderCreate | SalesOrderUpdate) -> None:
@@ -378,13 +422,14 @@ def create_sales_order(db: Session, payload: SalesOrderCreate, created_by: int)
 
 
 def update_sales_order(db: Session, sales_order_id: int, payload: SalesOrderUpdate, updated_by: int) -> SalesOrder:
-    sales_order = _get_sales_order_with_lines(db, sales_order_id, lock=True)
+    sales_order = _get_sales_order_with_lines(db, sales_order_id)
     if sales_order is None:
         _raise_sales_error(
             error_code="NOT_FOUND",
             message="Sales order not found",
             status_code=404,
         )
+    check_version(sales_order, payload.version)
     if sales_order.status != SalesOrderStatus.DRAFT:
         _raise_sales_error(
             error_code="INVALID_STATE",
@@ -412,6 +457,7 @@ def update_sales_order(db: Session, sales_order_id: int, payload: SalesOrderUpda
     if payload.lines is not None:
         _sync_sales_order_lines(db, sales_order, payload.lines)
     _apply_financials(sales_order, payload)
+    bump_version(sales_order)
 
     _add_sales_audit(
         db,
@@ -443,20 +489,21 @@ def confirm_sales_order(db: Session, sales_order_id: int, confirmed_by: int) ->
             status_code=409,
         )
 
+    available_by_product = _available_qty_by_product(
+        db,
+        warehouse_id=sales_order.warehouse_id,
+        product_ids={line.product_id for line in sales_order.lines},
+        exclude_sales_order_id=sales_order.id,
+    )
     shortages: list[dict[str, str]] = []
     for line in sales_order.lines:
-        availability = get_stock_availability(
-            db,
-            warehouse_id=sales_order.warehouse_id,
-            product_id=line.product_id,
-            exclude_sales_order_id=sales_order.id,
-        )
-        if availability.available_qty < _as_decimal(line.ordered_qty):
+        available_qty = available_by_product[line.product_id]
+        if available_qty < _as_decimal(line.ordered_qty):
             shortages.append(
                 {
                     "product_id": str(line.product_id),
                     "required_qty": str(line.ordered_qty),
-                    "available_qty": str(availability.available_qty),
+                    "available_qty": str(available_qty),
                 }
             )
 
@@ -468,21 +515,25 @@ def confirm_sales_order(db: Session, sales_order_id: int, confirmed_by: int) ->
             details=shortages,
         )
 
+    reservations: list[StockReservation] = []
     for line in sales_order.lines:
         line.reserved_qty = _as_decimal(line.ordered_qty)
-        reservation = StockReservation(
-            sales_order_id=sales_order.id,
-            sales_order_line_id=line.id,
-            warehouse_id=sales_order.warehouse_id,
-            product_id=line.product_id,
-            batch_id=None,
-            reserved_qty=_as_decimal(line.ordered_qty),
-            consumed_qty=Decimal("0"),
-            released_qty=Decimal("0"),
-            status=StockReservationStatus.ACTIVE,
-        )
-        db.add(reservation)
-        db.flush()
+        reservations.append(
+            StockReservation(
+                sales_order_id=sales_order.id,
+                sales_order_line_id=line.id,
+                warehouse_id=sales_order.warehouse_id,
+                product_id=line.product_id,
+                batch_id=None,
+                reserved_qty=_as_decimal(line.ordered_qty),
+                consumed_qty=Decimal("0"),
+                released_qty=Decimal("0"),
+                status=StockReservationStatus.ACTIVE,
+            )
+        )
+    db.add_all(reservations)
+    db.flush()
+    for reservation in reservations:
         _add_sales_audit(
             db,
             entity_type="STOCK_RESERVATION",
@@ -625,6 +676,7 @@ def create_dispatch_note_from_sales_order(
     )
     db.add(dispatch_note)
     db.flush()
+    record_dispatch_note_status(db, None, DispatchNoteStatus.DRAFT)
 
     for line_payload in payload.lines:
         sales_line = lines_by_id.get(line_payload.sales_order_line_id)
@@ -716,7 +768,9 @@ def create_dispatch_note_from_sales_order(
     return _get_dispatch_note_with_lines(db, dispatch_note.id)  # type: ignore[return-value]
 
 
-def post_dispatch_note(db: Session, dispatch_note_id: int, posted_by: int) -> DispatchNote:
+def post_dispatch_note(
+    db: Session, dispatch_note_id: int, posted_by: int, *, commit: bool = True
+) -> DispatchNote:
     dispatch_note = _get_dispatch_note_with_lines(db, dispatch_note_id, lock=True)
     if dispatch_note is None:
         _raise_sales_error(
@@ -752,6 +806,13 @@ def post_dispatch_note(db: Session, dispatch_note_id: int, posted_by: int) -> Di
         if reservation.status in _active_reservation_statuses()
     }
 
+    batches = {
+        batch.id: batch
+        for batch in db.scalars(
+            select(Batch).where(Batch.id.in_({line.batch_id for line in dispatch_note.lines}))
+        )
+    }
+    movements: list[StockMovement] = []
     for dispatch_line in dispatch_note.lines:
         sales_line = lines_by_id.get(dispatch_line.sales_order_line_id)
         if sales_line is None:
@@ -788,18 +849,16 @@ def post_dispatch_note(db: Session, dispatch_note_id: int, posted_by: int) -> Di
                 status_code=409,
             )
 
-        _assert_batch_for_product(db, batch_id=dispatch_line.batch_id, product_id=dispatch_line.product_id)
-        stock_out(
-            db,
-            warehouse_id=dispatch_note.warehouse_id,
-            product_id=dispatch_line.product_id,
-            batch_id=dispatch_line.batch_id,
-            qty=dispatch_qty,
-            reason=InventoryReason.SALES_DISPATCH,
-            created_by=posted_by,
-            ref_type="DISPATCH",
-            ref_id=dispatch_note.dispatch_number,
-            commit=False,
+        _check_batch_for_product(
+            batches.get(dispatch_line.batch_id), product_id=dispatch_line.product_id
+        )
+        movements.append(
+            StockMovement(
+                warehouse_id=dispatch_note.warehouse_id,
+                product_id=dispatch_line.product_id,
+                batch_id=dispatch_line.batch_id,
+                qty=dispatch_qty,
+            )
         )
 
         sales_line.dispatched_qty = _as_decimal(sales_line.dispatched_qty) + dispatch_qty
@@ -816,11 +875,21 @@ def post_dispatch_note(db: Session, dispatch_note_id: int, posted_by: int) -> Di
             else StockReservationStatus.PARTIALLY_CONSUMED
         )
 
+    stock_out_many(
+        db,
+        movements,
+        reason=InventoryReason.SALES_DISPATCH,
+        created_by=posted_by,
+        ref_type="DISPATCH",
+        ref_id=dispatch_note.dispatch_number,
+    )
+
     sales_order.status = (
         SalesOrderStatus.DISPATCHED
         if all(_as_decimal(line.dispatched_qty) >= _as_decimal(line.ordered_qty) for line in sales_order.lines)
         else SalesOrderStatus.PARTIALLY_DISPATCHED
     )
+    record_dispatch_note_status(db, dispatch_note.status, DispatchNoteStatus.POSTED)
     dispatch_note.status = DispatchNoteStatus.POSTED
     dispatch_note.posted_by = posted_by
     dispatch_note.posted_at = datetime.now(timezone.utc)
@@ -846,7 +915,10 @@ def post_dispatch_note(db: Session, dispatch_note_id: int, posted_by: int) -> Di
         source_reference=dispatch_note.dispatch_number,
         after_snapshot={"status": sales_order.status.value},
     )
-    _commit_with_tenant_context(db)
+    if commit:
+        _commit_with_tenant_context(db)
+    else:
+        db.flush()
     return _get_dispatch_note_with_lines(db, dispatch_note.id)  # type: ignore[return-value]
 
 
@@ -867,6 +939,7 @@ def cancel_dispatch_note(db: Session, dispatch_note_id: int, cancelled_by: int)
     if dispatch_note.status == DispatchNoteStatus.CANCELLED:
         return dispatch_note
 
+    record_dispatch_note_status(db, dispatch_note.status, DispatchNoteStatus.CANCELLED)
     dispatch_note.status = DispatchNoteStatus.CANCELLED
     _add_sales_audit(
         db,
@@ -0,0 +1,107 @@
+"""Shared text search for master and inventory lists.
+
+Each searchable table has one lower-cased *search document* expression. The
+trigram GIN indexes created by migration 20261019_0039 (and the tenant schema
+repair path) are built on exactly these expressions, so ``LIKE '%term%'`` can be
+answered from the index instead of scanning every row. When pg_trgm is
+installed, matches are ranked by trigram similarity; otherwise prefix matches
+rank first.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import case, func, literal_column, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+from app.core.database import IS_POSTGRES
+from app.models.batch import Batch
+from app.models.party import Party
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+
+PRODUCT_SEARCH_COLUMNS = ("sku", "name", "display_name", "brand", "category", "rack_number")
+PARTY_SEARCH_COLUMNS = ("name", "display_name", "contact_person", "gstin", "city")
+BATCH_SEARCH_COLUMNS = ("batch_no",)
+
+# index name -> (table, document columns); shared by the tenant schema repair path.
+SEARCH_INDEXES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "ix_products_search_trgm": ("products", PRODUCT_SEARCH_COLUMNS),
+    "ix_parties_search_trgm": ("parties", PARTY_SEARCH_COLUMNS),
+    "ix_batches_search_trgm": ("batches", BATCH_SEARCH_COLUMNS),
+}
+
+_TRIGRAM_AVAILABLE: bool | None = None
+
+
+def search_document_sql(columns: tuple[str, ...]) -> str:
+    """SQL text of a search document, as used in the trigram index definitions."""
+    parts = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"lower({parts})"
+
+
+def _search_document(model, columns: tuple[str, ...]) -> ColumnElement[str]:
+    # Constants are rendered inline (not as bind parameters) so the expression is
+    # structurally identical to the indexed one and the planner can match it.
+    separator = literal_column("' '")
+    document = None
+    for column in columns:
+        part = func.coalesce(getattr(model, column), literal_column("''"))
+        document = part if document is None else document.op("||")(separator).op("||")(part)
+    return func.lower(document)
+
+
+def product_search_document() -> ColumnElement[str]:
+    return _search_document(Product, PRODUCT_SEARCH_COLUMNS)
+
+
+def party_search_document() -> ColumnElement[str]:
+    return _search_document(Party, PARTY_SEARCH_COLUMNS)
+
+
+def batch_search_document() -> ColumnElement[str]:
+    return _search_document(Batch, BATCH_SEARCH_COLUMNS)
+
+
+def trigram_search_available(db: Session) -> bool:
+    global _TRIGRAM_AVAILABLE
+    if _TRIGRAM_AVAILABLE is None:
+        _TRIGRAM_AVAILABLE = IS_POSTGRES and (
+            db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first()
+            is not None
+        )
+    return _TRIGRAM_AVAILABLE
+
+
+@dataclass(frozen=True)
+class TextSearch:
+    term: str
+    ranked_by_similarity: bool
+
+    @property
+    def pattern(self) -> str:
+        return f"%{self.term}%"
+
+    def matches(self, document: ColumnElement[str]) -> ColumnElement[bool]:
+        return document.like(self.pattern)
+
+    def rank(self, document: ColumnElement[str]) -> UnaryExpression:
+        """Order-by clause putting the best matches first."""
+        if self.ranked_by_similarity:
+            return func.similarity(document, self.term).desc()
+        return case((document.like(f"{self.term}%"), 0), else_=1).asc()
+
+
+def build_text_search(db: Session, search: str | None) -> TextSearch | None:
+    term = (search or "").strip().lower()
+    if not term:
+        return None
+    return TextSearch(term=term, ranked_by_similarity=trigram_search_available(db))
+
+
+def matching_warehouse_ids(db: Session, text_search: TextSearch) -> list[int]:
+    """Warehouses whose name matches; resolved up front (the table is tiny) so list
+    queries can filter on an indexed warehouse_id instead of a correlated subquery."""
+    return list(
+        db.scalars(select(Warehouse.id).where(func.lower(Warehouse.name).like(text_search.pattern)))
+    )
@@ -0,0 +1,44 @@
+"""Optimistic concurrency for document headers.
+
+Purchase orders, GRNs, sales orders, dispatch notes and purchase bills carry a
+``version`` column that the mapper uses as its ``version_id_col``: every UPDATE
+of the header sets ``version = version + 1`` and only matches the version the
+session read. Two users editing the same draft therefore no longer queue on a
+row lock held for the whole request; the second write matches no row, the ORM
+raises :class:`~sqlalchemy.orm.exc.StaleDataError` and the API answers 409
+``VERSION_CONFLICT`` so the client can reload and retry.
+
+Edits may also send the ``version`` they were based on, which catches a
+conflict that committed before the request even started. Pessimistic row locks
+remain only where stock moves, in the posting paths.
+"""
+
+from typing import Any
+
+from app.core.exceptions import AppException
+
+VERSION_CONFLICT = "VERSION_CONFLICT"
+
+
+def version_conflict(details: dict | None = None) -> AppException:
+    return AppException(
+        error_code=VERSION_CONFLICT,
+        message="The document was changed by someone else; reload it and try again",
+        status_code=409,
+        details=details,
+    )
+
+
+def check_version(document: Any, expected: int | None) -> None:
+    """Reject an edit based on a version other than the one just loaded."""
+    if expected is not None and expected != document.version:
+        raise version_conflict({"expected_version": expected, "current_version": document.version})
+
+
+def bump_version(document: Any) -> None:
+    """Version the header even when an edit only touched its lines.
+
+    The mapper bumps ``version`` only when it UPDATEs the header row itself, so
+    an edit limited to lines would otherwise race another edit unnoticed.
+    """
+    document.version = document.version + 1
@@ -1,3 +1,6 @@
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date
 from decimal import Decimal
 from itertools import count
@@ -5,6 +8,7 @@ from itertools import count
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core.metrics import StatementRecorder, record_statements, statement_fingerprint
 from app.core.security import create_access_token
 from app.integrations.gst_verification.client import (
     GSTVerificationClientStep,
@@ -261,3 +265,64 @@ def create_and_post_grn(
     post_response = client.post(f"/purchase/grn/{grn['id']}/post", headers=headers)
     assert post_response.status_code == 200, post_response.text
     return post_response.json()
+
+
+class QueryBudget:
+    """SQL statement budgets for the requests a test makes (the ``query_budget`` fixture).
+
+    Requests made inside ``capture(size)`` are recorded against ``size``, e.g. the
+    number of document lines. ``check`` then fails, listing statement fingerprints,
+    if any capture ran more than ``max_queries`` statements or more than the
+    smallest capture did, so the budget holds whatever the line count.
+    """
+
+    def __init__(self) -> None:
+        self._captures: dict[int, StatementRecorder] = {}
+
+    @contextmanager
+    def capture(self, size: int = 1) -> Iterator[StatementRecorder]:
+        with record_statements() as recorder:
+            yield recorder
+        self._captures[size] = recorder
+
+    def check(self, max_queries: int) -> None:
+        captures, self._captures = self._captures, {}
+        assert captures and all(r.requests for r in captures.values()), "No requests captured"
+        fingerprints = {size: _fingerprints(recorder) for size, recorder in captures.items()}
+        baseline_size = min(captures)
+        baseline = fingerprints[baseline_size]
+        problems: list[str] = []
+        for size in sorted(captures):
+            queries = fingerprints[size].total()
+            if queries > max_queries:
+                problems.append(
+                    f"{_describe(captures[size], size)} ran {queries} statements, "
+                    f"over the budget of {max_queries}:"
+                )
+                problems.extend(_format_fingerprints(fingerprints[size]))
+            if queries > baseline.total():
+                problems.append(
+                    f"{_describe(captures[size], size)} ran {queries} statements, "
+                    f"{queries - baseline.total()} more than at size {baseline_size}; "
+                    "statements that grow with size:"
+                )
+                problems.extend(_format_fingerprints(fingerprints[size] - baseline))
+        if problems:
+            raise AssertionError("\n".join(problems))
+
+
+def _fingerprints(recorder: StatementRecorder) -> Counter[str]:
+    return Counter(
+        statement_fingerprint(statement)
+        for request in recorder.requests
+        for statement in request.metrics.statements or []
+    )
+
+
+def _describe(recorder: StatementRecorder, size: int) -> str:
+    routes = ", ".join(sorted({f"{r.method} {r.route}" for r in recorder.requests}))
+    return f"{routes} at size {size}"
+
+
+def _format_fingerprints(fingerprints: Counter[str], limit: int = 15) -> list[str]:
+    return [f"  {n:>4} x {statement[:240]}" for statement, n in fingerprints.most_common(limit)]
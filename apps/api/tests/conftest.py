@@ -1,17 +1,22 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import NamedTuple
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.benchmarks.generator import PROFILES, generate_tenant
 from app.core.config import get_settings
 from app.core.database import get_db as core_get_db
 from app.core.database import get_public_db
+from app.core.metrics import instrument_engine
 from app.core.tenant import ensure_tenant_db_context, resolve_request_tenant_schema
 from app.main import app
 from app.models.base import Base
+from app.models.user import User
+from app.testing import QueryBudget, create_superuser_headers
 
 TEST_TENANT_SLUG = "pytest_tenant"
 TEST_TENANT_NAME = "Pytest Tenant"
@@ -20,7 +25,9 @@ TEST_TENANT_SCHEMA = "org_pytest_tenant"
 
 def _build_test_engine():
     settings = get_settings()
-    return create_engine(settings.database_url, pool_pre_ping=True)
+    engine = create_engine(settings.database_url, pool_pre_ping=True)
+    instrument_engine(engine)
+    return engine
 
 
 def _bootstrap_test_schema(engine) -> None:
@@ -136,3 +143,37 @@ def client_with_test_db() -> Generator[tuple[TestClient, Session], None, None]:
             app_main.validate_tenant_header_or_raise = original_guard
             app.dependency_overrides.clear()
             client.close()
+
+
+class GeneratedTenant(NamedTuple):
+    client: TestClient
+    db: Session
+    headers: dict[str, str]
+    user: User
+
+
+@pytest.fixture()
+def generated_tenant(
+    request: pytest.FixtureRequest,
+    client_with_test_db: tuple[TestClient, Session],
+) -> GeneratedTenant:
+    """The test tenant filled by the benchmark generator, committed.
+
+    Uses the "tiny" profile; parametrize indirectly with a profile name for
+    another one.
+    """
+    client, db = client_with_test_db
+    headers, user = create_superuser_headers(db, "generated-tenant@medhaone.app")
+    generate_tenant(db, PROFILES[getattr(request, "param", "tiny")], created_by=user.id)
+    db.commit()
+    return GeneratedTenant(client, db, headers, user)
+
+
+@pytest.fixture()
+def query_budget() -> QueryBudget:
+    """Counts the SQL statements of requests made through the test client.
+
+    Statements are recorded by the same engine hooks that feed the request
+    metrics, so both the test engine above and the async read engine count.
+    """
+    return QueryBudget()
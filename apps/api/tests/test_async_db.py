@@ -0,0 +1,85 @@
+import asyncio
+import inspect
+
+import pytest
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core import concurrency
+from app.core.config import Settings
+from app.core.database import AsyncSessionLocal, set_tenant_search_path_async
+from app.core.exceptions import AppException
+from app.core.tenant import ensure_tenant_db_context
+from app.main import app
+
+
+def test_async_session_binds_tenant_search_path(db_session: Session) -> None:
+    schema_name = db_session.execute(text("SELECT current_schema()")).scalar_one()
+
+    async def _search_path() -> tuple[str, str]:
+        async with AsyncSessionLocal() as db:
+            await set_tenant_search_path_async(db, schema_name)
+            bound = (await db.execute(text("SHOW search_path"))).scalar_one()
+        async with AsyncSessionLocal() as db:
+            fresh = (await db.execute(text("SHOW search_path"))).scalar_one()
+        return bound, fresh
+
+    bound, fresh = asyncio.run(_search_path())
+    assert schema_name in bound
+    assert fresh == "public"
+
+
+def test_route_group_limit_rejects_requests_beyond_its_slots(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(concurrency.settings, "route_concurrency_limits", {"reports": 1})
+    monkeypatch.setattr(concurrency.settings, "route_concurrency_timeout_seconds", 0.05)
+    monkeypatch.setattr(concurrency, "_SEMAPHORES", {})
+    hold_slot = concurrency.limit_concurrency("reports")
+
+    async def _second_request_while_first_runs() -> None:
+        first = hold_slot(Request({"type": "http"}))
+        await first.__anext__()
+        try:
+            with pytest.raises(AppException) as exc_info:
+                await hold_slot(Request({"type": "http"})).__anext__()
+            assert exc_info.value.status_code == 503
+        finally:
+            await first.aclose()
+        second = hold_slot(Request({"type": "http"}))
+        await second.__anext__()
+        await second.aclose()
+
+    asyncio.run(_second_request_while_first_runs())
+
+
+def test_tenant_routes_take_their_slot_before_any_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(concurrency.settings, "route_concurrency_limits", {"reports": 1})
+    monkeypatch.setattr(concurrency.settings, "route_concurrency_timeout_seconds", 0.05)
+    monkeypatch.setattr(concurrency, "_SEMAPHORES", {})
+    route = next(route for route in app.routes if getattr(route, "path", None) == "/reports/expiry")
+    tenant_context, route_limit = (dependency.dependency for dependency in route.dependencies)
+    assert tenant_context is ensure_tenant_db_context
+    # The tenant context's first dependency, ahead of its sessions.
+    slot_dependency = next(iter(inspect.signature(tenant_context).parameters.values())).default
+    assert slot_dependency.dependency is concurrency.hold_route_slot
+
+    async def _one_request() -> None:
+        request = Request({"type": "http", "route": route})
+        early = concurrency.hold_route_slot(request)
+        await early.__anext__()
+        # The route's own limit reuses the slot instead of waiting for a second one.
+        late = route_limit(request)
+        await late.__anext__()
+        await late.aclose()
+        await early.aclose()
+
+    asyncio.run(_one_request())
+
+
+def test_route_concurrency_limits_parse_from_environment_string() -> None:
+    settings = Settings(route_concurrency_limits="reports=4, master_lists=12")
+    assert settings.route_concurrency_limits == {"reports": 4, "master_lists": 12}
@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.audit import AuditLog
+from app.services.audit import write_audit_log
+from app.testing import create_superuser_headers
+
+ENTITY_ID = 424242
+
+
+def _snapshot(qty: int) -> dict[str, object]:
+    return {"id": ENTITY_ID, "name": "Paracetamol 650", "hsn": "3004", "qty": str(qty)}
+
+
+@pytest.fixture()
+def audited(client_with_test_db: tuple[TestClient, Session], monkeypatch: pytest.MonkeyPatch):
+    client, db = client_with_test_db
+    monkeypatch.setattr(get_settings(), "audit_snapshot_mode", "delta")
+    monkeypatch.setattr(get_settings(), "audit_keyframe_interval", 3)
+    headers, user = create_superuser_headers(db, "audit-delta@medhaone.app")
+
+    def _write(action: str, before: dict | None, after: dict | None) -> None:
+        write_audit_log(
+            db,
+            module="Products",
+            action=action,
+            entity_type="PRODUCT",
+            entity_id=ENTITY_ID,
+            performed_by=user.id,
+            before_snapshot=before,
+            after_snapshot=after,
+        )
+
+    _write("CREATE", None, _snapshot(0))
+    _write("UPDATE", _snapshot(0), _snapshot(1))
+    db.commit()
+    # Later requests find their position with a query rather than the session.
+    for qty in range(1, 5):
+        _write("UPDATE", _snapshot(qty), _snapshot(qty + 1))
+        db.commit()
+    return client, db, headers
+
+
+def test_delta_mode_stores_changed_fields_between_keyframes(audited) -> None:
+    _client, db, _headers = audited
+
+    logs = db.scalars(
+        select(AuditLog).where(AuditLog.entity_id == ENTITY_ID).order_by(AuditLog.id)
+    ).all()
+
+    assert [log.snapshot_seq for log in logs] == [0, 1, 2, 0, 1, 2]
+    assert logs[1].before_snapshot == {"qty": "0"}
+    assert logs[1].after_snapshot == {"qty": "1"}
+    assert logs[3].after_snapshot == _snapshot(3)
+
+
+def test_history_and_detail_reconstruct_full_snapshots(audited) -> None:
+    client, _db, headers = audited
+
+    history = client.get(f"/settings/history/PRODUCT/{ENTITY_ID}", headers=headers)
+    assert history.status_code == 200, history.text
+    entries = history.json()["entries"]
+    assert [entry["after_snapshot"] for entry in entries] == [
+        _snapshot(qty) for qty in range(5, -1, -1)
+    ]
+    assert entries[0]["before_snapshot"] == _snapshot(4)
+    assert entries[0]["changed_fields"] == ["qty"]
+
+    detail = client.get(f"/settings/audit-trail/{entries[1]['id']}", headers=headers)
+    assert detail.status_code == 200, detail.text
+    assert detail.json()["before_snapshot"] == _snapshot(3)
+    assert detail.json()["after_snapshot"] == _snapshot(4)
+
+    listed = client.get(
+        "/settings/audit-trail",
+        headers=headers,
+        params={"entity_type": "PRODUCT", "entity_id": str(ENTITY_ID), "page_size": 2},
+    )
+    assert listed.status_code == 200, listed.text
+    assert [row["changed_fields"] for row in listed.json()["data"]] == [["qty"], ["qty"]]
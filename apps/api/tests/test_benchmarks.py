@@ -0,0 +1,95 @@
+from dataclasses import replace
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.benchmarks.baseline import ScenarioResult, find_budget_overruns, find_regressions
+from app.benchmarks.generator import PROFILES, generate_tenant
+from app.benchmarks.scenarios import (
+    LARGE_ITEM_IMPORT_ROWS,
+    build_scenarios,
+    load_context,
+    run_scenario,
+)
+from app.models.audit import AuditLog
+from app.models.inventory import InventoryLedger, StockSummary
+from app.models.product import Product
+from app.models.purchase import GRN, GRNLine, PurchaseOrder
+from app.models.stock_provenance import StockSourceProvenance
+from app.models.tax_rate import TaxRate
+from app.services.period_close import stock_balance_mismatches
+from app.testing import create_superuser_headers
+
+
+def _count(db: Session, model) -> int:
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_generated_tenant_matches_profile_and_balances(db_session: Session) -> None:
+    _headers, user = create_superuser_headers(db_session, "bench-generate@medhaone.app")
+    profile = PROFILES["tiny"]
+
+    written = generate_tenant(db_session, profile, created_by=user.id)
+
+    assert _count(db_session, PurchaseOrder) == profile.purchase_orders
+    assert _count(db_session, InventoryLedger) == profile.ledger_rows == written["inventory_ledger"]
+    assert _count(db_session, AuditLog) == written["audit_logs"] > 0
+    grn_lines = _count(db_session, GRNLine)
+    assert _count(db_session, StockSourceProvenance) == grn_lines > 0
+    assert _count(db_session, GRN) == profile.purchase_orders - profile.purchase_orders // 20
+    assert stock_balance_mismatches(db_session) == []
+    assert db_session.scalar(select(func.min(StockSummary.qty_on_hand))) > 0
+
+
+def test_scenarios_report_latency_and_query_counts(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    ctx = load_context(db, client, headers)
+    chosen = {"grn_post", "so_confirm_dispatch", "report:/reports/current-stock"}
+    scenarios = [scenario for scenario in build_scenarios() if scenario.name in chosen]
+    assert len(scenarios) == len(chosen)
+
+    results = [run_scenario(ctx, scenario, iterations=2, warmup=0) for scenario in scenarios]
+
+    for result in results:
+        assert result.iterations == 2
+        assert result.queries > 0
+        assert 0 < result.p50_ms <= result.p95_ms <= result.max_ms
+
+
+def test_regression_check_flags_slower_p95_and_extra_queries() -> None:
+    baseline = {
+        "grn_post": ScenarioResult("grn_post", 20, 40.0, 50.0, 60.0, queries=30),
+        "report:/reports/expiry": ScenarioResult("report:/reports/expiry", 10, 2.0, 3.0, 4.0, 5),
+    }
+    results = [
+        ScenarioResult("grn_post", 20, 45.0, 62.0, 70.0, queries=31),
+        # Within the absolute floor despite doubling.
+        ScenarioResult("report:/reports/expiry", 10, 4.0, 6.0, 7.0, queries=5),
+        ScenarioResult("import_items", 5, 100.0, 120.0, 130.0, queries=500),
+    ]
+
+    regressions = find_regressions(results, baseline, latency_tolerance=0.2)
+
+    assert [(r.scenario, r.metric) for r in regressions] == [
+        ("grn_post", "p95_ms"),
+        ("grn_post", "queries"),
+    ]
+    assert find_regressions(results, baseline, latency_tolerance=0.3, query_tolerance=1) == []
+
+
+def test_hundred_thousand_item_import_meets_its_budget(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    db.add(TaxRate(code="GST_5", label="GST 5%", rate_percent="5.00", is_active=True))
+    db.commit()
+    ctx = load_context(db, client, headers)
+    (scenario,) = [s for s in build_scenarios() if s.name == "import_items_100k"]
+    before = _count(db, Product)
+
+    result = run_scenario(ctx, scenario)
+
+    assert result.iterations == 1
+    assert _count(db, Product) == before + LARGE_ITEM_IMPORT_ROWS
+    assert find_budget_overruns([result], {scenario.name: scenario.budget_ms}) == []
+    # Chunked inserts: the statement count does not scale with the row count.
+    assert result.queries < LARGE_ITEM_IMPORT_ROWS // 100
+    assert find_budget_overruns([replace(result, max_ms=60_001.0)], {scenario.name: 60_000.0})
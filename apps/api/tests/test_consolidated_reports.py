@@ -0,0 +1,149 @@
+import asyncio
+from collections.abc import Generator
+from datetime import date
+from time import perf_counter
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.benchmarks.generator import PROFILES, generate_tenant
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+from app.models.base import Base
+from app.reports.consolidated import (
+    CODE_POINT_COLLATION,
+    current_stock_order,
+    run_consolidated_report,
+    run_per_tenant,
+)
+from app.reports.current_stock import (
+    CurrentStockFilters,
+    _current_stock_stmt,
+    get_current_stock_report,
+)
+from app.testing import create_superuser_headers
+
+TENANT_SLUG = "pytest_tenant"
+BRANCH_SLUG = "pytest_branch"
+BRANCH_SCHEMA = "org_pytest_branch"
+
+
+def _seed(db: Session, email: str) -> None:
+    _headers, user = create_superuser_headers(db, email)
+    generate_tenant(db, PROFILES["tiny"], created_by=user.id)
+    # Mixed case, which a locale collation and a code-point sort order differently.
+    db.execute(text("UPDATE products SET name = lower(name) WHERE id % 3 = 0"))
+    db.commit()
+
+
+@pytest.fixture()
+def branch_session(db_session: Session) -> Generator[Session, None, None]:
+    """A second active tenant next to the one ``db_session`` is bound to."""
+    engine = create_engine(get_settings().database_url)
+    with engine.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{BRANCH_SCHEMA}"'))
+        connection.execute(
+            text(
+                """
+                INSERT INTO public.organizations (id, name, schema_name, max_users, is_active)
+                VALUES (:slug, 'Pytest Branch', :schema_name, 100, TRUE)
+                ON CONFLICT (id) DO UPDATE SET schema_name = EXCLUDED.schema_name, is_active = TRUE
+                """
+            ),
+            {"slug": BRANCH_SLUG, "schema_name": BRANCH_SCHEMA},
+        )
+    connection = engine.connect()
+    connection.execute(text(f'SET search_path TO "{BRANCH_SCHEMA}", public'))
+    translated = connection.execution_options(schema_translate_map={None: BRANCH_SCHEMA})
+    Base.metadata.create_all(bind=translated)
+    connection.commit()
+    session = Session(bind=translated, autoflush=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        connection.close()
+        with engine.begin() as cleanup:
+            cleanup.execute(text(f'DROP SCHEMA IF EXISTS "{BRANCH_SCHEMA}" CASCADE'))
+            cleanup.execute(
+                text("DELETE FROM public.organizations WHERE id = :slug"), {"slug": BRANCH_SLUG}
+            )
+        engine.dispose()
+
+
+def test_consolidated_page_is_the_merge_of_each_tenants_report(
+    db_session: Session, branch_session: Session
+) -> None:
+    _seed(db_session, "consolidated-head@medhaone.app")
+    _seed(branch_session, "consolidated-branch@medhaone.app")
+    filters = CurrentStockFilters(page=2, page_size=7)
+
+    report = asyncio.run(
+        run_consolidated_report(
+            [TENANT_SLUG, BRANCH_SLUG],
+            get_current_stock_report,
+            filters,
+            sort_key=current_stock_order,
+        )
+    )
+
+    everything = CurrentStockFilters(
+        page=1, page_size=10_000, sort_collation=CODE_POINT_COLLATION
+    )
+    per_tenant = {
+        slug: get_current_stock_report(db, everything)[1]
+        for slug, db in ((TENANT_SLUG, db_session), (BRANCH_SLUG, branch_session))
+    }
+    # The merge relies on the merge key agreeing with each tenant's own SQL order.
+    for rows in per_tenant.values():
+        keys = [current_stock_order(row) for row in rows]
+        assert keys == sorted(keys)
+    expected = sorted(
+        [{"organization_slug": slug, **row} for slug, rows in per_tenant.items() for row in rows],
+        key=current_stock_order,
+    )
+    assert report.total == len(expected)
+    assert [current_stock_order(row) for row in report.data] == [
+        current_stock_order(row) for row in expected[7:14]
+    ]
+    assert set(report.summaries) == {TENANT_SLUG, BRANCH_SLUG}
+    assert sum(summary["total_skus"] for summary in report.summaries.values()) > 0
+
+
+def test_single_tenant_report_keeps_the_database_collation() -> None:
+    def order_by(filters: CurrentStockFilters) -> str:
+        return str(_current_stock_stmt(filters, date.today())).rsplit("ORDER BY", 1)[1]
+
+    assert "COLLATE" not in order_by(CurrentStockFilters())
+    assert order_by(CurrentStockFilters(sort_collation=CODE_POINT_COLLATION)).count("COLLATE") == 3
+
+
+def test_tenants_run_concurrently_up_to_the_limit(
+    db_session: Session, branch_session: Session
+) -> None:
+    def _slow_report(db: Session, seconds: float) -> str:
+        db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": seconds})
+        return db.execute(text("SELECT current_schema()")).scalar_one()
+
+    def _timed(concurrency: int) -> tuple[dict[str, str], float]:
+        started_at = perf_counter()
+        results = asyncio.run(
+            run_per_tenant(
+                [BRANCH_SLUG, TENANT_SLUG], _slow_report, 0.4, concurrency=concurrency
+            )
+        )
+        return results, perf_counter() - started_at
+
+    results, parallel = _timed(2)
+    assert results == {BRANCH_SLUG: BRANCH_SCHEMA, TENANT_SLUG: "org_pytest_tenant"}
+    assert parallel < 0.75
+
+    _results, serial = _timed(1)
+    assert serial >= 0.8
+
+
+def test_unknown_organization_is_rejected(db_session: Session) -> None:
+    with pytest.raises(AppException) as exc_info:
+        asyncio.run(run_per_tenant([TENANT_SLUG, "no_such_org"], lambda db: None))
+    assert exc_info.value.status_code == 403
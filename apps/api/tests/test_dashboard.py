@@ -0,0 +1,225 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.dashboard_snapshot import DASHBOARD_SNAPSHOT_ID, DashboardSnapshot
+from app.models.warehouse import Warehouse
+from app.services.dashboard import record_dashboard_delta, refresh_dashboard_snapshot
+from app.testing import (
+    approve_po,
+    create_and_post_grn,
+    create_customer,
+    create_po,
+    create_product,
+    create_superuser_headers,
+    create_supplier,
+    create_warehouse,
+)
+
+_FIGURES = (
+    "total_products",
+    "total_parties",
+    "total_warehouses",
+    "stock_items_count",
+    "expiring_soon_count",
+    "open_purchase_orders",
+    "pending_dispatches",
+)
+
+
+def _metrics(client: TestClient, headers: dict[str, str]) -> dict:
+    response = client.get("/dashboard/metrics", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _refreshed_at(db: Session):
+    db.expire_all()
+    return db.get(DashboardSnapshot, DASHBOARD_SNAPSHOT_ID).refreshed_at
+
+
+def test_dashboard_metrics_follow_write_paths_without_rebuilding(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "dashboard-kpis@medhaone.app")
+    today = date.today()
+
+    initial = _metrics(client, headers)
+    assert initial["as_of"] == today.isoformat()
+    assert all(initial[name] == 0 for name in _FIGURES)
+    built_at = _refreshed_at(db)
+
+    supplier_id = create_supplier(client, headers, "Dashboard Supplier")
+    customer_id = create_customer(client, headers, "Dashboard Customer")
+    warehouse_id = create_warehouse(client, headers, "DASH-WH")
+    product_id = create_product(client, headers, "DASH-SKU")
+
+    po = create_po(
+        client,
+        headers,
+        supplier_id=supplier_id,
+        warehouse_id=warehouse_id,
+        product_id=product_id,
+        ordered_qty="10",
+        unit_cost="12.50",
+        order_date=today.isoformat(),
+    )
+    assert _metrics(client, headers)["open_purchase_orders"] == 0
+    approve_po(client, headers, po["id"])
+    assert _metrics(client, headers)["open_purchase_orders"] == 1
+
+    grn = create_and_post_grn(
+        client,
+        headers,
+        po_id=po["id"],
+        po_line_id=po["lines"][0]["id"],
+        received_qty="4",
+        batch_no="DASH-SOON",
+        expiry_date=(today + timedelta(days=10)).isoformat(),
+        received_date=today.isoformat(),
+    )
+    after_grn = _metrics(client, headers)
+    assert after_grn["total_products"] == 1
+    assert after_grn["total_parties"] == 2
+    assert after_grn["total_warehouses"] == 1
+    assert after_grn["stock_items_count"] == 1
+    assert after_grn["expiring_soon_count"] == 1
+    assert after_grn["open_purchase_orders"] == 1
+    assert Decimal(after_grn["total_stock_value"]) == Decimal("50.00")
+
+    sales_order = client.post(
+        "/sales-orders",
+        headers=headers,
+        json={
+            "customer_id": customer_id,
+            "warehouse_id": warehouse_id,
+            "order_date": today.isoformat(),
+            "lines": [
+                {
+                    "product_id": product_id,
+                    "ordered_qty": "4",
+                    "unit_price": "20.00",
+                    "discount_percent": "0",
+                    "gst_rate": "12",
+                }
+            ],
+        },
+    ).json()
+    confirm = client.post(f"/sales-orders/{sales_order['id']}/confirm", headers=headers)
+    assert confirm.status_code == 200, confirm.text
+    dispatch = client.post(
+        f"/dispatch-notes/from-sales-order/{sales_order['id']}",
+        headers=headers,
+        json={
+            "dispatch_date": today.isoformat(),
+            "lines": [
+                {
+                    "sales_order_line_id": sales_order["lines"][0]["id"],
+                    "batch_id": grn["lines"][0]["batch_id"],
+                    "dispatched_qty": "4",
+                }
+            ],
+        },
+    )
+    assert dispatch.status_code == 201, dispatch.text
+    assert _metrics(client, headers)["pending_dispatches"] == 1
+
+    posted = client.post(f"/dispatch-notes/{dispatch.json()['id']}/post", headers=headers)
+    assert posted.status_code == 200, posted.text
+    final = _metrics(client, headers)
+    assert final["pending_dispatches"] == 0
+    assert final["stock_items_count"] == 0
+    assert final["expiring_soon_count"] == 0
+
+    # Every figure above came from deltas applied at commit, never a rebuild,
+    # and they agree with a full recount of the source tables.
+    assert _refreshed_at(db) == built_at
+    rebuilt = refresh_dashboard_snapshot(db, today)
+    assert {name: getattr(rebuilt, name) for name in _FIGURES} == {
+        name: final[name] for name in _FIGURES
+    }
+    assert rebuilt.total_stock_value == Decimal(final["total_stock_value"])
+    db.rollback()
+
+
+def test_dashboard_snapshot_rebuilds_expiry_window_on_a_new_day(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "dashboard-rollover@medhaone.app")
+    today = date.today()
+
+    supplier_id = create_supplier(client, headers, "Rollover Supplier")
+    warehouse_id = create_warehouse(client, headers, "ROLL-WH")
+    product_id = create_product(client, headers, "ROLL-SKU")
+    po = create_po(
+        client,
+        headers,
+        supplier_id=supplier_id,
+        warehouse_id=warehouse_id,
+        product_id=product_id,
+        ordered_qty="5",
+        unit_cost="10.00",
+        order_date=today.isoformat(),
+    )
+    approve_po(client, headers, po["id"])
+    create_and_post_grn(
+        client,
+        headers,
+        po_id=po["id"],
+        po_line_id=po["lines"][0]["id"],
+        received_qty="5",
+        batch_no="ROLL-LATER",
+        expiry_date=(today + timedelta(days=40)).isoformat(),
+        received_date=today.isoformat(),
+    )
+    assert _metrics(client, headers)["expiring_soon_count"] == 0
+    built_at = _refreshed_at(db)
+
+    snapshot = db.get(DashboardSnapshot, DASHBOARD_SNAPSHOT_ID)
+    snapshot.as_of = today - timedelta(days=1)
+    db.commit()
+    rebuilt = _metrics(client, headers)
+    assert rebuilt["as_of"] == today.isoformat()
+    assert rebuilt["stock_items_count"] == 1
+    assert _refreshed_at(db) != built_at
+
+    # Fifteen days on, the batch falls inside the 30-day window.
+    later = refresh_dashboard_snapshot(db, today + timedelta(days=15))
+    assert later.expiring_soon_count == 1
+    db.rollback()
+
+
+def test_rebuild_keeps_deltas_committed_while_it_counts(db_session: Session) -> None:
+    db = db_session
+    refresh_dashboard_snapshot(db)
+    db.commit()
+    engine = create_engine(get_settings().database_url)
+    writer = Session(
+        bind=engine.execution_options(schema_translate_map={None: "org_pytest_tenant"})
+    )
+
+    written = []
+
+    @event.listens_for(db, "do_orm_execute")
+    def _write_before_the_lock(state) -> None:
+        # A warehouse created after the counts were taken, before the row lock.
+        if state.is_select and state.statement._for_update_arg is not None and not written:
+            written.append(True)
+            writer.add(Warehouse(name="Late Warehouse", code="LATE-WH"))
+            record_dashboard_delta(writer, total_warehouses=1)
+            writer.commit()
+
+    try:
+        snapshot = refresh_dashboard_snapshot(db)
+        db.commit()
+        assert snapshot.total_warehouses == db.scalar(select(func.count(Warehouse.id))) == 1
+    finally:
+        event.remove(db, "do_orm_execute", _write_before_the_lock)
+        writer.close()
+        engine.dispose()
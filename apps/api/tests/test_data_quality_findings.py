@@ -0,0 +1,131 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.models.data_quality import DataQualityFinding
+from app.models.warehouse import Warehouse
+from app.services.data_quality import DUPLICATE_MASTERS, rescan_data_quality_findings
+from app.testing import create_customer, create_superuser_headers
+
+
+def _missing_fields(client: TestClient, headers: dict[str, str], **params) -> dict:
+    response = client.get(
+        "/reports/data-quality/missing-fields",
+        headers=headers,
+        params={"entity_types": "PARTY", **params},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_party_edits_update_missing_field_findings_and_rule_counts(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "dq-findings@medhaone.app")
+    party_id = create_customer(client, headers, "DQ Retailer")
+    create_customer(client, headers, "DQ Chemist")
+
+    payload = _missing_fields(client, headers)
+    assert payload["total"] == 2
+    assert [row["entity_name"] for row in payload["data"]] == ["DQ Chemist", "DQ Retailer"]
+    assert payload["data"][1]["missing_fields"] == "gstin, state, contact_person"
+
+    response = client.patch(
+        f"/masters/parties/{party_id}",
+        headers=headers,
+        json={"state": "Maharashtra", "contact_person": "Asha"},
+    )
+    assert response.status_code == 200, response.text
+
+    payload = _missing_fields(client, headers)
+    assert payload["data"][1] == {
+        "entity_type": "PARTY",
+        "entity_name": "DQ Retailer",
+        "entity_id": party_id,
+        "missing_fields": "gstin",
+    }
+    summary = {metric["key"]: metric["value"] for metric in payload["summary"]}
+    assert summary == {"rows": 2, "rule:gstin": 2, "rule:state": 1, "rule:contact_person": 1}
+
+    filtered = _missing_fields(client, headers, missing_field_type="state", page_size=1)
+    assert filtered["total"] == 1
+    assert filtered["data"][0]["entity_name"] == "DQ Chemist"
+
+
+def test_duplicate_groups_follow_renames_in_both_directions(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    _client, db = client_with_test_db
+    first = Warehouse(name="DQ Main", code="DQ-1")
+    second = Warehouse(name="DQ Annex", code="DQ-2")
+    db.add_all([first, second])
+    db.commit()
+
+    def duplicate_values() -> list[tuple[str, int | None]]:
+        return db.execute(
+            select(DataQualityFinding.subject_key, DataQualityFinding.record_count).where(
+                DataQualityFinding.report == DUPLICATE_MASTERS
+            )
+        ).all()
+
+    second.name = "DQ Main"
+    db.commit()
+    assert duplicate_values() == [("DQ Main", 2)]
+
+    # Only the old value names the group the rename leaves.
+    second.name = "DQ Annex"
+    db.commit()
+    assert duplicate_values() == []
+
+
+def test_rescan_repairs_writes_that_bypass_the_orm(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "dq-rescan@medhaone.app")
+    party_id = create_customer(client, headers, "DQ Bulk Retailer")
+    db.execute(
+        text(
+            "UPDATE parties SET gstin = '27ABCDE1234F1Z5', state = 'Goa', "
+            "contact_person = 'Ravi' WHERE id = :id"
+        ),
+        {"id": party_id},
+    )
+    db.commit()
+    assert _missing_fields(client, headers)["total"] == 1
+
+    rescan_data_quality_findings(db)
+    db.commit()
+
+    assert _missing_fields(client, headers)["total"] == 0
+
+
+def test_bulk_imported_parties_get_findings(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "dq-import@medhaone.app")
+    response = client.post(
+        "/masters/parties/bulk",
+        headers=headers,
+        json={
+            "rows": [
+                {"party_name": "DQ Imported Retailer", "party_category": "RETAILER"},
+                {
+                    "party_name": "DQ Imported Distributor",
+                    "party_type": "DISTRIBUTOR",
+                    "gstin": "27ABCDE1234F1Z5",
+                    "state": "Maharashtra",
+                    "contact_person": "Asha",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["created_count"] == 2
+
+    payload = _missing_fields(client, headers)
+    assert [(row["entity_name"], row["missing_fields"]) for row in payload["data"]] == [
+        ("DQ Imported Retailer", "gstin, state, contact_person"),
+    ]
@@ -0,0 +1,93 @@
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.main import stale_data_handler
+from app.models.enums import GSTVerifiedStatus, PartyType
+from app.models.party import Party
+from app.models.product import Product
+from app.models.purchase import PurchaseOrder
+from app.models.warehouse import Warehouse
+from app.schemas.purchase import PurchaseOrderUpdate
+from app.services.purchase import update_po
+
+
+def _po_payload(db: Session, ordered_qty: str) -> dict:
+    supplier_id = db.scalar(
+        select(Party.id)
+        .where(Party.party_type == PartyType.SUPPLIER)
+        .where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+        .limit(1)
+    )
+    return {
+        "supplier_id": supplier_id,
+        "warehouse_id": db.scalar(select(Warehouse.id).order_by(Warehouse.id).limit(1)),
+        "lines": [
+            {
+                "product_id": db.scalar(select(Product.id).order_by(Product.id).limit(1)),
+                "ordered_qty": ordered_qty,
+                "unit_cost": "10.00",
+            }
+        ],
+    }
+
+
+def test_po_edit_based_on_a_stale_version_is_rejected(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    created = client.post("/purchase/po", headers=headers, json=_po_payload(db, "10"))
+    assert created.status_code == 201, created.text
+    po_id, version = created.json()["id"], created.json()["version"]
+
+    # A line-only edit still moves the header's version on.
+    first = client.patch(
+        f"/purchase/po/{po_id}",
+        headers=headers,
+        json={**_po_payload(db, "12"), "version": version},
+    )
+    assert first.status_code == 200, first.text
+    assert first.json()["version"] == version + 1
+
+    second = client.patch(
+        f"/purchase/po/{po_id}",
+        headers=headers,
+        json={**_po_payload(db, "15"), "version": version},
+    )
+    assert second.status_code == 409, second.text
+    assert second.json()["error_code"] == "VERSION_CONFLICT"
+    assert second.json()["details"] == {
+        "expected_version": version,
+        "current_version": version + 1,
+    }
+
+    current = client.get(f"/purchase/po/{po_id}", headers=headers).json()
+    assert Decimal(str(current["lines"][0]["ordered_qty"])) == Decimal("12")
+    assert current["version"] == version + 1
+
+
+def test_write_after_a_concurrent_commit_fails_instead_of_overwriting(generated_tenant) -> None:
+    client, db, headers, user = generated_tenant
+    created = client.post("/purchase/po", headers=headers, json=_po_payload(db, "10"))
+    po_id = created.json()["id"]
+
+    db.expire_all()
+    loaded = db.get(PurchaseOrder, po_id)
+    assert loaded is not None
+    # Another writer gets in between this session's read and its write.
+    db.execute(
+        text("UPDATE purchase_orders SET version = version + 1, notes = 'theirs' WHERE id = :id"),
+        {"id": po_id},
+    )
+
+    payload = PurchaseOrderUpdate.model_validate({**_po_payload(db, "20"), "notes": "mine"})
+    with pytest.raises(StaleDataError):
+        update_po(db, po_id, payload, user.id)
+    db.rollback()
+
+    response = asyncio.run(stale_data_handler(None, StaleDataError()))
+    assert response.status_code == 409
+    assert json.loads(response.body)["error_code"] == "VERSION_CONFLICT"
@@ -0,0 +1,216 @@
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import ExitStack
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+from app.core.idempotency import REPLAYED_HEADER, IdempotentRequest
+from app.models.idempotency import IdempotencyKey
+from app.models.inventory import InventoryLedger
+from app.models.warehouse import Warehouse
+from app.testing import create_batch, create_product, create_superuser_headers, create_warehouse
+
+TENANT_SCHEMA = "org_pytest_tenant"
+
+
+def test_retried_stock_in_is_answered_from_the_store(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "idempotency@medhaone.app")
+    warehouse_id = create_warehouse(client, headers, "IDEM")
+    product_id = create_product(client, headers, "IDEM-SKU-1")
+    batch = create_batch(
+        db, product_id=product_id, batch_no="IDEM-B1", expiry_date=date(2030, 1, 1)
+    )
+    payload = {
+        "warehouse_id": warehouse_id,
+        "product_id": product_id,
+        "batch_id": batch.id,
+        "qty": "10",
+        "reason": "OPENING_STOCK",
+    }
+    keyed = {**headers, "Idempotency-Key": "tablet-7:stock-in:1"}
+
+    first = client.post("/inventory/in", headers=keyed, json=payload)
+    retry = client.post("/inventory/in", headers=keyed, json=payload)
+    assert first.status_code == retry.status_code == 200, retry.text
+    assert retry.json() == first.json()
+    assert REPLAYED_HEADER not in first.headers
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert Decimal(str(retry.json()["qty_on_hand"])) == Decimal("10")
+    assert db.scalar(select(func.count()).select_from(InventoryLedger)) == 1
+
+    reused = client.post("/inventory/in", headers=keyed, json={**payload, "qty": "5"})
+    assert reused.status_code == 422
+    assert reused.json()["error_code"] == "IDEMPOTENCY_KEY_REUSED"
+
+    # Without the header every request posts.
+    assert client.post("/inventory/in", headers=headers, json=payload).status_code == 200
+    assert db.scalar(select(func.count()).select_from(InventoryLedger)) == 2
+
+
+class _Posted(BaseModel):
+    code: str
+
+
+class _Unstorable(BaseModel):
+    missing: str
+
+
+@pytest.fixture()
+def sessions(db_session: Session) -> Generator[Callable[[], Session], None, None]:
+    """Opens sessions on connections of their own, one per simulated request."""
+    engine = create_engine(get_settings().database_url)
+    with ExitStack() as stack:
+
+        def _open() -> Session:
+            connection = stack.enter_context(engine.connect())
+            translated = connection.execution_options(schema_translate_map={None: TENANT_SCHEMA})
+            return stack.enter_context(Session(bind=translated, autoflush=False))
+
+        yield _open
+    engine.dispose()
+
+
+def _request(key: str, subject: str = "local:1") -> IdempotentRequest:
+    return IdempotentRequest(
+        key=key,
+        tenant_schema=TENANT_SCHEMA,
+        subject=subject,
+        route="/test/post",
+        request_hash="same-request",
+        status_code=200,
+        response_model=_Posted,
+    )
+
+
+def _post(
+    db: Session, code: str, *, delay: float = 0.0, fail: bool = False
+) -> Callable[[], Warehouse]:
+    """A posting that writes a warehouse and leaves the commit to ``run``."""
+
+    def _run() -> Warehouse:
+        warehouse = Warehouse(name=f"Posted {code}", code=code)
+        db.add(warehouse)
+        db.flush()
+        time.sleep(delay)
+        if fail:
+            raise AppException(error_code="INVALID_STATE", message="nope", status_code=409)
+        return warehouse
+
+    return _run
+
+
+def _posted_codes(db: Session) -> list[str]:
+    return sorted(db.scalars(select(Warehouse.code).where(Warehouse.code.like("IDEM-%"))))
+
+
+def _run_alongside(sessions, key: str, first_post) -> tuple[object, dict]:
+    """Start the first request under ``key``, then retry it while it runs."""
+    first_db, retry_db = sessions(), sessions()
+    results: dict = {}
+
+    def _first() -> None:
+        try:
+            results["first"] = _request(key).run(first_db, first_post(first_db))
+        except AppException as error:
+            results["first"] = error
+
+    thread = threading.Thread(target=_first)
+    thread.start()
+    # Let the first request take the key before the retry arrives.
+    time.sleep(0.1)
+    try:
+        retried = _request(key).run(retry_db, _post(retry_db, "IDEM-RETRY"))
+    finally:
+        thread.join()
+    return retried, results
+
+
+def test_concurrent_duplicate_waits_for_the_first_request(sessions) -> None:
+    retried, results = _run_alongside(
+        sessions, "wait-1", lambda db: _post(db, "IDEM-FIRST", delay=0.5)
+    )
+
+    assert REPLAYED_HEADER not in results["first"].headers
+    assert retried.headers[REPLAYED_HEADER] == "true"
+    assert retried.body == b'{"code":"IDEM-FIRST"}'
+    assert _posted_codes(sessions()) == ["IDEM-FIRST"]
+
+
+def test_duplicate_of_a_failed_request_runs_itself(sessions) -> None:
+    retried, results = _run_alongside(
+        sessions, "fail-1", lambda db: _post(db, "IDEM-FIRST", delay=0.3, fail=True)
+    )
+
+    assert isinstance(results["first"], AppException)
+    assert REPLAYED_HEADER not in retried.headers
+    assert retried.body == b'{"code":"IDEM-RETRY"}'
+    assert _posted_codes(sessions()) == ["IDEM-RETRY"]
+    # The retry's success is what later duplicates see.
+    db = sessions()
+    replayed = _request("fail-1").run(db, _post(db, "IDEM-AGAIN"))
+    assert replayed.headers[REPLAYED_HEADER] == "true"
+    assert replayed.body == b'{"code":"IDEM-RETRY"}'
+
+
+def test_duplicate_gives_up_waiting_with_409(sessions, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "idempotency_wait_seconds", 0.1)
+
+    with pytest.raises(AppException) as exc_info:
+        _run_alongside(sessions, "slow-1", lambda db: _post(db, "IDEM-FIRST", delay=0.5))
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.error_code == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+def test_response_is_stored_with_the_posting_or_not_at_all(sessions) -> None:
+    db = sessions()
+    unstorable = replace(_request("atomic-1"), response_model=_Unstorable)
+    with pytest.raises(ValidationError):
+        unstorable.run(db, _post(db, "IDEM-LOST"))
+
+    # Neither the posting nor the key survived, so the retry posts.
+    retried = _request("atomic-1").run(db, _post(db, "IDEM-RETRY"))
+    assert REPLAYED_HEADER not in retried.headers
+    assert _posted_codes(sessions()) == ["IDEM-RETRY"]
+    stored = sessions().scalar(select(func.count()).select_from(IdempotencyKey))
+    assert stored == 1
+
+
+def test_keys_are_scoped_to_the_caller(sessions) -> None:
+    db = sessions()
+    _request("shared-1", subject="local:1").run(db, _post(db, "IDEM-ONE"))
+    other = _request("shared-1", subject="local:2").run(db, _post(db, "IDEM-TWO"))
+
+    assert REPLAYED_HEADER not in other.headers
+    assert _posted_codes(sessions()) == ["IDEM-ONE", "IDEM-TWO"]
+
+
+def test_key_lock_is_taken_on_the_posting_connection(sessions) -> None:
+    db = sessions()
+    seen: dict = {}
+
+    def _post_and_look() -> Warehouse:
+        seen["lock_holders"] = db.scalars(
+            text("SELECT pid FROM pg_locks WHERE locktype = 'advisory' AND granted")
+        ).all()
+        seen["backend"] = db.scalar(text("SELECT pg_backend_pid()"))
+        seen["lock_timeout"] = db.scalar(text("SELECT current_setting('lock_timeout')"))
+        return _post(db, "IDEM-ONE")()
+
+    _request("conn-1").run(db, _post_and_look)
+
+    assert seen["lock_holders"] == [seen["backend"]]
+    # The wait timeout applied to the key lock only.
+    assert seen["lock_timeout"] == "0"
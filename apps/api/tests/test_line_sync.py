@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.core.exceptions import AppException
+from app.core.metrics import record_statements
+from app.models.enums import GSTVerifiedStatus, PartyType
+from app.models.party import Party
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+from app.services.line_sync import sync_lines
+
+
+@dataclass(eq=False)
+class _Line:
+    product_id: int
+    qty: Decimal
+    id: int | None = None
+
+
+def test_sync_lines_matches_by_id_then_natural_key() -> None:
+    first = _Line(1, Decimal("5"), id=10)
+    second = _Line(2, Decimal("1"), id=11)
+    third = _Line(3, Decimal("2"), id=12)
+    collection = [first, second, third]
+
+    changes = sync_lines(
+        collection,
+        [
+            {"id": 12, "product_id": 4, "qty": Decimal("2")},
+            {"product_id": 1, "qty": Decimal("5.000")},
+            {"product_id": 2, "qty": Decimal("7")},
+            {"product_id": 9, "qty": Decimal("1")},
+        ],
+        create=_Line,
+        natural_key=("product_id",),
+    )
+
+    assert changes.lines[:3] == [third, first, second]
+    assert changes.updated == [third, second]
+    assert (third.product_id, second.qty, first.qty) == (4, Decimal("7"), Decimal("5"))
+    assert [(line.product_id, line.id) for line in changes.created] == [(9, None)]
+    assert changes.deleted == []
+    assert collection == [first, second, third, changes.created[0]]
+
+
+def test_sync_lines_removes_unmatched_lines_and_rejects_foreign_ids() -> None:
+    kept, dropped = _Line(1, Decimal("1"), id=1), _Line(1, Decimal("2"), id=2)
+    collection = [kept, dropped]
+
+    changes = sync_lines(
+        collection, [{"product_id": 1, "qty": Decimal("1")}], create=_Line, natural_key=("product_id",)
+    )
+    assert collection == [kept]
+    assert changes.deleted == [dropped]
+    assert changes.updated == []
+
+    with pytest.raises(AppException) as error:
+        sync_lines(
+            collection,
+            [{"id": 99, "product_id": 1, "qty": Decimal("1")}],
+            create=_Line,
+            natural_key=("product_id",),
+        )
+    assert error.value.details == {"line_id": 99}
+
+
+def _statements(recorder, table: str) -> list[str]:
+    return [
+        statement.split(" ", 1)[0]
+        for request in recorder.requests
+        for statement in request.metrics.statements
+        if statement.startswith(("INSERT", "UPDATE", "DELETE")) and f"{table} " in statement
+    ]
+
+
+def test_sales_order_edit_only_writes_changed_lines(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    products = db.scalars(select(Product.id).order_by(Product.id).limit(5)).all()
+    customer_id = db.scalar(select(Party.id).where(Party.party_type == PartyType.CUSTOMER).limit(1))
+    pricing = {"unit_price": "10.00", "discount_percent": "0", "gst_rate": "12"}
+    created = client.post(
+        "/sales-orders",
+        headers=headers,
+        json={
+            "customer_id": customer_id,
+            "warehouse_id": db.scalar(select(Warehouse.id).order_by(Warehouse.id).limit(1)),
+            "lines": [
+                {"product_id": product_id, "ordered_qty": "2", **pricing}
+                for product_id in products[:4]
+            ],
+        },
+    )
+    assert created.status_code == 201, created.text
+    lines = created.json()["lines"]
+
+    with record_statements() as recorder:
+        response = client.patch(
+            f"/sales-orders/{created.json()['id']}",
+            headers=headers,
+            json={
+                "lines": [
+                    {"id": lines[0]["id"], "product_id": products[0], "ordered_qty": "2", **pricing},
+                    {"product_id": products[1], "ordered_qty": "9", **pricing},
+                    {"product_id": products[3], "ordered_qty": "2", **pricing},
+                    {"product_id": products[4], "ordered_qty": "1", **pricing},
+                ],
+            },
+        )
+    assert response.status_code == 200, response.text
+
+    updated = response.json()["lines"]
+    assert [line["id"] for line in updated[:3]] == [lines[0]["id"], lines[1]["id"], lines[3]["id"]]
+    assert Decimal(str(updated[1]["ordered_qty"])) == Decimal("9")
+    assert updated[3]["product_id"] == products[4]
+    assert sorted(_statements(recorder, "sales_order_lines")) == ["DELETE", "INSERT", "UPDATE"]
+
+
+def test_grn_draft_edit_keeps_line_ids(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    supplier_id = db.scalar(
+        select(Party.id)
+        .where(Party.party_type == PartyType.SUPPLIER)
+        .where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+        .limit(1)
+    )
+    products = db.scalars(select(Product.id).order_by(Product.id).limit(2)).all()
+    po = client.post(
+        "/purchase/po",
+        headers=headers,
+        json={
+            "supplier_id": supplier_id,
+            "warehouse_id": db.scalar(select(Warehouse.id).order_by(Warehouse.id).limit(1)),
+            "lines": [
+                {"product_id": product_id, "ordered_qty": "20", "unit_cost": "10.00"}
+                for product_id in products
+            ],
+        },
+    ).json()
+    assert client.post(f"/purchase/po/{po['id']}/approve", headers=headers).status_code == 200
+    expiry_date = (date.today() + timedelta(days=400)).isoformat()
+
+    def _grn_lines(received_qty: str) -> list[dict]:
+        return [
+            {
+                "po_line_id": line["id"],
+                "received_qty": received_qty if index == 0 else "5",
+                "batch_no": f"SYNC-{po['id']}-{index}",
+                "expiry_date": expiry_date,
+            }
+            for index, line in enumerate(po["lines"])
+        ]
+
+    grn = client.post(f"/purchase/grn/from-po/{po['id']}", headers=headers, json={"lines": _grn_lines("5")})
+    assert grn.status_code == 201, grn.text
+    response = client.patch(
+        f"/purchase/grn/{grn.json()['id']}",
+        headers=headers,
+        json={"received_date": date.today().isoformat(), "lines": _grn_lines("8")},
+    )
+    assert response.status_code == 200, response.text
+
+    before, after = grn.json()["lines"], response.json()["lines"]
+    assert [line["id"] for line in after] == [line["id"] for line in before]
+    assert [line["batch_lines"][0]["id"] for line in after] == [
+        line["batch_lines"][0]["id"] for line in before
+    ]
+    assert Decimal(str(after[0]["received_qty_total"])) == Decimal("8")
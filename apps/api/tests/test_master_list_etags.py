@@ -0,0 +1,215 @@
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.orm import Session
+
+from app.testing import create_customer, create_product, create_superuser_headers, create_warehouse
+
+
+def _current_etag(client: TestClient, headers: dict[str, str], path: str) -> str:
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+    revalidated = client.get(path, headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    return etag
+
+
+def _assert_invalidates(
+    client: TestClient,
+    headers: dict[str, str],
+    path: str,
+    mutate: Callable[[], Response],
+) -> Response:
+    etag = _current_etag(client, headers, path)
+    mutation = mutate()
+    assert mutation.status_code in (200, 201), mutation.text
+    response = client.get(path, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["etag"] != etag
+    return mutation
+
+
+def test_master_lists_revalidate_until_each_mutating_route_changes_them(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "list-etags@medhaone.app")
+
+    brand = _assert_invalidates(
+        client,
+        headers,
+        "/masters/brands",
+        lambda: client.post("/masters/brands", headers=headers, json={"name": "Etag Brand"}),
+    ).json()
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/brands",
+        lambda: client.patch(
+            f"/masters/brands/{brand['id']}", headers=headers, json={"name": "Etag Brand 2"}
+        ),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/brands",
+        lambda: client.delete(f"/masters/brands/{brand['id']}", headers=headers),
+    )
+
+    uom = _assert_invalidates(
+        client,
+        headers,
+        "/masters/uoms",
+        lambda: client.post("/masters/uoms", headers=headers, json={"name": "ETAGBOX"}),
+    ).json()
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/uoms",
+        lambda: client.patch(f"/masters/uoms/{uom['id']}", headers=headers, json={"name": "ETAGCASE"}),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/uoms",
+        lambda: client.delete(f"/masters/uoms/{uom['id']}", headers=headers),
+    )
+
+    category = _assert_invalidates(
+        client,
+        headers,
+        "/masters/categories",
+        lambda: client.post("/masters/categories", headers=headers, json={"name": "Etag Category"}),
+    ).json()
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/categories",
+        lambda: client.patch(
+            f"/masters/categories/{category['id']}", headers=headers, json={"name": "Etag Group"}
+        ),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/categories",
+        lambda: client.delete(f"/masters/categories/{category['id']}", headers=headers),
+    )
+
+    party_ids: list[int] = []
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/parties",
+        lambda: _record(party_ids, create_customer(client, headers, "Etag Retailer")),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/parties",
+        lambda: client.patch(
+            f"/masters/parties/{party_ids[0]}", headers=headers, json={"city": "Pune"}
+        ),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/parties",
+        lambda: client.delete(f"/masters/parties/{party_ids[0]}", headers=headers),
+    )
+
+    warehouse_ids: list[int] = []
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/warehouses",
+        lambda: _record(warehouse_ids, create_warehouse(client, headers, "ETAG-WH")),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/warehouses",
+        lambda: client.put(
+            f"/masters/warehouses/{warehouse_ids[0]}", headers=headers, json={"name": "Etag Store"}
+        ),
+    )
+
+    product_ids: list[int] = []
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/products",
+        lambda: _record(product_ids, create_product(client, headers, "ETAG-SKU")),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/products",
+        lambda: client.put(
+            f"/masters/products/{product_ids[0]}", headers=headers, json={"name": "Etag Product"}
+        ),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/products",
+        lambda: client.delete(f"/masters/products/{product_ids[0]}", headers=headers),
+    )
+    # Product lists embed warehouse context, so a warehouse change revalidates them too.
+    _assert_invalidates(
+        client,
+        headers,
+        "/masters/products",
+        lambda: client.delete(f"/masters/warehouses/{warehouse_ids[0]}", headers=headers),
+    )
+
+    tax_rate = _assert_invalidates(
+        client,
+        headers,
+        "/tax-rates?include_inactive=true",
+        lambda: client.post(
+            "/tax-rates",
+            headers=headers,
+            json={"code": "GST_ETAG", "label": "GST Etag", "rate_percent": 7, "is_active": True},
+        ),
+    ).json()
+    _assert_invalidates(
+        client,
+        headers,
+        "/tax-rates?include_inactive=true",
+        lambda: client.patch(
+            f"/tax-rates/{tax_rate['id']}", headers=headers, json={"label": "GST Etag 7"}
+        ),
+    )
+    _assert_invalidates(
+        client,
+        headers,
+        "/tax-rates?include_inactive=true",
+        lambda: client.delete(f"/tax-rates/{tax_rate['id']}", headers=headers),
+    )
+
+
+def test_master_list_etag_depends_on_query_and_ignores_unrelated_changes(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "list-etags-scope@medhaone.app")
+
+    warehouses_etag = _current_etag(client, headers, "/masters/warehouses")
+    inactive_etag = _current_etag(client, headers, "/masters/warehouses?include_inactive=true")
+    assert warehouses_etag != inactive_etag
+
+    create_customer(client, headers, "Unrelated Retailer")
+    unchanged = client.get(
+        "/masters/warehouses", headers={**headers, "If-None-Match": f"W/{warehouses_etag}"}
+    )
+    assert unchanged.status_code == 304
+
+
+def _record(ids: list[int], value: int) -> Response:
+    ids.append(value)
+    return Response(201)
@@ -194,6 +194,47 @@ def test_bulk_party_import_mixed_rows(client_with_test_db: tuple[TestClient, Ses
     assert all(error["field"] == "gstin" for error in body["errors"])
 
 
+def test_bulk_party_import_rejects_duplicate_gstins_and_assigns_codes(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db, headers = _headers_for_admin(client_with_test_db)
+    db.add(Party(name="Existing Supplier", party_type="SUPPLIER", gstin="27ABCDE1234F1Z5"))
+    db.commit()
+
+    response = client.post(
+        "/masters/parties/bulk",
+        headers=headers,
+        json={
+            "rows": [
+                {"party_name": "Existing GSTIN", "type": "DISTRIBUTOR", "gstin": "27abcde1234f1z5"},
+                {"party_name": "First In File", "type": "DISTRIBUTOR", "gstin": "29AAAPL1234C1Z3"},
+                {"party_name": "Unknown Category", "party_category": "NOPE", "gstin": "29AAAPL1234C1Z4"},
+                {"party_name": "Second In File", "type": "DISTRIBUTOR", "gstin": "29AAAPL1234C1Z3"},
+                {"party_name": "Walk-in Retailer", "party_category": "RETAILER"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["created_count"] == 2
+    assert body["failed_count"] == 3
+    assert [(error["row"], error["field"]) for error in body["errors"]] == [
+        (1, "gstin"),
+        (3, "party_category"),
+        (4, "gstin"),
+    ]
+
+    created = (
+        db.query(Party)
+        .filter(Party.name.in_(["First In File", "Walk-in Retailer"]))
+        .order_by(Party.id.asc())
+        .all()
+    )
+    assert [party.party_code for party in created] == [f"PTY-{party.id:06d}" for party in created]
+    assert created[0].pan_number == "AAAPL1234C"
+
+
 def test_party_state_override_respected_when_gstin_present(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
@@ -689,6 +730,69 @@ def test_bulk_item_import_accepts_current_product_fields(
     assert product.decimal_allowed is True
 
 
+def test_bulk_item_import_dry_run_validates_without_writing(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db, headers = _headers_for_admin(client_with_test_db)
+    warehouse = Warehouse(name="Main Warehouse", code="MAINWH", address="Pune", is_active=True)
+    db.add(TaxRate(code="GST_12", label="GST 12%", rate_percent="12.00", is_active=True))
+    db.add(Brand(name="Medha Pharma", is_active=True))
+    db.add(warehouse)
+    db.flush()
+    db.add(Rack(warehouse_id=warehouse.id, rack_number="R-01", is_active=True))
+    db.commit()
+
+    rows = [
+        {
+            "sku": "SKU-DRY-001",
+            "product_name": "Dry Run Product",
+            "manufacturer": "medha pharma",
+            "uom": "BOX",
+            "gst_rate": "12",
+            "default_warehouse_code": "mainwh",
+            "rack_number": "r-01",
+        },
+        {
+            "sku": "SKU-DRY-002",
+            "product_name": "Unknown Rack",
+            "manufacturer": "Medha Pharma",
+            "uom": "BOX",
+            "default_warehouse_id": str(warehouse.id),
+            "rack_number": "R-99",
+        },
+        {
+            "sku": "SKU-DRY-003",
+            "product_name": "Unknown Warehouse",
+            "manufacturer": "Medha Pharma",
+            "uom": "BOX",
+            "default_warehouse_code": "NOPE",
+        },
+    ]
+    response = client.post(
+        "/masters/items/bulk?dry_run=true",
+        headers=headers,
+        json={"rows": rows},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["dry_run"] is True
+    assert body["created_count"] == 1
+    assert [(error["row"], error["field"]) for error in body["errors"]] == [
+        (2, "rack_number"),
+        (3, "default_warehouse_code"),
+    ]
+    assert db.query(Product).filter(Product.sku.like("SKU-DRY-%")).count() == 0
+
+    response = client.post("/masters/items/bulk", headers=headers, json={"rows": rows[:1]})
+    assert response.status_code == 200, response.text
+    assert response.json()["created_count"] == 1
+    product = db.query(Product).filter(Product.sku == "SKU-DRY-001").one()
+    assert product.brand == "Medha Pharma"
+    assert product.rack_number == "R-01"
+    assert product.default_warehouse_id == warehouse.id
+
+
 def test_party_duplicate_gstin_rejected(client_with_test_db: tuple[TestClient, Session]) -> None:
     client, _db, headers = _headers_for_admin(client_with_test_db)
     first_response = client.post(
@@ -1268,6 +1372,73 @@ def test_list_products_page_paginates_orders_and_searches(
     assert categories.json() == ["Analgesics", "Antibiotics"]
 
 
+def test_list_products_page_search_ranks_best_match_first(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db, headers = _headers_for_admin(client_with_test_db)
+    db.add(Brand(name="PageBrand", is_active=True))
+    db.commit()
+    _create_simple_product(client, headers, sku="ZX-100", name="Amlodipine Paracetamol Combo")
+    _create_simple_product(client, headers, sku="PARA-500", name="Paracetamol 500")
+    _create_simple_product(client, headers, sku="IBU-200", name="Ibuprofen 200")
+
+    search = client.get("/masters/products/page?search=PARA&page_size=1", headers=headers)
+    assert search.status_code == 200, search.text
+    body = search.json()
+    assert body["total"] == 2
+    assert [item["sku"] for item in body["data"]] == ["PARA-500"]
+
+    beyond_last_page = client.get(
+        "/masters/products/page?search=para&page=3&page_size=1", headers=headers
+    )
+    assert beyond_last_page.json()["total"] == 2
+    assert beyond_last_page.json()["data"] == []
+
+
+def test_product_and_party_summaries_page_by_cursor(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db, headers = _headers_for_admin(client_with_test_db)
+    db.add(Brand(name="PageBrand", is_active=True))
+    db.add_all(
+        [
+            Party(name=f"Summary Party {i}", party_type="SUPPLIER", is_active=True)
+            for i in range(3)
+        ]
+    )
+    db.commit()
+    for i in range(3):
+        _create_simple_product(client, headers, sku=f"SUM-{i}", name=f"Summary Product {i}")
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "fields": "sku"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/masters/products/summary", headers=headers, params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert all(set(item) == {"id", "sku"} for item in body["items"])
+        seen.extend(item["sku"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["SUM-0", "SUM-1", "SUM-2"]
+
+    parties = client.get(
+        "/masters/parties/summary?search=summary party&limit=2", headers=headers
+    )
+    assert parties.status_code == 200, parties.text
+    parties_body = parties.json()
+    assert [item["name"] for item in parties_body["items"]] == [
+        "Summary Party 0",
+        "Summary Party 1",
+    ]
+    assert parties_body["items"][0]["party_type"] == "SUPPLIER"
+    assert parties_body["next_cursor"]
+
+
 def test_list_products_page_filters_by_active_status(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
@@ -0,0 +1,179 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.partitions import add_months, ensure_monthly_partitions, month_start, partition_name
+from app.models.audit import AuditLog
+from app.models.enums import StockAdjustmentReason, StockAdjustmentType
+from app.models.inventory import InventoryLedger
+from app.models.stock_operations import StockAdjustment
+from app.models.stock_provenance import StockSourceProvenance
+from app.reports.stock_movement import StockMovementFilters, _movement_base_stmt
+from app.testing import (
+    approve_po,
+    create_and_post_grn,
+    create_po,
+    create_product,
+    create_superuser_headers,
+    create_supplier,
+    create_warehouse,
+)
+
+
+def _partition_of(db: Session, model, row_id: int) -> str:
+    return db.execute(
+        select(text("tableoid::regclass::text")).select_from(model).where(model.id == row_id)
+    ).scalar_one()
+
+
+def _explain(db: Session, stmt) -> str:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    rows = db.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).scalars()
+    return "\n".join(rows)
+
+
+def test_ledger_rows_land_in_monthly_partitions_that_reports_prune(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "partitions@medhaone.app")
+    today = date.today()
+
+    supplier_id = create_supplier(client, headers, "Partition Supplier")
+    warehouse_id = create_warehouse(client, headers, "PART-WH")
+    product_id = create_product(client, headers, "PART-SKU")
+    po = create_po(
+        client,
+        headers,
+        supplier_id=supplier_id,
+        warehouse_id=warehouse_id,
+        product_id=product_id,
+        ordered_qty="3",
+        unit_cost="9.00",
+        order_date=today.isoformat(),
+    )
+    approve_po(client, headers, po["id"])
+    create_and_post_grn(
+        client,
+        headers,
+        po_id=po["id"],
+        po_line_id=po["lines"][0]["id"],
+        received_qty="3",
+        batch_no="PART-B1",
+        expiry_date=(today + timedelta(days=365)).isoformat(),
+        received_date=today.isoformat(),
+    )
+
+    ledger_id = db.execute(select(InventoryLedger.id)).scalar_one()
+    current = month_start(datetime.now(timezone.utc).date())
+    assert _partition_of(db, InventoryLedger, ledger_id) == partition_name(
+        "inventory_ledger", current
+    )
+    audit_id = db.execute(select(AuditLog.id).order_by(AuditLog.id.desc())).scalars().first()
+    assert _partition_of(db, AuditLog, audit_id) == partition_name("audit_logs", current)
+
+    filters = StockMovementFilters(date_from=current, date_to=current + timedelta(days=1))
+    plan = _explain(db, _movement_base_stmt(filters))
+    assert partition_name("inventory_ledger", current) in plan
+    assert partition_name("inventory_ledger", add_months(current, 1)) not in plan
+    assert "inventory_ledger_default" not in plan
+
+    report = client.get(
+        "/reports/stock-movement",
+        headers=headers,
+        params={"date_from": today.isoformat(), "date_to": today.isoformat()},
+    )
+    assert report.status_code == 200, report.text
+    assert report.json()["total"] == 1
+    db.rollback()
+
+
+def test_new_month_partition_adopts_rows_parked_in_default(db_session: Session) -> None:
+    db = db_session
+    current = month_start(date.today())
+    later = add_months(current, 6)
+    _, user = create_superuser_headers(db, "partition-audit@medhaone.app")
+    parked = AuditLog(
+        entity_type="PRODUCT",
+        entity_id=1,
+        module="Masters",
+        action="UPDATE",
+        performed_by=user.id,
+        timestamp=datetime(later.year, later.month, 15, tzinfo=timezone.utc),
+    )
+    db.add(parked)
+    db.commit()
+    assert _partition_of(db, AuditLog, parked.id) == "audit_logs_default"
+
+    created = ensure_monthly_partitions(db, today=later)
+    db.commit()
+    assert partition_name("audit_logs", later) in created
+    assert partition_name("inventory_ledger", add_months(later, 3)) in created
+    assert _partition_of(db, AuditLog, parked.id) == partition_name("audit_logs", later)
+    assert ensure_monthly_partitions(db, today=later) == []
+
+
+def test_ledger_references_must_point_at_a_ledger_row(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, user = create_superuser_headers(db, "partition-refs@medhaone.app")
+    today = date.today()
+    supplier_id = create_supplier(client, headers, "Reference Supplier")
+    warehouse_id = create_warehouse(client, headers, "REF-WH")
+    product_id = create_product(client, headers, "REF-SKU")
+    po = create_po(
+        client,
+        headers,
+        supplier_id=supplier_id,
+        warehouse_id=warehouse_id,
+        product_id=product_id,
+        ordered_qty="2",
+        unit_cost="4.00",
+        order_date=today.isoformat(),
+    )
+    approve_po(client, headers, po["id"])
+    create_and_post_grn(
+        client,
+        headers,
+        po_id=po["id"],
+        po_line_id=po["lines"][0]["id"],
+        received_qty="2",
+        batch_no="REF-B1",
+        expiry_date=(today + timedelta(days=365)).isoformat(),
+        received_date=today.isoformat(),
+    )
+    ledger = db.execute(select(InventoryLedger)).scalar_one()
+
+    def adjustment(ledger_id: int) -> StockAdjustment:
+        return StockAdjustment(
+            reference_id=f"REF-ADJ-{ledger_id}",
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            batch_id=ledger.batch_id,
+            adjustment_type=StockAdjustmentType.POSITIVE,
+            qty=Decimal("1"),
+            reason=StockAdjustmentReason.FOUND_STOCK,
+            before_qty=Decimal("2"),
+            after_qty=Decimal("3"),
+            ledger_id=ledger_id,
+            created_by=user.id,
+        )
+
+    db.add(adjustment(ledger.id))
+    db.commit()
+
+    db.add(adjustment(ledger.id + 1000))
+    with pytest.raises(IntegrityError, match="ledger_id=.* is not present in inventory_ledger"):
+        db.commit()
+    db.rollback()
+
+    with pytest.raises(IntegrityError, match="stock_source_provenance"):
+        db.execute(update(StockSourceProvenance).values(ledger_id=ledger.id + 1000))
+    db.rollback()
@@ -0,0 +1,94 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, text, update
+from sqlalchemy.orm import Session
+
+from app.core.partitions import add_months, ensure_monthly_partitions, month_start
+from app.models.inventory import InventoryLedger
+from app.models.period_close import InventoryCheckpoint, InventoryLedgerArchive
+from app.testing import create_batch, create_product, create_superuser_headers, create_warehouse
+
+
+def test_fiscal_year_close_archives_ledger_and_keeps_reports_intact(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _ = create_superuser_headers(db, "period-close@medhaone.app")
+    current = month_start(datetime.now(timezone.utc).date())
+    closed_month = add_months(current, -2)
+    fiscal_year_end = add_months(current, -1) - timedelta(days=1)
+
+    warehouse_id = create_warehouse(client, headers, "CLOSE-WH")
+    product_id = create_product(client, headers, "CLOSE-SKU")
+    batch = create_batch(
+        db,
+        product_id=product_id,
+        batch_no="CLOSE-B1",
+        expiry_date=date.today() + timedelta(days=365),
+    )
+    stock = {"warehouse_id": warehouse_id, "product_id": product_id, "batch_id": batch.id}
+    stock_in = client.post("/inventory/in", headers=headers, json={**stock, "qty": "5"})
+    assert stock_in.status_code == 200, stock_in.text
+    stock_out = client.post("/inventory/out", headers=headers, json={**stock, "qty": "2"})
+    assert stock_out.status_code == 200, stock_out.text
+
+    ensure_monthly_partitions(db, today=closed_month)
+    db.execute(
+        update(InventoryLedger)
+        .where(InventoryLedger.qty > 0)
+        .values(created_at=datetime(closed_month.year, closed_month.month, 10, tzinfo=timezone.utc))
+    )
+    db.commit()
+
+    not_month_end = client.post(
+        "/inventory/period-closes",
+        headers=headers,
+        json={"fiscal_year_end": (fiscal_year_end - timedelta(days=1)).isoformat()},
+    )
+    assert not_month_end.status_code == 400, not_month_end.text
+
+    closed = client.post(
+        "/inventory/period-closes",
+        headers=headers,
+        json={"fiscal_year_end": fiscal_year_end.isoformat()},
+    )
+    assert closed.status_code == 200, closed.text
+    assert closed.json()["archived_rows"] == 1
+    assert closed.json()["checkpoint_rows"] == 1
+
+    assert db.execute(select(func.count()).select_from(InventoryLedger)).scalar_one() == 1
+    checkpoint = db.execute(select(InventoryCheckpoint)).scalar_one()
+    assert checkpoint.qty == Decimal("5")
+    archived_partition = db.execute(
+        select(text("tableoid::regclass::text")).select_from(InventoryLedgerArchive)
+    ).scalar_one()
+    assert archived_partition == f"inventory_ledger_archive_p{closed_month:%Y%m}"
+
+    current_stock = client.get("/reports/current-stock", headers=headers)
+    assert current_stock.status_code == 200, current_stock.text
+    assert Decimal(str(current_stock.json()["summary"]["total_stock_qty"])) == Decimal("3")
+
+    history = client.get(
+        "/reports/stock-movement",
+        headers=headers,
+        params={"date_from": closed_month.isoformat(), "date_to": date.today().isoformat()},
+    )
+    assert history.status_code == 200, history.text
+    assert history.json()["total"] == 2
+
+    balance = client.get("/inventory/stock-balance-check", headers=headers)
+    assert balance.status_code == 200, balance.text
+    assert balance.json() == {"balanced": True, "mismatches": []}
+
+    again = client.post(
+        "/inventory/period-closes",
+        headers=headers,
+        json={"fiscal_year_end": fiscal_year_end.isoformat()},
+    )
+    assert again.status_code == 409, again.text
+    assert again.json()["error_code"] == "PERIOD_ALREADY_CLOSED"
+
+    listed = client.get("/inventory/period-closes", headers=headers)
+    assert [row["fiscal_year_end"] for row in listed.json()] == [fiscal_year_end.isoformat()]
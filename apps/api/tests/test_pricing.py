@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from app.benchmarks.pricing import run_pricing_benchmark
+from app.models.enums import GSTVerifiedStatus, PartyType
+from app.models.party import Party
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+from app.services.pricing import INTER_STATE, INTRA_STATE, PricingLine, price_document
+
+
+def test_price_document_rounds_each_line_and_sums_the_header() -> None:
+    lines = [
+        PricingLine(Decimal("3"), Decimal("33.335"), Decimal("12.00"), Decimal("2.50")),
+        PricingLine(Decimal("1"), Decimal("10.05"), Decimal("12.00"), Decimal("2.50")),
+    ]
+
+    amounts = price_document(lines, tax_type=INTRA_STATE, adjustment=Decimal("-0.005"))
+
+    first = amounts.lines[0]
+    assert (first.gross, first.discount_amount, first.taxable_value) == (
+        Decimal("100.01"),
+        Decimal("2.50"),
+        Decimal("97.51"),
+    )
+    assert (first.cgst_percent, first.cgst_amount, first.sgst_amount) == (
+        Decimal("6.00"),
+        Decimal("5.85"),
+        Decimal("5.85"),
+    )
+    assert first.line_total == Decimal("109.21")
+    assert amounts.taxable_value == sum(line.taxable_value for line in amounts.lines)
+    assert amounts.tax_amount == sum(line.tax_amount for line in amounts.lines)
+    assert amounts.total == amounts.taxable_value + amounts.tax_amount - Decimal("0.01")
+    assert (amounts.gst_percent, amounts.cgst_percent, amounts.igst_percent) == (
+        Decimal("12.00"),
+        Decimal("6.00"),
+        Decimal("0.00"),
+    )
+
+
+def test_price_document_splits_by_tax_type_and_honours_explicit_discounts() -> None:
+    lines = [
+        PricingLine(Decimal("2"), Decimal("50"), Decimal("5.00"), discount_amount=Decimal("1.25")),
+        PricingLine(Decimal("1"), Decimal("80"), Decimal("18.00")),
+    ]
+
+    inter_state = price_document(lines, tax_type=INTER_STATE)
+    assert [line.igst_amount for line in inter_state.lines] == [Decimal("4.94"), Decimal("14.40")]
+    assert inter_state.cgst_amount == Decimal("0.00")
+    # The lines carry different rates, so the header has none.
+    assert inter_state.gst_percent == Decimal("0.00")
+
+    untaxed = price_document(lines)
+    assert untaxed.tax_amount == Decimal("0.00")
+    assert untaxed.total == Decimal("178.75")
+
+
+def test_pricing_benchmark_prices_thousand_line_documents() -> None:
+    results = run_pricing_benchmark(line_count=1000, iterations=1, warmup=0)
+
+    assert [result.name for result in results] == [
+        "pricing:purchase_order:intra_state:1000",
+        "pricing:purchase_order:inter_state:1000",
+        "pricing:sales_order:1000",
+        "pricing:purchase_bill:1000",
+    ]
+    assert all(result.queries == 0 for result in results)
+
+
+def test_purchase_order_header_equals_sum_of_lines(generated_tenant) -> None:
+    client, db, headers, _user = generated_tenant
+    supplier_id = db.scalar(
+        select(Party.id)
+        .where(Party.party_type == PartyType.SUPPLIER)
+        .where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+        .limit(1)
+    )
+    products = db.scalars(select(Product.id).order_by(Product.id).limit(6)).all()
+
+    response = client.post(
+        "/purchase/po",
+        headers=headers,
+        json={
+            "supplier_id": supplier_id,
+            "warehouse_id": db.scalar(select(Warehouse.id).order_by(Warehouse.id).limit(1)),
+            "discount_percent": "2.5",
+            "lines": [
+                {"product_id": product_id, "ordered_qty": "3", "unit_cost": "33.335"}
+                for product_id in products
+            ],
+        },
+    )
+    assert response.status_code == 201, response.text
+
+    po = response.json()
+    assert Decimal(str(po["taxable_value"])) == sum(
+        Decimal(str(line["taxable_value"])) for line in po["lines"]
+    )
+    assert Decimal(str(po["final_total"])) == sum(
+        Decimal(str(line["line_total"])) for line in po["lines"]
+    )
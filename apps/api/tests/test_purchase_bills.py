@@ -7,6 +7,7 @@ from app.models.enums import PurchaseBillExtractionStatus, PurchaseBillStatus
 from app.models.inventory import InventoryLedger
 from app.models.party import Party
 from app.models.product import Product
+from app.models.purchase_bill import PurchaseBill
 from app.models.warehouse import Warehouse
 from app.schemas.purchase_bill import PurchaseBillExtractionPayload
 from app.services.purchase_bill import (
@@ -140,6 +141,42 @@ def test_upload_creates_draft_bill_and_audit(
     assert audit.module == "Purchase Bill"
 
 
+def test_bill_summary_pages_newest_first_with_status_filter(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, user = create_superuser_headers(db, "purchase-bill-summary@medhaone.app")
+    # Seeded in one transaction, so created_at ties and ordering falls back to id.
+    bills = [
+        PurchaseBill(bill_number=f"SUM-{index}", status=status, created_by=user.id)
+        for index, status in enumerate(
+            [PurchaseBillStatus.DRAFT, PurchaseBillStatus.VERIFIED, PurchaseBillStatus.DRAFT]
+        )
+    ]
+    db.add_all(bills)
+    db.commit()
+
+    first = client.get("/purchase-bills/summary?limit=2&fields=bill_number", headers=headers)
+    assert first.status_code == 200, first.text
+    first_body = first.json()
+    assert first_body["items"] == [
+        {"id": bills[2].id, "bill_number": "SUM-2"},
+        {"id": bills[1].id, "bill_number": "SUM-1"},
+    ]
+
+    second = client.get(
+        "/purchase-bills/summary",
+        headers=headers,
+        params={"limit": 2, "cursor": first_body["next_cursor"]},
+    )
+    assert [item["bill_number"] for item in second.json()["items"]] == ["SUM-0"]
+    assert second.json()["next_cursor"] is None
+    assert "lines" not in second.json()["items"][0]
+
+    drafts = client.get("/purchase-bills/summary?status=DRAFT", headers=headers)
+    assert [item["bill_number"] for item in drafts.json()["items"]] == ["SUM-2", "SUM-0"]
+
+
 def test_extraction_payload_maps_into_bill_correctly(
     client_with_test_db: tuple[TestClient, Session],
     tmp_path,
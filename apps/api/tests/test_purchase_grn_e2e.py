@@ -574,6 +574,69 @@ def test_one_grn_can_have_multiple_products(
     assert sum((Decimal(str(summary.qty_on_hand)) for summary in summaries), Decimal("0")) == Decimal("11")
 
 
+def test_grn_summary_pages_by_cursor_and_projects_fields(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    token = _create_access_user(db)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    supplier_id = _create_supplier(client, headers, "SUM")
+    warehouse_id = _create_warehouse(client, headers, "SUMWH")
+    product_id = _create_product(client, headers, "SUM-SKU-1")
+    po = _create_po(
+        client,
+        headers,
+        supplier_id=supplier_id,
+        warehouse_id=warehouse_id,
+        lines=[{"product_id": product_id, "ordered_qty": "10", "unit_cost": "5"}],
+    )
+    _approve_po(client, headers, po["id"])
+    grn_ids = [
+        _create_grn(
+            client,
+            headers,
+            po["id"],
+            lines=[
+                {
+                    "po_line_id": po["lines"][0]["id"],
+                    "received_qty": qty,
+                    "batch_no": f"SUM-BATCH-{qty}",
+                    "expiry_date": "2030-10-31",
+                }
+            ],
+        )["id"]
+        for qty in ("3", "4")
+    ]
+
+    first = client.get("/purchase/grn/summary?limit=1", headers=headers)
+    assert first.status_code == 200, first.text
+    first_body = first.json()
+    assert [item["id"] for item in first_body["items"]] == [grn_ids[1]]
+    assert first_body["items"][0]["supplier_name"]
+    assert first_body["items"][0]["total_products"] == 1
+    assert Decimal(str(first_body["items"][0]["total_received_qty"])) == Decimal("4")
+    assert "lines" not in first_body["items"][0]
+    assert first_body["next_cursor"]
+
+    second = client.get(
+        "/purchase/grn/summary",
+        headers=headers,
+        params={"limit": 1, "cursor": first_body["next_cursor"], "fields": "grn_number,status"},
+    )
+    assert second.status_code == 200, second.text
+    second_body = second.json()
+    assert second_body["next_cursor"] is None
+    assert second_body["items"] == [
+        {"id": grn_ids[0], "grn_number": second_body["items"][0]["grn_number"], "status": "DRAFT"}
+    ]
+
+    unknown_field = client.get("/purchase/grn/summary?fields=lines", headers=headers)
+    assert unknown_field.status_code == 400
+    bad_cursor = client.get("/purchase/grn/summary?cursor=not-a-cursor", headers=headers)
+    assert bad_cursor.status_code == 400
+
+
 def test_one_grn_line_can_have_multiple_batch_rows(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
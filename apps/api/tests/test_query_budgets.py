@@ -0,0 +1,332 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.benchmarks.generator import PROFILES, TenantProfile, generate_tenant
+from app.benchmarks.scenarios import BenchmarkContext, load_context, report_paths
+from app.core.config import get_settings
+from app.main import app
+from app.models.batch import Batch
+from app.models.enums import GSTVerifiedStatus, PartyType
+from app.models.inventory import StockSummary
+from app.models.party import Party
+from app.models.product import Product
+from app.models.tax_rate import TaxRate
+from app.schemas.purchase_bill import PurchaseBillExtractionPayload
+from app.services.purchase_bill import (
+    get_purchase_invoice_extractor,
+    set_purchase_invoice_extractor,
+)
+from app.testing import QueryBudget, create_superuser_headers
+
+# Document line counts compared by the write-path tests.
+LINE_COUNTS = (1, 6)
+# Statements allowed per request, a little above what each path runs today.
+GRN_POST_BUDGET = 50
+SALES_CONFIRM_BUDGET = 25
+DISPATCH_POST_BUDGET = 35
+PURCHASE_BILL_UPLOAD_BUDGET = 25
+# Bulk imports, at row counts that fit one insert chunk.
+IMPORT_ROW_COUNTS = (2, 40)
+IMPORT_BUDGET = 25
+# Every report and list endpoint shares one ceiling; /tax-rates seeds defaults on first read.
+READ_BUDGET = 20
+# The same tenant shape at three times the volume, for the read paths.
+_LARGER_PROFILE = TenantProfile(
+    products=120,
+    parties=36,
+    warehouses=3,
+    purchase_orders=90,
+    lines_per_order=3,
+    ledger_rows=600,
+    audit_logs=180,
+    history_months=3,
+)
+
+
+class _Extractor:
+    def __init__(self, payload: PurchaseBillExtractionPayload) -> None:
+        self.payload = payload
+
+    def extract(self, **_: object) -> PurchaseBillExtractionPayload:
+        return self.payload
+
+
+def _stocked_lines(db: Session, count: int) -> tuple[int, list[tuple[int, int]]]:
+    """A warehouse and ``count`` (product, batch) pairs with unexpired stock in it."""
+    rows = db.execute(
+        select(StockSummary.warehouse_id, StockSummary.product_id, StockSummary.batch_id)
+        .join(Batch, Batch.id == StockSummary.batch_id)
+        .where(StockSummary.qty_on_hand >= 5)
+        .where(Batch.expiry_date > date.today() + timedelta(days=90))
+        .order_by(StockSummary.warehouse_id, StockSummary.product_id, StockSummary.batch_id)
+    ).all()
+    by_warehouse: dict[int, dict[int, int]] = {}
+    for warehouse_id, product_id, batch_id in rows:
+        by_warehouse.setdefault(warehouse_id, {}).setdefault(product_id, batch_id)
+    warehouse_id, batches = max(by_warehouse.items(), key=lambda item: len(item[1]))
+    assert len(batches) >= count
+    return warehouse_id, list(batches.items())[:count]
+
+
+def _verified_supplier(db: Session) -> Party:
+    return db.scalar(
+        select(Party)
+        .where(Party.party_type == PartyType.SUPPLIER)
+        .where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+        .order_by(Party.id)
+        .limit(1)
+    )
+
+
+def _customer_id(db: Session) -> int:
+    return db.scalar(
+        select(Party.id).where(Party.party_type == PartyType.CUSTOMER).order_by(Party.id).limit(1)
+    )
+
+
+def _draft_grn(client: TestClient, headers: dict[str, str], db: Session, lines: int) -> int:
+    warehouse_id, stocked = _stocked_lines(db, lines)
+    po = client.post(
+        "/purchase/po",
+        headers=headers,
+        json={
+            "supplier_id": _verified_supplier(db).id,
+            "warehouse_id": warehouse_id,
+            "lines": [
+                {"product_id": product_id, "ordered_qty": "20", "unit_cost": "12.50"}
+                for product_id, _batch_id in stocked
+            ],
+        },
+    )
+    assert po.status_code == 201, po.text
+    po_body = po.json()
+    assert client.post(f"/purchase/po/{po_body['id']}/approve", headers=headers).status_code == 200
+    grn = client.post(
+        f"/purchase/grn/from-po/{po_body['id']}",
+        headers=headers,
+        json={
+            "lines": [
+                {
+                    "po_line_id": line["id"],
+                    "received_qty": "20",
+                    "free_qty": "0",
+                    "batch_no": f"QB-{po_body['id']}-{index}",
+                    "expiry_date": (date.today() + timedelta(days=500)).isoformat(),
+                }
+                for index, line in enumerate(po_body["lines"])
+            ],
+        },
+    )
+    assert grn.status_code == 201, grn.text
+    return grn.json()["id"]
+
+
+def _sales_order(client: TestClient, headers: dict[str, str], db: Session, lines: int) -> dict:
+    warehouse_id, stocked = _stocked_lines(db, lines)
+    response = client.post(
+        "/sales-orders",
+        headers=headers,
+        json={
+            "customer_id": _customer_id(db),
+            "warehouse_id": warehouse_id,
+            "lines": [
+                {
+                    "product_id": product_id,
+                    "ordered_qty": "1",
+                    "unit_price": "30.00",
+                    "discount_percent": "0",
+                    "gst_rate": "12",
+                }
+                for product_id, _batch_id in stocked
+            ],
+        },
+    )
+    assert response.status_code == 201, response.text
+    return {"order": response.json(), "batches": dict(stocked)}
+
+
+def test_grn_post_queries_do_not_grow_with_lines(generated_tenant, query_budget: QueryBudget) -> None:
+    client, db, headers, _user = generated_tenant
+    for lines in LINE_COUNTS:
+        grn_id = _draft_grn(client, headers, db, lines)
+        with query_budget.capture(lines):
+            response = client.post(f"/purchase/grn/{grn_id}/post", headers=headers)
+        assert response.status_code == 200, response.text
+
+    query_budget.check(max_queries=GRN_POST_BUDGET)
+
+
+def test_sales_confirm_and_dispatch_queries_do_not_grow_with_lines(
+    generated_tenant, query_budget: QueryBudget
+) -> None:
+    client, db, headers, _user = generated_tenant
+    orders = {}
+    for lines in LINE_COUNTS:
+        orders[lines] = _sales_order(client, headers, db, lines)
+        with query_budget.capture(lines):
+            response = client.post(
+                f"/sales-orders/{orders[lines]['order']['id']}/confirm", headers=headers
+            )
+        assert response.status_code == 200, response.text
+    query_budget.check(max_queries=SALES_CONFIRM_BUDGET)
+
+    for lines, prepared in orders.items():
+        order = prepared["order"]
+        dispatch = client.post(
+            f"/dispatch-notes/from-sales-order/{order['id']}",
+            headers=headers,
+            json={
+                "lines": [
+                    {
+                        "sales_order_line_id": line["id"],
+                        "batch_id": prepared["batches"][line["product_id"]],
+                        "dispatched_qty": "1",
+                    }
+                    for line in order["lines"]
+                ],
+            },
+        )
+        assert dispatch.status_code == 201, dispatch.text
+        with query_budget.capture(lines):
+            response = client.post(
+                f"/dispatch-notes/{dispatch.json()['id']}/post", headers=headers
+            )
+        assert response.status_code == 200, response.text
+    query_budget.check(max_queries=DISPATCH_POST_BUDGET)
+
+
+def test_purchase_bill_upload_queries_do_not_grow_with_lines(
+    generated_tenant, query_budget: QueryBudget, tmp_path
+) -> None:
+    client, db, headers, _user = generated_tenant
+    supplier = _verified_supplier(db)
+    products = db.scalars(select(Product).order_by(Product.id).limit(max(LINE_COUNTS))).all()
+    settings = get_settings()
+    original_storage_dir = settings.upload_storage_dir
+    original_extractor = get_purchase_invoice_extractor()
+    settings.upload_storage_dir = str(tmp_path)
+    try:
+        for lines in LINE_COUNTS:
+            payload = PurchaseBillExtractionPayload.model_validate(
+                {
+                    "supplier_name": supplier.name,
+                    "supplier_gstin": supplier.gstin,
+                    "invoice_number": f"QB-INV-{lines}",
+                    "invoice_date": date.today().isoformat(),
+                    "line_items": [
+                        {
+                            "description_raw": f"{product.sku} {product.name}",
+                            "qty": "10",
+                            "unit_price": "100.00",
+                            "gst_percent": "12.00",
+                            "line_total": "1000.00",
+                        }
+                        for product in products[:lines]
+                    ],
+                }
+            )
+            set_purchase_invoice_extractor(_Extractor(payload))
+            with query_budget.capture(lines):
+                response = client.post(
+                    "/purchase-bills/upload",
+                    headers=headers,
+                    files={"file": ("invoice.pdf", b"%PDF-1.4 budget", "application/pdf")},
+                )
+            assert response.status_code == 201, response.text
+            assert all(line["product_id"] for line in response.json()["lines"])
+    finally:
+        settings.upload_storage_dir = original_storage_dir
+        set_purchase_invoice_extractor(original_extractor)
+
+    query_budget.check(max_queries=PURCHASE_BILL_UPLOAD_BUDGET)
+
+
+def _import_rows(ctx: BenchmarkContext, path: str, count: int) -> list[dict]:
+    expiry_date = (date.today() + timedelta(days=540)).isoformat()
+    rows = {
+        "/masters/parties/bulk": lambda index: {
+            "party_name": f"Budget Chemist {count}-{index}",
+            "party_category": "RETAILER",
+        },
+        "/masters/items/bulk": lambda index: {
+            "sku": f"QB-IMP-{count}-{index}",
+            "product_name": f"Budget Item {count}-{index}",
+            "manufacturer": ctx.brand,
+            "uom": "BOX",
+            "gst_rate": "5",
+        },
+        "/inventory/opening-stock/bulk": lambda index: {
+            "sku": ctx.product_sku,
+            "warehouse_code": ctx.warehouse_code,
+            "batch_no": f"QB-OPEN-{count}-{index}",
+            "expiry_date": expiry_date,
+            "qty": "10",
+        },
+    }[path]
+    return [rows(index) for index in range(count)]
+
+
+@pytest.mark.parametrize(
+    "path", ["/masters/parties/bulk", "/masters/items/bulk", "/inventory/opening-stock/bulk"]
+)
+def test_bulk_import_queries_do_not_grow_with_rows(
+    generated_tenant, query_budget: QueryBudget, path: str
+) -> None:
+    client, db, headers, _user = generated_tenant
+    db.add(TaxRate(code="GST_5", label="GST 5%", rate_percent="5.00", is_active=True))
+    db.commit()
+    ctx = load_context(db, client, headers)
+    for count in IMPORT_ROW_COUNTS:
+        rows = _import_rows(ctx, path, count)
+        with query_budget.capture(count):
+            response = client.post(path, headers=headers, json={"rows": rows})
+        assert response.status_code == 200, response.text
+        assert response.json()["created_count"] == count, response.text
+
+    query_budget.check(max_queries=IMPORT_BUDGET)
+
+
+def _list_paths() -> list[str]:
+    paths = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if route.dependant.path_params or route.path.startswith(("/reports", "/test")):
+            continue
+        model_name = getattr(route.response_model, "__name__", "")
+        if model_name == "list" or model_name.endswith(("List", "ListResponse", "Page")):
+            paths.append(route.path)
+    return paths
+
+
+def test_report_and_list_queries_do_not_grow_with_data(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, user = create_superuser_headers(db, "query-budget-reads@medhaone.app")
+    paths = ["/dashboard/metrics", *report_paths(), *_list_paths()]
+    budgets = {path: QueryBudget() for path in paths}
+
+    for size, profile in ((1, PROFILES["tiny"]), (3, _LARGER_PROFILE)):
+        written = generate_tenant(db, profile, created_by=user.id)
+        db.commit()
+        for path in paths:
+            with budgets[path].capture(size):
+                response = client.get(path, headers=headers)
+            assert response.status_code == 200, f"{path}: {response.text}"
+        db.execute(text(f"TRUNCATE {', '.join(written)} RESTART IDENTITY CASCADE"))
+        db.commit()
+
+    failures = []
+    for budget in budgets.values():
+        try:
+            budget.check(max_queries=READ_BUDGET)
+        except AssertionError as error:
+            failures.append(str(error))
+    assert not failures, "\n\n".join(failures)
+    assert db.scalar(select(func.count()).select_from(Product)) == 0
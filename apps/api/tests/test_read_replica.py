@@ -0,0 +1,120 @@
+import asyncio
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core import database, replica
+from app.core.config import get_settings
+from app.core.tenant import ensure_tenant_db_context, get_read_db
+from app.main import app
+from app.testing import create_superuser_headers
+
+
+@pytest.fixture()
+def stand_in_replica(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # The primary doubles as the replica; lag is faked where a test needs it.
+    replica.configure_read_replica(get_settings().database_url)
+    monkeypatch.setattr(replica.settings, "read_replica_lag_check_seconds", 0.0)
+    monkeypatch.setattr(replica, "_RECENT_WRITES", {})
+    try:
+        yield
+    finally:
+        replica.configure_read_replica(None)
+
+
+def _read_source(payload: dict) -> str:
+    async def _open() -> str:
+        sessions = get_read_db(payload=payload, tenant_schema=None)
+        db = await sessions.__anext__()
+        try:
+            return db.info["read_source"]
+        finally:
+            await sessions.aclose()
+
+    return asyncio.run(_open())
+
+
+def test_reads_fall_back_to_primary_when_replica_lags_or_user_just_wrote(
+    stand_in_replica: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lag: list[float | None] = [0.5]
+
+    async def _fake_lag() -> float | None:
+        return lag[0]
+
+    monkeypatch.setattr(replica, "_measure_lag", _fake_lag)
+    writer, reader = {"sub": "7"}, {"sub": "8"}
+    assert _read_source(writer) == "replica"
+
+    lag[0] = replica.settings.read_replica_max_lag_seconds + 1
+    assert _read_source(writer) == "primary"
+    lag[0] = None
+    assert _read_source(writer) == "primary"
+
+    lag[0] = 0.0
+    replica.note_write(replica.token_subject(writer))
+    assert _read_source(writer) == "primary"
+    assert _read_source(reader) == "replica"
+
+
+def test_write_requests_pin_the_user_to_the_primary(
+    stand_in_replica: None, client_with_test_db: tuple[TestClient, Session]
+) -> None:
+    client, db = client_with_test_db
+    headers, user = create_superuser_headers(db, "replica@medhaone.app")
+    subject = replica.token_subject({"sub": str(user.id)})
+    assert asyncio.run(replica.replica_lag_seconds()) == 0.0
+
+    listed = client.get("/masters/warehouses", headers=headers)
+    assert listed.status_code == 200, listed.text
+    assert not replica.wrote_recently(subject)
+
+    created = client.post(
+        "/masters/warehouses",
+        headers=headers,
+        json={"name": "Replica WH", "code": "REP-WH", "is_active": True},
+    )
+    assert created.status_code == 201, created.text
+    assert replica.wrote_recently(subject)
+
+    listed = client.get("/masters/warehouses", headers=headers)
+    assert [row["code"] for row in listed.json()] == ["REP-WH"]
+
+
+def test_replica_report_checks_out_no_primary_connection(
+    stand_in_replica: None, client_with_test_db: tuple[TestClient, Session]
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "replica-report@medhaone.app")
+    # The real tenant context, and a request session from the primary's pool.
+    del app.dependency_overrides[ensure_tenant_db_context]
+    del app.dependency_overrides[database.get_db]
+    checkouts = {"primary": 0, "replica": 0}
+
+    def _counter(source: str):
+        def _count(*_args) -> None:
+            checkouts[source] += 1
+
+        return _count
+
+    pools = [
+        (database.engine, _counter("primary")),
+        (database.async_engine.sync_engine, _counter("primary")),
+        (replica.replica_sync_engine, _counter("replica")),
+    ]
+    for engine, count in pools:
+        event.listen(engine, "checkout", count)
+    try:
+        # The first request for the schema may still prepare it on the primary.
+        assert client.get("/reports/stock-ageing", headers=headers).status_code == 200
+        checkouts.update(primary=0, replica=0)
+        response = client.get("/reports/stock-ageing", headers=headers)
+    finally:
+        for engine, count in pools:
+            event.remove(engine, "checkout", count)
+
+    assert response.status_code == 200, response.text
+    assert checkouts == {"primary": 0, "replica": 1}
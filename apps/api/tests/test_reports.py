@@ -1,10 +1,16 @@
+import csv
+import io
+import json
+import zipfile
 from datetime import date
 from decimal import Decimal
+from xml.etree import ElementTree
 
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.core.security import create_access_token
+from app.models.batch import Batch
 from app.models.enums import (
     InventoryReason,
     PurchaseBillExtractionStatus,
@@ -566,6 +572,63 @@ def test_report_pagination_works(
     assert payload["data"][0]["po_number"] == seeded["po"]["po_number"]
 
 
+def test_report_export_streams_every_row_as_csv_ndjson_and_xlsx(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    seeded = _seed_report_dataset(client, db)
+    params = {
+        "product_id": seeded["product_id"],
+        "warehouse_id": seeded["warehouse_id"],
+        "page_size": 1,
+    }
+
+    csv_response = client.get(
+        "/reports/stock-movement",
+        headers=seeded["headers"],
+        params={**params, "format": "csv"},
+    )
+    assert csv_response.status_code == 200, csv_response.text
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    assert 'filename="stock-movement.csv"' in csv_response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert [row["reason"] for row in rows] == ["PURCHASE_GRN", "STOCK_ADJUSTMENT"]
+    assert Decimal(rows[1]["running_balance"]) == Decimal("7")
+    assert rows[0]["source_bill"] == ""
+
+    ndjson_response = client.get(
+        "/reports/stock-movement",
+        headers=seeded["headers"],
+        params={**params, "format": "ndjson"},
+    )
+    assert ndjson_response.status_code == 200, ndjson_response.text
+    records = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert [record["reason"] for record in records] == ["PURCHASE_GRN", "STOCK_ADJUSTMENT"]
+    assert records[0]["source_grn"] == seeded["grn"]["grn_number"]
+    assert Decimal(records[0]["qty_in"]) == Decimal("10")
+
+    xlsx_response = client.get(
+        "/reports/masters/warehouse-item-summary",
+        headers=seeded["headers"],
+        params={"format": "xlsx"},
+    )
+    assert xlsx_response.status_code == 200, xlsx_response.text
+    with zipfile.ZipFile(io.BytesIO(xlsx_response.content)) as workbook:
+        assert workbook.testzip() is None
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    namespace = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    sheet_rows = sheet.findall("s:sheetData/s:row", namespace)
+    assert len(sheet_rows) == 2
+    header = [cell.findtext("s:is/s:t", namespaces=namespace) for cell in sheet_rows[0]]
+    values = [
+        cell.findtext("s:is/s:t", namespaces=namespace) or cell.findtext("s:v", namespaces=namespace)
+        for cell in sheet_rows[1]
+    ]
+    row = dict(zip(header, values, strict=True))
+    assert row["warehouse_name"] == "Warehouse RPTWH"
+    assert Decimal(row["total_stock_qty"]) == Decimal("7")
+
+
 def test_current_stock_report_returns_summary_and_supports_filters(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
@@ -623,6 +686,94 @@ def test_report_filter_options_endpoint_returns_master_lists(
     assert any(option["id"] == seeded["warehouse_id"] for option in payload["warehouses"])
 
 
+def test_report_filter_options_revalidate_with_etag_until_masters_change(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    seeded = _seed_report_dataset(client, db)
+    headers = seeded["headers"]
+
+    first = client.get("/reports/filter-options", headers=headers)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    cached = client.get("/reports/filter-options", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    _create_product(client, headers, "RPT-SKU-ETAG")
+    changed = client.get("/reports/filter-options", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200, changed.text
+    assert changed.headers["etag"] != etag
+    assert any(option["label"].endswith("(RPT-SKU-ETAG)") for option in changed.json()["products"])
+
+
+def test_report_filter_options_etag_follows_new_batches(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    seeded = _seed_report_dataset(client, db)
+    headers = seeded["headers"]
+    etag = client.get("/reports/filter-options", headers=headers).headers["etag"]
+
+    db.add(Batch(product_id=seeded["product_id"], batch_no="RPT-LATE", expiry_date=date(2031, 1, 1)))
+    db.commit()
+
+    changed = client.get("/reports/filter-options", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200, changed.text
+    assert "RPT-LATE" in changed.json()["batches"]
+
+
+def test_report_filter_option_typeahead_searches_and_pages(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    seeded = _seed_report_dataset(client, db)
+    headers = seeded["headers"]
+    for sku in ("RPT-SKU-2", "RPT-SKU-3"):
+        _create_product(client, headers, sku)
+
+    first_page = client.get(
+        "/reports/filter-options/products",
+        headers=headers,
+        params={"q": "rpt-sku", "limit": 2},
+    )
+    assert first_page.status_code == 200, first_page.text
+    payload = first_page.json()
+    assert [item["label"] for item in payload["items"]] == [
+        "Product RPT-SKU-1 (RPT-SKU-1)",
+        "Product RPT-SKU-2 (RPT-SKU-2)",
+    ]
+    assert payload["items"][0]["id"] == seeded["product_id"]
+
+    second_page = client.get(
+        "/reports/filter-options/products",
+        headers=headers,
+        params={"q": "rpt-sku", "limit": 2, "cursor": payload["next_cursor"]},
+    )
+    assert second_page.status_code == 200, second_page.text
+    assert [item["label"] for item in second_page.json()["items"]] == [
+        "Product RPT-SKU-3 (RPT-SKU-3)"
+    ]
+    assert second_page.json()["next_cursor"] is None
+
+    batches = client.get(
+        "/reports/filter-options/batches",
+        headers=headers,
+        params={"q": "batch-1"},
+    )
+    assert batches.status_code == 200, batches.text
+    assert batches.json()["items"] == [
+        {"id": None, "value": "RPT-BATCH-1", "label": "RPT-BATCH-1"}
+    ]
+
+    brands = client.get("/reports/filter-options/brands", headers=headers, params={"q": "a"})
+    assert brands.status_code == 200, brands.text
+    assert [item["value"] for item in brands.json()["items"]] == ["AK"]
+
+
 def test_stock_source_traceability_report_shows_supplier_per_inward(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
@@ -0,0 +1,76 @@
+import logging
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+import app.main as app_main
+from app.core.metrics import begin_request_metrics, end_request_metrics
+from app.testing import create_superuser_headers
+
+
+def _server_timing(response) -> dict[str, str]:
+    entries = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, _, params = entry.partition(";")
+        entries[name] = params
+    return entries
+
+
+def test_responses_carry_server_timing_and_feed_metrics(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "metrics-admin@medhaone.app")
+
+    response = client.get("/masters/warehouses", headers=headers)
+    assert response.status_code == 200, response.text
+    timing = _server_timing(response)
+    assert set(timing) == {"db", "pool", "total"}
+    query_count = re.search(r'desc="(\d+) queries', timing["db"])
+    assert query_count is not None
+    assert int(query_count.group(1)) > 0
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain")
+    body = metrics.text
+    assert "# TYPE medhaone_http_request_db_queries histogram" in body
+    assert 'medhaone_http_request_duration_seconds_count{method="GET",route="/masters/warehouses"' in body
+
+
+def test_requests_over_query_budget_are_logged(
+    client_with_test_db: tuple[TestClient, Session],
+    monkeypatch,
+    caplog,
+) -> None:
+    client, db = client_with_test_db
+    headers, _user = create_superuser_headers(db, "metrics-budget@medhaone.app")
+    monkeypatch.setattr(app_main.settings, "request_query_budget", 1)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+        response = client.get("/masters/warehouses", headers=headers)
+
+    assert response.status_code == 200, response.text
+    records = [record for record in caplog.records if record.message == "Request exceeded SQL query budget"]
+    assert records
+    assert records[0].route == "/masters/warehouses"
+    assert records[0].query_count > 1
+
+
+def test_failed_statements_leave_nothing_on_the_pooled_connection(db_session: Session) -> None:
+    metrics, token = begin_request_metrics()
+    try:
+        for _ in range(3):
+            with pytest.raises(DBAPIError), db_session.begin_nested():
+                db_session.execute(text("SELECT 1 / 0"))
+        db_session.execute(text("SELECT pg_sleep(0.01)"))
+    finally:
+        end_request_metrics(token)
+
+    assert metrics.query_count >= 4
+    assert metrics.db_seconds >= 0.01
+    assert not [key for key in db_session.connection().info if "started" in str(key)]
@@ -2,12 +2,13 @@ from datetime import date
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import AppException
 from app.models.audit import AuditLog
 from app.models.enums import InventoryReason, InventoryTxnType
-from app.models.inventory import InventoryLedger
+from app.models.inventory import InventoryLedger, StockSummary
 from app.models.stock_operations import StockCorrection
 from app.testing import (
     approve_po,
@@ -157,6 +158,58 @@ def test_stock_correction_cannot_reclassify_more_than_source_qty(
     assert response.json()["error_code"] == "INSUFFICIENT_STOCK"
 
 
+def test_stock_correction_positions_carry_the_corrected_expiry(
+    client_with_test_db: tuple[TestClient, Session],
+) -> None:
+    client, db = client_with_test_db
+    seeded = _seed_stock(client, db)
+
+    response = client.post(
+        "/inventory/stock-corrections",
+        headers=seeded["headers"],
+        json={
+            "warehouse_id": seeded["warehouse_id"],
+            "product_id": seeded["product_id"],
+            "source_batch_id": seeded["source_batch_id"],
+            "qty_to_reclassify": "3",
+            "corrected_batch_no": "SCORR-BATCH-1",
+            "corrected_expiry_date": "2029-03-31",
+            "reason": "Wrong expiry posted at GRN",
+        },
+    )
+    assert response.status_code == 200, response.text
+    corrected_batch_id = response.json()["corrected_batch_id"]
+
+    positions = db.execute(
+        select(StockSummary.batch_id, StockSummary.expiry_date)
+        .where(StockSummary.product_id == seeded["product_id"])
+        .order_by(StockSummary.expiry_date)
+    ).all()
+    assert positions == [
+        (corrected_batch_id, date(2029, 3, 31)),
+        (seeded["source_batch_id"], date(2030, 12, 31)),
+    ]
+
+    availability = client.get(
+        "/reservations/availability",
+        headers=seeded["headers"],
+        params={"warehouse_id": seeded["warehouse_id"], "product_id": seeded["product_id"]},
+    )
+    assert availability.status_code == 200, availability.text
+    assert [
+        (batch["batch_id"], batch["expiry_date"])
+        for batch in availability.json()["candidate_batches"]
+    ] == [(corrected_batch_id, "2029-03-31"), (seeded["source_batch_id"], "2030-12-31")]
+
+    expiry = client.get(
+        "/reports/expiry",
+        headers=seeded["headers"],
+        params={"product_id": seeded["product_id"], "expiry_status": "safe"},
+    )
+    assert expiry.status_code == 200, expiry.text
+    assert [row["expiry_date"] for row in expiry.json()["data"]] == ["2029-03-31", "2030-12-31"]
+
+
 def test_stock_correction_writes_audit_record(
     client_with_test_db: tuple[TestClient, Session],
 ) -> None:
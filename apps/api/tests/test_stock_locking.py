@@ -0,0 +1,346 @@
+import random
+from collections import Counter
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.routes.inventory import create_stock_correction
+from app.core.config import get_settings
+from app.core.database import tenant_session
+from app.core.exceptions import AppException
+from app.models.batch import Batch
+from app.models.enums import GSTVerifiedStatus, InventoryReason, PartyType
+from app.models.inventory import StockSummary
+from app.models.party import Party
+from app.models.product import Product
+from app.models.user import User
+from app.models.warehouse import Warehouse
+from app.schemas.inventory import StockCorrectionRequest
+from app.services.inventory import (
+    StockMovement,
+    lock_stock,
+    stock_adjust,
+    stock_in_many,
+)
+from app.services.purchase import post_grn
+from app.services.sales import post_dispatch_note
+from app.testing import create_batch
+
+TENANT_SCHEMA = "org_pytest_tenant"
+# Of each of GRNs, dispatch notes and stock corrections.
+DOCUMENTS_PER_KIND = 100
+
+
+@pytest.fixture()
+def positions(generated_tenant):
+    """Five stocked positions in one warehouse and five not yet created in another."""
+    _client, db_session, _headers, user = generated_tenant
+    first, second = db_session.scalars(select(Warehouse.id).order_by(Warehouse.id).limit(2))
+    batches = db_session.execute(
+        select(Batch.id, Batch.product_id)
+        .where(
+            ~select(StockSummary.id)
+            .where(StockSummary.batch_id == Batch.id, StockSummary.warehouse_id == second)
+            .exists()
+        )
+        .order_by(Batch.id)
+        .limit(5)
+    ).all()
+    stocked = [(first, product_id, batch_id) for batch_id, product_id in batches]
+    fresh = [(second, product_id, batch_id) for batch_id, product_id in batches]
+    stock_in_many(
+        db_session,
+        [StockMovement(*key, Decimal("1000")) for key in stocked],
+        reason=InventoryReason.OPENING_STOCK,
+        created_by=user.id,
+    )
+    db_session.commit()
+    return db_session, user.id, stocked, fresh
+
+
+def _quantities(db: Session, keys) -> dict[tuple[int, int, int], Decimal]:
+    db.expire_all()
+    return {
+        (row.warehouse_id, row.product_id, row.batch_id): row.qty_on_hand
+        for row in db.scalars(select(StockSummary))
+        if (row.warehouse_id, row.product_id, row.batch_id) in keys
+    }
+
+
+@contextmanager
+def _worker_session(engine) -> Generator[Session, None, None]:
+    with engine.connect() as connection:
+        connection.execute(text(f'SET search_path TO "{TENANT_SCHEMA}", public'))
+        connection.commit()
+        translated = connection.execution_options(schema_translate_map={None: TENANT_SCHEMA})
+        with Session(bind=translated, autoflush=False) as session:
+            yield session
+
+
+def _lock_test_positions(db: Session, user_id: int) -> list[tuple[int, int, int]]:
+    """Two new batches of each of four products, stocked in one warehouse."""
+    warehouse_id = db.scalar(select(Warehouse.id).order_by(Warehouse.id).limit(1))
+    product_ids = db.scalars(select(Product.id).order_by(Product.id).limit(4)).all()
+    expiry_date = date.today() + timedelta(days=500)
+    keys = [
+        (
+            warehouse_id,
+            product_id,
+            create_batch(
+                db,
+                product_id=product_id,
+                batch_no=f"LOCK-{product_id}-{suffix}",
+                expiry_date=expiry_date,
+            ).id,
+        )
+        for product_id in product_ids
+        for suffix in "AB"
+    ]
+    stock_in_many(
+        db,
+        [StockMovement(*key, Decimal("1000")) for key in keys],
+        reason=InventoryReason.OPENING_STOCK,
+        created_by=user_id,
+    )
+    db.commit()
+    return keys
+
+
+def _party_id(db: Session, party_type: PartyType) -> int:
+    query = select(Party.id).where(Party.party_type == party_type).order_by(Party.id).limit(1)
+    if party_type == PartyType.SUPPLIER:
+        query = query.where(Party.gst_verified_status == GSTVerifiedStatus.VERIFIED.value)
+    return db.scalar(query)
+
+
+def _by_product(keys) -> dict[int, list[tuple[int, int, int]]]:
+    grouped: dict[int, list[tuple[int, int, int]]] = {}
+    for key in keys:
+        grouped.setdefault(key[1], []).append(key)
+    return grouped
+
+
+def _draft_grn(
+    client: TestClient, headers: dict[str, str], supplier_id: int, batches: dict[int, Batch], keys
+) -> int:
+    """A draft GRN receiving one unit into each of ``keys``, naming their batches."""
+    grouped = _by_product(keys)
+    po = client.post(
+        "/purchase/po",
+        headers=headers,
+        json={
+            "supplier_id": supplier_id,
+            "warehouse_id": keys[0][0],
+            "lines": [
+                {"product_id": product_id, "ordered_qty": str(len(rows)), "unit_cost": "10.00"}
+                for product_id, rows in grouped.items()
+            ],
+        },
+    )
+    assert po.status_code == 201, po.text
+    po_body = po.json()
+    assert client.post(f"/purchase/po/{po_body['id']}/approve", headers=headers).status_code == 200
+    grn = client.post(
+        f"/purchase/grn/from-po/{po_body['id']}",
+        headers=headers,
+        json={
+            "lines": [
+                {
+                    "po_line_id": line["id"],
+                    "received_qty": str(len(grouped[line["product_id"]])),
+                    "batch_lines": [
+                        {
+                            "batch_no": batches[batch_id].batch_no,
+                            "expiry_date": batches[batch_id].expiry_date.isoformat(),
+                            "mrp": str(batches[batch_id].mrp),
+                            "received_qty": "1",
+                        }
+                        for _warehouse_id, _product_id, batch_id in grouped[line["product_id"]]
+                    ],
+                }
+                for line in po_body["lines"]
+            ],
+        },
+    )
+    assert grn.status_code == 201, grn.text
+    return grn.json()["id"]
+
+
+def _draft_dispatch_note(
+    client: TestClient, headers: dict[str, str], customer_id: int, keys
+) -> int:
+    """A draft dispatch note taking one unit out of each of ``keys``."""
+    grouped = _by_product(keys)
+    order = client.post(
+        "/sales-orders",
+        headers=headers,
+        json={
+            "customer_id": customer_id,
+            "warehouse_id": keys[0][0],
+            "lines": [
+                {
+                    "product_id": product_id,
+                    "ordered_qty": str(len(rows)),
+                    "unit_price": "30.00",
+                    "discount_percent": "0",
+                    "gst_rate": "12",
+                }
+                for product_id, rows in grouped.items()
+            ],
+        },
+    )
+    assert order.status_code == 201, order.text
+    order_body = order.json()
+    confirmed = client.post(f"/sales-orders/{order_body['id']}/confirm", headers=headers)
+    assert confirmed.status_code == 200, confirmed.text
+    dispatch = client.post(
+        f"/dispatch-notes/from-sales-order/{order_body['id']}",
+        headers=headers,
+        json={
+            "lines": [
+                {"sales_order_line_id": line["id"], "batch_id": batch_id, "dispatched_qty": "1"}
+                for line in order_body["lines"]
+                for _warehouse_id, _product_id, batch_id in grouped[line["product_id"]]
+            ],
+        },
+    )
+    assert dispatch.status_code == 201, dispatch.text
+    return dispatch.json()["id"]
+
+
+def test_overlapping_postings_in_parallel_never_deadlock(generated_tenant) -> None:
+    client, db, headers, user = generated_tenant
+    keys = _lock_test_positions(db, user.id)
+    before = _quantities(db, set(keys))
+    batch_ids = [batch_id for _warehouse_id, _product_id, batch_id in keys]
+    batches = {
+        batch.id: batch for batch in db.scalars(select(Batch).where(Batch.id.in_(batch_ids)))
+    }
+    supplier_id = _party_id(db, PartyType.SUPPLIER)
+    customer_id = _party_id(db, PartyType.CUSTOMER)
+    rng = random.Random(49)
+    change = Counter()
+
+    # GRNs and dispatch notes each touch one to four of the eight positions, and
+    # corrections move a unit between the two batches of a product either way,
+    # so every document overlaps others in a different order.
+    documents = []
+    for _ in range(DOCUMENTS_PER_KIND):
+        received = rng.sample(keys, rng.randint(1, 4))
+        documents.append((post_grn, _draft_grn(client, headers, supplier_id, batches, received)))
+        change.update(received)
+
+        dispatched = rng.sample(keys, rng.randint(1, 4))
+        documents.append(
+            (post_dispatch_note, _draft_dispatch_note(client, headers, customer_id, dispatched))
+        )
+        change.subtract(dispatched)
+
+        source, corrected = rng.sample(_by_product(keys)[rng.choice(keys)[1]], 2)
+        target = batches[corrected[2]]
+        documents.append(
+            (
+                None,
+                StockCorrectionRequest(
+                    warehouse_id=source[0],
+                    product_id=source[1],
+                    source_batch_id=source[2],
+                    qty_to_reclassify=Decimal("1"),
+                    corrected_batch_no=target.batch_no,
+                    corrected_expiry_date=target.expiry_date,
+                    reason="Parallel posting test",
+                ),
+            )
+        )
+        change.subtract([source])
+        change.update([corrected])
+    rng.shuffle(documents)
+
+    engine = create_engine(get_settings().database_url, pool_size=16, max_overflow=0)
+    sessions = sessionmaker(bind=engine, autoflush=False)
+
+    def _post(document) -> None:
+        post, reference = document
+        with tenant_session(TENANT_SCHEMA, sessions) as session:
+            if post is None:
+                create_stock_correction(reference, session, session.get(User, user.id))
+            else:
+                post(session, reference, user.id)
+
+    failures = []
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            for future in [pool.submit(_post, document) for document in documents]:
+                if future.exception() is not None:
+                    failures.append(repr(future.exception()))
+    finally:
+        engine.dispose()
+
+    assert not failures, failures[:5]
+    assert _quantities(db, set(keys)) == {key: before[key] + change[key] for key in keys}
+
+
+@pytest.mark.parametrize("mode", ["nowait", "skip_locked"])
+def test_busy_positions_back_off_then_give_up(positions, monkeypatch, mode: str) -> None:
+    db, _user_id, stocked, _fresh = positions
+    monkeypatch.setattr(get_settings(), "stock_lock_attempts", 3)
+    monkeypatch.setattr(get_settings(), "stock_lock_backoff_seconds", 0.01)
+    engine = create_engine(get_settings().database_url)
+    with _worker_session(engine) as holder, _worker_session(engine) as contender:
+        lock_stock(holder, {stocked[1]})
+
+        with pytest.raises(AppException) as exc_info:
+            lock_stock(contender, set(stocked[:3]), mode=mode)
+        assert (exc_info.value.status_code, exc_info.value.error_code) == (503, "STOCK_BUSY")
+        # The failed attempts released what they had locked.
+        assert set(lock_stock(holder, {stocked[0], stocked[2]}, mode="nowait")) == {
+            stocked[0],
+            stocked[2],
+        }
+
+        holder.rollback()
+        assert set(lock_stock(contender, set(stocked[:3]), mode=mode)) == set(stocked[:3])
+        contender.rollback()
+    engine.dispose()
+
+
+def test_adjustments_follow_the_same_locking_protocol(positions, monkeypatch) -> None:
+    _db, user_id, stocked, fresh = positions
+    monkeypatch.setattr(get_settings(), "stock_lock_mode", "nowait")
+    monkeypatch.setattr(get_settings(), "stock_lock_attempts", 2)
+    monkeypatch.setattr(get_settings(), "stock_lock_backoff_seconds", 0.01)
+    engine = create_engine(get_settings().database_url)
+    with _worker_session(engine) as holder, _worker_session(engine) as contender:
+        lock_stock(holder, {stocked[0]})
+        warehouse_id, product_id, batch_id = stocked[0]
+        with pytest.raises(AppException) as exc_info:
+            stock_adjust(
+                contender,
+                warehouse_id=warehouse_id,
+                product_id=product_id,
+                batch_id=batch_id,
+                delta_qty=Decimal("-1"),
+                created_by=user_id,
+            )
+        assert exc_info.value.error_code == "STOCK_BUSY"
+        holder.rollback()
+
+        # A positive adjustment creates a missing position through lock_stock too.
+        warehouse_id, product_id, batch_id = fresh[0]
+        result = stock_adjust(
+            contender,
+            warehouse_id=warehouse_id,
+            product_id=product_id,
+            batch_id=batch_id,
+            delta_qty=Decimal("2"),
+            created_by=user_id,
+        )
+        assert result.summary.qty_on_hand == Decimal("2")
+    engine.dispose()
@@ -89,6 +89,9 @@ class _FakeSession:
     def query(self, _model):
         return _FakeQuery(self.user)
 
+    def in_transaction(self) -> bool:
+        return bool(self.statements)
+
     def commit(self) -> None:
         self.committed = True
 
@@ -5,6 +5,12 @@ import { useEffect, useState } from "react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { DashboardMetrics, apiClient } from "@/lib/api/client";
 
+const stockValueFormatter = new Intl.NumberFormat("en-IN", {
+  style: "currency",
+  currency: "INR",
+  maximumFractionDigits: 0,
+});
+
 type MetricsState = {
   loading: boolean;
   data: DashboardMetrics | null;
@@ -40,6 +46,10 @@ export function DashboardMetricsCards() {
     total_parties: 0,
     total_warehouses: 0,
     stock_items_count: 0,
+    total_stock_value: "0",
+    expiring_soon_count: 0,
+    open_purchase_orders: 0,
+    pending_dispatches: 0,
   };
 
   return (
@@ -49,6 +59,13 @@ export function DashboardMetricsCards() {
         { label: "Total Parties", value: metrics.total_parties },
         { label: "Total Warehouses", value: metrics.total_warehouses },
         { label: "Stock Items", value: metrics.stock_items_count },
+        {
+          label: "Stock Value",
+          value: stockValueFormatter.format(Number(metrics.total_stock_value)),
+        },
+        { label: "Expiring in 30 Days", value: metrics.expiring_soon_count },
+        { label: "Open Purchase Orders", value: metrics.open_purchase_orders },
+        { label: "Pending Dispatches", value: metrics.pending_dispatches },
       ].map((item) => (
         <Card key={item.label}>
           <CardHeader>
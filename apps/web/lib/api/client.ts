@@ -284,6 +284,11 @@ export type DashboardMetrics = {
   total_parties: number;
   total_warehouses: number;
   stock_items_count: number;
+  total_stock_value: string;
+  expiring_soon_count: number;
+  open_purchase_orders: number;
+  pending_dispatches: number;
+  as_of: string;
 };
 
 export type UserPreferences = {
@@ -780,6 +785,7 @@ export type PurchaseOrderListQuery = {
 };
 
 export type PurchaseOrderLinePayload = {
+  id?: number;
   product_id: number;
   ordered_qty: string;
   unit_cost?: string;
@@ -1036,6 +1042,7 @@ export type SalesOrder = {
 };
 
 export type SalesOrderLinePayload = {
+  id?: number;
   product_id: number;
   ordered_qty: string;
   unit_price?: string;
@@ -225,6 +225,24 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/inventory/period-closes": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** List Period Closes */
+        get: operations["list_period_closes_inventory_period_closes_get"];
+        put?: never;
+        /** Create Period Close */
+        post: operations["create_period_close_inventory_period_closes_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/inventory/stock-adjustments": {
         parameters: {
             query?: never;
@@ -243,6 +261,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/inventory/stock-balance-check": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Check Stock Balances */
+        get: operations["check_stock_balances_inventory_stock_balance_check_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/inventory/stock-corrections": {
         parameters: {
             query?: never;
@@ -546,7 +581,12 @@ export interface paths {
         };
         get?: never;
         put?: never;
-        /** Bulk Create Items */
+        /**
+         * Bulk Create Items
+         * @description Bulk product import. Rows are validated against master lookups loaded once per
+         *     import and inserted in chunks; with ``dry_run`` nothing is written and
+         *     ``created_count`` reports how many rows would be created.
+         */
         post: operations["bulk_create_items_masters_items_bulk_post"];
         delete?: never;
         options?: never;
@@ -589,6 +629,27 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/masters/parties/summary": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * List Party Summaries
+         * @description Cursor-paginated party list ordered by name; pass ``next_cursor`` back as
+         *     ``cursor`` and ``fields`` (comma separated) for a sparse projection.
+         */
+        get: operations["list_party_summaries_masters_parties_summary_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/masters/parties/template.csv": {
         parameters: {
             query?: never;
@@ -684,6 +745,27 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/masters/products/summary": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * List Product Summaries
+         * @description Cursor-paginated product list ordered by name; pass ``next_cursor`` back as
+         *     ``cursor`` and ``fields`` (comma separated) for a sparse projection.
+         */
+        get: operations["list_product_summaries_masters_products_summary_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/masters/products/{product_id}": {
         parameters: {
             query?: never;
@@ -915,6 +997,27 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/purchase-bills/summary": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * List Purchase Bill Summary Route
+         * @description Cursor-paginated bill list; pass ``next_cursor`` back as ``cursor`` and
+         *     ``fields`` (comma separated) for a sparse projection.
+         */
+        get: operations["list_purchase_bill_summary_route_purchase_bills_summary_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/purchase-bills/upload": {
         parameters: {
             query?: never;
@@ -1086,6 +1189,29 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/purchase/grn/summary": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * List Grn Summaries
+         * @description Cursor-paginated GRN list without line items, newest first.
+         *
+         *     Pass ``next_cursor`` back as ``cursor`` for the following page and ``fields``
+         *     (comma separated) to return only some columns. Use ``GET /grn/{grn_id}`` for lines.
+         */
+        get: operations["list_grn_summaries_purchase_grn_summary_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/purchase/grn/{grn_id}": {
         parameters: {
             query?: never;
@@ -1385,7 +1511,11 @@ export interface paths {
             path?: never;
             cookie?: never;
         };
-        /** Report Filter Options */
+        /**
+         * Report Filter Options
+         * @description Full option lists, revalidated with ``If-None-Match``; large tenants should
+         *     prefer the ``/filter-options/{kind}`` typeahead lookups.
+         */
         get: operations["report_filter_options_reports_filter_options_get"];
         put?: never;
         post?: never;
@@ -1395,6 +1525,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/reports/filter-options/{kind}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Search Report Filter Options
+         * @description Typeahead lookup for one filter; pass ``next_cursor`` back as ``cursor``.
+         */
+        get: operations["search_report_filter_options_reports_filter_options__kind__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/reports/masters/brand-item-report": {
         parameters: {
             query?: never;
@@ -1752,6 +1902,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/reports/purchase-analytics/filter-options/{kind}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Search Purchase Analytics Filter Options */
+        get: operations["search_purchase_analytics_filter_options_reports_purchase_analytics_filter_options__kind__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/reports/purchase-analytics/po-fulfillment-quality": {
         parameters: {
             query?: never;
@@ -2462,6 +2629,11 @@ export interface components {
         BulkImportResult: {
             /** Created Count */
             created_count: number;
+            /**
+             * Dry Run
+             * @default false
+             */
+            dry_run: boolean;
             /** Errors */
             errors: components["schemas"]["BulkImportError"][];
             /** Failed Count */
@@ -2679,12 +2851,25 @@ export interface components {
         };
         /** DashboardMetrics */
         DashboardMetrics: {
+            /**
+             * As Of
+             * Format: date
+             */
+            as_of: string;
+            /** Expiring Soon Count */
+            expiring_soon_count: number;
+            /** Open Purchase Orders */
+            open_purchase_orders: number;
+            /** Pending Dispatches */
+            pending_dispatches: number;
             /** Stock Items Count */
             stock_items_count: number;
             /** Total Parties */
             total_parties: number;
             /** Total Products */
             total_products: number;
+            /** Total Stock Value */
+            total_stock_value: string;
             /** Total Warehouses */
             total_warehouses: number;
         };
@@ -2803,6 +2988,8 @@ export interface components {
             /** Sales Order Id */
             sales_order_id: number;
             status: components["schemas"]["DispatchNoteStatus"];
+            /** Version */
+            version: number;
             /** Warehouse Id */
             warehouse_id: number;
         };
@@ -3185,11 +3372,59 @@ export interface components {
              * Format: date-time
              */
             updated_at: string;
+            /** Version */
+            version: number;
             /** Warehouse Id */
             warehouse_id: number;
             /** Warehouse Name */
             warehouse_name?: string | null;
         };
+        /**
+         * GRNSummary
+         * @description GRN list row without lines; fields left out of a ``fields=`` projection are omitted.
+         */
+        GRNSummary: {
+            /** Created At */
+            created_at?: string | null;
+            /** Grn Number */
+            grn_number?: string | null;
+            /** Id */
+            id: number;
+            /** Po Number */
+            po_number?: string | null;
+            /** Posted At */
+            posted_at?: string | null;
+            /** Purchase Bill Id */
+            purchase_bill_id?: number | null;
+            /** Purchase Bill Number */
+            purchase_bill_number?: string | null;
+            /** Purchase Order Id */
+            purchase_order_id?: number | null;
+            /** Received Date */
+            received_date?: string | null;
+            status?: components["schemas"]["GrnStatus"] | null;
+            /** Supplier Id */
+            supplier_id?: number | null;
+            /** Supplier Name */
+            supplier_name?: string | null;
+            /** Total Products */
+            total_products?: number | null;
+            /** Total Received Qty */
+            total_received_qty?: string | null;
+            /** Updated At */
+            updated_at?: string | null;
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+            /** Warehouse Name */
+            warehouse_name?: string | null;
+        };
+        /** GRNSummaryPage */
+        GRNSummaryPage: {
+            /** Items */
+            items: components["schemas"]["GRNSummary"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
         /** GRNUpdate */
         GRNUpdate: {
             /** Lines */
@@ -3203,6 +3438,8 @@ export interface components {
             received_date: string;
             /** Remarks */
             remarks?: string | null;
+            /** Version */
+            version?: number | null;
         };
         /** GSTVerificationHistoryResponse */
         GSTVerificationHistoryResponse: {
@@ -3760,6 +3997,43 @@ export interface components {
             /** Whatsapp No */
             whatsapp_no?: string | null;
         };
+        /**
+         * PartySummary
+         * @description Party list row with the columns pickers and tables need; fields left out of a
+         *     ``fields=`` projection are omitted.
+         */
+        PartySummary: {
+            /** City */
+            city?: string | null;
+            /** Display Name */
+            display_name?: string | null;
+            /** Gstin */
+            gstin?: string | null;
+            /** Id */
+            id: number;
+            /** Is Active */
+            is_active?: boolean | null;
+            /** Name */
+            name?: string | null;
+            /** Party Category */
+            party_category?: string | null;
+            /** Party Code */
+            party_code?: string | null;
+            party_type?: components["schemas"]["PartyType"] | null;
+            /** Phone */
+            phone?: string | null;
+            /** State */
+            state?: string | null;
+            /** Updated At */
+            updated_at?: string | null;
+        };
+        /** PartySummaryPage */
+        PartySummaryPage: {
+            /** Items */
+            items: components["schemas"]["PartySummary"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
         /**
          * PartyType
          * @enum {string}
@@ -3835,6 +4109,40 @@ export interface components {
             /** Whatsapp No */
             whatsapp_no?: string | null;
         };
+        /** PeriodCloseRequest */
+        PeriodCloseRequest: {
+            /**
+             * Fiscal Year End
+             * Format: date
+             */
+            fiscal_year_end: string;
+        };
+        /** PeriodCloseResponse */
+        PeriodCloseResponse: {
+            /** Archived Rows */
+            archived_rows: number;
+            /** Checkpoint Rows */
+            checkpoint_rows: number;
+            /**
+             * Closed At
+             * Format: date-time
+             */
+            closed_at: string;
+            /** Closed By */
+            closed_by: number;
+            /**
+             * Cutoff At
+             * Format: date-time
+             */
+            cutoff_at: string;
+            /**
+             * Fiscal Year End
+             * Format: date
+             */
+            fiscal_year_end: string;
+            /** Id */
+            id: number;
+        };
         /** ProductCreate */
         ProductCreate: {
             /** Barcode */
@@ -3948,6 +4256,50 @@ export interface components {
              */
             updated_at: string;
         };
+        /**
+         * ProductSummary
+         * @description Product list row with the columns pickers and tables need; fields left out of a
+         *     ``fields=`` projection are omitted.
+         */
+        ProductSummary: {
+            /** Brand */
+            brand?: string | null;
+            /** Category */
+            category?: string | null;
+            /** Default Warehouse Id */
+            default_warehouse_id?: number | null;
+            /** Default Warehouse Name */
+            default_warehouse_name?: string | null;
+            /** Display Name */
+            display_name?: string | null;
+            /** Gst Rate */
+            gst_rate?: string | null;
+            /** Hsn */
+            hsn?: string | null;
+            /** Id */
+            id: number;
+            /** Is Active */
+            is_active?: boolean | null;
+            /** Mrp */
+            mrp?: string | null;
+            /** Name */
+            name?: string | null;
+            /** Quantity Precision */
+            quantity_precision?: number | null;
+            /** Sku */
+            sku?: string | null;
+            /** Uom */
+            uom?: string | null;
+            /** Updated At */
+            updated_at?: string | null;
+        };
+        /** ProductSummaryPage */
+        ProductSummaryPage: {
+            /** Items */
+            items: components["schemas"]["ProductSummary"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
         /** ProductUpdate */
         ProductUpdate: {
             /** Barcode */
@@ -4181,6 +4533,8 @@ export interface components {
              * Format: date-time
              */
             updated_at: string;
+            /** Version */
+            version: number;
             /** Warehouse Id */
             warehouse_id?: number | null;
         };
@@ -4189,18 +4543,62 @@ export interface components {
          * @enum {string}
          */
         PurchaseBillStatus: "DRAFT" | "VERIFIED" | "POSTED" | "CANCELLED";
-        /** PurchaseBillUpdate */
-        PurchaseBillUpdate: {
-            /** Adjustment */
-            adjustment?: number | string | null;
+        /**
+         * PurchaseBillSummary
+         * @description Purchase bill list row without lines, attachment or extracted JSON; fields left
+         *     out of a ``fields=`` projection are omitted.
+         */
+        PurchaseBillSummary: {
             /** Bill Date */
             bill_date?: string | null;
             /** Bill Number */
             bill_number?: string | null;
-            /** Cgst Amount */
-            cgst_amount?: number | string | null;
-            /** Discount Amount */
-            discount_amount?: number | string | null;
+            /** Created At */
+            created_at?: string | null;
+            /** Due Date */
+            due_date?: string | null;
+            extraction_status?: components["schemas"]["PurchaseBillExtractionStatus"] | null;
+            /** Grn Id */
+            grn_id?: number | null;
+            /** Id */
+            id: number;
+            /** Purchase Order Id */
+            purchase_order_id?: number | null;
+            status?: components["schemas"]["PurchaseBillStatus"] | null;
+            /** Supplier Gstin */
+            supplier_gstin?: string | null;
+            /** Supplier Id */
+            supplier_id?: number | null;
+            /** Supplier Name Raw */
+            supplier_name_raw?: string | null;
+            /** Taxable Value */
+            taxable_value?: string | null;
+            /** Total */
+            total?: string | null;
+            /** Updated At */
+            updated_at?: string | null;
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+        };
+        /** PurchaseBillSummaryPage */
+        PurchaseBillSummaryPage: {
+            /** Items */
+            items: components["schemas"]["PurchaseBillSummary"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
+        /** PurchaseBillUpdate */
+        PurchaseBillUpdate: {
+            /** Adjustment */
+            adjustment?: number | string | null;
+            /** Bill Date */
+            bill_date?: string | null;
+            /** Bill Number */
+            bill_number?: string | null;
+            /** Cgst Amount */
+            cgst_amount?: number | string | null;
+            /** Discount Amount */
+            discount_amount?: number | string | null;
             /** Due Date */
             due_date?: string | null;
             /** Grn Id */
@@ -4227,6 +4625,8 @@ export interface components {
             taxable_value?: number | string | null;
             /** Total */
             total?: number | string | null;
+            /** Version */
+            version?: number | null;
             /** Warehouse Id */
             warehouse_id?: number | null;
         };
@@ -4298,6 +4698,8 @@ export interface components {
              * @default 0
              */
             free_qty: number | string;
+            /** Id */
+            id?: number | null;
             /** Line Notes */
             line_notes?: string | null;
             /** Ordered Qty */
@@ -4425,6 +4827,8 @@ export interface components {
              * Format: date-time
              */
             updated_at: string;
+            /** Version */
+            version: number;
             /** Warehouse Id */
             warehouse_id: number;
             /** Warehouse Name */
@@ -4465,6 +4869,8 @@ export interface components {
             order_date?: string;
             /** Supplier Id */
             supplier_id: number;
+            /** Version */
+            version?: number | null;
             /** Warehouse Id */
             warehouse_id: number;
         };
@@ -4576,6 +4982,22 @@ export interface components {
             /** Label */
             label: string;
         };
+        /** ReportFilterOption */
+        ReportFilterOption: {
+            /** Id */
+            id?: number | null;
+            /** Label */
+            label: string;
+            /** Value */
+            value?: string | null;
+        };
+        /** ReportFilterOptionPage */
+        ReportFilterOptionPage: {
+            /** Items */
+            items: components["schemas"]["ReportFilterOption"][];
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
         /** ReportFilterOptionsResponse */
         ReportFilterOptionsResponse: {
             /** Batches */
@@ -4716,6 +5138,8 @@ export interface components {
             gst_rate: number | string;
             /** Hsn Code */
             hsn_code?: string | null;
+            /** Id */
+            id?: number | null;
             /** Ordered Qty */
             ordered_qty: number | string;
             /** Product Id */
@@ -4808,6 +5232,8 @@ export interface components {
              * Format: date-time
              */
             updated_at: string;
+            /** Version */
+            version: number;
             /** Warehouse Id */
             warehouse_id: number;
         };
@@ -4844,6 +5270,8 @@ export interface components {
             tax_type?: string | null;
             /** Total */
             total?: number | string | null;
+            /** Version */
+            version?: number | null;
             /** Warehouse Id */
             warehouse_id?: number | null;
         };
@@ -4986,6 +5414,26 @@ export interface components {
             /** Warehouse Id */
             warehouse_id: number;
         };
+        /** StockBalanceCheckResponse */
+        StockBalanceCheckResponse: {
+            /** Balanced */
+            balanced: boolean;
+            /** Mismatches */
+            mismatches: components["schemas"]["StockBalanceMismatch"][];
+        };
+        /** StockBalanceMismatch */
+        StockBalanceMismatch: {
+            /** Batch Id */
+            batch_id: number;
+            /** Ledger Qty */
+            ledger_qty: string;
+            /** Product Id */
+            product_id: number;
+            /** Summary Qty */
+            summary_qty: string;
+            /** Warehouse Id */
+            warehouse_id: number;
+        };
         /** StockCorrectionListItem */
         StockCorrectionListItem: {
             /** Corrected Batch No */
@@ -5844,7 +6292,9 @@ export interface operations {
     post_dispatch_note_route_dispatch_notes__dispatch_note_id__post_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                "idempotency-key"?: string | null;
+            };
             path: {
                 dispatch_note_id: number;
             };
@@ -5897,7 +6347,9 @@ export interface operations {
     create_stock_adjust_legacy_inventory_adjust_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                "idempotency-key"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
@@ -5930,7 +6382,9 @@ export interface operations {
     create_stock_in_inventory_in_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                "idempotency-key"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
@@ -5983,7 +6437,9 @@ export interface operations {
     create_stock_out_inventory_out_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                "idempotency-key"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
@@ -6013,6 +6469,59 @@ export interface operations {
             };
         };
     };
+    list_period_closes_inventory_period_closes_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PeriodCloseResponse"][];
+                };
+            };
+        };
+    };
+    create_period_close_inventory_period_closes_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["PeriodCloseRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PeriodCloseResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     list_stock_adjustments_inventory_stock_adjustments_get: {
         parameters: {
             query?: {
@@ -6079,6 +6588,26 @@ export interface operations {
             };
         };
     };
+    check_stock_balances_inventory_stock_balance_check_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["StockBalanceCheckResponse"];
+                };
+            };
+        };
+    };
     list_stock_corrections_inventory_stock_corrections_get: {
         parameters: {
             query?: {
@@ -6800,7 +7329,9 @@ export interface operations {
     };
     bulk_create_items_masters_items_bulk_post: {
         parameters: {
-            query?: never;
+            query?: {
+                dry_run?: boolean;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -6816,6 +7347,15 @@ export interface operations {
                     "application/json": components["schemas"]["BulkImportResult"];
                 };
             };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     list_parties_masters_parties_get: {
@@ -6909,6 +7449,42 @@ export interface operations {
             };
         };
     };
+    list_party_summaries_masters_parties_summary_get: {
+        parameters: {
+            query?: {
+                include_inactive?: boolean;
+                party_type?: components["schemas"]["PartyType"] | null;
+                search?: string | null;
+                cursor?: string | null;
+                limit?: number;
+                fields?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PartySummaryPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     party_master_template_masters_parties_template_csv_get: {
         parameters: {
             query?: never;
@@ -7183,6 +7759,43 @@ export interface operations {
             };
         };
     };
+    list_product_summaries_masters_products_summary_get: {
+        parameters: {
+            query?: {
+                include_inactive?: boolean;
+                brand?: string | null;
+                category?: string | null;
+                search?: string | null;
+                cursor?: string | null;
+                limit?: number;
+                fields?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ProductSummaryPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_product_masters_products__product_id__get: {
         parameters: {
             query?: never;
@@ -7890,6 +8503,41 @@ export interface operations {
             };
         };
     };
+    list_purchase_bill_summary_route_purchase_bills_summary_get: {
+        parameters: {
+            query?: {
+                status?: components["schemas"]["PurchaseBillStatus"] | null;
+                supplier_id?: number | null;
+                cursor?: string | null;
+                limit?: number;
+                fields?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PurchaseBillSummaryPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     upload_purchase_bill_route_purchase_bills_upload_post: {
         parameters: {
             query?: never;
@@ -8242,6 +8890,48 @@ export interface operations {
             };
         };
     };
+    list_grn_summaries_purchase_grn_summary_get: {
+        parameters: {
+            query?: {
+                search?: string | null;
+                status?: string | null;
+                supplier_id?: number | null;
+                warehouse_id?: number | null;
+                po_number?: string | null;
+                bill_number?: string | null;
+                grn_number?: string | null;
+                date_from?: string | null;
+                date_to?: string | null;
+                cursor?: string | null;
+                limit?: number;
+                fields?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GRNSummaryPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_grn_purchase_grn__grn_id__get: {
         parameters: {
             query?: never;
@@ -8377,7 +9067,9 @@ export interface operations {
     post_grn_route_purchase_grn__grn_id__post_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                "idempotency-key"?: string | null;
+            };
             path: {
                 grn_id: number;
             };
@@ -8617,6 +9309,7 @@ export interface operations {
                 stock_source?: ("all" | "opening" | "non_opening") | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8684,6 +9377,7 @@ export interface operations {
                 compliance_type?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8718,6 +9412,7 @@ export interface operations {
                 duplicate_type?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8771,6 +9466,7 @@ export interface operations {
                 entity_types?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8805,6 +9501,7 @@ export interface operations {
                 missing_field_type?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8844,6 +9541,7 @@ export interface operations {
                 inactivity_days?: number;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8886,6 +9584,7 @@ export interface operations {
                 include_expired?: boolean;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8933,6 +9632,41 @@ export interface operations {
             };
         };
     };
+    search_report_filter_options_reports_filter_options__kind__get: {
+        parameters: {
+            query?: {
+                q?: string | null;
+                cursor?: string | null;
+                limit?: number;
+            };
+            header?: never;
+            path: {
+                kind: "products" | "suppliers" | "warehouses" | "brands" | "categories" | "batches" | "states" | "cities";
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReportFilterOptionPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     masters_brand_item_report_reports_masters_brand_item_report_get: {
         parameters: {
             query?: {
@@ -8942,6 +9676,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -8977,6 +9712,7 @@ export interface operations {
                 category_values?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9012,6 +9748,7 @@ export interface operations {
                 category_values?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9047,6 +9784,7 @@ export interface operations {
                 category_values?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9102,6 +9840,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9138,6 +9877,7 @@ export interface operations {
                 product_ids?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9174,6 +9914,7 @@ export interface operations {
                 product_ids?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9208,6 +9949,7 @@ export interface operations {
                 inactivity_days?: number;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9245,6 +9987,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9280,6 +10023,7 @@ export interface operations {
                 states?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9318,6 +10062,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9354,6 +10099,7 @@ export interface operations {
                 cities?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9390,6 +10136,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9424,6 +10171,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9459,6 +10207,7 @@ export interface operations {
                 category_values?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9495,6 +10244,7 @@ export interface operations {
                 active_status?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9530,6 +10280,7 @@ export interface operations {
                 inactivity_days?: number;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9569,6 +10320,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9648,6 +10400,41 @@ export interface operations {
             };
         };
     };
+    search_purchase_analytics_filter_options_reports_purchase_analytics_filter_options__kind__get: {
+        parameters: {
+            query?: {
+                q?: string | null;
+                cursor?: string | null;
+                limit?: number;
+            };
+            header?: never;
+            path: {
+                kind: "products" | "suppliers" | "warehouses" | "brands" | "categories" | "batches" | "states" | "cities";
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReportFilterOptionPage"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     po_fulfillment_quality_report_reports_purchase_analytics_po_fulfillment_quality_get: {
         parameters: {
             query?: {
@@ -9663,6 +10450,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9705,6 +10493,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9748,6 +10537,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9790,6 +10580,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9832,6 +10623,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9874,6 +10666,7 @@ export interface operations {
                 date_to?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9912,6 +10705,7 @@ export interface operations {
                 category_values?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9956,6 +10750,7 @@ export interface operations {
                 expiry_status?: ("all" | "expiring_30" | "expired" | "safe") | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -9998,6 +10793,7 @@ export interface operations {
                 movement_type?: ("inward" | "outward") | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;
@@ -10042,6 +10838,7 @@ export interface operations {
                 bill_number?: string | null;
                 page?: number;
                 page_size?: number;
+                format?: ("csv" | "ndjson" | "xlsx") | null;
             };
             header?: never;
             path?: never;